@@ -0,0 +1,36 @@
+"""
+This example demonstrates how to cache the results of knowledge base searches.
+
+Repeated searches with the same query, filters and number of documents skip the embedding and vector search.
+The cache is stored in Redis, so it is shared by all processes, and it is invalidated when documents are loaded.
+
+Run Redis with: docker run -d -p 6379:6379 redis
+"""
+
+from agno.agent import Agent
+from agno.cache.redis import RedisCache
+from agno.cache.retrieval import RetrievalCache
+from agno.knowledge.pdf_url import PDFUrlKnowledgeBase
+from agno.vectordb.pgvector import PgVector
+from rich.pretty import pprint
+
+db_url = "postgresql+psycopg://ai:ai@localhost:5532/ai"
+
+search_cache = RetrievalCache(backend=RedisCache(prefix="agno_search"), ttl=3600)
+
+knowledge_base = PDFUrlKnowledgeBase(
+    urls=["https://agno-public.s3.amazonaws.com/recipes/ThaiRecipes.pdf"],
+    vector_db=PgVector(table_name="recipes", db_url=db_url),
+    search_cache=search_cache,
+)
+knowledge_base.load(recreate=False)  # Comment out after first run
+
+agent = Agent(
+    knowledge=knowledge_base,
+    search_knowledge=True,
+)
+
+agent.print_response("How to make Thai curry?", markdown=True)
+agent.print_response("How do I make a Thai curry?", markdown=True)
+
+pprint(search_cache.get_metrics())
@@ -0,0 +1,54 @@
+"""
+This example demonstrates hybrid search on vector dbs without full-text search, and how to compare search modes.
+
+HybridSearch runs the vector search of ChromaDb and a keyword search of a local BM25 index concurrently,
+and fuses their results with reciprocal rank fusion. Vector dbs with full-text search, e.g. PgVector,
+can be wrapped without a keyword index to use their own keyword search.
+
+Install dependencies with: pip install chromadb pypdf openai
+"""
+
+from agno.agent import Agent
+from agno.knowledge.pdf_url import PDFUrlKnowledgeBase
+from agno.vectordb.benchmark import benchmark_search
+from agno.vectordb.chroma import ChromaDb
+from agno.vectordb.search import BM25Index, HybridSearch
+from rich.pretty import pprint
+
+vector_db = ChromaDb(collection="recipes", path="tmp/chromadb", persistent_client=True)
+hybrid_db = HybridSearch(
+    vector_db=vector_db,
+    # The keyword index is kept in a file, to survive restarts like the chroma collection
+    keyword_index=BM25Index(path="tmp/chromadb/recipes_bm25.jsonl"),
+    fusion="rrf",
+    keyword_weight=0.5,
+)
+
+knowledge_base = PDFUrlKnowledgeBase(
+    urls=["https://agno-public.s3.amazonaws.com/recipes/ThaiRecipes.pdf"],
+    vector_db=hybrid_db,
+)
+knowledge_base.load(recreate=True)  # Comment out after first run
+
+agent = Agent(knowledge=knowledge_base, search_knowledge=True)
+agent.print_response("How do I make Tom Kha Gai?", markdown=True)
+
+# Compare the recall and latency of vector and hybrid search.
+# Use an evaluation set of queries and relevant documents, here the chunks naming each dish.
+dishes = {
+    "How do I make Tom Kha Gai?": "Tom Kha",
+    "Recipe for a green curry": "Green Curry",
+}
+queries = list(dishes)
+relevant = [
+    [
+        document.content
+        for document in hybrid_db.keyword_search(name, limit=20)
+        if name.lower() in document.content.lower()
+    ]
+    for name in dishes.values()
+]
+results = benchmark_search(
+    {"vector": vector_db, "hybrid": hybrid_db}, queries, relevant, k=5
+)
+pprint([result.to_dict() for result in results])
@@ -0,0 +1,45 @@
+"""
+This example demonstrates how to create user memories and session summaries in the background.
+
+With a `MemoryProcessor`, runs return without waiting for the memories and summary. Runs of the same session
+within `coalesce_delay` seconds are processed together, and pending jobs are kept in the SQLite cache.
+"""
+
+from agno.agent.agent import Agent
+from agno.cache.sqlite import SqliteCache
+from agno.memory.v2.db.sqlite import SqliteMemoryDb
+from agno.memory.v2.memory import Memory
+from agno.memory.v2.processor import MemoryProcessor
+from agno.models.openai import OpenAIChat
+from rich.pretty import pprint
+
+memory = Memory(db=SqliteMemoryDb(table_name="memory", db_file="tmp/memory.db"))
+
+processor = MemoryProcessor(
+    backend=SqliteCache(db_file="tmp/memory_jobs.db"),
+    coalesce_delay=5,
+)
+
+agent = Agent(
+    model=OpenAIChat(id="gpt-4o-mini"),
+    memory=memory,
+    memory_processor=processor,
+    enable_user_memories=True,
+    enable_session_summaries=True,
+)
+
+agent.print_response(
+    "My name is John Doe and I like to hike in the mountains on weekends.",
+    user_id="john",
+)
+agent.print_response("I also like to cook Italian food.", user_id="john")
+
+print(
+    f"Seconds since the oldest unprocessed run: {processor.get_staleness(agent.session_id, 'john'):.2f}"
+)
+
+# Wait for the pending memories, e.g. before exiting
+processor.shutdown()
+
+pprint(processor.get_metrics())
+pprint(memory.get_user_memories(user_id="john"))
@@ -0,0 +1,33 @@
+"""
+This example demonstrates how to search previous sessions with a session history index.
+
+The runs are added to the index when the session is written to storage. With `search_previous_sessions_history`,
+the agent gets tools to search the messages and the tool calls of previous sessions, without loading the sessions.
+"""
+
+from agno.agent.agent import Agent
+from agno.models.openai import OpenAIChat
+from agno.storage.history import SqliteHistoryIndex
+from agno.storage.sqlite import SqliteStorage
+from agno.tools.yfinance import YFinanceTools
+
+agent = Agent(
+    model=OpenAIChat(id="gpt-4o-mini"),
+    storage=SqliteStorage(table_name="agent_sessions", db_file="tmp/data.db"),
+    history_index=SqliteHistoryIndex(db_file="tmp/history.db"),
+    search_previous_sessions_history=True,
+    tools=[YFinanceTools(stock_price=True)],
+)
+
+agent.print_response(
+    "What is the stock price of NVDA?", user_id="john", session_id="session_1"
+)
+agent.print_response(
+    "I parked my car on level 3 of the garage.", user_id="john", session_id="session_2"
+)
+
+agent.print_response(
+    "Where did I park my car, and which stock prices did you look up?",
+    user_id="john",
+    session_id="session_3",
+)
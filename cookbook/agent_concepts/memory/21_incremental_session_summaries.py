@@ -0,0 +1,41 @@
+"""
+This example demonstrates how to keep the cost of session summaries constant in long sessions.
+
+Session summaries are updated incrementally: the summarizer gets the previous summary and the runs added since.
+Here the summary is only updated every 3 runs, or sooner when the new messages exceed 2000 tokens.
+"""
+
+from agno.agent.agent import Agent
+from agno.memory.v2.db.sqlite import SqliteMemoryDb
+from agno.memory.v2.memory import Memory
+from agno.memory.v2.summarizer import SessionSummarizer
+from agno.models.openai import OpenAIChat
+from agno.storage.sqlite import SqliteStorage
+from rich.pretty import pprint
+
+memory = Memory(
+    db=SqliteMemoryDb(table_name="memory", db_file="tmp/memory.db"),
+    summarizer=SessionSummarizer(
+        model=OpenAIChat(id="gpt-4o-mini"), min_new_runs=3, min_new_tokens=2000
+    ),
+)
+
+agent = Agent(
+    model=OpenAIChat(id="gpt-4o-mini"),
+    memory=memory,
+    storage=SqliteStorage(table_name="agent_sessions", db_file="tmp/data.db"),
+    enable_session_summaries=True,
+    session_id="support_session",
+    user_id="john",
+)
+
+for message in [
+    "My order 1234 has not arrived yet.",
+    "It was shipped to 10 Main Street, Springfield.",
+    "The tracking page says it is stuck in Chicago.",
+    "Can you also check order 5678?",
+]:
+    agent.print_response(message)
+
+# The summary covers the runs up to the last summarized run
+pprint(memory.get_session_summary(session_id="support_session", user_id="john"))
@@ -0,0 +1,40 @@
+"""Run toolkits on dedicated pools, so that heavy tools can't starve the other tools.
+
+PandasTools keeps its dataframes in memory, so it runs on a dedicated thread pool.
+CalculatorTools is stateless and CPU-bound, so it runs in worker processes.
+"""
+
+import asyncio
+
+from agno.agent import Agent
+from agno.models.openai import OpenAIChat
+from agno.tools.calculator import CalculatorTools
+from agno.tools.duckduckgo import DuckDuckGoTools
+from agno.tools.executor import ToolExecutor
+from agno.tools.pandas import PandasTools
+from rich.pretty import pprint
+
+# At most 2 dataframe operations at a time, and 4 waiting before calls are rejected
+pandas_executor = ToolExecutor(name="pandas", max_workers=2, max_pending=4)
+math_executor = ToolExecutor(name="math", max_workers=2, processes=True)
+
+agent = Agent(
+    model=OpenAIChat(id="gpt-4o-mini"),
+    tools=[
+        PandasTools(executor=pandas_executor),
+        CalculatorTools(enable_all=True, executor=math_executor),
+        DuckDuckGoTools(),
+    ],
+    show_tool_calls=True,
+)
+
+if __name__ == "__main__":
+    asyncio.run(
+        agent.aprint_response(
+            "Is 104729 a prime number? What is its factorial's number of digits? Also find news about prime numbers.",
+            markdown=True,
+        )
+    )
+    pprint(pandas_executor.get_metrics())
+    pprint(math_executor.get_metrics())
+    math_executor.shutdown()
@@ -0,0 +1,41 @@
+"""Run many accuracy evals concurrently, caching the agent outputs between runs of the suite.
+
+Run `pip install openai agno` to install dependencies.
+"""
+
+from agno.agent import Agent
+from agno.cache.sqlite import SqliteCache
+from agno.eval.accuracy import AccuracyEval
+from agno.eval.suite import EvalSuite
+from agno.models.openai import OpenAIChat
+
+# The rate limit is shared by all the concurrent runs of the agent
+agent = Agent(model=OpenAIChat(id="gpt-4o-mini", requests_per_minute=500))
+evaluator_model = OpenAIChat(id="o4-mini", requests_per_minute=500)
+
+cases = [
+    ("What is 10*5 then to the power of 2? do it step by step", "2500"),
+    ("What is the capital of France?", "Paris"),
+    ("9.11 and 9.9 -- which is bigger?", "9.9"),
+]
+
+suite = EvalSuite(
+    name="Regression Suite",
+    evals=[
+        AccuracyEval(
+            agent=agent,
+            model=evaluator_model,
+            input=question,
+            expected_output=answer,
+            num_iterations=2,
+        )
+        for question, answer in cases
+    ],
+    max_concurrency=8,
+    # Running the suite again only runs the evaluator, e.g. after changing the expected outputs
+    output_cache=SqliteCache(db_file="tmp/eval_outputs.db"),
+    report_path="tmp/evals/{name}.jsonl",
+)
+
+if __name__ == "__main__":
+    suite.run(print_summary=True)
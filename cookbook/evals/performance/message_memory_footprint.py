@@ -0,0 +1,67 @@
+"""Measure the memory footprint of messages and streamed events. No API key needed.
+
+Run `pip install agno` to install dependencies.
+"""
+
+import tracemalloc
+
+from agno.eval.performance import PerformanceEval
+from agno.models.message import Message, MessageMetrics
+from agno.run.response import RunResponseContentEvent
+
+NUM_OBJECTS = 10_000
+
+
+def create_messages():
+    return [
+        Message(
+            role="assistant",
+            content=f"Reply number {i}",
+            metrics=MessageMetrics(
+                input_tokens=100, output_tokens=20, total_tokens=120
+            ),
+        )
+        for i in range(NUM_OBJECTS)
+    ]
+
+
+def stream_content_events():
+    # One event per streamed token, kept by the consumer like run_response.events
+    return [
+        RunResponseContentEvent(agent_id="agent", run_id="run", content=" token")
+        for _ in range(NUM_OBJECTS)
+    ]
+
+
+def measure(func) -> tuple:
+    """Return the bytes and the memory blocks allocated per object created by func."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = func()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    size = sum(stat.size_diff for stat in stats)
+    blocks = sum(stat.count_diff for stat in stats)
+    del objects
+    return size / NUM_OBJECTS, blocks / NUM_OBJECTS
+
+
+message_memory_perf = PerformanceEval(
+    name="Message Memory Footprint",
+    func=create_messages,
+    num_iterations=10,
+    warmup_runs=1,
+)
+
+if __name__ == "__main__":
+    bytes_per_message, blocks_per_message = measure(create_messages)
+    print(
+        f"Bytes per message: {bytes_per_message:.0f} ({blocks_per_message:.1f} allocations)"
+    )
+    bytes_per_event, blocks_per_event = measure(stream_content_events)
+    print(
+        f"Bytes per streamed token: {bytes_per_event:.0f} ({blocks_per_event:.1f} allocations)"
+    )
+
+    message_memory_perf.run(print_results=True, print_summary=True)
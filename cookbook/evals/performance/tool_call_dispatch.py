@@ -0,0 +1,46 @@
+"""Measure the overhead of running a tool call, without the tool itself and the model.
+
+Run `pip install agno` to install dependencies.
+"""
+
+from typing import Literal
+
+from agno.eval.performance import PerformanceEval
+from agno.tools.function import Function, FunctionCall
+
+
+def get_weather(city: Literal["nyc", "sf"], days: int = 1) -> str:
+    """Use this to get weather information."""
+    return f"It's always sunny in {city}"
+
+
+def logger_hook(function_name: str, function_call, arguments: dict):
+    return function_call(**arguments)
+
+
+plain_function = Function.from_callable(get_weather)
+hooked_function = Function.from_callable(get_weather)
+hooked_function.tool_hooks = [logger_hook, logger_hook]
+
+
+def run_tool_calls(function: Function, num_calls: int = 100):
+    for _ in range(num_calls):
+        FunctionCall(function=function, arguments={"city": "nyc", "days": 2}).execute()
+
+
+plain_dispatch_perf = PerformanceEval(
+    name="Tool Call Dispatch (100 calls)",
+    func=lambda: run_tool_calls(plain_function),
+    num_iterations=200,
+    measure_memory=False,
+)
+hooked_dispatch_perf = PerformanceEval(
+    name="Tool Call Dispatch with 2 hooks (100 calls)",
+    func=lambda: run_tool_calls(hooked_function),
+    num_iterations=200,
+    measure_memory=False,
+)
+
+if __name__ == "__main__":
+    plain_dispatch_perf.run(print_summary=True)
+    hooked_dispatch_perf.run(print_summary=True)
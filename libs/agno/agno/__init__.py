@@ -0,0 +1,4 @@
+from time import perf_counter as _perf_counter
+
+# Time the agno package started importing, used to measure cold starts (see agno.utils.import_time)
+_IMPORT_STARTED_AT = _perf_counter()
@@ -6,6 +6,7 @@ from dataclasses import asdict, dataclass
 from os import getenv
 from textwrap import dedent
 from typing import (
+    TYPE_CHECKING,
     Any,
     AsyncIterator,
     Callable,
@@ -28,7 +29,7 @@ from uuid import uuid4
 from pydantic import BaseModel
 
 from agno.agent.metrics import SessionMetrics
-from agno.exceptions import ModelProviderError, StopAgentRun
+from agno.exceptions import ModelProviderError, RunCancelledException, StopAgentRun
 from agno.knowledge.agent import AgentKnowledge
 from agno.media import Audio, AudioArtifact, AudioResponse, File, Image, ImageArtifact, Video, VideoArtifact
 from agno.memory.agent import AgentMemory, AgentRun
@@ -39,6 +40,14 @@ from agno.models.message import Citations, Message, MessageMetrics, MessageRefer
 from agno.models.response import ModelResponse, ModelResponseEvent, ToolExecution
 from agno.reasoning.step import NextAction, ReasoningStep, ReasoningSteps
 from agno.run.base import RunResponseExtraData, RunStatus
+from agno.run.cancellation import (
+    CancellationToken,
+    aiterate_in_scope,
+    cancellation_scope,
+    close_run_cancellation_token,
+    get_run_cancellation_token,
+    iterate_in_scope,
+)
 from agno.run.messages import RunMessages
 from agno.run.response import (
     RunEvent,
@@ -47,8 +56,10 @@ from agno.run.response import (
     RunResponsePausedEvent,
 )
 from agno.run.team import TeamRunResponse, TeamRunResponseEvent
-from agno.storage.base import Storage
+from agno.storage.base import Storage, asession_lock, session_lock
+from agno.storage.session import Session
 from agno.storage.session.agent import AgentSession
+from agno.storage.session.team import TeamSession
 from agno.tools.function import Function
 from agno.tools.toolkit import Toolkit
 from agno.utils.events import (
@@ -92,6 +103,12 @@ from agno.utils.response import (
 from agno.utils.safe_formatter import SafeFormatter
 from agno.utils.string import parse_response_model_str
 from agno.utils.timer import Timer
+from agno.utils.tokens import count_messages_tokens, count_tokens, get_input_token_budget
+
+if TYPE_CHECKING:
+    from agno.cache.response import ResponseCache
+    from agno.memory.v2.processor import MemoryProcessor
+    from agno.storage.history.base import SessionHistoryIndex
 
 
 @dataclass(init=False)
@@ -119,6 +136,9 @@ class Agent:
     session_state: Optional[Dict[str, Any]] = None
     search_previous_sessions_history: Optional[bool] = False
     num_history_sessions: Optional[int] = None
+    # If provided, the runs are indexed when the session is written to storage,
+    # and previous sessions are searched in the index rather than loaded from storage
+    history_index: Optional[SessionHistoryIndex] = None
     # If True, cache the session in memory
     cache_session: bool = True
 
@@ -142,6 +162,9 @@ class Agent:
     enable_session_summaries: bool = False
     # If True, the agent adds a reference to the session summaries in the response
     add_session_summary_references: Optional[bool] = None
+    # If provided, user memories and session summaries are created in the background by the processor,
+    # instead of at the end of each run
+    memory_processor: Optional[MemoryProcessor] = None
 
     # --- Agent History ---
     # add_history_to_messages=true adds messages from the chat history to the messages list sent to the Model.
@@ -151,6 +174,20 @@ class Agent:
     # Number of historical runs to include in the messages
     num_history_runs: int = 3
 
+    # --- Agent Context Budget ---
+    # If True, fit the messages sent to the Model into a token budget. Messages are added by priority:
+    # system and user message, recent history, knowledge references, then older history.
+    context_budget: bool = False
+    # Maximum number of input tokens. Defaults to the Model's context window minus its max output tokens.
+    max_context_tokens: Optional[int] = None
+    # Number of most recent history runs added before the knowledge references
+    num_recent_history_runs: int = 1
+
+    # --- Agent Response Cache ---
+    # Cache of Model responses. Repeated (or, with an embedder, similar) questions with the same context
+    # reuse the cached response instead of calling the Model.
+    response_cache: Optional[ResponseCache] = None
+
     # --- Agent Knowledge ---
     knowledge: Optional[AgentKnowledge] = None
     # Enable RAG by adding references from AgentKnowledge to the user prompt.
@@ -353,6 +390,7 @@ class Agent:
         session_state: Optional[Dict[str, Any]] = None,
         search_previous_sessions_history: Optional[bool] = False,
         num_history_sessions: Optional[int] = None,
+        history_index: Optional[SessionHistoryIndex] = None,
         cache_session: bool = True,
         context: Optional[Dict[str, Any]] = None,
         add_context: bool = False,
@@ -363,9 +401,14 @@ class Agent:
         add_memory_references: Optional[bool] = None,
         enable_session_summaries: bool = False,
         add_session_summary_references: Optional[bool] = None,
+        memory_processor: Optional[MemoryProcessor] = None,
         add_history_to_messages: bool = False,
         num_history_responses: Optional[int] = None,
         num_history_runs: int = 3,
+        context_budget: bool = False,
+        max_context_tokens: Optional[int] = None,
+        num_recent_history_runs: int = 1,
+        response_cache: Optional[ResponseCache] = None,
         knowledge: Optional[AgentKnowledge] = None,
         knowledge_filters: Optional[Dict[str, Any]] = None,
         enable_agentic_knowledge_filters: Optional[bool] = None,
@@ -443,6 +486,7 @@ class Agent:
         self.session_state = session_state
         self.search_previous_sessions_history = search_previous_sessions_history
         self.num_history_sessions = num_history_sessions
+        self.history_index = history_index
 
         self.cache_session = cache_session
 
@@ -456,11 +500,18 @@ class Agent:
         self.add_memory_references = add_memory_references
         self.enable_session_summaries = enable_session_summaries
         self.add_session_summary_references = add_session_summary_references
+        self.memory_processor = memory_processor
 
         self.add_history_to_messages = add_history_to_messages
         self.num_history_responses = num_history_responses
         self.num_history_runs = num_history_runs
 
+        self.context_budget = context_budget
+        self.max_context_tokens = max_context_tokens
+        self.num_recent_history_runs = num_recent_history_runs
+
+        self.response_cache = response_cache
+
         self.knowledge = knowledge
         self.knowledge_filters = knowledge_filters
         self.enable_agentic_knowledge_filters = enable_agentic_knowledge_filters
@@ -621,6 +672,9 @@ class Agent:
             log_info("Setting default model to OpenAI Chat")
             self.model = OpenAIChat(id="gpt-4o")
 
+        if self.response_cache is not None:
+            self.model.response_cache = self.response_cache
+
     def set_defaults(self) -> None:
         if self.add_memory_references is None:
             self.add_memory_references = self.enable_user_memories or self.enable_agentic_memory
@@ -936,6 +990,41 @@ class Agent:
 
         log_debug(f"Agent Run End: {run_response.run_id}", center=True, symbol="*")
 
+    def _cancellable_run_stream(
+        self,
+        response_iterator: Iterator[RunResponseEvent],
+        run_response: RunResponse,
+        cancellation_token: CancellationToken,
+    ) -> Iterator[RunResponseEvent]:
+        """Yield the events of a streamed run, ending it with a RunCancelled event if the run is cancelled."""
+        try:
+            yield from iterate_in_scope(response_iterator, cancellation_token)
+        except RunCancelledException as e:
+            self.run_response = self.create_run_response(
+                run_state=RunStatus.cancelled, content=str(e), run_response=run_response
+            )
+            yield create_run_response_cancelled_event(run_response, str(e))
+        finally:
+            close_run_cancellation_token(cancellation_token)
+
+    async def _acancellable_run_stream(
+        self,
+        response_iterator: AsyncIterator[RunResponseEvent],
+        run_response: RunResponse,
+        cancellation_token: CancellationToken,
+    ) -> AsyncIterator[RunResponseEvent]:
+        """Async version of `_cancellable_run_stream`."""
+        try:
+            async for event in aiterate_in_scope(response_iterator, cancellation_token):
+                yield event
+        except RunCancelledException as e:
+            self.run_response = self.create_run_response(
+                run_state=RunStatus.cancelled, content=str(e), run_response=run_response
+            )
+            yield create_run_response_cancelled_event(run_response, str(e))
+        finally:
+            close_run_cancellation_token(cancellation_token)
+
     @overload
     def run(
         self,
@@ -954,6 +1043,8 @@ class Agent:
         retries: Optional[int] = None,
         knowledge_filters: Optional[Dict[str, Any]] = None,
         refresh_session_before_write: Optional[bool] = False,
+        cancellation_token: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
         **kwargs: Any,
     ) -> RunResponse: ...
 
@@ -975,6 +1066,8 @@ class Agent:
         retries: Optional[int] = None,
         knowledge_filters: Optional[Dict[str, Any]] = None,
         refresh_session_before_write: Optional[bool] = False,
+        cancellation_token: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
         **kwargs: Any,
     ) -> Iterator[RunResponseEvent]: ...
 
@@ -995,189 +1088,217 @@ class Agent:
         retries: Optional[int] = None,
         knowledge_filters: Optional[Dict[str, Any]] = None,
         refresh_session_before_write: Optional[bool] = False,
+        cancellation_token: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
         **kwargs: Any,
     ) -> Union[RunResponse, Iterator[RunResponseEvent]]:
-        """Run the Agent and return the response."""
-        session_id, user_id = self._initialize_session(
-            session_id=session_id, user_id=user_id, session_state=session_state
-        )
+        """Run the Agent and return the response.
 
-        # Initialize the Agent
-        self.initialize_agent()
+        The run is cancelled when `cancellation_token` is cancelled or after `timeout` seconds,
+        together with its model requests, tool calls and member runs. A cancelled or timed out run does not raise:
+        it returns a response with the cancelled status, or ends its stream with a RunCancelled event.
+        """
+        cancellation_token = get_run_cancellation_token(cancellation_token, timeout)
+        # A streamed run closes its token when the stream ends
+        stream_owns_token = False
+        try:
+            session_id, user_id = self._initialize_session(
+                session_id=session_id, user_id=user_id, session_state=session_state
+            )
 
-        # Read existing session from storage
-        self.read_from_storage(session_id=session_id)
+            # Initialize the Agent
+            self.initialize_agent()
 
-        log_debug(f"Session ID: {session_id}", center=True)
+            # Read existing session from storage
+            self.read_from_storage(session_id=session_id)
 
-        # Initialize Knowledge Filters
-        effective_filters = knowledge_filters
+            log_debug(f"Session ID: {session_id}", center=True)
 
-        # When filters are passed manually
-        if self.knowledge_filters or knowledge_filters:
-            """
-                initialize metadata (specially required in case when load is commented out)
-                when load is not called the reader's document_lists won't be called and metadata filters won't be initialized
-                so we need to call initialize_valid_filters to make sure the filters are initialized
-            """
-            if not self.knowledge.valid_metadata_filters:  # type: ignore
-                self.knowledge.initialize_valid_filters()  # type: ignore
+            # Initialize Knowledge Filters
+            effective_filters = knowledge_filters
 
-            effective_filters = self._get_effective_filters(knowledge_filters)
+            # When filters are passed manually
+            if self.knowledge_filters or knowledge_filters:
+                """
+                    initialize metadata (specially required in case when load is commented out)
+                    when load is not called the reader's document_lists won't be called and metadata filters won't be initialized
+                    so we need to call initialize_valid_filters to make sure the filters are initialized
+                """
+                if not self.knowledge.valid_metadata_filters:  # type: ignore
+                    self.knowledge.initialize_valid_filters()  # type: ignore
 
-        # Agentic filters are enabled
-        if self.enable_agentic_knowledge_filters and not self.knowledge.valid_metadata_filters:  # type: ignore
-            # initialize metadata (specially required in case when load is commented out)
-            self.knowledge.initialize_valid_filters()  # type: ignore
+                effective_filters = self._get_effective_filters(knowledge_filters)
 
-        # Use stream override value when necessary
-        if stream is None:
-            stream = False if self.stream is None else self.stream
+            # Agentic filters are enabled
+            if self.enable_agentic_knowledge_filters and not self.knowledge.valid_metadata_filters:  # type: ignore
+                # initialize metadata (specially required in case when load is commented out)
+                self.knowledge.initialize_valid_filters()  # type: ignore
 
-        if stream_intermediate_steps is None:
-            stream_intermediate_steps = (
-                False if self.stream_intermediate_steps is None else self.stream_intermediate_steps
-            )
+            # Use stream override value when necessary
+            if stream is None:
+                stream = False if self.stream is None else self.stream
 
-        # Can't have stream_intermediate_steps if stream is False
-        if stream is False:
-            stream_intermediate_steps = False
+            if stream_intermediate_steps is None:
+                stream_intermediate_steps = (
+                    False if self.stream_intermediate_steps is None else self.stream_intermediate_steps
+                )
 
-        self.stream = self.stream or stream
-        self.stream_intermediate_steps = self.stream_intermediate_steps or (stream_intermediate_steps and self.stream)
+            # Can't have stream_intermediate_steps if stream is False
+            if stream is False:
+                stream_intermediate_steps = False
 
-        # Read existing session from storage
-        if self.context is not None:
-            self.resolve_run_context()
+            self.stream = self.stream or stream
+            self.stream_intermediate_steps = self.stream_intermediate_steps or (
+                stream_intermediate_steps and self.stream
+            )
 
-        # Prepare arguments for the model
-        self.set_default_model()
-        response_format = self._get_response_format() if self.parser_model is None else None
-        self.model = cast(Model, self.model)
+            # Read existing session from storage
+            if self.context is not None:
+                self.resolve_run_context()
+
+            # Prepare arguments for the model
+            self.set_default_model()
+            response_format = self._get_response_format() if self.parser_model is None else None
+            self.model = cast(Model, self.model)
+
+            self.determine_tools_for_model(
+                model=self.model,
+                session_id=session_id,
+                user_id=user_id,
+                async_mode=False,
+                knowledge_filters=effective_filters,
+            )
 
-        self.determine_tools_for_model(
-            model=self.model,
-            session_id=session_id,
-            user_id=user_id,
-            async_mode=False,
-            knowledge_filters=effective_filters,
-        )
+            # Create a run_id for this specific run
+            run_id = str(uuid4())
 
-        # Create a run_id for this specific run
-        run_id = str(uuid4())
+            # Create a new run_response for this attempt
+            run_response = RunResponse(
+                run_id=run_id,
+                session_id=session_id,
+                agent_id=self.agent_id,
+                agent_name=self.name,
+                team_session_id=self.team_session_id,
+            )
 
-        # Create a new run_response for this attempt
-        run_response = RunResponse(
-            run_id=run_id,
-            session_id=session_id,
-            agent_id=self.agent_id,
-            agent_name=self.name,
-            team_session_id=self.team_session_id,
-        )
+            run_response.model = self.model.id if self.model is not None else None
+            run_response.model_provider = self.model.provider if self.model is not None else None
 
-        run_response.model = self.model.id if self.model is not None else None
-        run_response.model_provider = self.model.provider if self.model is not None else None
+            self.run_response = run_response
+            self.run_id = run_id
 
-        self.run_response = run_response
-        self.run_id = run_id
+            # If no retries are set, use the agent's default retries
+            retries = retries if retries is not None else self.retries
 
-        # If no retries are set, use the agent's default retries
-        retries = retries if retries is not None else self.retries
+            last_exception = None
+            num_attempts = retries + 1
 
-        last_exception = None
-        num_attempts = retries + 1
+            for attempt in range(num_attempts):
+                try:
+                    # Set run_input
+                    if message is not None:
+                        if isinstance(message, str):
+                            self.run_input = message
+                        elif isinstance(message, Message):
+                            self.run_input = message.to_dict()
+                        else:
+                            self.run_input = message
+                    elif messages is not None:
+                        self.run_input = [m.to_dict() if isinstance(m, Message) else m for m in messages]
 
-        for attempt in range(num_attempts):
-            try:
-                # Set run_input
-                if message is not None:
-                    if isinstance(message, str):
-                        self.run_input = message
-                    elif isinstance(message, Message):
-                        self.run_input = message.to_dict()
+                    # Prepare run messages
+                    run_messages: RunMessages = self.get_run_messages(
+                        message=message,
+                        session_id=session_id,
+                        user_id=user_id,
+                        audio=audio,
+                        images=images,
+                        videos=videos,
+                        files=files,
+                        messages=messages,
+                        knowledge_filters=effective_filters,
+                        **kwargs,
+                    )
+                    if len(run_messages.messages) == 0:
+                        log_error("No messages to be sent to the model.")
+
+                    self.run_messages = run_messages
+
+                    if stream:
+                        response_iterator = self._run_stream(
+                            run_response=run_response,
+                            run_messages=run_messages,
+                            user_id=user_id,
+                            session_id=session_id,
+                            response_format=response_format,
+                            stream_intermediate_steps=stream_intermediate_steps,
+                            refresh_session_before_write=refresh_session_before_write,
+                        )
+                        if cancellation_token is not None:
+                            stream_owns_token = True
+                            return self._cancellable_run_stream(response_iterator, run_response, cancellation_token)
+                        return response_iterator
                     else:
-                        self.run_input = message
-                elif messages is not None:
-                    self.run_input = [m.to_dict() if isinstance(m, Message) else m for m in messages]
-
-                # Prepare run messages
-                run_messages: RunMessages = self.get_run_messages(
-                    message=message,
-                    session_id=session_id,
-                    user_id=user_id,
-                    audio=audio,
-                    images=images,
-                    videos=videos,
-                    files=files,
-                    messages=messages,
-                    knowledge_filters=effective_filters,
-                    **kwargs,
-                )
-                if len(run_messages.messages) == 0:
-                    log_error("No messages to be sent to the model.")
-
-                self.run_messages = run_messages
+                        with cancellation_scope(cancellation_token):
+                            response = self._run(
+                                run_response=run_response,
+                                run_messages=run_messages,
+                                user_id=user_id,
+                                session_id=session_id,
+                                response_format=response_format,
+                                refresh_session_before_write=refresh_session_before_write,
+                            )
+                        return response
+                except ModelProviderError as e:
+                    log_warning(f"Attempt {attempt + 1}/{num_attempts} failed: {str(e)}")
+                    if isinstance(e, StopAgentRun):
+                        raise e
+                    last_exception = e
+                    if attempt < num_attempts - 1:  # Don't sleep on the last attempt
+                        if self.exponential_backoff:
+                            delay = 2**attempt * self.delay_between_retries
+                        else:
+                            delay = self.delay_between_retries
+                        import time
 
-                if stream:
-                    response_iterator = self._run_stream(
-                        run_response=run_response,
-                        run_messages=run_messages,
-                        user_id=user_id,
-                        session_id=session_id,
-                        response_format=response_format,
-                        stream_intermediate_steps=stream_intermediate_steps,
-                        refresh_session_before_write=refresh_session_before_write,
+                        time.sleep(delay)
+                except KeyboardInterrupt:
+                    self.run_response = self.create_run_response(
+                        run_state=RunStatus.cancelled, content="Operation cancelled by user", run_response=run_response
                     )
-                    return response_iterator
-                else:
-                    response = self._run(
-                        run_response=run_response,
-                        run_messages=run_messages,
-                        user_id=user_id,
-                        session_id=session_id,
-                        response_format=response_format,
-                        refresh_session_before_write=refresh_session_before_write,
+                    if stream:
+                        return generator_wrapper(  # type: ignore
+                            create_run_response_cancelled_event(run_response, "Operation cancelled by user")
+                        )
+                    else:
+                        return self.run_response
+                except RunCancelledException as e:
+                    self.run_response = self.create_run_response(
+                        run_state=RunStatus.cancelled, content=str(e), run_response=run_response
                     )
-                    return response
-            except ModelProviderError as e:
-                log_warning(f"Attempt {attempt + 1}/{num_attempts} failed: {str(e)}")
-                if isinstance(e, StopAgentRun):
-                    raise e
-                last_exception = e
-                if attempt < num_attempts - 1:  # Don't sleep on the last attempt
-                    if self.exponential_backoff:
-                        delay = 2**attempt * self.delay_between_retries
+                    if stream:
+                        return generator_wrapper(create_run_response_cancelled_event(run_response, str(e)))  # type: ignore
                     else:
-                        delay = self.delay_between_retries
-                    import time
+                        return self.run_response
+                finally:
+                    self._reset_session_state()
 
-                    time.sleep(delay)
-            except KeyboardInterrupt:
-                self.run_response = self.create_run_response(
-                    run_state=RunStatus.cancelled, content="Operation cancelled by user", run_response=run_response
+            # If we get here, all retries failed
+            if last_exception is not None:
+                log_error(
+                    f"Failed after {num_attempts} attempts. Last error using {last_exception.model_name}({last_exception.model_id})"
                 )
                 if stream:
-                    return generator_wrapper(  # type: ignore
-                        create_run_response_cancelled_event(run_response, "Operation cancelled by user")
-                    )
-                else:
-                    return self.run_response
-            finally:
-                self._reset_session_state()
-
-        # If we get here, all retries failed
-        if last_exception is not None:
-            log_error(
-                f"Failed after {num_attempts} attempts. Last error using {last_exception.model_name}({last_exception.model_id})"
-            )
-            if stream:
-                return generator_wrapper(create_run_response_error_event(run_response, error=str(last_exception)))  # type: ignore
+                    return generator_wrapper(create_run_response_error_event(run_response, error=str(last_exception)))  # type: ignore
 
-            raise last_exception
-        else:
-            if stream:
-                return generator_wrapper(create_run_response_error_event(run_response, error=str(last_exception)))  # type: ignore
-            raise Exception(f"Failed after {num_attempts} attempts.")
+                raise last_exception
+            else:
+                if stream:
+                    return generator_wrapper(create_run_response_error_event(run_response, error=str(last_exception)))  # type: ignore
+                raise Exception(f"Failed after {num_attempts} attempts.")
+        finally:
+            if not stream_owns_token:
+                close_run_cancellation_token(cancellation_token)
 
     async def _arun(
         self,
@@ -1253,7 +1374,9 @@ class Agent:
         self._convert_response_to_structured_format(run_response)
 
         # 6. Save session to storage
-        self.write_to_storage(user_id=user_id, session_id=session_id, refresh_session=refresh_session_before_write)
+        await self.awrite_to_storage(
+            user_id=user_id, session_id=session_id, refresh_session=refresh_session_before_write
+        )
 
         # 7. Save output to file if save_response_to_file is set
         self.save_run_response_to_file(message=run_messages.user_message, session_id=session_id)
@@ -1349,7 +1472,9 @@ class Agent:
             yield self._handle_event(create_run_response_completed_event(from_run_response=run_response), run_response)
 
         # 7. Save session to storage
-        self.write_to_storage(user_id=user_id, session_id=session_id, refresh_session=refresh_session_before_write)
+        await self.awrite_to_storage(
+            user_id=user_id, session_id=session_id, refresh_session=refresh_session_before_write
+        )
 
         # Log Agent Run
         await self._alog_agent_run(user_id=user_id, session_id=session_id)
@@ -1373,189 +1498,223 @@ class Agent:
         retries: Optional[int] = None,
         knowledge_filters: Optional[Dict[str, Any]] = None,
         refresh_session_before_write: Optional[bool] = False,
+        cancellation_token: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
         **kwargs: Any,
     ) -> Any:
-        """Async Run the Agent and return the response."""
+        """Async Run the Agent and return the response.
 
-        session_id, user_id = self._initialize_session(
-            session_id=session_id, user_id=user_id, session_state=session_state
-        )
+        The run is cancelled when `cancellation_token` is cancelled or after `timeout` seconds,
+        together with its model requests, tool calls and member runs. A cancelled or timed out run does not raise:
+        it returns a response with the cancelled status, or ends its stream with a RunCancelled event.
+        """
+        cancellation_token = get_run_cancellation_token(cancellation_token, timeout)
+        # A streamed run closes its token when the stream ends
+        stream_owns_token = False
+        try:
+            session_id, user_id = self._initialize_session(
+                session_id=session_id, user_id=user_id, session_state=session_state
+            )
 
-        log_debug(f"Session ID: {session_id}", center=True)
+            log_debug(f"Session ID: {session_id}", center=True)
 
-        # Initialize the Agent
-        self.initialize_agent()
+            # Initialize the Agent
+            self.initialize_agent()
 
-        # Read existing session from storage
-        self.read_from_storage(session_id=session_id)
+            # Read existing session from storage
+            await self.aread_from_storage(session_id=session_id)
 
-        effective_filters = knowledge_filters
-        # When filters are passed manually
-        if self.knowledge_filters or knowledge_filters:
-            """
-                initialize metadata (specially required in case when load is commented out)
-                when load is not called the reader's document_lists won't be called and metadata filters won't be initialized
-                so we need to call initialize_valid_filters to make sure the filters are initialized
-            """
-            if not self.knowledge.valid_metadata_filters:  # type: ignore
-                self.knowledge.initialize_valid_filters()  # type: ignore
+            effective_filters = knowledge_filters
+            # When filters are passed manually
+            if self.knowledge_filters or knowledge_filters:
+                """
+                    initialize metadata (specially required in case when load is commented out)
+                    when load is not called the reader's document_lists won't be called and metadata filters won't be initialized
+                    so we need to call initialize_valid_filters to make sure the filters are initialized
+                """
+                if not self.knowledge.valid_metadata_filters:  # type: ignore
+                    self.knowledge.initialize_valid_filters()  # type: ignore
 
-            effective_filters = self._get_effective_filters(knowledge_filters)
+                effective_filters = self._get_effective_filters(knowledge_filters)
 
-        # Agentic filters are enabled
-        if self.enable_agentic_knowledge_filters and not self.knowledge.valid_metadata_filters:  # type: ignore
-            # initialize metadata (specially required in case when load is commented out)
-            self.knowledge.initialize_valid_filters()  # type: ignore
+            # Agentic filters are enabled
+            if self.enable_agentic_knowledge_filters and not self.knowledge.valid_metadata_filters:  # type: ignore
+                # initialize metadata (specially required in case when load is commented out)
+                self.knowledge.initialize_valid_filters()  # type: ignore
 
-        # Use stream override value when necessary
-        if stream is None:
-            stream = False if self.stream is None else self.stream
+            # Use stream override value when necessary
+            if stream is None:
+                stream = False if self.stream is None else self.stream
 
-        if stream_intermediate_steps is None:
-            stream_intermediate_steps = (
-                False if self.stream_intermediate_steps is None else self.stream_intermediate_steps
-            )
+            if stream_intermediate_steps is None:
+                stream_intermediate_steps = (
+                    False if self.stream_intermediate_steps is None else self.stream_intermediate_steps
+                )
 
-        # Can't have stream_intermediate_steps if stream is False
-        if stream is False:
-            stream_intermediate_steps = False
+            # Can't have stream_intermediate_steps if stream is False
+            if stream is False:
+                stream_intermediate_steps = False
 
-        self.stream = self.stream or stream
-        self.stream_intermediate_steps = self.stream_intermediate_steps or (stream_intermediate_steps and self.stream)
+            self.stream = self.stream or stream
+            self.stream_intermediate_steps = self.stream_intermediate_steps or (
+                stream_intermediate_steps and self.stream
+            )
 
-        # Read existing session from storage
-        if self.context is not None:
-            self.resolve_run_context()
+            # Read existing session from storage
+            if self.context is not None:
+                self.resolve_run_context()
+
+            # Prepare arguments for the model
+            self.set_default_model()
+            response_format = self._get_response_format() if self.parser_model is None else None
+            self.model = cast(Model, self.model)
+
+            self.determine_tools_for_model(
+                model=self.model,
+                session_id=session_id,
+                user_id=user_id,
+                async_mode=True,
+                knowledge_filters=effective_filters,
+            )
 
-        # Prepare arguments for the model
-        self.set_default_model()
-        response_format = self._get_response_format() if self.parser_model is None else None
-        self.model = cast(Model, self.model)
+            # Create a run_id for this specific run
+            run_id = str(uuid4())
 
-        self.determine_tools_for_model(
-            model=self.model,
-            session_id=session_id,
-            user_id=user_id,
-            async_mode=True,
-            knowledge_filters=effective_filters,
-        )
+            # Create a new run_response for this attempt
+            run_response = RunResponse(
+                run_id=run_id,
+                session_id=session_id,
+                agent_id=self.agent_id,
+                agent_name=self.name,
+                team_session_id=self.team_session_id,
+            )
 
-        # Create a run_id for this specific run
-        run_id = str(uuid4())
+            run_response.model = self.model.id if self.model is not None else None
+            run_response.model_provider = self.model.provider if self.model is not None else None
 
-        # Create a new run_response for this attempt
-        run_response = RunResponse(
-            run_id=run_id,
-            session_id=session_id,
-            agent_id=self.agent_id,
-            agent_name=self.name,
-            team_session_id=self.team_session_id,
-        )
+            self.run_response = run_response
+            self.run_id = run_id
 
-        run_response.model = self.model.id if self.model is not None else None
-        run_response.model_provider = self.model.provider if self.model is not None else None
+            # If no retries are set, use the agent's default retries
+            retries = retries if retries is not None else self.retries
 
-        self.run_response = run_response
-        self.run_id = run_id
+            last_exception = None
+            num_attempts = retries + 1
 
-        # If no retries are set, use the agent's default retries
-        retries = retries if retries is not None else self.retries
+            for attempt in range(num_attempts):
+                try:
+                    # Set run_input
+                    if message is not None:
+                        if isinstance(message, str):
+                            self.run_input = message
+                        elif isinstance(message, Message):
+                            self.run_input = message.to_dict()
+                        else:
+                            self.run_input = message
+                    elif messages is not None:
+                        self.run_input = [m.to_dict() if isinstance(m, Message) else m for m in messages]
 
-        last_exception = None
-        num_attempts = retries + 1
+                    # Prepare run messages
+                    run_messages: RunMessages = self.get_run_messages(
+                        message=message,
+                        session_id=session_id,
+                        user_id=user_id,
+                        audio=audio,
+                        images=images,
+                        videos=videos,
+                        files=files,
+                        messages=messages,
+                        knowledge_filters=effective_filters,
+                        **kwargs,
+                    )
+                    if len(run_messages.messages) == 0:
+                        log_error("No messages to be sent to the model.")
+
+                    self.run_messages = run_messages
+
+                    # Pass the new run_response to _arun
+                    if stream:
+                        response_iterator = self._arun_stream(
+                            run_response=run_response,
+                            run_messages=run_messages,
+                            user_id=user_id,
+                            session_id=session_id,
+                            response_format=response_format,
+                            stream_intermediate_steps=stream_intermediate_steps,
+                            refresh_session_before_write=refresh_session_before_write,
+                        )  # type: ignore[assignment]
+                        if cancellation_token is not None:
+                            stream_owns_token = True
+                            return self._acancellable_run_stream(response_iterator, run_response, cancellation_token)
+                        return response_iterator
+                    else:
+                        run_coroutine = self._arun(
+                            run_response=run_response,
+                            run_messages=run_messages,
+                            user_id=user_id,
+                            session_id=session_id,
+                            response_format=response_format,
+                            refresh_session_before_write=refresh_session_before_write,
+                        )
+                        if cancellation_token is None:
+                            return await run_coroutine
+                        with cancellation_scope(cancellation_token):
+                            # The run is a task in the cancellation scope, cancelled with the token
+                            return await cancellation_token.acall(run_coroutine)
+                except ModelProviderError as e:
+                    log_warning(f"Attempt {attempt + 1}/{num_attempts} failed: {str(e)}")
+                    if isinstance(e, StopAgentRun):
+                        raise e
+                    last_exception = e
+                    if attempt < num_attempts - 1:  # Don't sleep on the last attempt
+                        if self.exponential_backoff:
+                            delay = 2**attempt * self.delay_between_retries
+                        else:
+                            delay = self.delay_between_retries
+                        import time
 
-        for attempt in range(num_attempts):
-            try:
-                # Set run_input
-                if message is not None:
-                    if isinstance(message, str):
-                        self.run_input = message
-                    elif isinstance(message, Message):
-                        self.run_input = message.to_dict()
+                        time.sleep(delay)
+                except KeyboardInterrupt:
+                    self.run_response = self.create_run_response(
+                        run_state=RunStatus.cancelled, content="Operation cancelled by user", run_response=run_response
+                    )
+                    if stream:
+                        return async_generator_wrapper(
+                            create_run_response_cancelled_event(run_response, "Operation cancelled by user")
+                        )
                     else:
-                        self.run_input = message
-                elif messages is not None:
-                    self.run_input = [m.to_dict() if isinstance(m, Message) else m for m in messages]
+                        return self.run_response
+                except RunCancelledException as e:
+                    self.run_response = self.create_run_response(
+                        run_state=RunStatus.cancelled, content=str(e), run_response=run_response
+                    )
+                    if stream:
+                        return async_generator_wrapper(create_run_response_cancelled_event(run_response, str(e)))
+                    else:
+                        return self.run_response
+                finally:
+                    self._reset_session_state()
 
-                # Prepare run messages
-                run_messages: RunMessages = self.get_run_messages(
-                    message=message,
-                    session_id=session_id,
-                    user_id=user_id,
-                    audio=audio,
-                    images=images,
-                    videos=videos,
-                    files=files,
-                    messages=messages,
-                    knowledge_filters=effective_filters,
-                    **kwargs,
+            # If we get here, all retries failed
+            if last_exception is not None:
+                log_error(
+                    f"Failed after {num_attempts} attempts. Last error using {last_exception.model_name}({last_exception.model_id})"
                 )
-                if len(run_messages.messages) == 0:
-                    log_error("No messages to be sent to the model.")
-
-                self.run_messages = run_messages
 
-                # Pass the new run_response to _arun
                 if stream:
-                    response_iterator = self._arun_stream(
-                        run_response=run_response,
-                        run_messages=run_messages,
-                        user_id=user_id,
-                        session_id=session_id,
-                        response_format=response_format,
-                        stream_intermediate_steps=stream_intermediate_steps,
-                        refresh_session_before_write=refresh_session_before_write,
-                    )  # type: ignore[assignment]
-                    return response_iterator
-                else:
-                    response = await self._arun(
-                        run_response=run_response,
-                        run_messages=run_messages,
-                        user_id=user_id,
-                        session_id=session_id,
-                        response_format=response_format,
-                        refresh_session_before_write=refresh_session_before_write,
+                    return async_generator_wrapper(
+                        create_run_response_error_event(run_response, error=str(last_exception))
                     )
-                    return response
-            except ModelProviderError as e:
-                log_warning(f"Attempt {attempt + 1}/{num_attempts} failed: {str(e)}")
-                if isinstance(e, StopAgentRun):
-                    raise e
-                last_exception = e
-                if attempt < num_attempts - 1:  # Don't sleep on the last attempt
-                    if self.exponential_backoff:
-                        delay = 2**attempt * self.delay_between_retries
-                    else:
-                        delay = self.delay_between_retries
-                    import time
-
-                    time.sleep(delay)
-            except KeyboardInterrupt:
-                self.run_response = self.create_run_response(
-                    run_state=RunStatus.cancelled, content="Operation cancelled by user", run_response=run_response
-                )
+                raise last_exception
+            else:
                 if stream:
                     return async_generator_wrapper(
-                        create_run_response_cancelled_event(run_response, "Operation cancelled by user")
+                        create_run_response_error_event(run_response, error=str(last_exception))
                     )
-                else:
-                    return self.run_response
-            finally:
-                self._reset_session_state()
-
-        # If we get here, all retries failed
-        if last_exception is not None:
-            log_error(
-                f"Failed after {num_attempts} attempts. Last error using {last_exception.model_name}({last_exception.model_id})"
-            )
-
-            if stream:
-                return async_generator_wrapper(create_run_response_error_event(run_response, error=str(last_exception)))
-            raise last_exception
-        else:
-            if stream:
-                return async_generator_wrapper(create_run_response_error_event(run_response, error=str(last_exception)))
-            raise Exception(f"Failed after {num_attempts} attempts.")
+                raise Exception(f"Failed after {num_attempts} attempts.")
+        finally:
+            if not stream_owns_token:
+                close_run_cancellation_token(cancellation_token)
 
     @overload
     def continue_run(
@@ -2071,7 +2230,7 @@ class Agent:
         self.stream_intermediate_steps = self.stream_intermediate_steps or (stream_intermediate_steps and self.stream)
 
         # Read existing session from storage
-        self.read_from_storage(session_id=session_id)
+        await self.aread_from_storage(session_id=session_id)
 
         # Run can be continued from previous run response or from passed run_response context
         if run_response is not None:
@@ -2282,7 +2441,7 @@ class Agent:
         self._convert_response_to_structured_format(run_response)
 
         # 6. Save session to storage
-        self.write_to_storage(user_id=user_id, session_id=session_id)
+        await self.awrite_to_storage(user_id=user_id, session_id=session_id)
 
         # 7. Save output to file if save_response_to_file is set
         self.save_run_response_to_file(message=run_messages.user_message, session_id=session_id)
@@ -2372,7 +2531,7 @@ class Agent:
             yield self._handle_event(create_run_response_completed_event(run_response), run_response)
 
         # 7. Save session to storage
-        self.write_to_storage(user_id=user_id, session_id=session_id)
+        await self.awrite_to_storage(user_id=user_id, session_id=session_id)
 
         # Log Agent Run
         await self._alog_agent_run(user_id=user_id, session_id=session_id)
@@ -3419,6 +3578,58 @@ class Agent:
             rr.model = model
         return rr
 
+    def _enqueue_memories_and_summaries(
+        self,
+        run_messages: RunMessages,
+        session_id: str,
+        user_id: Optional[str] = None,
+    ) -> None:
+        """Enqueue the user memories and session summary of the run to the memory processor"""
+        self.memory_processor = cast("MemoryProcessor", self.memory_processor)
+
+        messages: List[Message] = []
+        if self.enable_user_memories:
+            if run_messages.user_message is not None:
+                messages.append(run_messages.user_message)
+            for _im in run_messages.extra_messages or []:
+                if isinstance(_im, Message):
+                    messages.append(_im)
+                elif isinstance(_im, dict):
+                    try:
+                        messages.append(Message(**_im))
+                    except Exception as e:
+                        log_warning(f"Failed to validate message during memory update: {e}")
+                else:
+                    log_warning(f"Unsupported message type: {type(_im)}")
+
+        if messages or self.enable_session_summaries:
+            log_debug("Enqueuing user memories and session summary.")
+            self.memory_processor.enqueue(
+                session_id=session_id,
+                user_id=user_id,
+                messages=messages,
+                create_session_summary=self.enable_session_summaries,
+                memory=cast(Memory, self.memory),
+                on_summary=lambda summary: self._save_session_summary(session_id, user_id, summary),
+            )
+
+    def _save_session_summary(self, session_id: str, user_id: Optional[str], summary: SessionSummary) -> None:
+        """Save a session summary created by the memory processor to the session in storage.
+
+        The summary is created after the run saved its session, and would otherwise be replaced by the stored
+        summaries when the session is loaded again.
+        """
+        if self.storage is None:
+            return
+        with session_lock(session_id):
+            session = self.storage.read(session_id=session_id)
+            if not isinstance(session, (AgentSession, TeamSession)):
+                return
+            session.memory = dict(session.memory or {})
+            summaries = session.memory.setdefault("summaries", {}).setdefault(user_id or "default", {})
+            summaries[session_id] = summary.to_dict()
+            self.storage.upsert(session=session)
+
     def _make_memories_and_summaries(
         self,
         run_messages: RunMessages,
@@ -3427,6 +3638,10 @@ class Agent:
     ) -> Iterator[RunResponseEvent]:
         from concurrent.futures import ThreadPoolExecutor, as_completed
 
+        if self.memory_processor is not None:
+            self._enqueue_memories_and_summaries(run_messages, session_id, user_id)
+            return
+
         self.run_response = cast(RunResponse, self.run_response)
         self.memory = cast(Memory, self.memory)
 
@@ -3501,6 +3716,10 @@ class Agent:
         session_id: str,
         user_id: Optional[str] = None,
     ) -> AsyncIterator[RunResponseEvent]:
+        if self.memory_processor is not None:
+            self._enqueue_memories_and_summaries(run_messages, session_id, user_id)
+            return
+
         self.run_response = cast(RunResponse, self.run_response)
         self.memory = cast(Memory, self.memory)
         tasks = []
@@ -3641,11 +3860,15 @@ class Agent:
             agent_tools.append(self.get_tool_call_history_function(session_id=session_id))
             self._rebuild_tools = True
         if self.search_previous_sessions_history:
-            agent_tools.append(
-                self.get_previous_sessions_messages_function(
-                    num_history_sessions=self.num_history_sessions, user_id=user_id
+            if self.history_index is not None:
+                agent_tools.append(self.get_search_previous_sessions_function(user_id=user_id))
+                agent_tools.append(self.get_previous_tool_calls_function(user_id=user_id))
+            else:
+                agent_tools.append(
+                    self.get_previous_sessions_messages_function(
+                        num_history_sessions=self.num_history_sessions, user_id=user_id
+                    )
                 )
-            )
             self._rebuild_tools = True
 
         if isinstance(self.memory, AgentMemory) and self.memory.create_user_memories:
@@ -4189,6 +4412,18 @@ class Agent:
             return
 
         agent_session_from_db = self.storage.read(session_id=session_id)  # type: ignore
+        self._merge_runs_from_session(session_id=session_id, agent_session_from_db=agent_session_from_db)
+
+    async def arefresh_from_storage(self, session_id: str) -> None:
+        """Async version of `refresh_from_storage`."""
+        if not self.storage:
+            return
+
+        agent_session_from_db = await self.storage.aread(session_id=session_id)
+        self._merge_runs_from_session(session_id=session_id, agent_session_from_db=agent_session_from_db)
+
+    def _merge_runs_from_session(self, session_id: str, agent_session_from_db: Optional[Session]) -> None:
+        """Add the runs of a session read from storage that are not in memory yet."""
         if (
             agent_session_from_db is not None
             and agent_session_from_db.memory is not None  # type: ignore
@@ -4229,10 +4464,49 @@ class Agent:
             if refresh_session:
                 self.refresh_from_storage(session_id=session_id)
 
-            self.agent_session = cast(
-                AgentSession,
-                self.storage.upsert(session=self.get_agent_session(session_id=session_id, user_id=user_id)),
-            )
+            with session_lock(session_id):
+                self.agent_session = cast(
+                    AgentSession,
+                    self.storage.upsert(session=self.get_agent_session(session_id=session_id, user_id=user_id)),
+                )
+            if self.history_index is not None and self.agent_session is not None:
+                try:
+                    self.history_index.index_session(self.agent_session)
+                except Exception as e:
+                    log_warning(f"Error indexing session history: {e}")
+
+        if not self.cache_session:
+            if self.memory is not None and self.memory.runs is not None and session_id in self.memory.runs:
+                self.memory.runs.pop(session_id)  # type: ignore
+
+        return self.agent_session
+
+    async def aread_from_storage(self, session_id: str) -> Optional[AgentSession]:
+        """Async version of `read_from_storage`, which does not block the event loop on storage I/O."""
+        if self.storage is not None:
+            self.agent_session = cast(AgentSession, await self.storage.aread(session_id=session_id))
+            if self.agent_session is not None:
+                self.load_agent_session(session=self.agent_session)
+        return self.agent_session
+
+    async def awrite_to_storage(
+        self, session_id: str, user_id: Optional[str] = None, refresh_session: Optional[bool] = False
+    ) -> Optional[AgentSession]:
+        """Async version of `write_to_storage`, which does not block the event loop on storage I/O."""
+        if self.storage is not None:
+            if refresh_session:
+                await self.arefresh_from_storage(session_id=session_id)
+
+            async with asession_lock(session_id):
+                self.agent_session = cast(
+                    AgentSession,
+                    await self.storage.aupsert(session=self.get_agent_session(session_id=session_id, user_id=user_id)),
+                )
+            if self.history_index is not None and self.agent_session is not None:
+                try:
+                    await self.history_index.aindex_session(self.agent_session)
+                except Exception as e:
+                    log_warning(f"Error indexing session history: {e}")
 
         if not self.cache_session:
             if self.memory is not None and self.memory.runs is not None and session_id in self.memory.runs:
@@ -4666,6 +4940,7 @@ class Agent:
         videos: Optional[Sequence[Video]] = None,
         files: Optional[Sequence[File]] = None,
         knowledge_filters: Optional[Dict[str, Any]] = None,
+        references_token_budget: Optional[int] = None,
         **kwargs: Any,
     ) -> Optional[Message]:
         """Return the user message for the Agent.
@@ -4673,6 +4948,8 @@ class Agent:
         1. If the user_message is provided, use that.
         2. If create_default_user_message is False or if the message is a list, return the message as is.
         3. Build the default user message for the Agent
+
+        If references_token_budget is set, references that do not fit the budget are left out.
         """
         # Get references from the knowledge base to use in the user message
         references = None
@@ -4794,10 +5071,14 @@ class Agent:
             and references.references is not None
             and len(references.references) > 0
         ):
-            user_msg_content_str += "\n\nUse the following references from the knowledge base if it helps:\n"
-            user_msg_content_str += "<references>\n"
-            user_msg_content_str += self.convert_documents_to_string(references.references) + "\n"
-            user_msg_content_str += "</references>"
+            references_to_add = references.references
+            if references_token_budget is not None:
+                references_to_add = self._fit_references_to_budget(references_to_add, references_token_budget)
+            if len(references_to_add) > 0:
+                user_msg_content_str += "\n\nUse the following references from the knowledge base if it helps:\n"
+                user_msg_content_str += "<references>\n"
+                user_msg_content_str += self.convert_documents_to_string(references_to_add) + "\n"
+                user_msg_content_str += "</references>"
         # 4.2 Add context to user message
         if self.add_context and self.context is not None:
             user_msg_content_str += "\n\n<context>\n"
@@ -4859,6 +5140,7 @@ class Agent:
         # Initialize the RunMessages object
         run_messages = RunMessages()
         self.run_response = cast(RunResponse, self.run_response)
+        token_budget = self.get_context_token_budget()
 
         # 1. Add system message to run_messages
         system_message = self.get_system_message(session_id=session_id, user_id=user_id)
@@ -4897,6 +5179,11 @@ class Agent:
                         self.run_response.extra_data.add_messages.extend(messages_to_add_to_run_response)
 
         # 3. Add history to run_messages
+        # With a context budget, history is added once the other messages are known
+        history_index = len(run_messages.messages)
+        recent_history: List[List[Message]] = []
+        older_history: List[List[Message]] = []
+        references_token_budget: Optional[int] = None
         if self.add_history_to_messages:
             from copy import deepcopy
 
@@ -4922,9 +5209,24 @@ class Agent:
                 for _msg in history_copy:
                     _msg.from_history = True
 
-                log_debug(f"Adding {len(history_copy)} messages from history")
-
-                run_messages.messages += history_copy
+                if token_budget is None:
+                    log_debug(f"Adding {len(history_copy)} messages from history")
+                    run_messages.messages += history_copy
+                else:
+                    turns = self._group_history_turns(history_copy)
+                    split_index = max(len(turns) - self.num_recent_history_runs, 0)
+                    older_history = turns[:split_index]
+                    recent_history = turns[split_index:]
+
+        if token_budget is not None:
+            # Recent history has priority over the references, which have priority over older history
+            tokens_used = count_messages_tokens(run_messages.messages, self.model.id if self.model else None)
+            if isinstance(message, str):
+                tokens_used += count_tokens(message, self.model.id if self.model else None)
+            recent_history, recent_history_tokens = self._fit_history_to_budget(
+                recent_history, token_budget - tokens_used
+            )
+            references_token_budget = max(token_budget - tokens_used - recent_history_tokens, 0)
 
         # 4.Add user message to run_messages
         user_message: Optional[Message] = None
@@ -4937,6 +5239,7 @@ class Agent:
                 videos=videos,
                 files=files,
                 knowledge_filters=knowledge_filters,
+                references_token_budget=references_token_budget,
                 **kwargs,
             )
         # 4.2 If message is provided as a Message, use it directly
@@ -4978,8 +5281,80 @@ class Agent:
                     except Exception as e:
                         log_warning(f"Failed to validate message: {e}")
 
+        # 6. Add the history that fits the context budget
+        if token_budget is not None:
+            tokens_used = count_messages_tokens(run_messages.messages, self.model.id if self.model else None)
+            recent_history_tokens = count_messages_tokens(
+                [m for turn in recent_history for m in turn], self.model.id if self.model else None
+            )
+            older_history, _ = self._fit_history_to_budget(
+                older_history, token_budget - tokens_used - recent_history_tokens
+            )
+            history_to_add = [m for turn in older_history + recent_history for m in turn]
+            if len(history_to_add) > 0:
+                log_debug(f"Adding {len(history_to_add)} messages from history")
+                run_messages.messages[history_index:history_index] = history_to_add
+            total_tokens = tokens_used + count_messages_tokens(history_to_add, self.model.id if self.model else None)
+            if total_tokens > token_budget:
+                log_warning(f"Messages use {total_tokens} tokens, more than the context budget of {token_budget}")
+            else:
+                log_debug(f"Messages use {total_tokens} of {token_budget} tokens")
+
         return run_messages
 
+    def get_context_token_budget(self) -> Optional[int]:
+        """Return the maximum number of input tokens sent to the Model, or None if context_budget is disabled."""
+        if not self.context_budget:
+            return None
+        if self.max_context_tokens is not None:
+            return self.max_context_tokens
+        if self.model is None:
+            return None
+        return get_input_token_budget(self.model)
+
+    def _group_history_turns(self, history: List[Message]) -> List[List[Message]]:
+        """Group history messages into turns, each starting at a user message.
+
+        Turns are added or left out as a whole so tool calls stay paired with their results.
+        """
+        turns: List[List[Message]] = []
+        for history_message in history:
+            if history_message.role == self.user_message_role or len(turns) == 0:
+                turns.append([history_message])
+            else:
+                turns[-1].append(history_message)
+        return turns
+
+    def _fit_history_to_budget(self, turns: List[List[Message]], max_tokens: int) -> Tuple[List[List[Message]], int]:
+        """Keep the most recent history turns that fit in max_tokens. Returns the kept turns and their token count."""
+        kept: List[List[Message]] = []
+        tokens_used = 0
+        for turn in reversed(turns):
+            turn_tokens = count_messages_tokens(turn, self.model.id if self.model else None)
+            if tokens_used + turn_tokens > max_tokens:
+                log_debug(f"Leaving out {len(turns) - len(kept)} history turns to fit the context budget")
+                break
+            kept.insert(0, turn)
+            tokens_used += turn_tokens
+        return kept, tokens_used
+
+    def _fit_references_to_budget(
+        self, references: List[Union[Dict[str, Any], str]], max_tokens: int
+    ) -> List[Union[Dict[str, Any], str]]:
+        """Keep the highest ranked references that fit in max_tokens."""
+        kept: List[Union[Dict[str, Any], str]] = []
+        tokens_used = 0
+        for reference in references:
+            reference_tokens = count_tokens(
+                self.convert_documents_to_string([reference]), self.model.id if self.model else None
+            )
+            if tokens_used + reference_tokens > max_tokens:
+                log_debug(f"Leaving out {len(references) - len(kept)} references to fit the context budget")
+                break
+            kept.append(reference)
+            tokens_used += reference_tokens
+        return kept
+
     def get_continue_run_messages(
         self,
         messages: List[Message],
@@ -7972,6 +8347,50 @@ class Agent:
 
         return get_previous_session_messages
 
+    def get_search_previous_sessions_function(self, user_id: Optional[str] = None) -> Callable:
+        """Factory function to create a search_previous_sessions function backed by the history index."""
+
+        def search_previous_sessions(query: str, num_results: int = 5) -> str:
+            """Use this function to search the messages of previous chat sessions by content.
+
+            Args:
+                query: The words to search for in previous messages.
+                num_results: The number of messages to return. Default: 5
+
+            Returns:
+                str: JSON formatted list of the matching messages, most relevant first
+            """
+            import json
+
+            history_index = cast("SessionHistoryIndex", self.history_index)
+            entries = history_index.search(query, user_id=user_id, entity_id=self.agent_id, limit=num_results)
+            return json.dumps([entry.to_dict() for entry in entries]) if entries else "No history found"
+
+        return search_previous_sessions
+
+    def get_previous_tool_calls_function(self, user_id: Optional[str] = None) -> Callable:
+        """Factory function to create a get_previous_tool_calls function backed by the history index."""
+
+        def get_previous_tool_calls(num_calls: int = 5, tool_name: Optional[str] = None) -> str:
+            """Use this function to get the tools called in previous chat sessions, most recent first.
+
+            Args:
+                num_calls: The number of tool calls to return. Default: 5
+                tool_name: If provided, only return the calls of this tool.
+
+            Returns:
+                str: JSON formatted list of the tool calls and their results
+            """
+            import json
+
+            history_index = cast("SessionHistoryIndex", self.history_index)
+            entries = history_index.get_tool_calls(
+                user_id=user_id, entity_id=self.agent_id, tool_name=tool_name, limit=num_calls
+            )
+            return json.dumps([entry.to_dict() for entry in entries]) if entries else "No tool calls found"
+
+        return get_previous_tool_calls
+
     def cli_app(
         self,
         message: Optional[str] = None,
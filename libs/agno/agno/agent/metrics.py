@@ -22,6 +22,9 @@ class SessionMetrics:
     prompt_tokens_details: Optional[dict] = None
     completion_tokens_details: Optional[dict] = None
 
+    hedged_requests: int = 0
+    hedged_input_tokens: int = 0
+
     additional_metrics: Optional[dict] = None
 
     time: Optional[float] = None
@@ -58,6 +61,8 @@ class SessionMetrics:
             cached_tokens=self.cached_tokens + other.cached_tokens,
             cache_write_tokens=self.cache_write_tokens + other.cache_write_tokens,
             reasoning_tokens=self.reasoning_tokens + other.reasoning_tokens,
+            hedged_requests=self.hedged_requests + other.hedged_requests,
+            hedged_input_tokens=self.hedged_input_tokens + other.hedged_input_tokens,
         )
 
         # Handle prompt_tokens_details
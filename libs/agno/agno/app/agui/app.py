@@ -2,8 +2,6 @@
 
 from fastapi.routing import APIRouter
 
-from agno.app.agui.async_router import get_async_agui_router
-from agno.app.agui.sync_router import get_sync_agui_router
 from agno.app.base import BaseAPIApp
 
 
@@ -11,7 +9,11 @@ class AGUIApp(BaseAPIApp):
     type = "agui"
 
     def get_router(self) -> APIRouter:
+        from agno.app.agui.sync_router import get_sync_agui_router
+
         return get_sync_agui_router(agent=self.agent, team=self.team)
 
     def get_async_router(self) -> APIRouter:
+        from agno.app.agui.async_router import get_async_agui_router
+
         return get_async_agui_router(agent=self.agent, team=self.team)
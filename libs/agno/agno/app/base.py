@@ -13,11 +13,14 @@ from agno.agent.agent import Agent
 from agno.api.app import AppCreate, create_app
 from agno.app.settings import APIAppSettings
 from agno.team.team import Team
+from agno.utils.import_time import get_cold_start_time
 from agno.utils.log import log_debug, log_info
 
 
 class BaseAPIApp(ABC):
     type: Optional[str] = None
+    # Seconds from the start of the agno import to the app being built, set by get_app
+    cold_start_time: Optional[float] = None
 
     def __init__(
         self,
@@ -148,6 +151,10 @@ class BaseAPIApp(ABC):
             expose_headers=["*"],
         )
 
+        if self.cold_start_time is None:
+            self.cold_start_time = get_cold_start_time()
+            log_debug(f"App ready {self.cold_start_time:.3f}s after importing agno")
+
         return self.api_app
 
     def serve(
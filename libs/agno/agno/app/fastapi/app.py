@@ -7,8 +7,6 @@ from fastapi.routing import APIRouter
 
 from agno.agent.agent import Agent
 from agno.app.base import BaseAPIApp
-from agno.app.fastapi.async_router import get_async_router
-from agno.app.fastapi.sync_router import get_sync_router
 from agno.app.settings import APIAppSettings
 from agno.app.utils import generate_id
 from agno.team.team import Team
@@ -83,9 +81,13 @@ class FastAPIApp(BaseAPIApp):
                     workflow.workflow_id = generate_id(workflow.name)
 
     def get_router(self) -> APIRouter:
+        from agno.app.fastapi.sync_router import get_sync_router
+
         return get_sync_router(agents=self.agents, teams=self.teams, workflows=self.workflows)
 
     def get_async_router(self) -> APIRouter:
+        from agno.app.fastapi.async_router import get_async_router
+
         return get_async_router(agents=self.agents, teams=self.teams, workflows=self.workflows)
 
     def serve(
@@ -13,18 +13,20 @@ from starlette.requests import Request
 
 from agno.agent.agent import Agent
 from agno.api.playground import PlaygroundEndpointCreate
-from agno.app.playground.async_router import get_async_playground_router
-from agno.app.playground.sync_router import get_sync_playground_router
 from agno.app.utils import generate_id
 from agno.cli.console import console
 from agno.cli.settings import agno_cli_settings
 from agno.playground.settings import PlaygroundSettings
 from agno.team.team import Team
+from agno.utils.import_time import get_cold_start_time
 from agno.utils.log import log_debug, logger
 from agno.workflow.workflow import Workflow
 
 
 class Playground:
+    # Seconds from the start of the agno import to the app being built, set by get_app
+    cold_start_time: Optional[float] = None
+
     def __init__(
         self,
         agents: Optional[List[Agent]] = None,
@@ -105,9 +107,13 @@ class Playground:
             self.monitoring = monitor_env.lower() == "true"
 
     def get_router(self) -> APIRouter:
+        from agno.app.playground.sync_router import get_sync_playground_router
+
         return get_sync_playground_router(self.agents, self.workflows, self.teams, self.app_id)
 
     def get_async_router(self) -> APIRouter:
+        from agno.app.playground.async_router import get_async_playground_router
+
         return get_async_playground_router(self.agents, self.workflows, self.teams, self.app_id)
 
     def get_app(self, use_async: bool = True, prefix: str = "/v1") -> FastAPI:
@@ -161,6 +167,10 @@ class Playground:
             expose_headers=["*"],
         )
 
+        if self.cold_start_time is None:
+            self.cold_start_time = get_cold_start_time()
+            log_debug(f"App ready {self.cold_start_time:.3f}s after importing agno")
+
         return self.api_app
 
     def serve(
@@ -3,16 +3,14 @@ from io import BytesIO
 from typing import Any, AsyncGenerator, Dict, List, Optional, cast
 from uuid import uuid4
 
-from fastapi import APIRouter, File, Form, HTTPException, Query, UploadFile
+from fastapi import APIRouter, File, Form, HTTPException, Query, Response, UploadFile
 from fastapi.responses import JSONResponse, StreamingResponse
 
 from agno.agent.agent import Agent, RunResponse
 from agno.app.playground.operator import (
     format_tools,
     get_agent_by_id,
-    get_session_title,
-    get_session_title_from_team_session,
-    get_session_title_from_workflow_session,
+    get_session_title_from_index,
     get_team_by_id,
     get_workflow_by_id,
 )
@@ -41,7 +39,6 @@ from agno.run.team import RunResponseErrorEvent as TeamRunResponseErrorEvent
 from agno.run.v2.workflow import WorkflowErrorEvent
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
-from agno.storage.session.workflow import WorkflowSession
 from agno.team.team import Team
 from agno.utils.log import logger
 from agno.workflow.v2.workflow import Workflow as WorkflowV2
@@ -509,7 +506,13 @@ def get_async_playground_router(
             return run_response_obj.to_dict()
 
     @playground_router.get("/agents/{agent_id}/sessions")
-    async def get_all_agent_sessions(agent_id: str, user_id: Optional[str] = Query(None, min_length=1)):
+    async def get_all_agent_sessions(
+        agent_id: str,
+        response: Response,
+        user_id: Optional[str] = Query(None, min_length=1),
+        limit: Optional[int] = Query(None, ge=1),
+        cursor: Optional[str] = Query(None),
+    ):
         logger.debug(f"AgentSessionsRequest: {agent_id} {user_id}")
         agent = get_agent_by_id(agent_id, agents)
         if agent is None:
@@ -518,16 +521,24 @@ def get_async_playground_router(
         if agent.storage is None:
             return JSONResponse(status_code=404, content="Agent does not have storage enabled.")
 
+        try:
+            page = await agent.storage.aget_session_index(
+                user_id=user_id, entity_id=agent_id, limit=limit, cursor=cursor
+            )
+        except ValueError as e:
+            return JSONResponse(status_code=400, content=str(e))
+        if page.next_cursor is not None:
+            response.headers["X-Next-Cursor"] = page.next_cursor
+
         agent_sessions: List[AgentSessionsResponse] = []
-        all_agent_sessions: List[AgentSession] = agent.storage.get_all_sessions(user_id=user_id, entity_id=agent_id)  # type: ignore
-        for session in all_agent_sessions:
-            title = get_session_title(session)
+        for entry in page.sessions:
             agent_sessions.append(
                 AgentSessionsResponse(
-                    title=title,
-                    session_id=session.session_id,
-                    session_name=session.session_data.get("session_name") if session.session_data else None,
-                    created_at=session.created_at,
+                    title=get_session_title_from_index(entry),
+                    session_id=entry.session_id,
+                    session_name=entry.session_name,
+                    created_at=entry.created_at,
+                    updated_at=entry.updated_at,
                 )
             )
         return agent_sessions
@@ -542,7 +553,7 @@ def get_async_playground_router(
         if agent.storage is None:
             return JSONResponse(status_code=404, content="Agent does not have storage enabled.")
 
-        agent_session: Optional[AgentSession] = agent.storage.read(session_id, user_id)  # type: ignore
+        agent_session: Optional[AgentSession] = await agent.storage.aread(session_id, user_id)  # type: ignore
         if agent_session is None:
             return JSONResponse(status_code=404, content="Session not found.")
 
@@ -580,11 +591,10 @@ def get_async_playground_router(
         if agent.storage is None:
             return JSONResponse(status_code=404, content="Agent does not have storage enabled.")
 
-        all_agent_sessions: List[AgentSession] = agent.storage.get_all_sessions(user_id=body.user_id)  # type: ignore
-        for session in all_agent_sessions:
-            if session.session_id == session_id:
-                agent.rename_session(body.name, session_id=session_id)
-                return JSONResponse(content={"message": f"successfully renamed session {session.session_id}"})
+        session_ids = await agent.storage.aget_all_session_ids(user_id=body.user_id)
+        if session_id in session_ids:
+            agent.rename_session(body.name, session_id=session_id)
+            return JSONResponse(content={"message": f"successfully renamed session {session_id}"})
 
         return JSONResponse(status_code=404, content="Session not found.")
 
@@ -597,11 +607,10 @@ def get_async_playground_router(
         if agent.storage is None:
             return JSONResponse(status_code=404, content="Agent does not have storage enabled.")
 
-        all_agent_sessions: List[AgentSession] = agent.storage.get_all_sessions(user_id=user_id, entity_id=agent_id)  # type: ignore
-        for session in all_agent_sessions:
-            if session.session_id == session_id:
-                agent.delete_session(session_id)
-                return JSONResponse(content={"message": f"successfully deleted session {session_id}"})
+        session_ids = await agent.storage.aget_all_session_ids(user_id=user_id, entity_id=agent_id)
+        if session_id in session_ids:
+            agent.delete_session(session_id)
+            return JSONResponse(content={"message": f"successfully deleted session {session_id}"})
 
         return JSONResponse(status_code=404, content="Session not found.")
 
@@ -723,7 +732,13 @@ def get_async_playground_router(
                 raise HTTPException(status_code=500, detail=f"Error running workflow: {str(e)}")
 
     @playground_router.get("/workflows/{workflow_id}/sessions")
-    async def get_all_workflow_sessions(workflow_id: str, user_id: Optional[str] = Query(None, min_length=1)):
+    async def get_all_workflow_sessions(
+        workflow_id: str,
+        response: Response,
+        user_id: Optional[str] = Query(None, min_length=1),
+        limit: Optional[int] = Query(None, ge=1),
+        cursor: Optional[str] = Query(None),
+    ):
         # Retrieve the workflow by ID
         workflow = get_workflow_by_id(workflow_id, workflows)
         if not workflow:
@@ -733,24 +748,28 @@ def get_async_playground_router(
         if not workflow.storage:
             raise HTTPException(status_code=404, detail="Workflow does not have storage enabled")
 
-        # Retrieve all sessions for the given workflow and user
+        # Retrieve a page of the sessions for the given workflow and user
         try:
-            all_workflow_sessions: List[WorkflowSession] = workflow.storage.get_all_sessions(
-                user_id=user_id, entity_id=workflow_id
-            )  # type: ignore
+            page = await workflow.storage.aget_session_index(
+                user_id=user_id, entity_id=workflow_id, limit=limit, cursor=cursor
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error retrieving sessions: {str(e)}")
+        if page.next_cursor is not None:
+            response.headers["X-Next-Cursor"] = page.next_cursor
 
         # Return the sessions
         workflow_sessions: List[WorkflowSessionResponse] = []
-        for session in all_workflow_sessions:
-            title = get_session_title_from_workflow_session(session)
+        for entry in page.sessions:
             workflow_sessions.append(
                 {
-                    "title": title,
-                    "session_id": session.session_id,
-                    "session_name": session.session_data.get("session_name") if session.session_data else None,
-                    "created_at": session.created_at,
+                    "title": get_session_title_from_index(entry, workflow=True),
+                    "session_id": entry.session_id,
+                    "session_name": entry.session_name,
+                    "created_at": entry.created_at,
+                    "updated_at": entry.updated_at,
                 }  # type: ignore
             )
         return workflow_sessions
@@ -770,7 +789,7 @@ def get_async_playground_router(
 
         # Retrieve the specific session
         try:
-            workflow_session = workflow.storage.read(session_id, user_id)  # type: ignore
+            workflow_session = await workflow.storage.aread(session_id, user_id)  # type: ignore
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error retrieving session: {str(e)}")
 
@@ -923,7 +942,13 @@ def get_async_playground_router(
             return run_response.to_dict()
 
     @playground_router.get("/teams/{team_id}/sessions", response_model=List[TeamSessionResponse])
-    async def get_all_team_sessions(team_id: str, user_id: Optional[str] = Query(None, min_length=1)):
+    async def get_all_team_sessions(
+        team_id: str,
+        response: Response,
+        user_id: Optional[str] = Query(None, min_length=1),
+        limit: Optional[int] = Query(None, ge=1),
+        cursor: Optional[str] = Query(None),
+    ):
         team = get_team_by_id(team_id, teams)
         if team is None:
             raise HTTPException(status_code=404, detail="Team not found")
@@ -932,19 +957,23 @@ def get_async_playground_router(
             raise HTTPException(status_code=404, detail="Team does not have storage enabled")
 
         try:
-            all_team_sessions: List[TeamSession] = team.storage.get_all_sessions(user_id=user_id, entity_id=team_id)  # type: ignore
+            page = await team.storage.aget_session_index(user_id=user_id, entity_id=team_id, limit=limit, cursor=cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error retrieving sessions: {str(e)}")
+        if page.next_cursor is not None:
+            response.headers["X-Next-Cursor"] = page.next_cursor
 
         team_sessions: List[TeamSessionResponse] = []
-        for session in all_team_sessions:
-            title = get_session_title_from_team_session(session)
+        for entry in page.sessions:
             team_sessions.append(
                 TeamSessionResponse(
-                    title=title,
-                    session_id=session.session_id,
-                    session_name=session.session_data.get("session_name") if session.session_data else None,
-                    created_at=session.created_at,
+                    title=get_session_title_from_index(entry),
+                    session_id=entry.session_id,
+                    session_name=entry.session_name,
+                    created_at=entry.created_at,
+                    updated_at=entry.updated_at,
                 )
             )
         return team_sessions
@@ -959,7 +988,7 @@ def get_async_playground_router(
             raise HTTPException(status_code=404, detail="Team does not have storage enabled")
 
         try:
-            team_session: Optional[TeamSession] = team.storage.read(session_id, user_id)  # type: ignore
+            team_session: Optional[TeamSession] = await team.storage.aread(session_id, user_id)  # type: ignore
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error retrieving session: {str(e)}")
 
@@ -1004,11 +1033,10 @@ def get_async_playground_router(
         if team.storage is None:
             raise HTTPException(status_code=404, detail="Team does not have storage enabled")
 
-        all_team_sessions: List[TeamSession] = team.storage.get_all_sessions(user_id=body.user_id, entity_id=team_id)  # type: ignore
-        for session in all_team_sessions:
-            if session.session_id == session_id:
-                team.rename_session(body.name, session_id=session_id)
-                return JSONResponse(content={"message": f"successfully renamed team session {body.name}"})
+        session_ids = await team.storage.aget_all_session_ids(user_id=body.user_id, entity_id=team_id)
+        if session_id in session_ids:
+            team.rename_session(body.name, session_id=session_id)
+            return JSONResponse(content={"message": f"successfully renamed team session {body.name}"})
 
         raise HTTPException(status_code=404, detail="Session not found")
 
@@ -1021,11 +1049,10 @@ def get_async_playground_router(
         if team.storage is None:
             raise HTTPException(status_code=404, detail="Team does not have storage enabled")
 
-        all_team_sessions: List[TeamSession] = team.storage.get_all_sessions(user_id=user_id, entity_id=team_id)  # type: ignore
-        for session in all_team_sessions:
-            if session.session_id == session_id:
-                team.delete_session(session_id)
-                return JSONResponse(content={"message": f"successfully deleted team session {session_id}"})
+        session_ids = await team.storage.aget_all_session_ids(user_id=user_id, entity_id=team_id)
+        if session_id in session_ids:
+            team.delete_session(session_id)
+            return JSONResponse(content={"message": f"successfully deleted team session {session_id}"})
 
         raise HTTPException(status_code=404, detail="Session not found")
 
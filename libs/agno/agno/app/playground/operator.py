@@ -1,9 +1,10 @@
-from typing import Any, List, Optional, Union, cast
+from typing import Any, List, Optional, Union
 
 from agno.agent.agent import Agent, AgentRun, Function, Toolkit
 from agno.run.response import RunResponse
 from agno.run.team import TeamRunResponse
 from agno.storage.session.agent import AgentSession
+from agno.storage.session.index import SessionIndexEntry
 from agno.storage.session.team import TeamSession
 from agno.storage.session.workflow import WorkflowSession
 from agno.team.team import Team
@@ -40,6 +41,35 @@ def get_agent_by_id(agent_id: str, agents: Optional[List[Agent]] = None) -> Opti
     return None
 
 
+def _get_title_from_runs(runs: Optional[List[Any]]) -> Optional[str]:
+    """Return the first user message of the runs of an agent or team session"""
+    for _run in runs or []:
+        try:
+            if "response" in _run:
+                run_parsed = AgentRun.model_validate(_run)
+                if run_parsed.message is not None and run_parsed.message.role == "user":
+                    content = run_parsed.message.get_content_string()
+                    if content:
+                        return content
+                    else:
+                        return "No title"
+            else:
+                if "agent_id" in _run:
+                    run_response_parsed = RunResponse.from_dict(_run)
+                else:
+                    run_response_parsed = TeamRunResponse.from_dict(_run)  # type: ignore
+                if run_response_parsed.messages is not None and len(run_response_parsed.messages) > 0:
+                    for msg in run_response_parsed.messages:
+                        if msg.role == "user":
+                            content = msg.get_content_string()
+                            if content:
+                                return content
+
+        except Exception as e:
+            logger.error(f"Error parsing chat: {e}")
+    return None
+
+
 def get_session_title(session: Union[AgentSession, TeamSession]) -> str:
     if session is None:
         return "Unnamed session"
@@ -49,39 +79,35 @@ def get_session_title(session: Union[AgentSession, TeamSession]) -> str:
     memory = session.memory
     if memory is not None:
         # Proxy for knowing it is legacy memory implementation
-        runs = memory.get("runs")
-        runs = cast(List[Any], runs)
-
-        for _run in runs:
-            try:
-                if "response" in _run:
-                    run_parsed = AgentRun.model_validate(_run)
-                    if run_parsed.message is not None and run_parsed.message.role == "user":
-                        content = run_parsed.message.get_content_string()
-                        if content:
-                            return content
-                        else:
-                            return "No title"
-                else:
-                    if "agent_id" in _run:
-                        run_response_parsed = RunResponse.from_dict(_run)
-                    else:
-                        run_response_parsed = TeamRunResponse.from_dict(_run)  # type: ignore
-                    if run_response_parsed.messages is not None and len(run_response_parsed.messages) > 0:
-                        for msg in run_response_parsed.messages:
-                            if msg.role == "user":
-                                content = msg.get_content_string()
-                                if content:
-                                    return content
-
-            except Exception as e:
-                import traceback
-
-                traceback.print_exc(limit=3)
+        title = _get_title_from_runs(memory.get("runs"))
+        if title is not None:
+            return title
+    return "Unnamed session"
 
-                logger.error(f"Error parsing chat: {e}")
 
-    return "Unnamed session"
+def _get_title_from_workflow_runs(runs: Optional[List[Any]]) -> Optional[str]:
+    """Return the first line of the first run with content of a workflow session"""
+    for _run in runs or []:
+        try:
+            # Try to get content directly from the run first (workflow structure)
+            content = _run.get("content")
+            if content:
+                # Split content by newlines and take first line, but limit to 100 chars
+                first_line = content.split("\n")[0]
+                return first_line[:100] + "..." if len(first_line) > 100 else first_line
+
+            # Fallback to response.content structure (if it exists)
+            response = _run.get("response")
+            if response:
+                content = response.get("content")
+                if content:
+                    # Split content by newlines and take first line, but limit to 100 chars
+                    first_line = content.split("\n")[0]
+                    return first_line[:100] + "..." if len(first_line) > 100 else first_line
+
+        except Exception as e:
+            logger.error(f"Error parsing workflow session: {e}")
+    return None
 
 
 def get_session_title_from_workflow_session(workflow_session: WorkflowSession) -> str:
@@ -95,28 +121,9 @@ def get_session_title_from_workflow_session(workflow_session: WorkflowSession) -
     if hasattr(workflow_session, "memory"):
         memory = workflow_session.memory
         if memory is not None:
-            runs = memory.get("runs")
-            runs = cast(List[Any], runs)
-            for _run in runs:
-                try:
-                    # Try to get content directly from the run first (workflow structure)
-                    content = _run.get("content")
-                    if content:
-                        # Split content by newlines and take first line, but limit to 100 chars
-                        first_line = content.split("\n")[0]
-                        return first_line[:100] + "..." if len(first_line) > 100 else first_line
-
-                    # Fallback to response.content structure (if it exists)
-                    response = _run.get("response")
-                    if response:
-                        content = response.get("content")
-                        if content:
-                            # Split content by newlines and take first line, but limit to 100 chars
-                            first_line = content.split("\n")[0]
-                            return first_line[:100] + "..." if len(first_line) > 100 else first_line
-
-                except Exception as e:
-                    logger.error(f"Error parsing workflow session: {e}")
+            title = _get_title_from_workflow_runs(memory.get("runs"))
+            if title is not None:
+                return title
     if hasattr(workflow_session, "runs"):
         if workflow_session.runs is not None and len(workflow_session.runs) > 0:
             for _run in workflow_session.runs:
@@ -125,6 +132,15 @@ def get_session_title_from_workflow_session(workflow_session: WorkflowSession) -
     return "Unnamed session"
 
 
+def get_session_title_from_index(entry: SessionIndexEntry, workflow: bool = False) -> str:
+    """Title of a session of the session index, from its name or its first run"""
+    if entry.session_name is not None:
+        return entry.session_name
+    runs = [entry.first_run] if entry.first_run is not None else None
+    title = _get_title_from_workflow_runs(runs) if workflow else _get_title_from_runs(runs)
+    return title if title is not None else "Unnamed session"
+
+
 def get_workflow_by_id(workflow_id: str, workflows: Optional[List[Workflow]] = None) -> Optional[Workflow]:
     if workflows is None or workflow_id is None:
         return None
@@ -153,31 +169,7 @@ def get_session_title_from_team_session(team_session: TeamSession) -> str:
         return session_name
     memory = team_session.memory
     if memory is not None:
-        runs = memory.get("runs")
-        runs = cast(List[Any], runs)
-
-        for _run in runs:
-            try:
-                if "response" in _run:
-                    run_parsed = AgentRun.model_validate(_run)
-                    if run_parsed.message is not None and run_parsed.message.role == "user":
-                        content = run_parsed.message.get_content_string()
-                        if content:
-                            return content
-                        else:
-                            return "No title"
-                else:
-                    if "agent_id" in _run:
-                        run_response_parsed = RunResponse.from_dict(_run)
-                    else:
-                        run_response_parsed = TeamRunResponse.from_dict(_run)  # type: ignore
-                    if run_response_parsed.messages is not None and len(run_response_parsed.messages) > 0:
-                        for msg in run_response_parsed.messages:
-                            if msg.role == "user":
-                                content = msg.get_content_string()
-                                if content:
-                                    return content
-
-            except Exception as e:
-                logger.error(f"Error parsing chat: {e}")
+        title = _get_title_from_runs(memory.get("runs"))
+        if title is not None:
+            return title
     return "Unnamed session"
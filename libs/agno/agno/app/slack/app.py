@@ -3,8 +3,6 @@ import logging
 from fastapi.routing import APIRouter
 
 from agno.app.base import BaseAPIApp
-from agno.app.slack.async_router import get_async_router
-from agno.app.slack.sync_router import get_sync_router
 
 logger = logging.getLogger(__name__)
 
@@ -13,7 +11,11 @@ class SlackAPI(BaseAPIApp):
     type = "slack"
 
     def get_router(self) -> APIRouter:
+        from agno.app.slack.sync_router import get_sync_router
+
         return get_sync_router(agent=self.agent, team=self.team)
 
     def get_async_router(self) -> APIRouter:
+        from agno.app.slack.async_router import get_async_router
+
         return get_async_router(agent=self.agent, team=self.team)
@@ -0,0 +1,6 @@
+from agno.cache.base import CacheBackend, CacheMetrics
+from agno.cache.in_memory import InMemoryCache
+from agno.cache.response import ResponseCache
+from agno.cache.retrieval import RetrievalCache
+
+__all__ = ["CacheBackend", "CacheMetrics", "InMemoryCache", "ResponseCache", "RetrievalCache"]
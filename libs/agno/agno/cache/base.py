@@ -0,0 +1,75 @@
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+
+class CacheBackend(ABC):
+    """Base class for key-value caches of JSON serializable dicts."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the value stored for a key, or None if it is missing or expired."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, value: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        """Store a value, expiring after `ttl` seconds if given."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def scan(self, prefix: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Iterate over the unexpired (key, value) pairs whose key starts with `prefix`."""
+        raise NotImplementedError
+
+    def delete_prefix(self, prefix: str) -> None:
+        """Delete all keys starting with `prefix`."""
+        for key in [key for key, _ in self.scan(prefix)]:
+            self.delete(key)
+
+    @abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+@dataclass
+class CacheMetrics:
+    """Counters of a cache, to monitor its hit rate."""
+
+    hits: int = 0
+    similar_hits: int = 0
+    misses: int = 0
+    bypassed: int = 0
+    stores: int = 0
+    # Times the entries of a source were dropped after it changed
+    invalidations: int = 0
+    errors: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    def increment(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "similar_hits": self.similar_hits,
+            "misses": self.misses,
+            "bypassed": self.bypassed,
+            "stores": self.stores,
+            "invalidations": self.invalidations,
+            "errors": self.errors,
+            "hit_rate": self.hit_rate,
+        }
@@ -0,0 +1,58 @@
+import threading
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from agno.cache.base import CacheBackend
+
+
+class InMemoryCache(CacheBackend):
+    """Cache held in the memory of the process, evicting the least recently used entries beyond `max_size`."""
+
+    def __init__(self, max_size: Optional[int] = 10_000):
+        self.max_size = max_size
+        # key -> (expires at, value)
+        self._entries: "OrderedDict[str, Tuple[Optional[float], Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        expires_at = monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            if self.max_size is not None:
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def scan(self, prefix: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        now = monotonic()
+        with self._lock:
+            entries = [
+                (key, value)
+                for key, (expires_at, value) in self._entries.items()
+                if key.startswith(prefix) and (expires_at is None or expires_at > now)
+            ]
+        yield from entries
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,76 @@
+import json
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+try:
+    from redis import Redis
+except ImportError:
+    raise ImportError("`redis` not installed. Please install it using `pip install redis`")
+
+from agno.cache.base import CacheBackend
+from agno.utils.log import log_debug
+
+
+class RedisCache(CacheBackend):
+    """Cache stored in Redis, shared by all processes using the same prefix.
+
+    Args:
+        prefix: Prefix for Redis keys to namespace the cache.
+        host: Redis host address.
+        port: Redis port number.
+        db: Redis database number.
+        password: Redis password if authentication is required.
+        ssl: Whether to use SSL for the Redis connection.
+        redis_client: An existing Redis client, used instead of the connection parameters.
+    """
+
+    def __init__(
+        self,
+        prefix: str = "agno_cache",
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        password: Optional[str] = None,
+        ssl: Optional[bool] = False,
+        redis_client: Optional[Redis] = None,
+    ):
+        self.prefix = prefix
+        self.redis_client = redis_client or Redis(
+            host=host,
+            port=port,
+            db=db,
+            password=password,
+            decode_responses=True,
+            ssl=ssl,
+        )
+        log_debug(f"Created RedisCache with prefix: '{self.prefix}'")
+
+    def _get_key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        value = self.redis_client.get(self._get_key(key))
+        return json.loads(value) if value is not None else None  # type: ignore
+
+    def set(self, key: str, value: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        px = int(ttl * 1000) if ttl is not None else None
+        self.redis_client.set(self._get_key(key), json.dumps(value, default=str), px=px)
+
+    def delete(self, key: str) -> None:
+        self.redis_client.delete(self._get_key(key))
+
+    def scan(self, prefix: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        full_prefix = self._get_key(prefix)
+        keys = list(self.redis_client.scan_iter(match=f"{full_prefix}*"))
+        if not keys:
+            return
+        for redis_key, value in zip(keys, self.redis_client.mget(keys)):  # type: ignore
+            if value is not None:
+                yield redis_key[len(self.prefix) + 1 :], json.loads(value)
+
+    def delete_prefix(self, prefix: str) -> None:
+        keys = list(self.redis_client.scan_iter(match=f"{self._get_key(prefix)}*"))
+        if keys:
+            self.redis_client.delete(*keys)
+
+    def clear(self) -> None:
+        self.delete_prefix("")
@@ -0,0 +1,198 @@
+import json
+import math
+import re
+from dataclasses import dataclass
+from hashlib import sha256
+from time import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel
+
+from agno.cache.base import CacheBackend, CacheMetrics
+from agno.cache.in_memory import InMemoryCache
+from agno.embedder.base import Embedder
+from agno.utils.log import log_debug, log_warning
+
+if TYPE_CHECKING:
+    from agno.models.base import Model
+    from agno.models.message import Message
+    from agno.models.response import ModelResponse
+
+
+def normalize_prompt(text: str) -> str:
+    """Normalize a prompt for cache lookups: lowercase, trimmed and with collapsed whitespace."""
+    return re.sub(r"\s+", " ", text).strip().lower()
+
+
+def _hash(value: Any) -> str:
+    return sha256(json.dumps(value, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:32]
+
+
+def _cosine_similarity(a: List[float], b: List[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+@dataclass
+class ResponseCacheKey:
+    # Hash of the model, response format, tools and every message but the last user message
+    context: str
+    # Hash of the normalized last user message
+    prompt: str
+    # The normalized last user message
+    prompt_text: str
+
+    @property
+    def key(self) -> str:
+        return f"{self.context}:{self.prompt}"
+
+
+class ResponseCache:
+    """Caches Model responses, keyed on the messages sent to the Model.
+
+    A response is reused when the model, tools, response format, system message and history are identical
+    and the last user message is identical once normalized. If an `embedder` is given, a response is also
+    reused when the embedding of the user message is at least `similarity_threshold` similar to a cached one
+    with the same context.
+
+    Responses of runs that called tools are not cached unless `cache_tool_runs` is True, as tool results
+    usually depend on the time of the run. Runs with media inputs or a structured output model are never cached.
+    Note that time dependent instructions (e.g. `add_datetime_to_instructions`) prevent cache hits.
+
+    Args:
+        backend: Where responses are stored. Defaults to an InMemoryCache.
+        ttl: Seconds before a cached response expires. None to never expire.
+        embedder: Embedder used to find similar prompts.
+        similarity_threshold: Minimum cosine similarity of a similar prompt.
+        cache_tool_runs: If True, also cache responses of runs that called tools.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        ttl: Optional[float] = 3600,
+        embedder: Optional[Embedder] = None,
+        similarity_threshold: float = 0.95,
+        cache_tool_runs: bool = False,
+    ):
+        self.backend = backend or InMemoryCache()
+        self.ttl = ttl
+        self.embedder = embedder
+        self.similarity_threshold = similarity_threshold
+        self.cache_tool_runs = cache_tool_runs
+        self.metrics = CacheMetrics()
+
+    def get_key(
+        self,
+        model: "Model",
+        messages: List["Message"],
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+    ) -> Optional[ResponseCacheKey]:
+        """Return the cache key of a request, or None if the request can not be cached."""
+        if isinstance(response_format, type) or not messages or messages[-1].role != "user":
+            self.metrics.increment("bypassed")
+            return None
+        if any(m.images or m.audio or m.videos or m.files for m in messages):
+            self.metrics.increment("bypassed")
+            return None
+
+        context = [
+            model.__class__.__name__,
+            model.id,
+            response_format,
+            tools,
+            [[m.role, m.get_content_string(), m.name, m.tool_call_id, m.tool_calls] for m in messages[:-1]],
+        ]
+        prompt_text = normalize_prompt(messages[-1].get_content_string())
+        return ResponseCacheKey(context=_hash(context), prompt=_hash(prompt_text), prompt_text=prompt_text)
+
+    def get(self, key: ResponseCacheKey) -> Optional[Dict[str, Any]]:
+        """Return the cached response for a key, matching similar prompts if an embedder is set."""
+        try:
+            entry = self.backend.get(key.key)
+            if entry is None and self.embedder is not None:
+                entry = self._get_similar(key)
+        except Exception as e:
+            log_warning(f"Response cache lookup failed: {e}")
+            self.metrics.increment("errors")
+            return None
+
+        if entry is None:
+            self.metrics.increment("misses")
+            return None
+        self.metrics.increment("hits")
+        log_debug(f"Response cache hit for prompt: {key.prompt_text[:80]}")
+        return entry
+
+    def _get_similar(self, key: ResponseCacheKey) -> Optional[Dict[str, Any]]:
+        query_embedding = self.embedder.get_embedding(key.prompt_text)  # type: ignore
+        best_score, best_entry = self.similarity_threshold, None
+        for _, entry in self.backend.scan(f"{key.context}:"):
+            embedding = entry.get("embedding")
+            if not embedding:
+                continue
+            score = _cosine_similarity(query_embedding, embedding)
+            if score >= best_score:
+                best_score, best_entry = score, entry
+        if best_entry is not None:
+            self.metrics.increment("similar_hits")
+            log_debug(f"Similar prompt in response cache with similarity {best_score:.3f}")
+        return best_entry
+
+    def set(self, key: ResponseCacheKey, model_response: "ModelResponse", called_tools: Optional[bool] = None) -> None:
+        """Cache a Model response, unless it called tools or has no text content.
+
+        `called_tools` defaults to whether the response has tool executions.
+        """
+        if called_tools is None:
+            called_tools = bool(model_response.tool_executions)
+        if called_tools and not self.cache_tool_runs:
+            self.metrics.increment("bypassed")
+            return
+        if not isinstance(model_response.content, str) or not model_response.content:
+            return
+
+        entry: Dict[str, Any] = {
+            "content": model_response.content,
+            "thinking": model_response.thinking,
+            "reasoning_content": model_response.reasoning_content,
+            "prompt": key.prompt_text,
+            "created_at": int(time()),
+        }
+        try:
+            if self.embedder is not None:
+                entry["embedding"] = self.embedder.get_embedding(key.prompt_text)
+            self.backend.set(key.key, entry, ttl=self.ttl)
+            self.metrics.increment("stores")
+        except Exception as e:
+            log_warning(f"Storing response in cache failed: {e}")
+            self.metrics.increment("errors")
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return the hit rate and counters of the cache."""
+        return self.metrics.to_dict()
+
+
+def get_cached_model_response(entry: Dict[str, Any]) -> Tuple["ModelResponse", "Message"]:
+    """Build the Model response and assistant message of a cached response."""
+    from agno.models.message import Message
+    from agno.models.response import ModelResponse
+
+    model_response = ModelResponse(
+        role="assistant",
+        content=entry.get("content"),
+        thinking=entry.get("thinking"),
+        reasoning_content=entry.get("reasoning_content"),
+    )
+    assistant_message = Message(
+        role="assistant",
+        content=entry.get("content"),
+        thinking=entry.get("thinking"),
+        reasoning_content=entry.get("reasoning_content"),
+    )
+    return model_response, assistant_message
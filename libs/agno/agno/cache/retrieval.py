@@ -0,0 +1,142 @@
+from pathlib import Path
+from time import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from agno.cache.base import CacheBackend, CacheMetrics
+from agno.cache.in_memory import InMemoryCache
+from agno.cache.response import _hash, normalize_prompt
+from agno.utils.log import log_debug, log_warning
+
+if TYPE_CHECKING:
+    from agno.document import Document
+    from agno.reranker.base import Reranker
+
+
+# Attributes locating the data of a vector db
+SOURCE_LOCATION_ATTRIBUTES = (
+    "db_url",
+    "uri",
+    "url",
+    "host",
+    "path",
+    "schema",
+    "table_name",
+    "collection",
+    "collection_name",
+    "index_name",
+)
+
+
+def get_source_id(vector_db: Any) -> str:
+    """Return an id of the data searched by a vector db, stable across processes."""
+    location = [vector_db.__class__.__name__]
+    for attribute in SOURCE_LOCATION_ATTRIBUTES:
+        value = getattr(vector_db, attribute, None)
+        if isinstance(value, (str, int, float, Path)):
+            location.append(f"{attribute}={value}")
+    return _hash(location)[:16]
+
+
+def get_reranker_key(reranker: Optional["Reranker"]) -> Optional[Dict[str, Any]]:
+    """Return the settings of a reranker that change its results, without its clients and credentials."""
+    if reranker is None:
+        return None
+    settings = {
+        name: value
+        for name, value in reranker.model_dump(exclude_none=True).items()
+        if isinstance(value, (str, int, float, bool)) and "key" not in name
+    }
+    return {"class": reranker.__class__.__name__, **settings}
+
+
+class RetrievalCache:
+    """Caches the documents returned by knowledge base searches.
+
+    Results are keyed on the knowledge base, the normalized query, the filters, the number of documents and the
+    reranker, and are invalidated when documents are loaded to the knowledge base. With a shared backend,
+    e.g. a RedisCache, the results are shared by all processes searching the same knowledge base.
+
+    Args:
+        backend: Where results are stored. Defaults to an InMemoryCache.
+        ttl: Seconds before cached results expire. None to never expire.
+        normalize_queries: If True, queries differing only in case and whitespace share their results.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        ttl: Optional[float] = 600,
+        normalize_queries: bool = True,
+    ):
+        self.backend = backend or InMemoryCache()
+        self.ttl = ttl
+        self.normalize_queries = normalize_queries
+        self.metrics = CacheMetrics()
+
+    def get_key(
+        self,
+        knowledge_id: str,
+        query: str,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        reranker: Optional["Reranker"] = None,
+    ) -> str:
+        query = normalize_prompt(query) if self.normalize_queries else query
+        return f"{knowledge_id}:{_hash([query, filters, limit, get_reranker_key(reranker)])}"
+
+    def get(self, key: str) -> Optional[List["Document"]]:
+        """Return the cached documents for a key, or None on a miss."""
+        from agno.document import Document
+
+        try:
+            entry = self.backend.get(key)
+        except Exception as e:
+            log_warning(f"Retrieval cache lookup failed: {e}")
+            self.metrics.increment("errors")
+            return None
+
+        if entry is None:
+            self.metrics.increment("misses")
+            return None
+        self.metrics.increment("hits")
+        log_debug(f"Retrieval cache hit: {key}")
+        # Copy the metadata, so that changes to the documents do not change the cache
+        return [Document(**{**document, "meta_data": dict(document["meta_data"])}) for document in entry["documents"]]
+
+    def set(self, key: str, documents: List["Document"]) -> None:
+        """Cache the documents of a search. Embeddings are not cached."""
+        entry = {
+            "documents": [
+                {
+                    "content": document.content,
+                    "id": document.id,
+                    "name": document.name,
+                    "meta_data": dict(document.meta_data),
+                    "reranking_score": document.reranking_score,
+                }
+                for document in documents
+            ],
+            "created_at": int(time()),
+        }
+        try:
+            self.backend.set(key, entry, ttl=self.ttl)
+            self.metrics.increment("stores")
+        except Exception as e:
+            log_warning(f"Storing search results in cache failed: {e}")
+            self.metrics.increment("errors")
+
+    def invalidate(self, knowledge_id: str) -> None:
+        """Drop the cached results of a knowledge base, after its documents changed."""
+        try:
+            self.backend.delete_prefix(f"{knowledge_id}:")
+            self.metrics.increment("invalidations")
+        except Exception as e:
+            log_warning(f"Invalidating retrieval cache failed: {e}")
+            self.metrics.increment("errors")
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return the hit rate and counters of the cache."""
+        return self.metrics.to_dict()
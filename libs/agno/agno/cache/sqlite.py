@@ -0,0 +1,78 @@
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from time import time
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+
+from agno.cache.base import CacheBackend
+from agno.utils.log import log_debug
+
+
+class SqliteCache(CacheBackend):
+    """Cache stored in a SQLite table, persisted across processes when `db_file` is set.
+
+    Args:
+        db_file: Path of the database file. Defaults to an in-memory database.
+        table_name: Name of the cache table.
+    """
+
+    def __init__(self, db_file: Optional[Union[str, Path]] = None, table_name: str = "agno_cache"):
+        if not table_name.isidentifier():
+            raise ValueError(f"Invalid table name: {table_name}")
+        self.db_file = db_file
+        self.table_name = table_name
+        if db_file is not None:
+            Path(db_file).parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(db_file) if db_file is not None else ":memory:", check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {table_name} (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+            )
+        log_debug(f"Created SqliteCache with table: '{table_name}'")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT value, expires_at FROM {self.table_name} WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] is not None and row[1] <= time():
+                with self._connection:
+                    self._connection.execute(f"DELETE FROM {self.table_name} WHERE key = ?", (key,))
+                return None
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        expires_at = time() + ttl if ttl is not None else None
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"INSERT OR REPLACE INTO {self.table_name} (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value, default=str), expires_at),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(f"DELETE FROM {self.table_name} WHERE key = ?", (key,))
+
+    def scan(self, prefix: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT key, value FROM {self.table_name} "
+                "WHERE substr(key, 1, ?) = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (len(prefix), prefix, time()),
+            ).fetchall()
+        for key, value in rows:
+            yield key, json.loads(value)
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"DELETE FROM {self.table_name} WHERE substr(key, 1, ?) = ?", (len(prefix), prefix)
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(f"DELETE FROM {self.table_name}")
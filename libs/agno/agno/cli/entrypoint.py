@@ -8,7 +8,9 @@ from typing import Optional
 import typer
 
 from agno.cli.ws.ws_cli import ws_cli
-from agno.utils.log import set_log_level_to_debug
+from agno.utils.import_time import get_cold_start_time
+from agno.utils.log import log_debug, set_log_level_to_debug
+from agno.utils.timer import Timer
 
 agno_cli = typer.Typer(
     help="""\b
@@ -28,6 +30,20 @@ Usage:
 )
 
 
+@agno_cli.callback()
+def main(ctx: typer.Context):
+    # Log the cold start and the run time of the command, shown with -d/--debug
+    cold_start_time = get_cold_start_time()
+    timer = Timer()
+    timer.start()
+
+    def log_timing() -> None:
+        timer.stop()
+        log_debug(f"Cold start: {cold_start_time:.3f}s, command `{ctx.invoked_subcommand}` ran in {timer.elapsed:.3f}s")
+
+    ctx.call_on_close(log_timing)
+
+
 @agno_cli.command(short_help="Setup your account")
 def setup(
     print_debug_log: bool = typer.Option(
@@ -1,8 +1,9 @@
 import asyncio
 import random
 import time
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Deque, Dict, List, Optional, Set, Tuple
 from urllib.parse import urljoin, urlparse
 
 import httpx
@@ -17,6 +18,16 @@ except ImportError:
     raise ImportError("The `bs4` package is not installed. Please install it via `pip install beautifulsoup4`.")
 
 
+@dataclass
+class _CachedPage:
+    """Validators and parsed content of a crawled page, used for conditional GETs on re-crawls."""
+
+    etag: Optional[str]
+    last_modified: Optional[str]
+    content: str
+    links: List[str]
+
+
 @dataclass
 class WebsiteReader(Reader):
     """Reader for Websites"""
@@ -25,19 +36,34 @@ class WebsiteReader(Reader):
     max_links: int = 10
 
     _visited: Set[str] = field(default_factory=set)
-    _urls_to_crawl: List[Tuple[str, int]] = field(default_factory=list)
+    _urls_to_crawl: Deque[Tuple[str, int]] = field(default_factory=deque)
 
     def __init__(
-        self, max_depth: int = 3, max_links: int = 10, timeout: int = 10, proxy: Optional[str] = None, **kwargs
+        self,
+        max_depth: int = 3,
+        max_links: int = 10,
+        timeout: int = 10,
+        proxy: Optional[str] = None,
+        max_concurrency: int = 10,
+        per_host_delay: float = 1.0,
+        **kwargs,
     ):
         super().__init__(**kwargs)
         self.max_depth = max_depth
         self.max_links = max_links
         self.proxy = proxy
         self.timeout = timeout
+        # Number of pages fetched concurrently by async_crawl
+        self.max_concurrency = max_concurrency
+        # Minimum number of seconds between two requests to the same host in async_crawl, 1 second by default
+        self.per_host_delay = per_host_delay
 
         self._visited = set()
-        self._urls_to_crawl = []
+        self._urls_to_crawl = deque()
+        # URLs already added to the frontier, so each URL is queued once
+        self._seen: Set[str] = set()
+        # Pages crawled by this reader, revalidated with conditional GETs when crawled again
+        self._page_cache: Dict[str, _CachedPage] = {}
 
     def delay(self, min_seconds=1, max_seconds=3):
         """
@@ -101,6 +127,63 @@ class WebsiteReader(Reader):
 
         return soup.get_text(strip=True, separator=" ")
 
+    def _parse_page(self, url: str, html: bytes, primary_domain: str) -> Tuple[str, List[str]]:
+        """
+        Parse a page and return its main content and the links to crawl from it.
+
+        :param url: The URL of the page, used to resolve relative links.
+        :param html: The HTML of the page.
+        :param primary_domain: Only links within this domain are returned.
+        :return: The main content and the list of links.
+        """
+        soup = BeautifulSoup(html, "html.parser")
+        main_content = self._extract_main_content(soup)
+
+        links: List[str] = []
+        for link in soup.find_all("a", href=True):
+            if not isinstance(link, Tag):
+                continue
+
+            full_url = urljoin(url, str(link["href"]))
+            if not isinstance(full_url, str):
+                continue
+
+            parsed_url = urlparse(full_url)
+            if parsed_url.netloc.endswith(primary_domain) and not any(
+                parsed_url.path.endswith(ext) for ext in [".pdf", ".jpg", ".png"]
+            ):
+                links.append(str(full_url))
+        return main_content, links
+
+    def _get_conditional_headers(self, url: str) -> Dict[str, str]:
+        """Return the If-None-Match and If-Modified-Since headers for a page crawled before."""
+        cached_page = self._page_cache.get(url)
+        if cached_page is None:
+            return {}
+        headers: Dict[str, str] = {}
+        if cached_page.etag:
+            headers["If-None-Match"] = cached_page.etag
+        if cached_page.last_modified:
+            headers["If-Modified-Since"] = cached_page.last_modified
+        return headers
+
+    def _cache_page(self, url: str, response: httpx.Response, main_content: str, links: List[str]) -> None:
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._page_cache[url] = _CachedPage(
+                etag=etag, last_modified=last_modified, content=main_content, links=links
+            )
+
+    def _enqueue_links(self, links: List[str], depth: int) -> None:
+        """Add the links not seen before to the frontier."""
+        if depth > self.max_depth:
+            return
+        for link in links:
+            if link not in self._seen:
+                self._seen.add(link)
+                self._urls_to_crawl.append((link, depth))
+
     def crawl(self, url: str, starting_depth: int = 1) -> Dict[str, str]:
         """
         Crawls a website and returns a dictionary of URLs and their corresponding content.
@@ -126,11 +209,12 @@ class WebsiteReader(Reader):
         num_links = 0
         crawler_result: Dict[str, str] = {}
         primary_domain = self._get_primary_domain(url)
-        # Add starting URL with its depth to the global list
+        # Add starting URL with its depth to the frontier
         self._urls_to_crawl.append((url, starting_depth))
+        self._seen.add(url)
         while self._urls_to_crawl:
-            # Unpack URL and depth from the global list
-            current_url, current_depth = self._urls_to_crawl.pop(0)
+            # Unpack URL and depth from the frontier
+            current_url, current_depth = self._urls_to_crawl.popleft()
 
             # Skip if
             # - URL is already visited
@@ -150,42 +234,28 @@ class WebsiteReader(Reader):
 
             try:
                 log_debug(f"Crawling: {current_url}")
+                headers = self._get_conditional_headers(current_url)
                 response = (
-                    httpx.get(current_url, timeout=self.timeout, proxy=self.proxy)
+                    httpx.get(current_url, timeout=self.timeout, proxy=self.proxy, headers=headers)
                     if self.proxy
-                    else httpx.get(current_url, timeout=self.timeout)
+                    else httpx.get(current_url, timeout=self.timeout, headers=headers)
                 )
 
-                response.raise_for_status()
-                soup = BeautifulSoup(response.content, "html.parser")
+                cached_page = self._page_cache.get(current_url)
+                if response.status_code == 304 and cached_page is not None:
+                    log_debug(f"Not modified: {current_url}")
+                    main_content, links = cached_page.content, cached_page.links
+                else:
+                    response.raise_for_status()
+                    main_content, links = self._parse_page(current_url, response.content, primary_domain)
+                    self._cache_page(current_url, response, main_content, links)
 
-                # Extract main content
-                main_content = self._extract_main_content(soup)
                 if main_content:
                     crawler_result[current_url] = main_content
                     num_links += 1
 
-                # Add found URLs to the global list, with incremented depth
-                for link in soup.find_all("a", href=True):
-                    if not isinstance(link, Tag):
-                        continue
-
-                    href_str = str(link["href"])
-                    full_url = urljoin(current_url, href_str)
-
-                    if not isinstance(full_url, str):
-                        continue
-
-                    parsed_url = urlparse(full_url)
-                    if parsed_url.netloc.endswith(primary_domain) and not any(
-                        parsed_url.path.endswith(ext) for ext in [".pdf", ".jpg", ".png"]
-                    ):
-                        full_url_str = str(full_url)
-                        if (
-                            full_url_str not in self._visited
-                            and (full_url_str, current_depth + 1) not in self._urls_to_crawl
-                        ):
-                            self._urls_to_crawl.append((full_url_str, current_depth + 1))
+                # Add found URLs to the frontier, with incremented depth
+                self._enqueue_links(links, current_depth + 1)
 
             except httpx.HTTPStatusError as e:
                 # Log HTTP status errors but continue crawling other pages
@@ -213,10 +283,51 @@ class WebsiteReader(Reader):
 
         return crawler_result
 
+    async def _async_fetch_page(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        primary_domain: str,
+        host_locks: Dict[str, asyncio.Lock],
+        host_next_request: Dict[str, float],
+    ) -> Tuple[str, List[str]]:
+        """
+        Fetch and parse a page, waiting for the per host delay first.
+
+        :return: The main content of the page and its links.
+        """
+        host = urlparse(url).netloc
+        # Reserve the next request slot of the host under the lock and wait for it after releasing the lock
+        async with host_locks.setdefault(host, asyncio.Lock()):
+            now = time.monotonic()
+            request_at = max(now, host_next_request.get(host, 0.0))
+            host_next_request[host] = request_at + self.per_host_delay
+        if request_at > now:
+            await asyncio.sleep(request_at - now)
+
+        log_debug(f"Crawling asynchronously: {url}")
+        response = await client.get(
+            url, timeout=self.timeout, follow_redirects=True, headers=self._get_conditional_headers(url)
+        )
+        cached_page = self._page_cache.get(url)
+        if response.status_code == 304 and cached_page is not None:
+            log_debug(f"Not modified: {url}")
+            return cached_page.content, cached_page.links
+
+        response.raise_for_status()
+        # Parse in a thread so the event loop keeps serving the other fetchers
+        main_content, links = await asyncio.to_thread(self._parse_page, url, response.content, primary_domain)
+        self._cache_page(url, response, main_content, links)
+        return main_content, links
+
     async def async_crawl(self, url: str, starting_depth: int = 1) -> Dict[str, str]:
         """
         Asynchronously crawls a website and returns a dictionary of URLs and their corresponding content.
 
+        Pages are fetched by `max_concurrency` concurrent workers from a breadth-first frontier, with at
+        least `per_host_delay` seconds (1 second by default) between two requests to the same host. Pages
+        crawled before by this reader are revalidated with conditional GETs.
+
         Parameters:
         - url (str): The starting URL to begin the crawl.
         - starting_depth (int, optional): The starting depth level for the crawl. Defaults to 1.
@@ -229,86 +340,80 @@ class WebsiteReader(Reader):
         - httpx.HTTPStatusError: If there's an HTTP status error.
         - httpx.RequestError: If there's a request-related error (connection, timeout, etc).
         """
-        num_links = 0
         crawler_result: Dict[str, str] = {}
         primary_domain = self._get_primary_domain(url)
 
         # Clear previously visited URLs and URLs to crawl
-        self._visited = set()
-        self._urls_to_crawl = [(url, starting_depth)]
-
-        client_args = {"proxy": self.proxy} if self.proxy else {}
-        async with httpx.AsyncClient(**client_args) as client:  # type: ignore
-            while self._urls_to_crawl and num_links < self.max_links:
-                current_url, current_depth = self._urls_to_crawl.pop(0)
-
-                if (
-                    current_url in self._visited
-                    or not urlparse(current_url).netloc.endswith(primary_domain)
-                    or current_depth > self.max_depth
-                    or num_links >= self.max_links
-                ):
-                    continue
+        self._visited = {url}
+        self._seen = {url}
+        self._urls_to_crawl = deque()
 
-                self._visited.add(current_url)
-                await self.async_delay()
+        host_locks: Dict[str, asyncio.Lock] = {}
+        host_next_request: Dict[str, float] = {}
+        queue: "asyncio.Queue[Tuple[str, int]]" = asyncio.Queue()
 
-                try:
-                    log_debug(f"Crawling asynchronously: {current_url}")
-                    response = await client.get(current_url, timeout=self.timeout, follow_redirects=True)
-                    response.raise_for_status()
-
-                    soup = BeautifulSoup(response.content, "html.parser")
-
-                    # Extract main content
-                    main_content = self._extract_main_content(soup)
-                    if main_content:
-                        crawler_result[current_url] = main_content
-                        num_links += 1
-
-                    # Add found URLs to the list, with incremented depth
-                    for link in soup.find_all("a", href=True):
-                        if not isinstance(link, Tag):
-                            continue
+        def enqueue_links(links: List[str], depth: int) -> None:
+            self._enqueue_links(links, depth)
+            while self._urls_to_crawl:
+                queue.put_nowait(self._urls_to_crawl.popleft())
 
-                        href_str = str(link["href"])
-                        full_url = urljoin(current_url, href_str)
-
-                        if not isinstance(full_url, str):
-                            continue
-
-                        parsed_url = urlparse(full_url)
-                        if parsed_url.netloc.endswith(primary_domain) and not any(
-                            parsed_url.path.endswith(ext) for ext in [".pdf", ".jpg", ".png"]
+        client_args = {"proxy": self.proxy} if self.proxy else {}
+        async with httpx.AsyncClient(**client_args) as client:  # type: ignore
+            # Crawl the starting URL first, errors on it are raised
+            try:
+                main_content, links = await self._async_fetch_page(
+                    client, url, primary_domain, host_locks, host_next_request
+                )
+            except (httpx.HTTPStatusError, httpx.RequestError) as e:
+                logger.warning(f"Error while crawling asynchronously {url}: {e}")
+                raise
+            except Exception as e:
+                logger.warning(f"Failed to crawl asynchronously {url}: {e}")
+                # Wrap non-HTTP exceptions in a RequestError
+                raise httpx.RequestError(
+                    f"Failed to crawl starting URL {url} asynchronously: {str(e)}", request=None
+                ) from e
+            if main_content:
+                crawler_result[url] = main_content
+            enqueue_links(links, starting_depth + 1)
+
+            async def worker() -> None:
+                while True:
+                    current_url, current_depth = await queue.get()
+                    try:
+                        if (
+                            len(crawler_result) >= self.max_links
+                            or current_url in self._visited
+                            or not urlparse(current_url).netloc.endswith(primary_domain)
                         ):
-                            full_url_str = str(full_url)
-                            if (
-                                full_url_str not in self._visited
-                                and (full_url_str, current_depth + 1) not in self._urls_to_crawl
-                            ):
-                                self._urls_to_crawl.append((full_url_str, current_depth + 1))
-
-                except httpx.HTTPStatusError as e:
-                    # Log HTTP status errors but continue crawling other pages
-                    logger.warning(f"HTTP status error while crawling asynchronously {current_url}: {e}")
-                    # For the initial URL, we should raise the error
-                    if current_url == url and not crawler_result:
-                        raise
-                except httpx.RequestError as e:
-                    # Log request errors but continue crawling other pages
-                    logger.warning(f"Request error while crawling asynchronously {current_url}: {e}")
-                    # For the initial URL, we should raise the error
-                    if current_url == url and not crawler_result:
-                        raise
-                except Exception as e:
-                    # Log other exceptions but continue crawling other pages
-                    logger.warning(f"Failed to crawl asynchronously {current_url}: {e}")
-                    # For the initial URL, we should raise the error
-                    if current_url == url and not crawler_result:
-                        # Wrap non-HTTP exceptions in a RequestError
-                        raise httpx.RequestError(
-                            f"Failed to crawl starting URL {url} asynchronously: {str(e)}", request=None
-                        ) from e
+                            continue
+                        self._visited.add(current_url)
+                        main_content, links = await self._async_fetch_page(
+                            client, current_url, primary_domain, host_locks, host_next_request
+                        )
+                        if main_content and len(crawler_result) < self.max_links:
+                            crawler_result[current_url] = main_content
+                        enqueue_links(links, current_depth + 1)
+                    except httpx.HTTPStatusError as e:
+                        # Log HTTP status errors but continue crawling other pages
+                        logger.warning(f"HTTP status error while crawling asynchronously {current_url}: {e}")
+                    except httpx.RequestError as e:
+                        # Log request errors but continue crawling other pages
+                        logger.warning(f"Request error while crawling asynchronously {current_url}: {e}")
+                    except Exception as e:
+                        # Log other exceptions but continue crawling other pages
+                        logger.warning(f"Failed to crawl asynchronously {current_url}: {e}")
+                    finally:
+                        queue.task_done()
+
+            if len(crawler_result) < self.max_links:
+                workers = [asyncio.create_task(worker()) for _ in range(max(1, self.max_concurrency))]
+                try:
+                    await queue.join()
+                finally:
+                    for task in workers:
+                        task.cancel()
+                    await asyncio.gather(*workers, return_exceptions=True)
 
         # If we couldn't crawl any pages, raise an error
         if not crawler_result:
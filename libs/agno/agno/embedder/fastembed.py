@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
 from agno.embedder.base import Embedder
+from agno.utils.local_models import local_model_registry
 from agno.utils.log import logger
 
 try:
@@ -25,15 +26,24 @@ class FastEmbedEmbedder(Embedder):
     id: str = "BAAI/bge-small-en-v1.5"
     dimensions: int = 384
 
-    def get_embedding(self, text: str) -> List[float]:
-        model = TextEmbedding(model_name=self.id)
-        embeddings = model.embed(text)
-        embedding_list = list(embeddings)[0]
-        if isinstance(embedding_list, np.ndarray):
-            return embedding_list.tolist()
+    # Concurrent requests are embedded together, in batches of up to max_batch_size texts
+    max_batch_size: int = 32
+    max_wait_ms: float = 5.0
 
+    def get_embedding(self, text: str) -> List[float]:
+        # Models are loaded once per process and shared between embedders
+        model = local_model_registry.get_model(("fastembed", self.id), lambda: TextEmbedding(model_name=self.id))
+        batcher = local_model_registry.get_batcher(
+            key=(("fastembed", self.id),),
+            batch_fn=lambda texts: list(model.embed(texts)),
+            max_batch_size=self.max_batch_size,
+            max_wait_ms=self.max_wait_ms,
+        )
         try:
-            return list(embedding_list)
+            embedding = batcher.submit([text])[0]
+            if isinstance(embedding, np.ndarray):
+                return embedding.tolist()
+            return list(embedding)
         except Exception as e:
             logger.warning(e)
             return []
@@ -0,0 +1,44 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from agno.embedder.base import Embedder
+
+
+@dataclass
+class MatryoshkaEmbedder(Embedder):
+    """Truncates the embeddings of a Matryoshka-trained model to fewer dimensions.
+
+    Models trained with Matryoshka representation learning (e.g. OpenAI text-embedding-3, nomic-embed)
+    keep most of their quality when only the first dimensions are used. Vector dbs size their
+    columns from `dimensions`, so storage and index size shrink accordingly.
+    """
+
+    embedder: Optional[Embedder] = None
+    dimensions: Optional[int] = 256
+    # Re-normalize truncated embeddings to unit length
+    normalize: bool = True
+
+    def __post_init__(self):
+        if self.embedder is None:
+            raise ValueError("MatryoshkaEmbedder requires an embedder")
+        if self.dimensions is None:
+            raise ValueError("MatryoshkaEmbedder requires dimensions")
+        if self.embedder.dimensions is not None and self.dimensions > self.embedder.dimensions:
+            raise ValueError(
+                f"Cannot truncate {self.embedder.dimensions} dimensional embeddings to {self.dimensions} dimensions"
+            )
+
+    def _truncate(self, embedding: List[float]) -> List[float]:
+        truncated = list(embedding[: self.dimensions])
+        if self.normalize:
+            norm = sum(v * v for v in truncated) ** 0.5
+            if norm > 0:
+                truncated = [v / norm for v in truncated]
+        return truncated
+
+    def get_embedding(self, text: str) -> List[float]:
+        return self._truncate(self.embedder.get_embedding(text))  # type: ignore
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        embedding, usage = self.embedder.get_embedding_and_usage(text)  # type: ignore
+        return self._truncate(embedding), usage
@@ -1,7 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple, Union
 
 from agno.embedder.base import Embedder
+from agno.utils.local_models import local_model_registry
 from agno.utils.log import logger
 
 try:
@@ -24,18 +25,44 @@ class SentenceTransformerEmbedder(Embedder):
     sentence_transformer_client: Optional[SentenceTransformer] = None
     prompt: Optional[str] = None
     normalize_embeddings: bool = False
+    # Concurrent requests are encoded together, in batches of up to max_batch_size texts
+    max_batch_size: int = 32
+    max_wait_ms: float = 5.0
+
+    # The model of the embedder is the one loaded by the registry, not a client passed in
+    _uses_shared_model: bool = field(default=False, init=False, repr=False)
+
+    def _get_model(self) -> SentenceTransformer:
+        if self.sentence_transformer_client is None:
+            # Models are loaded once per process and shared between embedders
+            self.sentence_transformer_client = local_model_registry.get_model(
+                ("sentence_transformer", self.id), lambda: SentenceTransformer(model_name_or_path=self.id)
+            )
+            self._uses_shared_model = True
+        return self.sentence_transformer_client
+
+    def _encode(self, texts: List[str]) -> List[List[float]]:
+        model = self._get_model()
+        # The batch function does not reference the embedder, so the embedder can be garbage collected
+        prompt, normalize_embeddings = self.prompt, self.normalize_embeddings
+        batcher = local_model_registry.get_batcher(
+            key=(("sentence_transformer", self.id), prompt, normalize_embeddings),
+            batch_fn=lambda batch: model.encode(batch, prompt=prompt, normalize_embeddings=normalize_embeddings),
+            max_batch_size=self.max_batch_size,
+            max_wait_ms=self.max_wait_ms,
+            # A client passed in gets a batcher of its own, stopped with the embedder
+            owner=None if self._uses_shared_model else self,
+        )
+        return [
+            embedding.tolist() if isinstance(embedding, np.ndarray) else embedding
+            for embedding in batcher.submit(texts)
+        ]
 
     def get_embedding(self, text: Union[str, List[str]]) -> List[float]:
-        if not self.sentence_transformer_client:
-            model = SentenceTransformer(model_name_or_path=self.id)
-        else:
-            model = self.sentence_transformer_client
-        embedding = model.encode(text, prompt=self.prompt, normalize_embeddings=self.normalize_embeddings)
         try:
-            if isinstance(embedding, np.ndarray):
-                return embedding.tolist()
-
-            return embedding  # type: ignore
+            if isinstance(text, str):
+                return self._encode([text])[0]
+            return self._encode(text)  # type: ignore
         except Exception as e:
             logger.warning(e)
             return []
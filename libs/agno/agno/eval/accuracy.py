@@ -259,6 +259,22 @@ Remember: You must only compare the agent_output to the expected_output. The exp
                 raise EvalError(f"The eval input needs to be or return a string, but it returned: {type(_input)}")
         return self.input
 
+    def get_evaluation_input(self, eval_input: str, expected_output: str, output: str) -> str:
+        """Return the input of the evaluator agent, comparing the output of the Agent to the expected output"""
+        return dedent(f"""\
+            <agent_input>
+            {eval_input}
+            </agent_input>
+
+            <expected_output>
+            {expected_output}
+            </expected_output>
+
+            <agent_output>
+            {output}
+            </agent_output>\
+            """)
+
     def evaluate_answer(
         self,
         input: str,
@@ -352,19 +368,7 @@ Remember: You must only compare the agent_output to the expected_output. The exp
                     logger.error(f"Failed to generate a valid answer on iteration {i + 1}: {output}")
                     continue
 
-                evaluation_input = dedent(f"""\
-                    <agent_input>
-                    {eval_input}
-                    </agent_input>
-
-                    <expected_output>
-                    {eval_expected_output}
-                    </expected_output>
-
-                    <agent_output>
-                    {output}
-                    </agent_output>\
-                    """)
+                evaluation_input = self.get_evaluation_input(eval_input, eval_expected_output, output)
                 logger.debug(f"Agent output #{i + 1}: {output}")
                 result = self.evaluate_answer(
                     input=eval_input,
@@ -474,19 +478,7 @@ Remember: You must only compare the agent_output to the expected_output. The exp
                     logger.error(f"Failed to generate a valid answer on iteration {i + 1}: {output}")
                     continue
 
-                evaluation_input = dedent(f"""\
-                    <agent_input>
-                    {eval_input}
-                    </agent_input>
-
-                    <expected_output>
-                    {eval_expected_output}
-                    </expected_output>
-
-                    <agent_output>
-                    {output}
-                    </agent_output>\
-                    """)
+                evaluation_input = self.get_evaluation_input(eval_input, eval_expected_output, output)
                 logger.debug(f"Agent output #{i + 1}: {output}")
                 result = await self.aevaluate_answer(
                     input=eval_input,
@@ -556,19 +548,7 @@ Remember: You must only compare the agent_output to the expected_output. The exp
         eval_input = self.get_eval_input()
         eval_expected_output = self.get_eval_expected_output()
 
-        evaluation_input = dedent(f"""\
-            <agent_input>
-            {eval_input}
-            </agent_input>
-
-            <expected_output>
-            {eval_expected_output}
-            </expected_output>
-
-            <agent_output>
-            {output}
-            </agent_output>\
-            """)
+        evaluation_input = self.get_evaluation_input(eval_input, eval_expected_output, output)
 
         result = self.evaluate_answer(
             input=eval_input,
@@ -650,19 +630,7 @@ Remember: You must only compare the agent_output to the expected_output. The exp
         eval_input = self.get_eval_input()
         eval_expected_output = self.get_eval_expected_output()
 
-        evaluation_input = dedent(f"""\
-            <agent_input>
-            {eval_input}
-            </agent_input>
-
-            <expected_output>
-            {eval_expected_output}
-            </expected_output>
-
-            <agent_output>
-            {output}
-            </agent_output>\
-            """)
+        evaluation_input = self.get_evaluation_input(eval_input, eval_expected_output, output)
 
         result = await self.aevaluate_answer(
             input=eval_input,
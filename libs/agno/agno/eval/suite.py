@@ -0,0 +1,376 @@
+import asyncio
+import json
+from dataclasses import asdict, dataclass, field
+from hashlib import sha256
+from os import getenv
+from pathlib import Path
+from time import perf_counter
+from typing import IO, TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+from uuid import uuid4
+
+from agno.agent import Agent
+from agno.api.schemas.evals import EvalType
+from agno.cache.base import CacheBackend, CacheMetrics
+from agno.eval.accuracy import AccuracyEval, AccuracyEvaluation, AccuracyResult
+from agno.eval.performance import PerformanceEval
+from agno.eval.reliability import ReliabilityEval
+from agno.eval.utils import async_log_eval_run, store_result_in_file
+from agno.team.team import Team
+from agno.utils.log import log_debug, logger, set_log_level_to_debug, set_log_level_to_info
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+Eval = Union[AccuracyEval, ReliabilityEval, PerformanceEval]
+
+
+def get_eval_type(eval: Eval) -> EvalType:
+    if isinstance(eval, AccuracyEval):
+        return EvalType.ACCURACY
+    if isinstance(eval, ReliabilityEval):
+        return EvalType.RELIABILITY
+    return EvalType.PERFORMANCE
+
+
+@dataclass
+class EvalCaseResult:
+    """Result of one eval of a suite"""
+
+    eval_id: str
+    eval_type: EvalType
+    name: Optional[str] = None
+    # "completed" or "error"
+    status: str = "completed"
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    # Seconds taken by the eval, including the time waiting for the concurrency limits
+    duration: float = 0.0
+    # Number of agent outputs read from the output cache
+    cached_outputs: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "eval_id": self.eval_id,
+            "eval_type": self.eval_type.value,
+            "name": self.name,
+            "status": self.status,
+            "result": self.result,
+            "error": self.error,
+            "duration": self.duration,
+            "cached_outputs": self.cached_outputs,
+        }
+
+
+@dataclass
+class EvalSuiteResult:
+    results: List[EvalCaseResult] = field(default_factory=list)
+    # Seconds taken by the suite
+    duration: float = 0.0
+    cache_metrics: Optional[Dict[str, Any]] = None
+
+    @property
+    def failed(self) -> List[EvalCaseResult]:
+        return [r for r in self.results if r.status != "completed"]
+
+    def print_summary(self, console: Optional["Console"] = None):
+        from rich.box import ROUNDED
+        from rich.console import Console
+        from rich.table import Table
+
+        if console is None:
+            console = Console()
+
+        summary_table = Table(
+            box=ROUNDED,
+            border_style="blue",
+            title="[ Eval Suite Summary ]",
+            title_style="bold sky_blue1",
+            title_justify="center",
+        )
+        summary_table.add_column("Eval")
+        summary_table.add_column("Type")
+        summary_table.add_column("Status")
+        summary_table.add_column("Result")
+        summary_table.add_column("Duration (s)")
+        for case in self.results:
+            if case.error is not None:
+                outcome = case.error
+            elif case.eval_type == EvalType.ACCURACY and case.result is not None:
+                outcome = f"{case.result['avg_score']:.2f}/10"
+            elif case.eval_type == EvalType.RELIABILITY and case.result is not None:
+                outcome = case.result["eval_status"]
+            elif case.eval_type == EvalType.PERFORMANCE and case.result is not None:
+                outcome = f"{case.result['avg_run_time']:.6f}s"
+            else:
+                outcome = ""
+            summary_table.add_row(
+                case.name or case.eval_id, case.eval_type.value, case.status, outcome, f"{case.duration:.2f}"
+            )
+        console.print(summary_table)
+        console.print(
+            f"{len(self.results)} evals, {len(self.failed)} errors in {self.duration:.2f}s"
+            + (f", output cache hit rate {self.cache_metrics['hit_rate']:.0%}" if self.cache_metrics else "")
+        )
+
+
+@dataclass
+class EvalSuite:
+    """Run many AccuracyEval, ReliabilityEval and PerformanceEval cases together.
+
+    The agent runs and evaluator runs of the accuracy evals, all iterations included, run concurrently, up to
+    `max_concurrency` agent runs and `max_evaluator_concurrency` evaluator runs at a time. Agents are copied for each
+    run; runs of the same Team are not run concurrently, as a Team can not be copied. Requests to a model go through
+    its rate limiter, shared by all runs: set `requests_per_minute`, `tokens_per_minute` or `max_concurrent_requests`
+    on the models to stay within the provider limits.
+
+    Reliability evals make no model calls and run as they come. Performance evals measure run time and memory,
+    so they run one at a time once the other evals are done.
+
+    If `output_cache` is set, the outputs of the agents are cached by agent, model, input and iteration, so that
+    changing the expected outputs or the evaluator does not run the agents again. Use a persistent backend,
+    e.g. SqliteCache, to reuse outputs across runs of the suite.
+    """
+
+    # Evals to run
+    evals: List[Eval] = field(default_factory=list)
+    # Suite name
+    name: Optional[str] = None
+    # Suite UUID
+    suite_id: str = field(default_factory=lambda: str(uuid4()))
+
+    # Maximum number of concurrent agent and team runs
+    max_concurrency: int = 8
+    # Maximum number of concurrent evaluator runs. Defaults to `max_concurrency`
+    max_evaluator_concurrency: Optional[int] = None
+
+    # Cache of the agent outputs
+    output_cache: Optional[CacheBackend] = None
+    # Seconds before a cached output expires. None to never expire.
+    output_cache_ttl: Optional[float] = None
+
+    # If set, the result of each eval is appended to this JSONL file as soon as the eval finishes
+    report_path: Optional[str] = None
+    # Result of the suite
+    result: Optional[EvalSuiteResult] = None
+
+    # Print summary of results
+    print_summary: bool = False
+    # Enable debug logs
+    debug_mode: bool = getenv("AGNO_DEBUG", "false").lower() == "true"
+
+    def __post_init__(self):
+        self.cache_metrics = CacheMetrics()
+        self._team_locks: Dict[int, asyncio.Lock] = {}
+        self._report_file: Optional[IO[str]] = None
+
+    def get_output_cache_key(self, eval: AccuracyEval, eval_input: str, iteration: int) -> str:
+        """Key of an agent output in the output cache"""
+        entity: Union[Agent, Team] = eval.agent if eval.agent is not None else eval.team  # type: ignore
+        model = entity.model
+        instructions = entity.instructions if isinstance(entity.instructions, (str, list)) else None
+        description = entity.description if isinstance(entity.description, str) else None
+        key_data = {
+            "agent_id": eval.agent.agent_id if eval.agent is not None else None,
+            "team_id": eval.team.team_id if eval.team is not None else None,
+            "name": entity.name,
+            "model": model.to_dict() if model is not None else None,
+            "instructions": instructions,
+            "description": description,
+            "input": eval_input,
+            "iteration": iteration,
+        }
+        key_hash = sha256(json.dumps(key_data, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:32]
+        return f"eval_output:{key_hash}"
+
+    def _get_cached_output(self, key: str) -> Optional[str]:
+        if self.output_cache is None:
+            return None
+        try:
+            cached = self.output_cache.get(key)
+        except Exception as e:
+            self.cache_metrics.increment("errors")
+            logger.warning(f"Failed to read the eval output cache: {e}")
+            return None
+        if cached is None:
+            self.cache_metrics.increment("misses")
+            return None
+        self.cache_metrics.increment("hits")
+        return cached["output"]
+
+    def _set_cached_output(self, key: str, output: str) -> None:
+        if self.output_cache is None:
+            return
+        try:
+            self.output_cache.set(key, {"output": output}, ttl=self.output_cache_ttl)
+            self.cache_metrics.increment("stores")
+        except Exception as e:
+            self.cache_metrics.increment("errors")
+            logger.warning(f"Failed to write the eval output cache: {e}")
+
+    async def _aget_output(
+        self, eval: AccuracyEval, eval_input: str, iteration: int, semaphore: asyncio.Semaphore
+    ) -> Tuple[Optional[str], bool]:
+        """Return the output of the agent or team for an iteration, and whether it was read from the cache"""
+        key = self.get_output_cache_key(eval, eval_input, iteration)
+        cached_output = self._get_cached_output(key)
+        if cached_output is not None:
+            return cached_output, True
+
+        if eval.agent is not None:
+            async with semaphore:
+                response = await eval.agent.deep_copy().arun(message=eval_input)
+        else:
+            team = eval.team
+            team_lock = self._team_locks.setdefault(id(team), asyncio.Lock())
+            async with team_lock, semaphore:
+                response = await team.arun(message=eval_input)  # type: ignore
+
+        if not response.content:
+            return None, False
+        output = response.content if isinstance(response.content, str) else str(response.content)
+        self._set_cached_output(key, output)
+        return output, False
+
+    async def _arun_accuracy_eval(
+        self, eval: AccuracyEval, semaphore: asyncio.Semaphore, evaluator_semaphore: asyncio.Semaphore
+    ) -> EvalCaseResult:
+        case = EvalCaseResult(eval_id=eval.eval_id, eval_type=EvalType.ACCURACY, name=eval.name)
+        if (eval.agent is None) == (eval.team is None):
+            case.status = "error"
+            case.error = "Provide one of 'agent' or 'team' to run the evaluation"
+            return case
+
+        eval_input = eval.get_eval_input()
+        eval_expected_output = eval.get_eval_expected_output()
+        evaluator_agent = eval.get_evaluator_agent()
+
+        async def run_iteration(iteration: int) -> Tuple[Optional[AccuracyEvaluation], bool]:
+            output, cached = await self._aget_output(eval, eval_input, iteration, semaphore)
+            if not output:
+                logger.error(f"Failed to generate a valid answer on iteration {iteration + 1} of eval {eval.eval_id}")
+                return None, cached
+            async with evaluator_semaphore:
+                evaluation = await eval.aevaluate_answer(
+                    input=eval_input,
+                    evaluator_agent=evaluator_agent.deep_copy(),
+                    evaluation_input=eval.get_evaluation_input(eval_input, eval_expected_output, output),
+                    evaluator_expected_output=eval_expected_output,
+                    agent_output=output,
+                )
+            return evaluation, cached
+
+        iterations = await asyncio.gather(*[run_iteration(i) for i in range(eval.num_iterations)])
+        case.cached_outputs = sum(1 for _, cached in iterations if cached)
+        evaluations = [evaluation for evaluation, _ in iterations if evaluation is not None]
+        if not evaluations:
+            case.status = "error"
+            case.error = "No iteration could be evaluated"
+            return case
+
+        eval.result = AccuracyResult(results=evaluations)
+        case.result = asdict(eval.result)
+
+        if eval.file_path_to_save_results is not None:
+            store_result_in_file(
+                file_path=eval.file_path_to_save_results, name=eval.name, eval_id=eval.eval_id, result=eval.result
+            )
+        if eval.monitoring:
+            entity: Union[Agent, Team] = eval.agent if eval.agent is not None else eval.team  # type: ignore
+            await async_log_eval_run(
+                run_id=eval.eval_id,
+                run_data=case.result,
+                eval_type=EvalType.ACCURACY,
+                agent_id=eval.agent.agent_id if eval.agent is not None else None,
+                team_id=eval.team.team_id if eval.team is not None else None,
+                model_id=entity.model.id if entity.model is not None else None,
+                model_provider=entity.model.provider if entity.model is not None else None,
+                name=eval.name,
+                evaluated_entity_name=entity.name,
+            )
+        return case
+
+    async def _arun_reliability_eval(self, eval: ReliabilityEval) -> EvalCaseResult:
+        case = EvalCaseResult(eval_id=eval.eval_id, eval_type=EvalType.RELIABILITY, name=eval.name)
+        result = await eval.arun(print_results=False)
+        case.result = asdict(result) if result is not None else None
+        return case
+
+    async def _arun_performance_eval(self, eval: PerformanceEval) -> EvalCaseResult:
+        case = EvalCaseResult(eval_id=eval.eval_id, eval_type=EvalType.PERFORMANCE, name=eval.name)
+        if asyncio.iscoroutinefunction(eval.func):
+            result = await eval.arun(print_summary=False, print_results=False)
+        else:
+            result = eval.run(print_summary=False, print_results=False)
+        case.result = asdict(result)
+        return case
+
+    async def _arun_case(self, eval: Eval, *args: Any) -> EvalCaseResult:
+        """Run an eval, recording its duration and errors, and append its result to the report"""
+        start = perf_counter()
+        try:
+            if isinstance(eval, AccuracyEval):
+                case = await self._arun_accuracy_eval(eval, *args)
+            elif isinstance(eval, ReliabilityEval):
+                case = await self._arun_reliability_eval(eval)
+            else:
+                case = await self._arun_performance_eval(eval)
+        except Exception as e:
+            logger.exception(f"Eval {eval.eval_id} failed: {e}")
+            case = EvalCaseResult(
+                eval_id=eval.eval_id, eval_type=get_eval_type(eval), name=eval.name, status="error", error=str(e)
+            )
+        case.duration = perf_counter() - start
+        self._write_report(case)
+        log_debug(f"Eval {case.name or case.eval_id} finished in {case.duration:.2f}s: {case.status}")
+        return case
+
+    def _write_report(self, case: EvalCaseResult) -> None:
+        if self._report_file is None:
+            return
+        self._report_file.write(json.dumps(case.to_dict(), default=str) + "\n")
+        self._report_file.flush()
+
+    async def arun(self, *, print_summary: bool = False) -> EvalSuiteResult:
+        """Run the evals of the suite, returning their results in the order of `evals`"""
+        set_log_level_to_debug() if self.debug_mode else set_log_level_to_info()
+        log_debug(f"************ Eval Suite Start: {self.suite_id} ************")
+
+        start = perf_counter()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        evaluator_semaphore = asyncio.Semaphore(self.max_evaluator_concurrency or self.max_concurrency)
+        self.cache_metrics = CacheMetrics()
+
+        if self.report_path is not None:
+            report_path = Path(self.report_path.format(name=self.name, suite_id=self.suite_id))
+            report_path.parent.mkdir(parents=True, exist_ok=True)
+            self._report_file = report_path.open("w")
+        try:
+            results: List[Optional[EvalCaseResult]] = [None] * len(self.evals)
+            concurrent = [i for i, e in enumerate(self.evals) if not isinstance(e, PerformanceEval)]
+            cases = await asyncio.gather(
+                *[self._arun_case(self.evals[i], semaphore, evaluator_semaphore) for i in concurrent]
+            )
+            for i, case in zip(concurrent, cases):
+                results[i] = case
+            for i, e in enumerate(self.evals):
+                if isinstance(e, PerformanceEval):
+                    results[i] = await self._arun_case(e)
+        finally:
+            if self._report_file is not None:
+                self._report_file.close()
+                self._report_file = None
+
+        self.result = EvalSuiteResult(
+            results=[case for case in results if case is not None],
+            duration=perf_counter() - start,
+            cache_metrics=self.cache_metrics.to_dict() if self.output_cache is not None else None,
+        )
+        if self.print_summary or print_summary:
+            self.result.print_summary()
+
+        log_debug(f"*********** Eval Suite End: {self.suite_id} ***********")
+        return self.result
+
+    def run(self, *, print_summary: bool = False) -> EvalSuiteResult:
+        """Run the evals of the suite. Use `arun` if an event loop is already running"""
+        return asyncio.run(self.arun(print_summary=print_summary))
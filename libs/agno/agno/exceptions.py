@@ -56,6 +56,16 @@ class RunCancelledException(Exception):
         super().__init__(message)
 
 
+class RunTimeoutException(RunCancelledException):
+    """Exception raised inside a run that does not finish before its deadline.
+
+    It stops the model requests and tool calls of the run, the run itself returns a cancelled response.
+    """
+
+    def __init__(self, message: str = "Run timed out"):
+        super().__init__(message)
+
+
 class AgnoError(Exception):
     """Exception raised when an internal error occurs."""
 
@@ -92,3 +102,9 @@ class EvalError(Exception):
     """Exception raised when an evaluation fails."""
 
     pass
+
+
+class ToolExecutorOverloadedError(Exception):
+    """Exception raised when a tool executor has too many calls waiting."""
+
+    pass
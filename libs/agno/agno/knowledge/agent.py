@@ -4,6 +4,7 @@ from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Set, Tupl
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from agno.cache.retrieval import RetrievalCache, get_source_id
 from agno.document import Document
 from agno.document.chunking.fixed import FixedSizeChunking
 from agno.document.chunking.strategy import ChunkingStrategy
@@ -26,6 +27,11 @@ class AgentKnowledge(BaseModel):
 
     chunking_strategy: ChunkingStrategy = Field(default_factory=FixedSizeChunking)
 
+    # Cache of search results, invalidated when documents are loaded to the knowledge base
+    search_cache: Optional[RetrievalCache] = None
+    # Id of the knowledge base in the search cache. Defaults to an id derived from the vector db
+    knowledge_id: Optional[str] = None
+
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
     valid_metadata_filters: Set[str] = None  # type: ignore
@@ -50,6 +56,30 @@ class AgentKnowledge(BaseModel):
         """
         raise NotImplementedError
 
+    def get_knowledge_id(self) -> str:
+        """Returns the id of the knowledge base in the search cache"""
+        if self.knowledge_id is not None:
+            return self.knowledge_id
+        return get_source_id(self.vector_db)
+
+    def _get_search_cache_key(
+        self, query: str, num_documents: int, filters: Optional[Dict[str, Any]] = None
+    ) -> Optional[str]:
+        if self.search_cache is None:
+            return None
+        return self.search_cache.get_key(
+            self.get_knowledge_id(),
+            query,
+            filters=filters,
+            limit=num_documents,
+            reranker=getattr(self.vector_db, "reranker", None),
+        )
+
+    def invalidate_search_cache(self) -> None:
+        """Drops the cached search results, after the documents of the knowledge base changed"""
+        if self.search_cache is not None:
+            self.search_cache.invalidate(self.get_knowledge_id())
+
     def search(
         self, query: str, num_documents: Optional[int] = None, filters: Optional[Dict[str, Any]] = None
     ) -> List[Document]:
@@ -60,8 +90,17 @@ class AgentKnowledge(BaseModel):
                 return []
 
             _num_documents = num_documents or self.num_documents
+            cache_key = self._get_search_cache_key(query, _num_documents, filters)
+            if cache_key is not None:
+                cached_documents = self.search_cache.get(cache_key)  # type: ignore
+                if cached_documents is not None:
+                    return cached_documents
+
             log_debug(f"Getting {_num_documents} relevant documents for query: {query}")
-            return self.vector_db.search(query=query, limit=_num_documents, filters=filters)
+            documents = self.vector_db.search(query=query, limit=_num_documents, filters=filters)
+            if cache_key is not None:
+                self.search_cache.set(cache_key, documents)  # type: ignore
+            return documents
         except Exception as e:
             logger.error(f"Error searching for documents: {e}")
             return []
@@ -76,12 +115,21 @@ class AgentKnowledge(BaseModel):
                 return []
 
             _num_documents = num_documents or self.num_documents
+            cache_key = self._get_search_cache_key(query, _num_documents, filters)
+            if cache_key is not None:
+                cached_documents = self.search_cache.get(cache_key)  # type: ignore
+                if cached_documents is not None:
+                    return cached_documents
+
             log_debug(f"Getting {_num_documents} relevant documents for query: {query}")
             try:
-                return await self.vector_db.async_search(query=query, limit=_num_documents, filters=filters)
+                documents = await self.vector_db.async_search(query=query, limit=_num_documents, filters=filters)
             except NotImplementedError:
                 logger.info("Vector db does not support async search")
-                return self.search(query=query, num_documents=_num_documents, filters=filters)
+                documents = self.vector_db.search(query=query, limit=_num_documents, filters=filters)
+            if cache_key is not None:
+                self.search_cache.set(cache_key, documents)  # type: ignore
+            return documents
         except Exception as e:
             logger.error(f"Error searching for documents: {e}")
             return []
@@ -138,6 +186,7 @@ class AgentKnowledge(BaseModel):
 
             num_documents += len(documents_to_load)
             log_info(f"Added {len(documents_to_load)} documents to knowledge base")
+        self.invalidate_search_cache()
 
     async def aload(
         self,
@@ -192,6 +241,7 @@ class AgentKnowledge(BaseModel):
 
             num_documents += len(documents_to_load)
             log_info(f"Added {len(documents_to_load)} documents to knowledge base")
+        self.invalidate_search_cache()
 
     def load_documents(
         self,
@@ -221,6 +271,7 @@ class AgentKnowledge(BaseModel):
         if upsert and self.vector_db.upsert_available():
             self.vector_db.upsert(documents=documents, filters=filters)
             log_info(f"Loaded {len(documents)} documents to knowledge base")
+            self.invalidate_search_cache()
         else:
             # Filter out documents which already exist in the vector db
             documents_to_load = (
@@ -233,6 +284,7 @@ class AgentKnowledge(BaseModel):
             if len(documents_to_load) > 0:
                 self.vector_db.insert(documents=documents_to_load, filters=filters)
                 log_info(f"Loaded {len(documents_to_load)} documents to knowledge base")
+                self.invalidate_search_cache()
             else:
                 log_info("No new documents to load")
 
@@ -271,6 +323,7 @@ class AgentKnowledge(BaseModel):
                 logger.warning("Vector db does not support async upsert")
                 self.vector_db.upsert(documents=documents, filters=filters)
             log_info(f"Loaded {len(documents)} documents to knowledge base")
+            self.invalidate_search_cache()
         else:
             # Filter out documents which already exist in the vector db
             if skip_existing:
@@ -299,6 +352,7 @@ class AgentKnowledge(BaseModel):
                     logger.warning("Vector db does not support async insert")
                     self.vector_db.insert(documents=documents_to_load, filters=filters)
                 log_info(f"Loaded {len(documents_to_load)} documents to knowledge base")
+                self.invalidate_search_cache()
             else:
                 log_info("No new documents to load")
 
@@ -400,7 +454,9 @@ class AgentKnowledge(BaseModel):
             logger.warning("No vector db available")
             return True
 
-        return self.vector_db.delete()
+        deleted = self.vector_db.delete()
+        self.invalidate_search_cache()
+        return deleted
 
     def filter_existing_documents(self, documents: List[Document]) -> List[Document]:
         """Filter out documents that already exist in the vector database.
@@ -564,6 +620,7 @@ class AgentKnowledge(BaseModel):
         if recreate:
             # log_info(f"Recreating collection.")
             self.vector_db.drop()
+            self.invalidate_search_cache()
 
         # Create collection if it doesn't exist
         if not self.vector_db.exists():
@@ -612,6 +669,7 @@ class AgentKnowledge(BaseModel):
         if recreate:
             log_info("Recreating collection.")
             await self.vector_db.async_drop()
+            self.invalidate_search_cache()
 
         # Create collection if it doesn't exist
         if not await self.vector_db.async_exists():
@@ -659,6 +717,7 @@ class AgentKnowledge(BaseModel):
             else:
                 log_info("No new documents to insert after filtering.")
 
+        self.invalidate_search_cache()
         log_info(f"Finished loading documents from {source_info}.")
 
     async def aprocess_documents(
@@ -700,4 +759,5 @@ class AgentKnowledge(BaseModel):
             else:
                 log_info("No new documents to insert after filtering.")
 
+        self.invalidate_search_cache()
         log_info(f"Finished loading documents from {source_info}.")
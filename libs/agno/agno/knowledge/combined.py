@@ -1,13 +1,42 @@
-from typing import AsyncIterator, Iterator, List
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, AsyncIterator, Dict, Iterator, List, Literal, Optional
+
+from pydantic import model_validator
 
 from agno.document import Document
 from agno.knowledge.agent import AgentKnowledge
-from agno.utils.log import log_debug
+from agno.reranker.base import Reranker
+from agno.utils.fusion import RRF_K, normalized_score_fusion, rank_scores, reciprocal_rank_fusion
+from agno.utils.log import log_debug, logger
 
 
 class CombinedKnowledgeBase(AgentKnowledge):
     sources: List[AgentKnowledge] = []
 
+    # How results of the sources are merged when searching them in parallel:
+    # "rrf" for reciprocal rank fusion, "score" to sum min-max normalized scores
+    fusion: Literal["rrf", "score"] = "rrf"
+    # Constant of reciprocal rank fusion
+    rrf_k: int = RRF_K
+    # Optional weight of each source, in the order of `sources`
+    source_weights: Optional[List[float]] = None
+    # Seconds to wait for each source. Slow sources are skipped.
+    source_timeout: Optional[float] = 10.0
+    # Number of documents requested from each source, defaults to the number of documents returned
+    num_documents_per_source: Optional[int] = None
+    # Reranker applied once to the fused results
+    reranker: Optional[Reranker] = None
+
+    @model_validator(mode="after")
+    def check_source_weights(self) -> "CombinedKnowledgeBase":
+        if self.source_weights is not None and len(self.source_weights) != len(self.sources):
+            raise ValueError(
+                f"Got {len(self.source_weights)} source weights for {len(self.sources)} sources, "
+                "source_weights needs one weight per source"
+            )
+        return self
+
     @property
     def document_lists(self) -> Iterator[List[Document]]:
         """Iterate over knowledge bases and yield lists of documents.
@@ -34,3 +63,99 @@ class CombinedKnowledgeBase(AgentKnowledge):
             log_debug(f"Loading documents from {kb.__class__.__name__}")
             async for document in kb.async_document_lists:  # type: ignore
                 yield document
+
+    def search(
+        self, query: str, num_documents: Optional[int] = None, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        """Returns relevant documents matching a query.
+
+        If the combined knowledge base has its own vector db, it is searched. Otherwise all sources are
+        searched in parallel and their results are fused into a single ranking.
+        """
+        if self.vector_db is not None or not self.sources:
+            return super().search(query=query, num_documents=num_documents, filters=filters)
+
+        _num_documents = num_documents or self.num_documents
+        _num_per_source = self.num_documents_per_source or _num_documents
+        log_debug(f"Searching {len(self.sources)} knowledge sources for query: {query}")
+
+        executor = ThreadPoolExecutor(max_workers=len(self.sources), thread_name_prefix="agno-knowledge-search")
+        try:
+            futures = [
+                executor.submit(kb.search, query=query, num_documents=_num_per_source, filters=filters)
+                for kb in self.sources
+            ]
+            wait(futures, timeout=self.source_timeout)
+            rankings: List[Optional[List[Document]]] = []
+            for kb, future in zip(self.sources, futures):
+                if not future.done():
+                    logger.warning(f"Search of {kb.__class__.__name__} timed out after {self.source_timeout}s")
+                    future.cancel()
+                    rankings.append(None)
+                elif future.exception() is not None:
+                    logger.warning(f"Search of {kb.__class__.__name__} failed: {future.exception()}")
+                    rankings.append(None)
+                else:
+                    rankings.append(future.result())
+        finally:
+            # Do not wait for the sources that timed out
+            executor.shutdown(wait=False)
+        return self._fuse_results(query=query, rankings=rankings, num_documents=_num_documents)
+
+    async def async_search(
+        self, query: str, num_documents: Optional[int] = None, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        """Returns relevant documents matching a query, searching the sources concurrently."""
+        if self.vector_db is not None or not self.sources:
+            return await super().async_search(query=query, num_documents=num_documents, filters=filters)
+
+        _num_documents = num_documents or self.num_documents
+        _num_per_source = self.num_documents_per_source or _num_documents
+        log_debug(f"Searching {len(self.sources)} knowledge sources for query: {query}")
+
+        results = await asyncio.gather(
+            *[
+                asyncio.wait_for(
+                    kb.async_search(query=query, num_documents=_num_per_source, filters=filters),
+                    timeout=self.source_timeout,
+                )
+                for kb in self.sources
+            ],
+            return_exceptions=True,
+        )
+        rankings: List[Optional[List[Document]]] = []
+        for kb, result in zip(self.sources, results):
+            if isinstance(result, asyncio.TimeoutError):
+                logger.warning(f"Search of {kb.__class__.__name__} timed out after {self.source_timeout}s")
+                rankings.append(None)
+            elif isinstance(result, BaseException):
+                logger.warning(f"Search of {kb.__class__.__name__} failed: {result}")
+                rankings.append(None)
+            else:
+                rankings.append(result)
+        return self._fuse_results(query=query, rankings=rankings, num_documents=_num_documents)
+
+    def _fuse_results(self, query: str, rankings: List[Optional[List[Document]]], num_documents: int) -> List[Document]:
+        """Merge the results of the sources, skipping the sources that failed, and rerank the merged results."""
+        weights = self.source_weights or [1.0] * len(self.sources)
+        answered = [(ranking, weight) for ranking, weight in zip(rankings, weights) if ranking is not None]
+        if not answered:
+            return []
+
+        if self.fusion == "score":
+            fused = normalized_score_fusion(
+                [rank_scores(ranking) for ranking, _ in answered], weights=[weight for _, weight in answered]
+            )
+        else:
+            fused = reciprocal_rank_fusion(
+                [ranking for ranking, _ in answered], k=self.rrf_k, weights=[weight for _, weight in answered]
+            )
+        documents = [document for document, _ in fused]
+
+        if self.reranker is not None and documents:
+            try:
+                documents = self.reranker.rerank(query=query, documents=documents)
+            except Exception as e:
+                logger.warning(f"Reranking fused results failed: {e}")
+        log_debug(f"Fused {sum(len(r) for r, _ in answered)} results from {len(answered)} sources")
+        return documents[:num_documents]
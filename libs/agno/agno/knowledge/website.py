@@ -100,6 +100,7 @@ class WebsiteKnowledgeBase(AgentKnowledge):
                 num_documents += len(document_list)
                 log_info(f"Loaded {num_documents} documents to knowledge base")
 
+        self.invalidate_search_cache()
         if self.optimize_on is not None and num_documents > self.optimize_on:
             log_debug("Optimizing Vector DB")
             self.vector_db.optimize()
@@ -171,6 +172,7 @@ class WebsiteKnowledgeBase(AgentKnowledge):
                 num_documents += len(document_list)
                 log_info(f"Loaded {num_documents} documents to knowledge base asynchronously")
 
+        self.invalidate_search_cache()
         if self.optimize_on is not None and num_documents > self.optimize_on:
             log_debug("Optimizing Vector DB")
             vector_db.optimize()
@@ -1,7 +1,23 @@
-from agno.memory.agent import AgentMemory
-from agno.memory.memory import Memory
-from agno.memory.row import MemoryRow
-from agno.memory.team import TeamMemory
+from typing import TYPE_CHECKING
+
+from agno.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from agno.memory.agent import AgentMemory
+    from agno.memory.memory import Memory
+    from agno.memory.row import MemoryRow
+    from agno.memory.team import TeamMemory
+
+# Imported on first access, so that importing agno.memory.v2 does not load the legacy memory classes
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AgentMemory": "agno.memory.agent",
+        "Memory": "agno.memory.memory",
+        "MemoryRow": "agno.memory.row",
+        "TeamMemory": "agno.memory.team",
+    },
+)
 
 __all__ = [
     "AgentMemory",
@@ -3,7 +3,7 @@ from copy import deepcopy
 from dataclasses import dataclass, field
 from datetime import datetime
 from os import getenv
-from typing import Any, Dict, List, Literal, Optional, Type, Union
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple, Type, Union
 
 from pydantic import BaseModel, Field
 
@@ -401,8 +401,31 @@ class Memory:
         return self.runs.get(session_id, [])
 
     # -*- Agent Functions
+    def get_runs_to_summarize(
+        self, session_id: str, user_id: str
+    ) -> Tuple[List[Union[RunResponse, TeamRunResponse]], Optional[SessionSummary]]:
+        """Returns the runs of a session to summarize, and the existing summary to update with them.
+
+        With an incremental summarizer, only the runs added since the existing summary are returned.
+        Otherwise, or if the last summarized run is not in memory anymore, all the runs are summarized again.
+        """
+        session_runs = list(self.runs.get(session_id, [])) if self.runs else []
+        previous_summary = self.get_session_summary(session_id=session_id, user_id=user_id)
+        if (
+            self.summary_manager is None
+            or not self.summary_manager.incremental
+            or previous_summary is None
+            or previous_summary.last_run_id is None
+        ):
+            return session_runs, None
+
+        run_ids = [run.run_id for run in session_runs]
+        if previous_summary.last_run_id not in run_ids:
+            return session_runs, None
+        return session_runs[run_ids.index(previous_summary.last_run_id) + 1 :], previous_summary
+
     def create_session_summary(self, session_id: str, user_id: Optional[str] = None) -> Optional[SessionSummary]:
-        """Creates a summary of the session"""
+        """Creates a summary of the session, or updates its summary with the new runs"""
 
         if not self.summary_manager:
             raise ValueError("Summarizer not initialized")
@@ -412,18 +435,27 @@ class Memory:
         if user_id is None:
             user_id = "default"
 
-        summary_response = self.summary_manager.run(conversation=self.get_messages_for_session(session_id=session_id))
+        runs, previous_summary = self.get_runs_to_summarize(session_id=session_id, user_id=user_id)
+        conversation = self._get_messages_from_runs(runs)
+        if previous_summary is not None and not self.summary_manager.should_update_summary(len(runs), conversation):
+            log_debug(f"Not enough new runs to update the summary of session {session_id}")
+            return previous_summary
+
+        summary_response = self.summary_manager.run(conversation=conversation, previous_summary=previous_summary)
         if summary_response is None:
             return None
         session_summary = SessionSummary(
-            summary=summary_response.summary, topics=summary_response.topics, last_updated=datetime.now()
+            summary=summary_response.summary,
+            topics=summary_response.topics,
+            last_updated=datetime.now(),
+            last_run_id=runs[-1].run_id if runs else None,
         )
         self.summaries.setdefault(user_id, {})[session_id] = session_summary  # type: ignore
 
         return session_summary
 
     async def acreate_session_summary(self, session_id: str, user_id: Optional[str] = None) -> Optional[SessionSummary]:
-        """Creates a summary of the session"""
+        """Creates a summary of the session, or updates its summary with the new runs"""
         if not self.summary_manager:
             raise ValueError("Summarizer not initialized")
 
@@ -432,13 +464,20 @@ class Memory:
         if user_id is None:
             user_id = "default"
 
-        summary_response = await self.summary_manager.arun(
-            conversation=self.get_messages_for_session(session_id=session_id)
-        )
+        runs, previous_summary = self.get_runs_to_summarize(session_id=session_id, user_id=user_id)
+        conversation = self._get_messages_from_runs(runs)
+        if previous_summary is not None and not self.summary_manager.should_update_summary(len(runs), conversation):
+            log_debug(f"Not enough new runs to update the summary of session {session_id}")
+            return previous_summary
+
+        summary_response = await self.summary_manager.arun(conversation=conversation, previous_summary=previous_summary)
         if summary_response is None:
             return None
         session_summary = SessionSummary(
-            summary=summary_response.summary, topics=summary_response.topics, last_updated=datetime.now()
+            summary=summary_response.summary,
+            topics=summary_response.topics,
+            last_updated=datetime.now(),
+            last_run_id=runs[-1].run_id if runs else None,
         )
         self.summaries.setdefault(user_id, {})[session_id] = session_summary  # type: ignore
         return session_summary
@@ -641,12 +680,26 @@ class Memory:
     ) -> List[Message]:
         """Returns a list of messages for the session that iterate through user message and assistant response."""
 
+        session_runs = self.runs.get(session_id, []) if self.runs else []
+        return self._get_messages_from_runs(
+            session_runs,
+            user_role=user_role,
+            assistant_role=assistant_role,
+            skip_history_messages=skip_history_messages,
+        )
+
+    def _get_messages_from_runs(
+        self,
+        runs: Sequence[Union[RunResponse, TeamRunResponse]],
+        user_role: str = "user",
+        assistant_role: Optional[List[str]] = None,
+        skip_history_messages: bool = True,
+    ) -> List[Message]:
         if assistant_role is None:
             assistant_role = ["assistant", "model", "CHATBOT"]
 
         final_messages: List[Message] = []
-        session_runs = self.runs.get(session_id, []) if self.runs else []
-        for run_response in session_runs:
+        for run_response in runs:
             if run_response and run_response.messages:
                 user_message_from_run = None
                 assistant_message_from_run = None
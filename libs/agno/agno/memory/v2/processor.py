@@ -0,0 +1,297 @@
+"""Background processing of user memories and session summaries.
+
+By default, agents create user memories and session summaries at the end of each run, and the run waits for them.
+With a `MemoryProcessor`, the run only enqueues the work: a job per session is stored in a cache backend,
+runs of the same session coalesce into the job until it is processed, and a worker pool processes the jobs
+after `coalesce_delay` seconds. Pending jobs are kept in the backend until processed, so with a persistent
+backend (SqliteCache or RedisCache) they are resumed when the processor restarts.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from time import monotonic, time
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from agno.cache.base import CacheBackend
+from agno.cache.in_memory import InMemoryCache
+from agno.models.message import Message
+from agno.utils.log import log_debug, log_warning
+
+if TYPE_CHECKING:
+    from agno.memory.v2.memory import Memory, SessionSummary
+
+
+@dataclass
+class MemoryProcessorMetrics:
+    """Counters of a memory processor. Lags are the seconds between a run and the processing of its memories."""
+
+    # Runs enqueued
+    enqueued_runs: int = 0
+    # Runs merged into a pending job of their session
+    coalesced_runs: int = 0
+    # Jobs processed, each covering one or more runs
+    processed_jobs: int = 0
+    failed_jobs: int = 0
+    retried_jobs: int = 0
+    last_lag: float = 0.0
+    max_lag: float = 0.0
+    total_lag: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "enqueued_runs": self.enqueued_runs,
+            "coalesced_runs": self.coalesced_runs,
+            "processed_jobs": self.processed_jobs,
+            "failed_jobs": self.failed_jobs,
+            "retried_jobs": self.retried_jobs,
+            "last_lag": self.last_lag,
+            "max_lag": self.max_lag,
+            "mean_lag": self.total_lag / self.processed_jobs if self.processed_jobs else 0.0,
+        }
+
+
+class MemoryProcessor:
+    """Creates user memories and session summaries in the background, out of the runs of agents and teams.
+
+    Args:
+        memory: Memory to update, for jobs enqueued without one (e.g. pending jobs resumed from the backend).
+        backend: Where pending jobs are stored. Defaults to an InMemoryCache, lost when the process exits.
+        max_workers: Number of jobs processed at the same time.
+        coalesce_delay: Seconds to wait after the first run of a job before processing it,
+            so that following runs of the session are processed with it.
+        max_retries: Times a failed job is retried before it is dropped.
+        key_prefix: Prefix of the job keys in the backend.
+    """
+
+    def __init__(
+        self,
+        memory: Optional["Memory"] = None,
+        backend: Optional[CacheBackend] = None,
+        max_workers: int = 2,
+        coalesce_delay: float = 2.0,
+        max_retries: int = 2,
+        key_prefix: str = "memory_job:",
+    ):
+        self.memory = memory
+        self.backend = backend or InMemoryCache(max_size=None)
+        self.max_workers = max_workers
+        self.coalesce_delay = coalesce_delay
+        self.max_retries = max_retries
+        self.key_prefix = key_prefix
+        self.metrics = MemoryProcessorMetrics()
+
+        self._lock = threading.Condition()
+        # Job key -> time it is due, in monotonic seconds
+        self._due: Dict[str, float] = {}
+        self._running: set = set()
+        # Job key -> memory of the agent or team that enqueued it
+        self._memories: Dict[str, "Memory"] = {}
+        # Job key -> callback saving the session summary, e.g. to the session in storage
+        self._summary_callbacks: Dict[str, Callable[["SessionSummary"], None]] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._dispatcher: Optional[threading.Thread] = None
+        self._stopped = False
+
+    def _get_key(self, session_id: str, user_id: Optional[str]) -> str:
+        return f"{self.key_prefix}{user_id or ''}:{session_id}"
+
+    def start(self) -> None:
+        """Start the workers and schedule the jobs left pending in the backend. Called on the first enqueue."""
+        with self._lock:
+            if self._dispatcher is not None:
+                return
+            self._stopped = False
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="agno-memory")
+            self._dispatcher = threading.Thread(target=self._dispatch, name="agno-memory-dispatcher", daemon=True)
+            self._dispatcher.start()
+            now = monotonic()
+            for key, _ in self.backend.scan(self.key_prefix):
+                self._due.setdefault(key, now)
+            if self._due:
+                log_debug(f"Resuming {len(self._due)} pending memory jobs")
+            self._lock.notify_all()
+
+    def enqueue(
+        self,
+        session_id: str,
+        user_id: Optional[str] = None,
+        messages: Optional[List[Message]] = None,
+        create_session_summary: bool = False,
+        memory: Optional["Memory"] = None,
+        on_summary: Optional[Callable[["SessionSummary"], None]] = None,
+    ) -> None:
+        """Add the memories and summary of a run to the job of its session.
+
+        Args:
+            session_id: Session of the run.
+            user_id: User of the run.
+            messages: Messages to create user memories from.
+            create_session_summary: If True, update the summary of the session.
+            memory: Memory to update. Defaults to the memory of the processor.
+            on_summary: Called with the session summary once it is created, e.g. to save it with the session.
+        """
+        if self._dispatcher is None:
+            self.start()
+
+        key = self._get_key(session_id, user_id)
+        new_messages = [
+            {"role": m.role, "content": m.get_content_string()} for m in messages or [] if m.get_content_string()
+        ]
+        with self._lock:
+            if memory is not None:
+                self._memories[key] = memory
+            if on_summary is not None:
+                self._summary_callbacks[key] = on_summary
+            job = self.backend.get(key)
+            if job is None:
+                job = {"session_id": session_id, "user_id": user_id, "messages": [], "summary": False, "runs": []}
+            else:
+                self.metrics.coalesced_runs += 1
+            job["messages"] = job["messages"] + new_messages
+            job["summary"] = job["summary"] or create_session_summary
+            job["runs"] = job["runs"] + [time()]
+            job["attempts"] = job.get("attempts", 0)
+            self.backend.set(key, job)
+            self.metrics.enqueued_runs += 1
+            if key not in self._due and key not in self._running:
+                self._due[key] = monotonic() + self.coalesce_delay
+                self._lock.notify_all()
+
+    def _dispatch(self) -> None:
+        """Submit the jobs to the workers once they are due"""
+        while True:
+            with self._lock:
+                if self._stopped:
+                    return
+                now = monotonic()
+                ready = [key for key, due in self._due.items() if due <= now]
+                for key in ready:
+                    del self._due[key]
+                    self._running.add(key)
+                if not ready:
+                    next_due = min(self._due.values(), default=None)
+                    self._lock.wait(timeout=None if next_due is None else next_due - now)
+                    continue
+            for key in ready:
+                self._executor.submit(self._process, key)  # type: ignore
+
+    def _process(self, key: str) -> None:
+        try:
+            job = self.backend.get(key)
+            if job is not None:
+                # Copy the job, runs enqueued while it is processed update the job in the backend
+                self._run_job(key, dict(job))
+        except Exception as e:
+            log_warning(f"Error in memory job {key}: {e}")
+        finally:
+            with self._lock:
+                self._running.discard(key)
+                # Runs enqueued while the job was processed
+                if key not in self._due and self.backend.get(key) is not None:
+                    self._due[key] = monotonic() + self.coalesce_delay
+                self._lock.notify_all()
+
+    def _run_job(self, key: str, job: Dict[str, Any]) -> None:
+        memory = self._memories.get(key, self.memory)
+        if memory is None:
+            raise ValueError("MemoryProcessor has no memory to update")
+        # Messages of the job whose memories were created by a previous attempt
+        processed_messages = job.get("processed_messages", 0)
+        try:
+            if len(job["messages"]) > processed_messages:
+                memory.create_user_memories(
+                    messages=[
+                        Message(role=m["role"], content=m["content"]) for m in job["messages"][processed_messages:]
+                    ],
+                    user_id=job["user_id"],
+                )
+                processed_messages = len(job["messages"])
+            if job["summary"]:
+                summary = memory.create_session_summary(session_id=job["session_id"], user_id=job["user_id"])
+                on_summary = self._summary_callbacks.get(key)
+                if summary is not None and on_summary is not None:
+                    on_summary(summary)
+        except Exception as e:
+            with self._lock:
+                current = self.backend.get(key) or job
+                current["attempts"] = current.get("attempts", 0) + 1
+                if current["attempts"] > self.max_retries:
+                    log_warning(f"Dropping memory job of session {job['session_id']}: {e}")
+                    self.metrics.failed_jobs += 1
+                    self._remove_processed(key, job)
+                else:
+                    log_warning(f"Error in memory/summary operation, retrying: {e}")
+                    self.metrics.retried_jobs += 1
+                    # A retry only creates the memories of the messages not processed yet
+                    current["processed_messages"] = processed_messages
+                    self.backend.set(key, current)
+            return
+
+        lag = time() - job["runs"][0]
+        with self._lock:
+            self._remove_processed(key, job)
+            self.metrics.processed_jobs += 1
+            self.metrics.last_lag = lag
+            self.metrics.max_lag = max(self.metrics.max_lag, lag)
+            self.metrics.total_lag += lag
+        log_debug(f"Processed memory job of session {job['session_id']} covering {len(job['runs'])} runs")
+
+    def _remove_processed(self, key: str, job: Dict[str, Any]) -> None:
+        """Remove the runs of a processed job, keeping the runs enqueued since"""
+        current = self.backend.get(key)
+        if current is None or len(current["runs"]) <= len(job["runs"]):
+            self.backend.delete(key)
+            self._memories.pop(key, None)
+            self._summary_callbacks.pop(key, None)
+            return
+        current["messages"] = current["messages"][len(job["messages"]) :]
+        current["runs"] = current["runs"][len(job["runs"]) :]
+        current["attempts"] = 0
+        current["processed_messages"] = 0
+        self.backend.set(key, current)
+
+    def get_staleness(self, session_id: str, user_id: Optional[str] = None) -> float:
+        """Return the seconds since the oldest run of a session whose memories are not processed yet, 0 if none"""
+        job = self.backend.get(self._get_key(session_id, user_id))
+        if job is None or not job["runs"]:
+            return 0.0
+        return max(time() - job["runs"][0], 0.0)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            metrics = self.metrics.to_dict()
+            metrics["pending_jobs"] = len(self._due) + len(self._running)
+        return metrics
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Process the pending jobs now and wait for them. Returns False if `timeout` seconds passed first."""
+        deadline = monotonic() + timeout if timeout is not None else None
+        with self._lock:
+            while self._due or self._running:
+                # Including the jobs rescheduled while flushing
+                now = monotonic()
+                for key in self._due:
+                    self._due[key] = now
+                self._lock.notify_all()
+                remaining = deadline - monotonic() if deadline is not None else None
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._lock.wait(timeout=remaining)
+        return True
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the workers. If `wait`, process the pending jobs first, else they stay in the backend."""
+        if wait:
+            self.flush()
+        with self._lock:
+            self._stopped = True
+            self._lock.notify_all()
+            dispatcher, self._dispatcher = self._dispatcher, None
+            executor, self._executor = self._executor, None
+        if dispatcher is not None:
+            dispatcher.join()
+        if executor is not None:
+            executor.shutdown(wait=wait)
+        with self._lock:
+            self._due.clear()
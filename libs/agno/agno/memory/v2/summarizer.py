@@ -5,11 +5,13 @@ from typing import Any, Dict, List, Optional, Type, Union
 
 from pydantic import BaseModel, Field
 
+from agno.memory.v2.schema import SessionSummary
 from agno.models.base import Model
 from agno.models.message import Message
 from agno.utils.log import log_debug, log_error, log_info, log_warning
 from agno.utils.prompts import get_json_output_prompt
 from agno.utils.string import parse_response_model_str
+from agno.utils.tokens import count_messages_tokens
 
 
 class SessionSummaryResponse(BaseModel):
@@ -39,6 +41,14 @@ class SessionSummarizer:
     # Additional instructions for the summarizer. If not provided, a default prompt will be used.
     additional_instructions: Optional[str] = None
 
+    # If True, an existing summary is updated with the runs added since it was created,
+    # instead of summarizing all the runs of the session again
+    incremental: bool = True
+    # Number of new runs that trigger an update of an existing summary
+    min_new_runs: int = 1
+    # Number of tokens of new messages that trigger an update of an existing summary, even with fewer new runs
+    min_new_tokens: Optional[int] = None
+
     # Whether the summarizer has created a summary
     summary_updated: bool = False
 
@@ -47,12 +57,27 @@ class SessionSummarizer:
         model: Optional[Model] = None,
         system_message: Optional[str] = None,
         additional_instructions: Optional[str] = None,
+        incremental: bool = True,
+        min_new_runs: int = 1,
+        min_new_tokens: Optional[int] = None,
     ):
         self.model = model
         if self.model is not None and isinstance(self.model, str):
             raise ValueError("Model must be a Model object, not a string")
         self.system_message = system_message
         self.additional_instructions = additional_instructions
+        self.incremental = incremental
+        self.min_new_runs = min_new_runs
+        self.min_new_tokens = min_new_tokens
+
+    def should_update_summary(self, num_new_runs: int, new_messages: List[Message]) -> bool:
+        """Whether the runs added since the last summary are enough to update it"""
+        if num_new_runs == 0 or not new_messages:
+            return False
+        if num_new_runs >= self.min_new_runs:
+            return True
+        model_id = self.model.id if self.model is not None else None
+        return self.min_new_tokens is not None and count_messages_tokens(new_messages, model_id) >= self.min_new_tokens
 
     def get_response_format(self, model: Model) -> Union[Dict[str, Any], Type[BaseModel]]:
         if model.supports_native_structured_outputs:
@@ -70,20 +95,36 @@ class SessionSummarizer:
             return {"type": "json_object"}
 
     def get_system_message(
-        self, conversation: List[Message], response_format: Union[Dict[str, Any], Type[BaseModel]]
+        self,
+        conversation: List[Message],
+        response_format: Union[Dict[str, Any], Type[BaseModel]],
+        previous_summary: Optional[SessionSummary] = None,
     ) -> Message:
         if self.system_message is not None:
             return Message(role="system", content=self.system_message)
 
         # -*- Return a system message for summarization
-        system_prompt = dedent("""\
-        Analyze the following conversation between a user and an assistant, and extract the following details:
-          - Summary (str): Provide a concise summary of the session, focusing on important information that would be helpful for future interactions.
-          - Topics (Optional[List[str]]): List the topics discussed in the session.
-        Keep the summary concise and to the point. Only include relevant information.
-
-        <conversation>
-        """)
+        if previous_summary is not None:
+            system_prompt = dedent("""\
+            Update the summary of a conversation between a user and an assistant with the new messages of the conversation, and extract the following details:
+              - Summary (str): Provide a concise summary of the whole session, combining the previous summary with the important information of the new messages that would be helpful for future interactions.
+              - Topics (Optional[List[str]]): List the topics discussed in the whole session.
+            Keep the summary concise and to the point. Only include relevant information.
+
+            """)
+            system_prompt += f"<previous_summary>\n{previous_summary.summary}\n</previous_summary>\n"
+            if previous_summary.topics:
+                system_prompt += f"<previous_topics>\n{', '.join(previous_summary.topics)}\n</previous_topics>\n"
+            system_prompt += "\n<conversation>\n"
+        else:
+            system_prompt = dedent("""\
+            Analyze the following conversation between a user and an assistant, and extract the following details:
+              - Summary (str): Provide a concise summary of the session, focusing on important information that would be helpful for future interactions.
+              - Topics (Optional[List[str]]): List the topics discussed in the session.
+            Keep the summary concise and to the point. Only include relevant information.
+
+            <conversation>
+            """)
         conversation_messages = []
         for message in conversation:
             if message.role == "user":
@@ -104,6 +145,7 @@ class SessionSummarizer:
     def run(
         self,
         conversation: List[Message],
+        previous_summary: Optional[SessionSummary] = None,
     ) -> Optional[SessionSummaryResponse]:
         if self.model is None:
             log_error("No model provided for summary_manager")
@@ -120,7 +162,7 @@ class SessionSummarizer:
 
         # Prepare the List of messages to send to the Model
         messages_for_model: List[Message] = [
-            self.get_system_message(conversation, response_format=response_format),
+            self.get_system_message(conversation, response_format=response_format, previous_summary=previous_summary),
             # For models that require a non-system message
             Message(role="user", content="Provide the summary of the conversation."),
         ]
@@ -161,6 +203,7 @@ class SessionSummarizer:
     async def arun(
         self,
         conversation: List[Message],
+        previous_summary: Optional[SessionSummary] = None,
     ) -> Optional[SessionSummaryResponse]:
         if self.model is None:
             log_error("No model provided for summary_manager")
@@ -177,7 +220,7 @@ class SessionSummarizer:
 
         # Prepare the List of messages to send to the Model
         messages_for_model: List[Message] = [
-            self.get_system_message(conversation, response_format=response_format),
+            self.get_system_message(conversation, response_format=response_format, previous_summary=previous_summary),
             # For models that require a non-system message
             Message(role="user", content="Provide the summary of the conversation."),
         ]
@@ -1,16 +1,22 @@
 import asyncio
 import collections.abc
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager, contextmanager
 from dataclasses import dataclass, field
+from time import perf_counter
 from types import AsyncGeneratorType, GeneratorType
 from typing import (
+    TYPE_CHECKING,
     Any,
     AsyncGenerator,
     AsyncIterator,
+    Awaitable,
+    Callable,
     Dict,
     Iterator,
     List,
     Literal,
+    Mapping,
     Optional,
     Tuple,
     Type,
@@ -21,18 +27,28 @@ from uuid import uuid4
 
 from pydantic import BaseModel
 
-from agno.exceptions import AgentRunException
+from agno.exceptions import AgentRunException, ToolExecutorOverloadedError
 from agno.media import AudioResponse, ImageArtifact
+from agno.models.hedging import HedgedResult, arun_hedged, get_latency_key, run_hedged
 from agno.models.message import Citations, Message, MessageMetrics
+from agno.models.rate_limit import RateLimiter, RateLimitSlot, get_rate_limiter
 from agno.models.response import ModelResponse, ModelResponseEvent, ToolExecution
+from agno.run.cancellation import get_cancellation_token, raise_if_cancelled
 from agno.run.response import RunResponseContentEvent, RunResponseEvent
 from agno.run.team import RunResponseContentEvent as TeamRunResponseContentEvent
 from agno.run.team import TeamRunResponseEvent
 from agno.tools.function import Function, FunctionCall, FunctionExecutionResult, UserInputField
 from agno.utils.log import log_debug, log_error, log_warning
 from agno.utils.timer import Timer
+from agno.utils.tokens import count_messages_tokens
 from agno.utils.tools import get_function_call_for_tool_call, get_function_call_for_tool_execution
 
+if TYPE_CHECKING:
+    from agno.cache.response import ResponseCacheKey
+
+# Marks a stream that ended before its first delta
+_STREAM_END = object()
+
 
 @dataclass
 class MessageData:
@@ -230,6 +246,18 @@ class Model(ABC):
     name: Optional[str] = None
     # Provider for this Model. This is not sent to the Model API.
     provider: Optional[str] = None
+    # Maximum number of input and output tokens of the Model. Used to budget the context sent to the Model.
+    # Defaults to the known context window of the model id. This is not sent to the Model API.
+    context_window: Optional[int] = None
+    # Client-side rate limits, shared by all Models with the same provider and id in the process.
+    # Requests are queued to stay under the limits, which are updated from the provider's rate limit headers.
+    # These are not sent to the Model API.
+    # Requests per minute allowed.
+    requests_per_minute: Optional[int] = None
+    # Input and output tokens per minute allowed.
+    tokens_per_minute: Optional[int] = None
+    # Maximum number of concurrent requests. Lowered on 429s and restored gradually (AIMD).
+    max_concurrent_requests: Optional[int] = None
 
     # -*- Do not set the following attributes directly -*-
     # -*- Set them on the Agent instead -*-
@@ -257,6 +285,13 @@ class Model(ABC):
     # The role of the assistant message.
     assistant_message_role: str = "assistant"
 
+    # Cache of responses (a ResponseCache), shared by copies of the Model
+    response_cache: Optional[Any] = None
+
+    # Policy (a HedgingPolicy) to send a duplicate request, to the same or a fallback Model,
+    # when a response is slower than usual. The first response wins.
+    hedging: Optional[Any] = None
+
     def __post_init__(self):
         if self.provider is None and self.name is not None:
             self.provider = f"{self.name} ({self.id})"
@@ -269,6 +304,48 @@ class Model(ABC):
     def get_provider(self) -> str:
         return self.provider or self.name or self.__class__.__name__
 
+    def get_rate_limiter(self) -> Optional[RateLimiter]:
+        """Return the rate limiter of this provider and model, or None if no rate limit is set."""
+        if self.requests_per_minute is None and self.tokens_per_minute is None and self.max_concurrent_requests is None:
+            return None
+        return get_rate_limiter(
+            provider=self.get_provider(),
+            model_id=self.id,
+            requests_per_minute=self.requests_per_minute,
+            tokens_per_minute=self.tokens_per_minute,
+            max_concurrent_requests=self.max_concurrent_requests,
+        )
+
+    def update_rate_limits(self, headers: Mapping[str, str]) -> None:
+        """Update the rate limiter from the rate limit headers of a provider response."""
+        rate_limiter = self.get_rate_limiter()
+        if rate_limiter is not None:
+            rate_limiter.update_from_headers(headers)
+
+    def _estimate_request_tokens(self, rate_limiter: RateLimiter, messages: List[Message]) -> int:
+        if rate_limiter.tokens is None:
+            return 0
+        return count_messages_tokens(messages, self.id)
+
+    @contextmanager
+    def _rate_limit(self, messages: List[Message]) -> Iterator[RateLimitSlot]:
+        """Wait for the rate limiter, if any, and hold a slot while a request runs."""
+        rate_limiter = self.get_rate_limiter()
+        if rate_limiter is None:
+            yield RateLimitSlot()
+            return
+        with rate_limiter.limit(estimated_tokens=self._estimate_request_tokens(rate_limiter, messages)) as slot:
+            yield slot
+
+    @asynccontextmanager
+    async def _arate_limit(self, messages: List[Message]) -> AsyncIterator[RateLimitSlot]:
+        rate_limiter = self.get_rate_limiter()
+        if rate_limiter is None:
+            yield RateLimitSlot()
+            return
+        async with rate_limiter.alimit(estimated_tokens=self._estimate_request_tokens(rate_limiter, messages)) as slot:
+            yield slot
+
     @abstractmethod
     def invoke(self, *args, **kwargs) -> Any:
         pass
@@ -328,6 +405,13 @@ class Model(ABC):
         log_debug(f"Model: {self.id}", center=True, symbol="-")
 
         _log_messages(messages)
+
+        cache_key, cached_response = self._get_cached_response(
+            messages=messages, response_format=response_format, tools=tools
+        )
+        if cached_response is not None:
+            return cached_response
+
         model_response = ModelResponse()
 
         function_call_count = 0
@@ -420,6 +504,9 @@ class Model(ABC):
             # No tool calls or finished processing them
             break
 
+        if cache_key is not None:
+            self.response_cache.set(cache_key, model_response)  # type: ignore
+
         log_debug(f"{self.get_provider()} Response End", center=True, symbol="-")
         return model_response
 
@@ -439,6 +526,13 @@ class Model(ABC):
         log_debug(f"{self.get_provider()} Async Response Start", center=True, symbol="-")
         log_debug(f"Model: {self.id}", center=True, symbol="-")
         _log_messages(messages)
+
+        cache_key, cached_response = await asyncio.to_thread(
+            self._get_cached_response, messages=messages, response_format=response_format, tools=tools
+        )
+        if cached_response is not None:
+            return cached_response
+
         model_response = ModelResponse()
 
         function_call_count = 0
@@ -530,9 +624,249 @@ class Model(ABC):
             # No tool calls or finished processing them
             break
 
+        if cache_key is not None:
+            await asyncio.to_thread(self.response_cache.set, cache_key, model_response)  # type: ignore
+
         log_debug(f"{self.get_provider()} Async Response End", center=True, symbol="-")
         return model_response
 
+    def _get_cached_response(
+        self,
+        messages: List[Message],
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+    ) -> Tuple[Optional["ResponseCacheKey"], Optional[ModelResponse]]:
+        """Look up the response cache.
+
+        Returns the cache key of the request (None if it can not be cached) and the cached response if found.
+        On a hit, the cached assistant message is added to the messages.
+        """
+        if self.response_cache is None:
+            return None, None
+        cache_key = self.response_cache.get_key(self, messages, response_format=response_format, tools=tools)
+        if cache_key is None:
+            return None, None
+        entry = self.response_cache.get(cache_key)
+        if entry is None:
+            return cache_key, None
+
+        from agno.cache.response import get_cached_model_response
+
+        model_response, assistant_message = get_cached_model_response(entry)
+        assistant_message.role = self.assistant_message_role
+        messages.append(assistant_message)
+        assistant_message.log(metrics=True)
+        return cache_key, model_response
+
+    def _cache_stream_response(
+        self, cache_key: "ResponseCacheKey", assistant_message: Message, called_tools: bool = False
+    ) -> None:
+        """Cache the final assistant message of a streamed response."""
+        if self.response_cache is None:
+            return
+        model_response = ModelResponse(
+            role=assistant_message.role,
+            content=assistant_message.content,
+            thinking=assistant_message.thinking,
+            reasoning_content=assistant_message.reasoning_content,
+        )
+        self.response_cache.set(cache_key, model_response, called_tools=called_tools)
+
+    def _record_hedged_request(self, assistant_message: Message, messages: List[Message], result: HedgedResult) -> None:
+        if not result.hedged or self.hedging is None:
+            return
+        target = self.hedging.fallback_model or self
+        assistant_message.metrics.hedged_requests += 1
+        assistant_message.metrics.hedged_input_tokens += count_messages_tokens(messages, target.id)
+        log_debug(f"Hedged request to {target.id} {'won' if result.hedge_won else 'lost'}")
+
+    def _get_provider_response(
+        self,
+        messages: List[Message],
+        assistant_message: Message,
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+    ) -> ModelResponse:
+        """Invoke the model and parse its response, hedging slow requests if a hedging policy is set."""
+
+        def get_response(model: Model) -> ModelResponse:
+            response = model.invoke(
+                messages=messages, response_format=response_format, tools=tools, tool_choice=tool_choice
+            )
+            return model.parse_provider_response(response, response_format=response_format)
+
+        cancellation_token = get_cancellation_token()
+        if cancellation_token is not None:
+            # Return as soon as the run is cancelled, without waiting for the request
+            return cancellation_token.call(
+                lambda: self._get_hedged_provider_response(get_response, messages, assistant_message)
+            )
+        return self._get_hedged_provider_response(get_response, messages, assistant_message)
+
+    def _get_hedged_provider_response(
+        self,
+        get_response: Callable[["Model"], ModelResponse],
+        messages: List[Message],
+        assistant_message: Message,
+    ) -> ModelResponse:
+        if self.hedging is None:
+            return get_response(self)
+
+        latency_key = get_latency_key(self, "response")
+        delay = self.hedging.get_delay(latency_key)
+        start = perf_counter()
+        if delay is None:
+            provider_response = get_response(self)
+        else:
+            fallback = self.hedging.fallback_model or self
+            result = run_hedged(lambda: get_response(self), lambda: get_response(fallback), delay=delay)
+            self._record_hedged_request(assistant_message, messages, result)
+            provider_response = result.value
+        self.hedging.record(latency_key, perf_counter() - start)
+        return provider_response
+
+    async def _aget_provider_response(
+        self,
+        messages: List[Message],
+        assistant_message: Message,
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+    ) -> ModelResponse:
+        """Async version of `_get_provider_response`. The losing request is cancelled."""
+
+        async def get_response(model: Model) -> ModelResponse:
+            response = await model.ainvoke(
+                messages=messages, response_format=response_format, tools=tools, tool_choice=tool_choice
+            )
+            return model.parse_provider_response(response, response_format=response_format)
+
+        cancellation_token = get_cancellation_token()
+        if cancellation_token is not None:
+            # Cancel the request as soon as the run is cancelled
+            return await cancellation_token.acall(
+                self._aget_hedged_provider_response(get_response, messages, assistant_message)
+            )
+        return await self._aget_hedged_provider_response(get_response, messages, assistant_message)
+
+    async def _aget_hedged_provider_response(
+        self,
+        get_response: Callable[["Model"], Awaitable[ModelResponse]],
+        messages: List[Message],
+        assistant_message: Message,
+    ) -> ModelResponse:
+        if self.hedging is None:
+            return await get_response(self)
+
+        latency_key = get_latency_key(self, "response")
+        delay = self.hedging.get_delay(latency_key)
+        start = perf_counter()
+        if delay is None:
+            provider_response = await get_response(self)
+        else:
+            fallback = self.hedging.fallback_model or self
+            result = await arun_hedged(lambda: get_response(self), lambda: get_response(fallback), delay=delay)
+            self._record_hedged_request(assistant_message, messages, result)
+            provider_response = result.value
+        self.hedging.record(latency_key, perf_counter() - start)
+        return provider_response
+
+    def _get_provider_response_stream(
+        self,
+        messages: List[Message],
+        assistant_message: Message,
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+    ) -> Iterator[ModelResponse]:
+        """Invoke the model and parse its response deltas, hedging if the first delta is slow to arrive."""
+        if self.hedging is None:
+            for response_delta in self.invoke_stream(
+                messages=messages, response_format=response_format, tools=tools, tool_choice=tool_choice
+            ):
+                raise_if_cancelled()
+                yield self.parse_provider_response_delta(response_delta)
+            return
+
+        def start_stream(model: Model) -> Tuple[Model, Iterator[Any], Any]:
+            stream = iter(
+                model.invoke_stream(
+                    messages=messages, response_format=response_format, tools=tools, tool_choice=tool_choice
+                )
+            )
+            return model, stream, next(stream, _STREAM_END)
+
+        def close_stream(started: Tuple[Model, Iterator[Any], Any]) -> None:
+            close = getattr(started[1], "close", None)
+            if close is not None:
+                close()
+
+        latency_key = get_latency_key(self, "first_token")
+        delay = self.hedging.get_delay(latency_key)
+        start = perf_counter()
+        if delay is None:
+            model, stream, first_delta = start_stream(self)
+        else:
+            fallback = self.hedging.fallback_model or self
+            result = run_hedged(
+                lambda: start_stream(self), lambda: start_stream(fallback), delay=delay, on_loser=close_stream
+            )
+            self._record_hedged_request(assistant_message, messages, result)
+            model, stream, first_delta = result.value
+        self.hedging.record(latency_key, perf_counter() - start)
+
+        if first_delta is _STREAM_END:
+            return
+        yield model.parse_provider_response_delta(first_delta)
+        for response_delta in stream:
+            raise_if_cancelled()
+            yield model.parse_provider_response_delta(response_delta)
+
+    async def _aget_provider_response_stream(
+        self,
+        messages: List[Message],
+        assistant_message: Message,
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+    ) -> AsyncIterator[ModelResponse]:
+        """Async version of `_get_provider_response_stream`. The losing stream is cancelled."""
+        if self.hedging is None:
+            async for response_delta in self.ainvoke_stream(  # type: ignore
+                messages=messages, response_format=response_format, tools=tools, tool_choice=tool_choice
+            ):
+                yield self.parse_provider_response_delta(response_delta)
+            return
+
+        async def start_stream(model: Model) -> Tuple[Model, AsyncIterator[Any], Any]:
+            stream = model.ainvoke_stream(
+                messages=messages, response_format=response_format, tools=tools, tool_choice=tool_choice
+            ).__aiter__()  # type: ignore
+            try:
+                first_delta = await stream.__anext__()
+            except StopAsyncIteration:
+                first_delta = _STREAM_END
+            return model, stream, first_delta
+
+        latency_key = get_latency_key(self, "first_token")
+        delay = self.hedging.get_delay(latency_key)
+        start = perf_counter()
+        if delay is None:
+            model, stream, first_delta = await start_stream(self)
+        else:
+            fallback = self.hedging.fallback_model or self
+            result = await arun_hedged(lambda: start_stream(self), lambda: start_stream(fallback), delay=delay)
+            self._record_hedged_request(assistant_message, messages, result)
+            model, stream, first_delta = result.value
+        self.hedging.record(latency_key, perf_counter() - start)
+
+        if first_delta is _STREAM_END:
+            return
+        yield model.parse_provider_response_delta(first_delta)
+        async for response_delta in stream:
+            yield model.parse_provider_response_delta(response_delta)
+
     def _process_model_response(
         self,
         messages: List[Message],
@@ -548,25 +882,26 @@ class Model(ABC):
         Returns:
             Tuple[Message, bool]: (assistant_message, should_continue)
         """
-        # Generate response
-        assistant_message.metrics.start_timer()
-        response = self.invoke(
-            messages=messages,
-            response_format=response_format,
-            tools=tools,
-            tool_choice=tool_choice or self._tool_choice,
-        )
-        assistant_message.metrics.stop_timer()
-
-        # Parse provider response
-        provider_response: ModelResponse = self.parse_provider_response(response, response_format=response_format)
+        with self._rate_limit(messages) as rate_limit_slot:
+            # Generate response
+            assistant_message.metrics.start_timer()
+            # Get and parse the provider response
+            provider_response: ModelResponse = self._get_provider_response(
+                messages=messages,
+                assistant_message=assistant_message,
+                response_format=response_format,
+                tools=tools,
+                tool_choice=tool_choice or self._tool_choice,
+            )
+            assistant_message.metrics.stop_timer()
 
-        # Add parsed data to model response
-        if provider_response.parsed is not None:
-            model_response.parsed = provider_response.parsed
+            # Add parsed data to model response
+            if provider_response.parsed is not None:
+                model_response.parsed = provider_response.parsed
 
-        # Populate the assistant message
-        self._populate_assistant_message(assistant_message=assistant_message, provider_response=provider_response)
+            # Populate the assistant message
+            self._populate_assistant_message(assistant_message=assistant_message, provider_response=provider_response)
+            rate_limit_slot.used_tokens = assistant_message.metrics.total_tokens or None
 
         # Update model response with assistant message content and audio
         if assistant_message.content is not None:
@@ -604,25 +939,26 @@ class Model(ABC):
         Returns:
             Tuple[Message, bool]: (assistant_message, should_continue)
         """
-        # Generate response
-        assistant_message.metrics.start_timer()
-        response = await self.ainvoke(
-            messages=messages,
-            response_format=response_format,
-            tools=tools,
-            tool_choice=tool_choice or self._tool_choice,
-        )
-        assistant_message.metrics.stop_timer()
-
-        # Parse provider response
-        provider_response: ModelResponse = self.parse_provider_response(response, response_format=response_format)
+        async with self._arate_limit(messages) as rate_limit_slot:
+            # Generate response
+            assistant_message.metrics.start_timer()
+            # Get and parse the provider response
+            provider_response: ModelResponse = await self._aget_provider_response(
+                messages=messages,
+                assistant_message=assistant_message,
+                response_format=response_format,
+                tools=tools,
+                tool_choice=tool_choice or self._tool_choice,
+            )
+            assistant_message.metrics.stop_timer()
 
-        # Add parsed data to model response
-        if provider_response.parsed is not None:
-            model_response.parsed = provider_response.parsed
+            # Add parsed data to model response
+            if provider_response.parsed is not None:
+                model_response.parsed = provider_response.parsed
 
-        # Populate the assistant message
-        self._populate_assistant_message(assistant_message=assistant_message, provider_response=provider_response)
+            # Populate the assistant message
+            self._populate_assistant_message(assistant_message=assistant_message, provider_response=provider_response)
+            rate_limit_slot.used_tokens = assistant_message.metrics.total_tokens or None
 
         # Update model response with assistant message content and audio
         if assistant_message.content is not None:
@@ -720,18 +1056,22 @@ class Model(ABC):
         """
         Process a streaming response from the model.
         """
-        assistant_message.metrics.start_timer()
-        for response_delta in self.invoke_stream(
-            messages=messages,
-            response_format=response_format,
-            tools=tools,
-            tool_choice=tool_choice or self._tool_choice,
-        ):
-            model_response_delta = self.parse_provider_response_delta(response_delta)
-            yield from self._populate_stream_data_and_assistant_message(
-                stream_data=stream_data, assistant_message=assistant_message, model_response_delta=model_response_delta
-            )
-        assistant_message.metrics.stop_timer()
+        with self._rate_limit(messages) as rate_limit_slot:
+            assistant_message.metrics.start_timer()
+            for model_response_delta in self._get_provider_response_stream(
+                messages=messages,
+                assistant_message=assistant_message,
+                response_format=response_format,
+                tools=tools,
+                tool_choice=tool_choice or self._tool_choice,
+            ):
+                yield from self._populate_stream_data_and_assistant_message(
+                    stream_data=stream_data,
+                    assistant_message=assistant_message,
+                    model_response_delta=model_response_delta,
+                )
+            assistant_message.metrics.stop_timer()
+            rate_limit_slot.used_tokens = assistant_message.metrics.total_tokens or None
 
     def response_stream(
         self,
@@ -751,7 +1091,15 @@ class Model(ABC):
         log_debug(f"Model: {self.id}", center=True, symbol="-")
         _log_messages(messages)
 
+        cache_key, cached_response = self._get_cached_response(
+            messages=messages, response_format=response_format, tools=tools
+        )
+        if cached_response is not None:
+            yield cached_response
+            return
+
         function_call_count = 0
+        called_tools = False
 
         while True:
             assistant_message = Message(role=self.assistant_message_role)
@@ -802,6 +1150,7 @@ class Model(ABC):
 
             # Handle tool calls if present
             if assistant_message.tool_calls is not None:
+                called_tools = True
                 # Prepare function calls
                 function_calls_to_run: List[FunctionCall] = self.get_function_calls_to_run(
                     assistant_message, messages, functions
@@ -853,6 +1202,9 @@ class Model(ABC):
             # No tool calls or finished processing them
             break
 
+        if cache_key is not None:
+            self._cache_stream_response(cache_key, assistant_message=assistant_message, called_tools=called_tools)
+
         log_debug(f"{self.get_provider()} Response Stream End", center=True, symbol="-")
 
     async def aprocess_response_stream(
@@ -867,19 +1219,23 @@ class Model(ABC):
         """
         Process a streaming response from the model.
         """
-        assistant_message.metrics.start_timer()
-        async for response_delta in self.ainvoke_stream(
-            messages=messages,
-            response_format=response_format,
-            tools=tools,
-            tool_choice=tool_choice or self._tool_choice,
-        ):  # type: ignore
-            model_response_delta = self.parse_provider_response_delta(response_delta)
-            for model_response in self._populate_stream_data_and_assistant_message(
-                stream_data=stream_data, assistant_message=assistant_message, model_response_delta=model_response_delta
+        async with self._arate_limit(messages) as rate_limit_slot:
+            assistant_message.metrics.start_timer()
+            async for model_response_delta in self._aget_provider_response_stream(
+                messages=messages,
+                assistant_message=assistant_message,
+                response_format=response_format,
+                tools=tools,
+                tool_choice=tool_choice or self._tool_choice,
             ):
-                yield model_response
-        assistant_message.metrics.stop_timer()
+                for model_response in self._populate_stream_data_and_assistant_message(
+                    stream_data=stream_data,
+                    assistant_message=assistant_message,
+                    model_response_delta=model_response_delta,
+                ):
+                    yield model_response
+            assistant_message.metrics.stop_timer()
+            rate_limit_slot.used_tokens = assistant_message.metrics.total_tokens or None
 
     async def aresponse_stream(
         self,
@@ -899,7 +1255,15 @@ class Model(ABC):
         log_debug(f"Model: {self.id}", center=True, symbol="-")
         _log_messages(messages)
 
+        cache_key, cached_response = await asyncio.to_thread(
+            self._get_cached_response, messages=messages, response_format=response_format, tools=tools
+        )
+        if cached_response is not None:
+            yield cached_response
+            return
+
         function_call_count = 0
+        called_tools = False
 
         while True:
             # Create assistant message and stream data
@@ -949,6 +1313,7 @@ class Model(ABC):
 
             # Handle tool calls if present
             if assistant_message.tool_calls is not None:
+                called_tools = True
                 # Prepare function calls
                 function_calls_to_run: List[FunctionCall] = self.get_function_calls_to_run(
                     assistant_message, messages, functions
@@ -1000,6 +1365,11 @@ class Model(ABC):
             # No tool calls or finished processing them
             break
 
+        if cache_key is not None:
+            await asyncio.to_thread(
+                self._cache_stream_response, cache_key, assistant_message=assistant_message, called_tools=called_tools
+            )
+
         log_debug(f"{self.get_provider()} Async Response Stream End", center=True, symbol="-")
 
     def _populate_stream_data_and_assistant_message(
@@ -1189,7 +1559,13 @@ class Model(ABC):
         # Run function calls sequentially
         function_execution_result: FunctionExecutionResult = FunctionExecutionResult(status="failure")
         try:
-            function_execution_result = function_call.execute()
+            if function_call.function.executor is not None:
+                function_execution_result = function_call.function.executor.run(function_call.execute)
+            else:
+                function_execution_result = function_call.execute()
+        except ToolExecutorOverloadedError as e:
+            log_warning(str(e))
+            function_call.error = f"{e}. Try again later."
         except AgentRunException as a_exc:
             # Update additional messages from function call
             _handle_agent_exception(a_exc, additional_messages)
@@ -1387,9 +1763,16 @@ class Model(ABC):
             ):
                 result = await function_call.aexecute()
                 success = result.status == "success"
+            elif function_call.function.executor is not None:
+                result = await function_call.function.executor.arun(function_call.execute)
+                success = result.status == "success"
             else:
                 result = await asyncio.to_thread(function_call.execute)
                 success = result.status == "success"
+        except ToolExecutorOverloadedError as e:
+            log_warning(str(e))
+            function_call.error = f"{e}. Try again later."
+            success = False
         except AgentRunException as e:
             success = e
         except Exception as e:
@@ -1691,6 +2074,10 @@ class Model(ABC):
         for k, v in self.__dict__.items():
             if k in {"response_format", "_tools", "_functions"}:
                 continue
+            # The response cache and hedging policy are shared with the copy
+            if k in {"response_cache", "hedging"}:
+                setattr(new_model, k, v)
+                continue
             try:
                 setattr(new_model, k, deepcopy(v, memo))
             except Exception:
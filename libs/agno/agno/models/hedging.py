@@ -0,0 +1,180 @@
+import asyncio
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+from agno.utils.log import log_debug, log_warning
+
+if TYPE_CHECKING:
+    from agno.models.base import Model
+
+T = TypeVar("T")
+
+
+class LatencyTracker:
+    """Sliding window of latencies, used to compute percentiles."""
+
+    def __init__(self, window: int = 200):
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._latencies)
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        with self._lock:
+            latencies = sorted(self._latencies)
+        if not latencies:
+            return None
+        index = min(len(latencies) - 1, max(0, round(percentile / 100 * len(latencies)) - 1))
+        return latencies[index]
+
+
+@dataclass
+class HedgingPolicy:
+    """When to send a duplicate (hedged) request for a slow Model response.
+
+    If a response (or the first chunk of a streamed response) has not arrived after the `percentile`
+    latency of the recent requests, the same request is sent to `fallback_model` (or again to the same model).
+    The first response wins and the other request is cancelled.
+
+    Args:
+        percentile: Latency percentile after which the hedged request is sent.
+        min_samples: Number of latencies recorded before the percentile is used.
+        initial_delay: Delay before hedging while fewer than `min_samples` latencies are recorded.
+            None to not hedge until then.
+        min_delay: Lower bound of the delay, to not double the load on fast responses.
+        max_delay: Upper bound of the delay.
+        window: Number of recent latencies the percentile is computed on.
+        fallback_model: Model the hedged request is sent to. Defaults to the same model.
+    """
+
+    percentile: float = 95.0
+    min_samples: int = 20
+    initial_delay: Optional[float] = None
+    min_delay: float = 0.5
+    max_delay: Optional[float] = None
+    window: int = 200
+    fallback_model: Optional["Model"] = None
+
+    _trackers: Dict[str, LatencyTracker] = field(default_factory=dict, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def get_tracker(self, key: str) -> LatencyTracker:
+        with self._lock:
+            tracker = self._trackers.get(key)
+            if tracker is None:
+                tracker = LatencyTracker(window=self.window)
+                self._trackers[key] = tracker
+            return tracker
+
+    def get_delay(self, key: str) -> Optional[float]:
+        """Return the seconds to wait before hedging a request, or None to not hedge it."""
+        tracker = self.get_tracker(key)
+        if len(tracker) < self.min_samples:
+            delay = self.initial_delay
+        else:
+            delay = tracker.percentile(self.percentile)
+        if delay is None:
+            return None
+        delay = max(delay, self.min_delay)
+        if self.max_delay is not None:
+            delay = min(delay, self.max_delay)
+        return delay
+
+    def record(self, key: str, seconds: float) -> None:
+        self.get_tracker(key).record(seconds)
+
+
+@dataclass
+class HedgedResult:
+    value: Any
+    # True if a hedged request was sent
+    hedged: bool = False
+    # True if the hedged request won
+    hedge_won: bool = False
+
+
+def _call_on_loser(future: Future, on_loser: Callable[[Any], None]) -> None:
+    if future.exception() is None:
+        try:
+            on_loser(future.result())
+        except Exception as e:
+            log_debug(f"Error cleaning up losing request: {e}")
+
+
+def run_hedged(
+    primary: Callable[[], T],
+    hedge: Callable[[], T],
+    delay: float,
+    on_loser: Optional[Callable[[T], None]] = None,
+) -> HedgedResult:
+    """Run `primary`, and `hedge` too if `primary` has not returned after `delay` seconds.
+
+    Returns the first successful result. A running call can not be stopped from another thread: the losing call
+    is left to finish in the background and `on_loser` is called with its result, e.g. to close a stream.
+    Raises the error of `primary` if both calls fail.
+    """
+    executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="agno-hedged-request")
+    try:
+        primary_future = executor.submit(primary)
+        done, _ = wait([primary_future], timeout=delay)
+        if done:
+            return HedgedResult(value=primary_future.result())
+
+        log_debug(f"No response after {delay:.2f}s, sending a hedged request")
+        hedge_future = executor.submit(hedge)
+        pending = {primary_future, hedge_future}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    log_warning(
+                        f"{'Hedged' if future is hedge_future else 'Primary'} request failed: {future.exception()}"
+                    )
+                    continue
+                loser: Future = hedge_future if future is primary_future else primary_future
+                if not loser.cancel() and on_loser is not None:
+                    loser.add_done_callback(lambda f: _call_on_loser(f, on_loser))
+                return HedgedResult(value=future.result(), hedged=True, hedge_won=future is hedge_future)
+        return HedgedResult(value=primary_future.result(), hedged=True)
+    finally:
+        executor.shutdown(wait=False)
+
+
+async def arun_hedged(
+    primary: Callable[[], Awaitable[T]],
+    hedge: Callable[[], Awaitable[T]],
+    delay: float,
+) -> HedgedResult:
+    """Async version of `run_hedged`. The losing request is cancelled."""
+    primary_task = asyncio.ensure_future(primary())
+    done, _ = await asyncio.wait({primary_task}, timeout=delay)
+    if done:
+        return HedgedResult(value=primary_task.result())
+
+    log_debug(f"No response after {delay:.2f}s, sending a hedged request")
+    hedge_task = asyncio.ensure_future(hedge())
+    pending = {primary_task, hedge_task}
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is not None:
+                    log_warning(f"{'Hedged' if task is hedge_task else 'Primary'} request failed: {task.exception()}")
+                    continue
+                return HedgedResult(value=task.result(), hedged=True, hedge_won=task is hedge_task)
+        return HedgedResult(value=primary_task.result(), hedged=True)
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def get_latency_key(model: "Model", kind: str) -> str:
+    return f"{model.get_provider()}:{model.id}:{kind}"
@@ -1,11 +1,13 @@
 import json
+import sys
 from dataclasses import asdict, dataclass
 from time import time
-from typing import Any, Dict, List, Optional, Sequence, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 
 from agno.media import Audio, AudioResponse, File, Image, ImageArtifact, Video
+from agno.utils.common import DATACLASS_SLOTS
 from agno.utils.log import log_debug, log_error, log_info, log_warning
 from agno.utils.timer import Timer
 
@@ -49,7 +51,7 @@ class Citations(BaseModel):
     documents: Optional[List[DocumentCitation]] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MessageMetrics:
     input_tokens: int = 0
     output_tokens: int = 0
@@ -66,6 +68,10 @@ class MessageMetrics:
     prompt_tokens_details: Optional[dict] = None
     completion_tokens_details: Optional[dict] = None
 
+    # Duplicate requests sent by request hedging, and their estimated input tokens
+    hedged_requests: int = 0
+    hedged_input_tokens: int = 0
+
     additional_metrics: Optional[dict] = None
 
     time: Optional[float] = None
@@ -112,6 +118,8 @@ class MessageMetrics:
             cached_tokens=self.cached_tokens + other.cached_tokens,
             cache_write_tokens=self.cache_write_tokens + other.cache_write_tokens,
             reasoning_tokens=self.reasoning_tokens + other.reasoning_tokens,
+            hedged_requests=self.hedged_requests + other.hedged_requests,
+            hedged_input_tokens=self.hedged_input_tokens + other.hedged_input_tokens,
         )
 
         # Handle prompt_tokens_details
@@ -219,8 +227,17 @@ class Message(BaseModel):
     # The Unix timestamp the message was created.
     created_at: int = Field(default_factory=lambda: int(time()))
 
+    # Cached token count of the message, keyed by model id and content hash. See agno.utils.tokens.
+    _token_count: Optional[Tuple[Tuple[Optional[str], int], int]] = PrivateAttr(default=None)
+
     model_config = ConfigDict(extra="allow", populate_by_name=True, arbitrary_types_allowed=True)
 
+    @field_validator("role")
+    @classmethod
+    def intern_role(cls, role: str) -> str:
+        # Messages loaded from storage share one copy of each role string
+        return sys.intern(role)
+
     def get_content_string(self) -> str:
         """Returns the content as a string."""
         if isinstance(self.content, str):
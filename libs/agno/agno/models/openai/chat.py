@@ -123,6 +123,11 @@ class OpenAIChat(Model):
         client_params: Dict[str, Any] = self._get_client_params()
         if self.http_client is not None:
             client_params["http_client"] = self.http_client
+        elif self.get_rate_limiter() is not None:
+            # Read the rate limit headers of every response
+            client_params["http_client"] = httpx.Client(
+                event_hooks={"response": [lambda response: self.update_rate_limits(response.headers)]}
+            )
         return OpenAIClient(**client_params)
 
     def get_async_client(self) -> AsyncOpenAIClient:
@@ -136,9 +141,17 @@ class OpenAIChat(Model):
         if self.http_client:
             client_params["http_client"] = self.http_client
         else:
+            event_hooks: Dict[str, List[Any]] = {}
+            if self.get_rate_limiter() is not None:
+
+                async def update_rate_limits(response: httpx.Response) -> None:
+                    self.update_rate_limits(response.headers)
+
+                # Read the rate limit headers of every response
+                event_hooks["response"] = [update_rate_limits]
             # Create a new async HTTP client with custom limits
             client_params["http_client"] = httpx.AsyncClient(
-                limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100)
+                limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100), event_hooks=event_hooks
             )
         return AsyncOpenAIClient(**client_params)
 
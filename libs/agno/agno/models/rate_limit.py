@@ -0,0 +1,391 @@
+import asyncio
+import re
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from time import monotonic, sleep
+from typing import Any, AsyncIterator, Dict, Iterator, Mapping, Optional, Tuple
+
+from agno.exceptions import ModelProviderError
+from agno.utils.log import log_debug, log_warning
+
+# Fraction of the rate limit left below which the concurrency limit is decreased
+LOW_REMAINING_FRACTION = 0.05
+
+
+@dataclass
+class RateLimiterMetrics:
+    """Counters of a rate limiter."""
+
+    requests: int = 0
+    # Requests that had to wait for the rate or concurrency limit
+    queued: int = 0
+    # Requests currently waiting
+    waiting: int = 0
+    in_flight: int = 0
+    total_wait_time: float = 0.0
+    max_wait_time: float = 0.0
+    # Responses with a 429 status
+    rate_limited: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "queued": self.queued,
+            "waiting": self.waiting,
+            "in_flight": self.in_flight,
+            "total_wait_time": self.total_wait_time,
+            "mean_wait_time": self.total_wait_time / self.requests if self.requests else 0.0,
+            "max_wait_time": self.max_wait_time,
+            "rate_limited": self.rate_limited,
+        }
+
+
+class TokenBucket:
+    """Token bucket refilled at `rate_per_minute`, holding at most `capacity` tokens.
+
+    Reservations are taken immediately and may overdraw the bucket: the caller waits for the returned delay,
+    so concurrent callers are spaced out instead of all retrying at once.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        self._lock = threading.Lock()
+        self.rate_per_minute = rate_per_minute
+        # Default to a burst of 10 seconds worth of tokens
+        self.capacity = capacity if capacity is not None else max(1.0, rate_per_minute / 6)
+        self._tokens = self.capacity
+        self._updated_at = monotonic()
+        self._blocked_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate_per_minute / 60)
+        self._updated_at = now
+
+    def reserve(self, amount: float = 1.0) -> float:
+        """Take `amount` tokens and return the number of seconds to wait before using them."""
+        with self._lock:
+            now = monotonic()
+            self._refill(now)
+            self._tokens -= min(amount, self.capacity)
+            wait = -self._tokens * 60 / self.rate_per_minute if self._tokens < 0 else 0.0
+            return max(wait, self._blocked_until - now)
+
+    def refund(self, amount: float) -> None:
+        """Give back tokens, or take more if `amount` is negative, e.g. once the actual usage is known."""
+        with self._lock:
+            self._refill(monotonic())
+            self._tokens = min(self.capacity, self._tokens + amount)
+
+    def set_rate(self, rate_per_minute: float) -> None:
+        with self._lock:
+            self._refill(monotonic())
+            if rate_per_minute != self.rate_per_minute:
+                self.capacity = self.capacity * rate_per_minute / self.rate_per_minute
+                self.rate_per_minute = rate_per_minute
+                self._tokens = min(self._tokens, self.capacity)
+
+    def block(self, seconds: float) -> None:
+        """Hold all reservations for `seconds`."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, monotonic() + seconds)
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limits concurrent requests, adapting the limit with additive increase and multiplicative decrease (AIMD).
+
+    The limit grows by about one every `limit` successful requests and is multiplied by `decrease_factor`
+    when the provider signals overload.
+    """
+
+    def __init__(
+        self,
+        initial_limit: float = 8,
+        min_limit: float = 1,
+        max_limit: float = 64,
+        decrease_factor: float = 0.5,
+    ):
+        self.limit = float(min(max(initial_limit, min_limit), max_limit))
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.in_flight = 0
+        self._condition = threading.Condition()
+
+    def _has_capacity(self) -> bool:
+        return self.in_flight < max(1, int(self.limit))
+
+    def try_acquire(self) -> bool:
+        with self._condition:
+            if not self._has_capacity():
+                return False
+            self.in_flight += 1
+            return True
+
+    def acquire(self) -> None:
+        with self._condition:
+            self._condition.wait_for(self._has_capacity)
+            self.in_flight += 1
+
+    async def aacquire(self) -> None:
+        # Poll so that sync and async callers share the same limit
+        delay = 0.005
+        while not self.try_acquire():
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.1)
+
+    def release(self) -> None:
+        with self._condition:
+            self.in_flight -= 1
+            self._condition.notify()
+
+    def on_success(self) -> None:
+        with self._condition:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            self._condition.notify()
+
+    def on_overload(self) -> None:
+        with self._condition:
+            self.limit = max(self.min_limit, self.limit * self.decrease_factor)
+
+
+def _parse_duration(value: str) -> Optional[float]:
+    """Parse a reset duration header, e.g. "20", "1.5s", "6m0s" or "120ms", into seconds."""
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = re.findall(r"(\d+(?:\.\d+)?)(ms|h|m|s)", value)
+    if not parts:
+        return None
+    units = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+    return sum(float(number) * units[unit] for number, unit in parts)
+
+
+def _get_header(headers: Mapping[str, str], *names: str) -> Optional[str]:
+    lower_headers = {k.lower(): v for k, v in headers.items()}
+    for name in names:
+        if name in lower_headers:
+            return lower_headers[name]
+    return None
+
+
+def _get_number(headers: Mapping[str, str], *names: str) -> Optional[float]:
+    value = _get_header(headers, *names)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class RateLimiter:
+    """Client-side rate limiter for the requests to a model.
+
+    Combines token buckets for requests and tokens per minute with an adaptive concurrency limit.
+    The limits are updated from the rate limit headers of the provider responses (OpenAI and Anthropic style)
+    and requests are held back after a 429, so concurrent agents queue instead of retrying in a storm.
+
+    Args:
+        requests_per_minute: Requests allowed per minute.
+        tokens_per_minute: Input and output tokens allowed per minute.
+        max_concurrent_requests: Upper bound of the adaptive concurrency limit.
+        initial_concurrent_requests: Starting concurrency limit. Defaults to `max_concurrent_requests`.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        max_concurrent_requests: Optional[int] = None,
+        initial_concurrent_requests: Optional[int] = None,
+    ):
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.concurrency = (
+            AdaptiveConcurrencyLimiter(
+                initial_limit=initial_concurrent_requests or max_concurrent_requests,
+                max_limit=max_concurrent_requests,
+            )
+            if max_concurrent_requests
+            else None
+        )
+        self.metrics = RateLimiterMetrics()
+        self._metrics_lock = threading.Lock()
+
+    def _reserve(self, estimated_tokens: int) -> float:
+        wait = self.requests.reserve(1) if self.requests is not None else 0.0
+        if self.tokens is not None and estimated_tokens > 0:
+            wait = max(wait, self.tokens.reserve(estimated_tokens))
+        return wait
+
+    def _on_queued(self) -> None:
+        with self._metrics_lock:
+            self.metrics.requests += 1
+            self.metrics.waiting += 1
+
+    def _on_started(self, wait: float) -> None:
+        with self._metrics_lock:
+            self.metrics.waiting -= 1
+            self.metrics.in_flight += 1
+            self.metrics.total_wait_time += wait
+            self.metrics.max_wait_time = max(self.metrics.max_wait_time, wait)
+            if wait > 0.001:
+                self.metrics.queued += 1
+
+    def _finish(self, estimated_tokens: int, used_tokens: Optional[int], error: Optional[BaseException]) -> None:
+        with self._metrics_lock:
+            self.metrics.in_flight -= 1
+        if self.concurrency is not None:
+            self.concurrency.release()
+        if self.tokens is not None and used_tokens is not None:
+            self.tokens.refund(estimated_tokens - used_tokens)
+        if error is None:
+            if self.concurrency is not None:
+                self.concurrency.on_success()
+        elif isinstance(error, ModelProviderError) and error.status_code == 429:
+            self.on_rate_limited(self._get_error_headers(error))
+
+    @staticmethod
+    def _get_error_headers(error: BaseException) -> Optional[Mapping[str, str]]:
+        response = getattr(error.__cause__, "response", None)
+        return getattr(response, "headers", None)
+
+    @contextmanager
+    def limit(self, estimated_tokens: int = 0) -> Iterator["RateLimitSlot"]:
+        """Wait for the rate and concurrency limits, then hold a slot while the request runs.
+
+        Set `used_tokens` on the yielded slot once the actual usage is known.
+        """
+        start = monotonic()
+        self._on_queued()
+        wait = self._reserve(estimated_tokens)
+        if wait > 0:
+            sleep(wait)
+        if self.concurrency is not None:
+            self.concurrency.acquire()
+        self._on_started(monotonic() - start)
+
+        slot = RateLimitSlot()
+        error: Optional[BaseException] = None
+        try:
+            yield slot
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            self._finish(estimated_tokens, slot.used_tokens, error)
+
+    @asynccontextmanager
+    async def alimit(self, estimated_tokens: int = 0) -> AsyncIterator["RateLimitSlot"]:
+        """Async version of `limit`."""
+        start = monotonic()
+        self._on_queued()
+        wait = self._reserve(estimated_tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        if self.concurrency is not None:
+            await self.concurrency.aacquire()
+        self._on_started(monotonic() - start)
+
+        slot = RateLimitSlot()
+        error: Optional[BaseException] = None
+        try:
+            yield slot
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            self._finish(estimated_tokens, slot.used_tokens, error)
+
+    def on_rate_limited(self, headers: Optional[Mapping[str, str]] = None) -> None:
+        """Back off after a 429: decrease the concurrency limit and hold requests until the limit resets."""
+        with self._metrics_lock:
+            self.metrics.rate_limited += 1
+        if self.concurrency is not None:
+            self.concurrency.on_overload()
+        retry_after = None
+        if headers is not None:
+            self.update_from_headers(headers)
+            retry_after_header = _get_header(headers, "retry-after")
+            retry_after = _parse_duration(retry_after_header) if retry_after_header else None
+        retry_after = retry_after if retry_after is not None else 1.0
+        log_warning(f"Rate limited by the model provider, holding requests for {retry_after:.1f}s")
+        for bucket in (self.requests, self.tokens):
+            if bucket is not None:
+                bucket.block(retry_after)
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """Update the limits from the rate limit headers of a provider response."""
+        for bucket_name, kind in (("requests", "requests"), ("tokens", "tokens")):
+            limit = _get_number(headers, f"x-ratelimit-limit-{kind}", f"anthropic-ratelimit-{kind}-limit")
+            remaining = _get_number(headers, f"x-ratelimit-remaining-{kind}", f"anthropic-ratelimit-{kind}-remaining")
+            if limit is None or limit <= 0:
+                continue
+
+            bucket: Optional[TokenBucket] = getattr(self, bucket_name)
+            if bucket is None:
+                bucket = TokenBucket(limit)
+                setattr(self, bucket_name, bucket)
+                log_debug(f"Rate limit of {limit:.0f} {kind} per minute read from response headers")
+            elif bucket.rate_per_minute != limit:
+                bucket.set_rate(limit)
+
+            if remaining is not None and remaining <= limit * LOW_REMAINING_FRACTION:
+                if self.concurrency is not None:
+                    self.concurrency.on_overload()
+                if remaining <= 0:
+                    reset = _get_header(headers, f"x-ratelimit-reset-{kind}")
+                    reset_seconds = _parse_duration(reset) if reset else None
+                    if reset_seconds:
+                        bucket.block(reset_seconds)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return the queueing metrics and current limits."""
+        with self._metrics_lock:
+            metrics = self.metrics.to_dict()
+        metrics["requests_per_minute"] = self.requests.rate_per_minute if self.requests else None
+        metrics["tokens_per_minute"] = self.tokens.rate_per_minute if self.tokens else None
+        metrics["concurrency_limit"] = self.concurrency.limit if self.concurrency else None
+        return metrics
+
+
+@dataclass
+class RateLimitSlot:
+    """A request holding a rate limiter slot."""
+
+    used_tokens: Optional[int] = None
+
+
+_rate_limiters: Dict[Tuple[str, str], RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(
+    provider: str,
+    model_id: str,
+    requests_per_minute: Optional[float] = None,
+    tokens_per_minute: Optional[float] = None,
+    max_concurrent_requests: Optional[int] = None,
+) -> RateLimiter:
+    """Return the rate limiter shared by all models of a provider and id in the process, creating it on first use."""
+    key = (provider, model_id)
+    with _rate_limiters_lock:
+        rate_limiter = _rate_limiters.get(key)
+        if rate_limiter is None:
+            rate_limiter = RateLimiter(
+                requests_per_minute=requests_per_minute,
+                tokens_per_minute=tokens_per_minute,
+                max_concurrent_requests=max_concurrent_requests,
+            )
+            _rate_limiters[key] = rate_limiter
+        return rate_limiter
+
+
+def get_rate_limiter_metrics() -> Dict[str, Dict[str, Any]]:
+    """Return the metrics of every rate limiter, keyed by "provider:model_id"."""
+    with _rate_limiters_lock:
+        rate_limiters = list(_rate_limiters.items())
+    return {f"{provider}:{model_id}": limiter.get_metrics() for (provider, model_id), limiter in rate_limiters}
@@ -6,6 +6,7 @@ from typing import Any, Dict, List, Optional
 from agno.media import AudioResponse, ImageArtifact
 from agno.models.message import Citations, MessageMetrics
 from agno.tools.function import UserInputField
+from agno.utils.common import DATACLASS_SLOTS
 
 
 class ModelResponseEvent(str, Enum):
@@ -17,7 +18,7 @@ class ModelResponseEvent(str, Enum):
     assistant_response = "AssistantResponse"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ToolExecution:
     """Execution of a tool"""
 
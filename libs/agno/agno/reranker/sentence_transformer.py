@@ -1,7 +1,9 @@
+import json
 from typing import Any, Dict, List, Optional
 
 from agno.document import Document
 from agno.reranker.base import Reranker
+from agno.utils.local_models import local_model_registry
 from agno.utils.log import logger
 
 try:
@@ -14,13 +16,28 @@ class SentenceTransformerReranker(Reranker):
     model: str = "BAAI/bge-reranker-v2-m3"
     model_kwargs: Optional[Dict[str, Any]] = None
     top_n: Optional[int] = None
+    # Concurrent reranks are scored together, in batches of up to max_batch_size pairs
+    max_batch_size: int = 32
+    max_wait_ms: float = 5.0
+
+    def _predict(self, sentence_pairs: List[List[str]]) -> List[float]:
+        # Models are loaded once per process and shared between rerankers
+        model_key = ("cross_encoder", self.model, json.dumps(self.model_kwargs, sort_keys=True, default=str))
+        model = local_model_registry.get_model(
+            model_key, lambda: CrossEncoder(model_name_or_path=self.model, model_kwargs=self.model_kwargs)
+        )
+        batcher = local_model_registry.get_batcher(
+            key=(model_key,),
+            batch_fn=lambda pairs: model.predict(pairs).tolist(),
+            max_batch_size=self.max_batch_size,
+            max_wait_ms=self.max_wait_ms,
+        )
+        return batcher.submit(sentence_pairs)
 
     def _rerank(self, query: str, documents: List[Document]) -> List[Document]:
         if not documents:
             return []
 
-        sentence_transformer_client = CrossEncoder(model_name_or_path=self.model, model_kwargs=self.model_kwargs)
-
         top_n = self.top_n
         if top_n and not (0 < top_n):
             logger.warning(f"top_n should be a positive integer, got {self.top_n}, setting top_n to None")
@@ -30,7 +47,7 @@ class SentenceTransformerReranker(Reranker):
 
         sentence_pairs = [[query, doc.content] for doc in documents]
 
-        scores = sentence_transformer_client.predict(sentence_pairs).tolist()
+        scores = self._predict(sentence_pairs)
         for index, score in enumerate(scores):
             doc = documents[index]
             doc.reranking_score = score
@@ -8,10 +8,11 @@ from agno.media import AudioArtifact, AudioResponse, ImageArtifact, VideoArtifac
 from agno.models.message import Citations, Message, MessageReferences
 from agno.models.response import ToolExecution
 from agno.reasoning.step import ReasoningStep
+from agno.utils.common import DATACLASS_SLOTS
 from agno.utils.log import log_error
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BaseRunResponseEvent:
     def to_dict(self) -> Dict[str, Any]:
         _dict = {
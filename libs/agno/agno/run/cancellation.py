@@ -0,0 +1,358 @@
+"""Cancellation and deadlines of runs.
+
+A `CancellationToken` is cancelled explicitly with `cancel()`, or when its deadline passes. The token of the current
+run is kept in a context variable, so models, tools and member runs started by the run pick it up without it being
+passed around. A member run with its own timeout gets a child token, cancelled with its leader.
+"""
+
+import asyncio
+import ctypes
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from time import monotonic
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+from agno.exceptions import RunCancelledException, RunTimeoutException
+from agno.utils.log import log_debug, log_warning
+
+T = TypeVar("T")
+
+# Seconds a cancelled task is given to handle its cancellation
+CANCEL_GRACE_PERIOD = 1.0
+
+_current_token: ContextVar[Optional["CancellationToken"]] = ContextVar("agno_cancellation_token", default=None)
+
+
+class CancellationToken:
+    """Cancels a run, and the model requests, tool calls and member runs it started.
+
+    Args:
+        timeout: Seconds the run has to finish.
+        deadline: Time the run has to finish by, in `time.monotonic()` seconds.
+        parent: Token of the enclosing run. This token is cancelled with it and does not outlive its deadline.
+        interrupt_tools: Raise RunCancelledException in the threads running sync tools when the token is cancelled.
+            The exception is raised at the next Python instruction of the tool, so it does not interrupt
+            blocking calls into C code.
+    """
+
+    def __init__(
+        self,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        parent: Optional["CancellationToken"] = None,
+        interrupt_tools: bool = True,
+    ):
+        if timeout is not None:
+            deadline = min(deadline, monotonic() + timeout) if deadline is not None else monotonic() + timeout
+        self.deadline: Optional[float] = deadline
+        self.interrupt_tools = interrupt_tools
+        self.reason: Optional[str] = None
+        self.timed_out = False
+
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: List[Callable[[], None]] = []
+        self._timer: Optional[threading.Timer] = None
+        # Callbacks added to parent tokens, removed on close
+        self._links: List[Tuple["CancellationToken", Callable[[], None]]] = []
+        # Set on tokens created for a single run, closed when the run ends
+        self.owned_by_run = False
+
+        if parent is not None:
+            self.link(parent)
+        self._start_timer()
+
+    def link(self, parent: "CancellationToken") -> None:
+        """Cancel this token with `parent`, and do not let it outlive the deadline of `parent`."""
+        self.interrupt_tools = self.interrupt_tools and parent.interrupt_tools
+        if parent.deadline is not None and (self.deadline is None or parent.deadline < self.deadline):
+            self.deadline = parent.deadline
+            self._start_timer()
+
+        def cancel_with_parent() -> None:
+            self.cancel(parent.reason, timed_out=parent.timed_out)
+
+        with self._lock:
+            self._links.append((parent, cancel_with_parent))
+        parent.add_callback(cancel_with_parent)
+
+    def close(self) -> None:
+        """Stop the deadline timer and unlink the token from its parents, once the run it cancels is over.
+
+        The token is not cancelled, closing it only releases its timer thread and the callbacks kept by its parents.
+        """
+        with self._lock:
+            timer, self._timer = self._timer, None
+            links, self._links = self._links, []
+        if timer is not None:
+            timer.cancel()
+        for parent, callback in links:
+            parent.remove_callback(callback)
+
+    def _start_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+        if self.deadline is None or self._event.is_set():
+            return
+        self._timer = threading.Timer(max(self.deadline - monotonic(), 0), self.cancel, kwargs={"timed_out": True})
+        self._timer.daemon = True
+        self._timer.start()
+
+    @property
+    def is_cancelled(self) -> bool:
+        if self._event.is_set():
+            return True
+        if self.deadline is not None and monotonic() >= self.deadline:
+            self.cancel(timed_out=True)
+            return True
+        return False
+
+    def remaining(self) -> Optional[float]:
+        """Return the seconds left before the deadline, or None if there is no deadline."""
+        if self.deadline is None:
+            return None
+        return max(self.deadline - monotonic(), 0.0)
+
+    def cancel(self, reason: Optional[str] = None, timed_out: bool = False) -> None:
+        """Cancel the token and run its callbacks. Cancelling a cancelled token does nothing."""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self.timed_out = timed_out
+            self.reason = reason or ("Run timed out" if timed_out else "Operation cancelled by user")
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        if self._timer is not None:
+            self._timer.cancel()
+        log_debug(f"Run cancelled: {self.reason}")
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                log_warning(f"Error in cancellation callback: {e}")
+
+    def add_callback(self, callback: Callable[[], None]) -> None:
+        """Call `callback` when the token is cancelled, right away if it already is."""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def remove_callback(self, callback: Callable[[], None]) -> None:
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def raise_if_cancelled(self) -> None:
+        if self.is_cancelled:
+            if self.timed_out:
+                raise RunTimeoutException(self.reason or "Run timed out")
+            raise RunCancelledException(self.reason or "Operation cancelled by user")
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the token is cancelled or `timeout` seconds passed. Returns True if the token is cancelled."""
+        self._event.wait(timeout)
+        return self.is_cancelled
+
+    def call(self, func: Callable[[], T]) -> T:
+        """Run `func` in a worker thread and return its result, or raise as soon as the token is cancelled.
+
+        A running thread can not be stopped: when the token is cancelled, `func` is left to finish in the background.
+        """
+        self.raise_if_cancelled()
+        context = copy_context()
+        outcome: Dict[str, Any] = {}
+        wake = threading.Event()
+
+        def target() -> None:
+            try:
+                outcome["result"] = context.run(func)
+            except BaseException as e:
+                outcome["error"] = e
+            finally:
+                wake.set()
+
+        self.add_callback(wake.set)
+        try:
+            threading.Thread(target=target, name="agno-cancellable-call", daemon=True).start()
+            wake.wait()
+        finally:
+            self.remove_callback(wake.set)
+        if "error" in outcome:
+            raise outcome["error"]
+        if "result" in outcome:
+            return outcome["result"]
+        self.raise_if_cancelled()
+        raise RunCancelledException()
+
+    async def acall(self, awaitable: Awaitable[T]) -> T:
+        """Await `awaitable`, cancelling it as soon as the token is cancelled."""
+        task = asyncio.ensure_future(awaitable)
+        if self.is_cancelled:
+            task.cancel()
+            self.raise_if_cancelled()
+        loop = asyncio.get_running_loop()
+        cancelled = loop.create_future()
+
+        def on_cancel() -> None:
+            def set_cancelled() -> None:
+                if not cancelled.done():
+                    cancelled.set_result(None)
+
+            try:
+                loop.call_soon_threadsafe(set_cancelled)
+            except RuntimeError:
+                # The event loop is closed
+                pass
+
+        self.add_callback(on_cancel)
+        try:
+            await asyncio.wait({task, cancelled}, return_when=asyncio.FIRST_COMPLETED)
+            if task.done():
+                return task.result()
+            task.cancel()
+            # Let the task handle its cancellation, e.g. close its HTTP connection
+            await asyncio.wait({task}, timeout=CANCEL_GRACE_PERIOD)
+            self.raise_if_cancelled()
+            raise RunCancelledException()
+        finally:
+            self.remove_callback(on_cancel)
+            cancelled.cancel()
+            if not task.done():
+                task.cancel()
+
+    @contextmanager
+    def interruptible(self) -> Iterator[None]:
+        """Raise RunCancelledException in the current thread if the token is cancelled inside the block.
+
+        Does nothing if `interrupt_tools` is False or the interpreter does not support it.
+        """
+        self.raise_if_cancelled()
+        thread_id = threading.get_ident()
+        lock = threading.Lock()
+        state = {"running": True}
+
+        def interrupt() -> None:
+            with lock:
+                if state["running"]:
+                    _raise_in_thread(thread_id, RunTimeoutException if self.timed_out else RunCancelledException)
+
+        if self.interrupt_tools:
+            self.add_callback(interrupt)
+        try:
+            yield
+        finally:
+            with lock:
+                state["running"] = False
+            self.remove_callback(interrupt)
+
+
+def _raise_in_thread(thread_id: int, exception: type) -> bool:
+    """Raise `exception` in a thread, at its next Python instruction. Only supported on CPython."""
+    set_async_exc = getattr(getattr(ctypes, "pythonapi", None), "PyThreadState_SetAsyncExc", None)
+    if set_async_exc is None:
+        return False
+    modified = set_async_exc(ctypes.c_ulong(thread_id), ctypes.py_object(exception))
+    if modified > 1:
+        # Should not happen, undo it
+        set_async_exc(ctypes.c_ulong(thread_id), None)
+        return False
+    return modified == 1
+
+
+def get_cancellation_token() -> Optional[CancellationToken]:
+    """Return the cancellation token of the current run, if any."""
+    return _current_token.get()
+
+
+def raise_if_cancelled() -> None:
+    """Raise RunCancelledException if the current run is cancelled."""
+    token = _current_token.get()
+    if token is not None:
+        token.raise_if_cancelled()
+
+
+def get_run_cancellation_token(
+    cancellation_token: Optional[CancellationToken] = None, timeout: Optional[float] = None
+) -> Optional[CancellationToken]:
+    """Return the cancellation token of a new run.
+
+    The token is linked to the token of the enclosing run, if any, so that member runs stop with their leader.
+    """
+    parent = _current_token.get()
+    if timeout is None and (cancellation_token is None or parent is None or cancellation_token is parent):
+        return cancellation_token or parent
+    token = CancellationToken(timeout=timeout, parent=cancellation_token)
+    if parent is not None:
+        token.link(parent)
+    token.owned_by_run = True
+    return token
+
+
+def close_run_cancellation_token(token: Optional[CancellationToken]) -> None:
+    """Close a token returned by `get_run_cancellation_token` once its run is over.
+
+    Tokens of the caller or of the enclosing run are left open.
+    """
+    if token is not None and token.owned_by_run:
+        token.close()
+
+
+@contextmanager
+def cancellation_scope(token: Optional[CancellationToken]) -> Iterator[Optional[CancellationToken]]:
+    """Make `token` the cancellation token of the code in the block."""
+    reset_token = _current_token.set(token)
+    try:
+        yield token
+    finally:
+        _current_token.reset(reset_token)
+
+
+def iterate_in_scope(iterator: Iterator[T], token: Optional[CancellationToken]) -> Iterator[T]:
+    """Yield the items of `iterator`, producing each of them in the cancellation scope of `token`.
+
+    Raises RunCancelledException between items once the token is cancelled, and closes the iterator.
+    """
+    if token is None:
+        yield from iterator
+        return
+    try:
+        while True:
+            with cancellation_scope(token):
+                token.raise_if_cancelled()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            close()
+
+
+async def aiterate_in_scope(iterator: AsyncIterator[T], token: Optional[CancellationToken]) -> AsyncIterator[T]:
+    """Async version of `iterate_in_scope`. A pending item is cancelled as soon as the token is cancelled."""
+    if token is None:
+        async for item in iterator:
+            yield item
+        return
+    try:
+        while True:
+            with cancellation_scope(token):
+                try:
+                    # The task producing the item copies the context, and so the scope
+                    item = await token.acall(iterator.__anext__())
+                except StopAsyncIteration:
+                    return
+            yield item
+    finally:
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            try:
+                await aclose()
+            except RuntimeError as e:
+                # The generator is still running the cancelled item, it is closed when garbage collected
+                log_debug(f"Could not close the cancelled iterator: {e}")
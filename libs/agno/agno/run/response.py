@@ -9,6 +9,7 @@ from agno.media import AudioArtifact, AudioResponse, ImageArtifact, VideoArtifac
 from agno.models.message import Citations, Message
 from agno.models.response import ToolExecution
 from agno.run.base import BaseRunResponseEvent, RunResponseExtraData, RunStatus
+from agno.utils.common import DATACLASS_SLOTS
 from agno.utils.log import logger
 
 
@@ -38,7 +39,7 @@ class RunEvent(str, Enum):
     parser_model_response_completed = "ParserModelResponseCompleted"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BaseAgentRunResponseEvent(BaseRunResponseEvent):
     created_at: int = field(default_factory=lambda: int(time()))
     event: str = ""
@@ -52,7 +53,7 @@ class BaseAgentRunResponseEvent(BaseRunResponseEvent):
     content: Optional[Any] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RunResponseStartedEvent(BaseAgentRunResponseEvent):
     """Event sent when the run starts"""
 
@@ -61,7 +62,7 @@ class RunResponseStartedEvent(BaseAgentRunResponseEvent):
     model_provider: str = ""
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RunResponseContentEvent(BaseAgentRunResponseEvent):
     """Main event for each delta of the RunResponse"""
 
@@ -75,7 +76,7 @@ class RunResponseContentEvent(BaseAgentRunResponseEvent):
     extra_data: Optional[RunResponseExtraData] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RunResponseCompletedEvent(BaseAgentRunResponseEvent):
     event: str = RunEvent.run_completed.value
     content: Optional[Any] = None
@@ -90,7 +91,7 @@ class RunResponseCompletedEvent(BaseAgentRunResponseEvent):
     extra_data: Optional[RunResponseExtraData] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RunResponsePausedEvent(BaseAgentRunResponseEvent):
     event: str = RunEvent.run_paused.value
     tools: Optional[List[ToolExecution]] = None
@@ -100,18 +101,18 @@ class RunResponsePausedEvent(BaseAgentRunResponseEvent):
         return True
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RunResponseContinuedEvent(BaseAgentRunResponseEvent):
     event: str = RunEvent.run_continued.value
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RunResponseErrorEvent(BaseAgentRunResponseEvent):
     event: str = RunEvent.run_error.value
     content: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RunResponseCancelledEvent(BaseAgentRunResponseEvent):
     event: str = RunEvent.run_cancelled.value
     reason: Optional[str] = None
@@ -121,22 +122,22 @@ class RunResponseCancelledEvent(BaseAgentRunResponseEvent):
         return True
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MemoryUpdateStartedEvent(BaseAgentRunResponseEvent):
     event: str = RunEvent.memory_update_started.value
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MemoryUpdateCompletedEvent(BaseAgentRunResponseEvent):
     event: str = RunEvent.memory_update_completed.value
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ReasoningStartedEvent(BaseAgentRunResponseEvent):
     event: str = RunEvent.reasoning_started.value
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ReasoningStepEvent(BaseAgentRunResponseEvent):
     event: str = RunEvent.reasoning_step.value
     content: Optional[Any] = None
@@ -144,20 +145,20 @@ class ReasoningStepEvent(BaseAgentRunResponseEvent):
     reasoning_content: str = ""
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ReasoningCompletedEvent(BaseAgentRunResponseEvent):
     event: str = RunEvent.reasoning_completed.value
     content: Optional[Any] = None
     content_type: str = "str"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ToolCallStartedEvent(BaseAgentRunResponseEvent):
     event: str = RunEvent.tool_call_started.value
     tool: Optional[ToolExecution] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ToolCallCompletedEvent(BaseAgentRunResponseEvent):
     event: str = RunEvent.tool_call_completed.value
     tool: Optional[ToolExecution] = None
@@ -167,12 +168,12 @@ class ToolCallCompletedEvent(BaseAgentRunResponseEvent):
     audio: Optional[List[AudioArtifact]] = None  # Audio produced by the tool call
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ParserModelResponseStartedEvent(BaseAgentRunResponseEvent):
     event: str = RunEvent.parser_model_response_started.value
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ParserModelResponseCompletedEvent(BaseAgentRunResponseEvent):
     event: str = RunEvent.parser_model_response_completed.value
 
@@ -10,6 +10,7 @@ from agno.models.message import Citations, Message
 from agno.models.response import ToolExecution
 from agno.run.base import BaseRunResponseEvent, RunResponseExtraData, RunStatus
 from agno.run.response import RunEvent, RunResponse, RunResponseEvent, run_response_event_from_dict
+from agno.utils.common import DATACLASS_SLOTS
 
 
 class TeamRunEvent(str, Enum):
@@ -35,7 +36,7 @@ class TeamRunEvent(str, Enum):
     parser_model_response_completed = "TeamParserModelResponseCompleted"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BaseTeamRunResponseEvent(BaseRunResponseEvent):
     created_at: int = field(default_factory=lambda: int(time()))
     event: str = ""
@@ -52,7 +53,8 @@ class BaseTeamRunResponseEvent(BaseRunResponseEvent):
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "BaseTeamRunResponseEvent":
         member_responses = data.pop("member_responses", None)
-        event = super().from_dict(data)
+        # Explicit super() arguments, the class is recreated with __slots__ by @dataclass
+        event = super(BaseTeamRunResponseEvent, cls).from_dict(data)
 
         member_responses_final = []
         for response in member_responses or []:
@@ -62,13 +64,14 @@ class BaseTeamRunResponseEvent(BaseRunResponseEvent):
                 run_response_parsed = TeamRunResponse.from_dict(response)  # type: ignore
             member_responses_final.append(run_response_parsed)
 
-        if member_responses_final:
+        # Only events with a member_responses field keep them
+        if member_responses_final and hasattr(event, "member_responses"):
             event.member_responses = member_responses_final
 
         return event
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RunResponseStartedEvent(BaseTeamRunResponseEvent):
     """Event sent when the run starts"""
 
@@ -77,7 +80,7 @@ class RunResponseStartedEvent(BaseTeamRunResponseEvent):
     model_provider: str = ""
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RunResponseContentEvent(BaseTeamRunResponseEvent):
     """Main event for each delta of the RunResponse"""
 
@@ -91,7 +94,7 @@ class RunResponseContentEvent(BaseTeamRunResponseEvent):
     extra_data: Optional[RunResponseExtraData] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RunResponseCompletedEvent(BaseTeamRunResponseEvent):
     event: str = TeamRunEvent.run_completed.value
     content: Optional[Any] = None
@@ -107,34 +110,34 @@ class RunResponseCompletedEvent(BaseTeamRunResponseEvent):
     member_responses: List[Union["TeamRunResponse", RunResponse]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RunResponseErrorEvent(BaseTeamRunResponseEvent):
     event: str = TeamRunEvent.run_error.value
     content: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RunResponseCancelledEvent(BaseTeamRunResponseEvent):
     event: str = TeamRunEvent.run_cancelled.value
     reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MemoryUpdateStartedEvent(BaseTeamRunResponseEvent):
     event: str = TeamRunEvent.memory_update_started.value
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MemoryUpdateCompletedEvent(BaseTeamRunResponseEvent):
     event: str = TeamRunEvent.memory_update_completed.value
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ReasoningStartedEvent(BaseTeamRunResponseEvent):
     event: str = TeamRunEvent.reasoning_started.value
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ReasoningStepEvent(BaseTeamRunResponseEvent):
     event: str = TeamRunEvent.reasoning_step.value
     content: Optional[Any] = None
@@ -142,20 +145,20 @@ class ReasoningStepEvent(BaseTeamRunResponseEvent):
     reasoning_content: str = ""
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ReasoningCompletedEvent(BaseTeamRunResponseEvent):
     event: str = TeamRunEvent.reasoning_completed.value
     content: Optional[Any] = None
     content_type: str = "str"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ToolCallStartedEvent(BaseTeamRunResponseEvent):
     event: str = TeamRunEvent.tool_call_started.value
     tool: Optional[ToolExecution] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ToolCallCompletedEvent(BaseTeamRunResponseEvent):
     event: str = TeamRunEvent.tool_call_completed.value
     tool: Optional[ToolExecution] = None
@@ -165,12 +168,12 @@ class ToolCallCompletedEvent(BaseTeamRunResponseEvent):
     audio: Optional[List[AudioArtifact]] = None  # Audio produced by the tool call
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ParserModelResponseStartedEvent(BaseTeamRunResponseEvent):
     event: str = TeamRunEvent.parser_model_response_started.value
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ParserModelResponseCompletedEvent(BaseTeamRunResponseEvent):
     event: str = TeamRunEvent.parser_model_response_completed.value
 
@@ -381,6 +381,7 @@ WorkflowRunResponseEvent = Union[
     WorkflowStartedEvent,
     WorkflowCompletedEvent,
     WorkflowErrorEvent,
+    WorkflowCancelledEvent,
     StepStartedEvent,
     StepCompletedEvent,
     StepErrorEvent,
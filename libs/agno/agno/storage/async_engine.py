@@ -0,0 +1,66 @@
+import asyncio
+from typing import TYPE_CHECKING, Optional
+from weakref import WeakKeyDictionary
+
+from agno.utils.log import log_debug
+
+try:
+    from sqlalchemy.engine import Engine
+except ImportError:
+    raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+def get_async_engine(db_engine: Engine, async_driver: str) -> Optional["AsyncEngine"]:
+    """Create an async engine connecting to the database of `db_engine` through `async_driver`.
+
+    Args:
+        db_engine: The sync engine of the storage.
+        async_driver: The SQLAlchemy async driver to use, e.g. "psycopg" or "aiosqlite".
+
+    Returns:
+        Optional[AsyncEngine]: The async engine, or None if `sqlalchemy[asyncio]` or the driver is not installed.
+    """
+    try:
+        # Needs greenlet, which is only installed with sqlalchemy[asyncio]
+        from sqlalchemy.ext.asyncio import create_async_engine
+    except ImportError as e:
+        log_debug(f"Async engine not available, storage calls will run in a thread: {e}")
+        return None
+
+    url = db_engine.url.set(drivername=f"{db_engine.url.get_backend_name()}+{async_driver}")
+    try:
+        return create_async_engine(url)
+    except Exception as e:
+        log_debug(f"Could not create async engine with `{async_driver}`, storage calls will run in a thread: {e}")
+        return None
+
+
+class AsyncEngineCache:
+    """Creates the async engine of a storage on first use, one per event loop.
+
+    Pooled connections belong to the event loop that opened them, so an engine can not be shared across event loops,
+    e.g. when `asyncio.run()` is called for each run.
+    """
+
+    def __init__(self, db_engine: Engine, async_driver: str):
+        self.db_engine = db_engine
+        self.async_driver = async_driver
+        self._engines: "WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncEngine]" = WeakKeyDictionary()
+        self._available = True
+
+    def get(self) -> Optional["AsyncEngine"]:
+        """Return the async engine of the running event loop, or None if no async driver is installed."""
+        if not self._available:
+            return None
+        loop = asyncio.get_running_loop()
+        engine = self._engines.get(loop)
+        if engine is None:
+            engine = get_async_engine(self.db_engine, async_driver=self.async_driver)
+            if engine is None:
+                self._available = False
+                return None
+            self._engines[loop] = engine
+        return engine
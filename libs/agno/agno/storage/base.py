@@ -1,7 +1,35 @@
+import asyncio
+import threading
 from abc import ABC, abstractmethod
-from typing import List, Literal, Optional
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Callable, Iterator, List, Literal, Optional, TypeVar
 
 from agno.storage.session import Session
+from agno.storage.session.index import SessionIndexPage, paginate_sessions
+
+T = TypeVar("T")
+
+# Locks serializing the writes of a session, a session always maps to the same lock
+_SESSION_LOCKS = [threading.Lock() for _ in range(64)]
+
+
+@contextmanager
+def session_lock(session_id: str) -> Iterator[None]:
+    """Hold the write lock of a session, so a read-modify-write of the session is not interleaved with an upsert."""
+    with _SESSION_LOCKS[hash(session_id) % len(_SESSION_LOCKS)]:
+        yield
+
+
+@asynccontextmanager
+async def asession_lock(session_id: str) -> AsyncIterator[None]:
+    """Async version of `session_lock`, which polls the lock instead of blocking the event loop."""
+    lock = _SESSION_LOCKS[hash(session_id) % len(_SESSION_LOCKS)]
+    while not lock.acquire(blocking=False):
+        await asyncio.sleep(0.005)
+    try:
+        yield
+    finally:
+        lock.release()
 
 
 class Storage(ABC):
@@ -43,6 +71,28 @@ class Storage(ABC):
     ) -> List[Session]:
         raise NotImplementedError
 
+    def get_session_index(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> SessionIndexPage:
+        """Get a page of session summaries, most recently updated first.
+
+        Backends that can select the summary columns override this, the others project the full sessions.
+
+        Args:
+            user_id: Only list the sessions of this user.
+            entity_id: Only list the sessions of this agent, team or workflow.
+            limit: Maximum number of sessions in the page. All sessions if None.
+            cursor: `next_cursor` of the previous page.
+
+        Raises:
+            ValueError: If the cursor is invalid.
+        """
+        return paginate_sessions(self.get_all_sessions(user_id, entity_id), limit=limit, cursor=cursor)
+
     @abstractmethod
     def upsert(self, session: Session) -> Optional[Session]:
         raise NotImplementedError
@@ -58,3 +108,51 @@ class Storage(ABC):
     @abstractmethod
     def upgrade_schema(self) -> None:
         raise NotImplementedError
+
+    # Async versions of the methods above. Backends with an async driver override them, the others run the sync
+    # method in a worker thread so that storage I/O does not block the event loop.
+
+    async def _acall_sync(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a sync storage method without blocking the event loop."""
+        return await asyncio.to_thread(func, *args)
+
+    async def acreate(self) -> None:
+        await self._acall_sync(self.create)
+
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
+        return await self._acall_sync(self.read, session_id, user_id)
+
+    async def aget_all_session_ids(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[str]:
+        return await self._acall_sync(self.get_all_session_ids, user_id, entity_id)
+
+    async def aget_all_sessions(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[Session]:
+        return await self._acall_sync(self.get_all_sessions, user_id, entity_id)
+
+    async def aget_recent_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = 2,
+    ) -> List[Session]:
+        return await self._acall_sync(self.get_recent_sessions, user_id, entity_id, limit)
+
+    async def aget_session_index(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> SessionIndexPage:
+        return await self._acall_sync(self.get_session_index, user_id, entity_id, limit, cursor)
+
+    async def aupsert(self, session: Session) -> Optional[Session]:
+        return await self._acall_sync(self.upsert, session)
+
+    async def adelete_session(self, session_id: Optional[str] = None):
+        return await self._acall_sync(self.delete_session, session_id)
+
+    async def adrop(self) -> None:
+        await self._acall_sync(self.drop)
+
+    async def aupgrade_schema(self) -> None:
+        await self._acall_sync(self.upgrade_schema)
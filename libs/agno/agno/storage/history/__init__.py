@@ -0,0 +1,4 @@
+from agno.storage.history.base import HistoryEntry, SessionHistoryIndex
+from agno.storage.history.sqlite import SqliteHistoryIndex
+
+__all__ = ["HistoryEntry", "SessionHistoryIndex", "SqliteHistoryIndex"]
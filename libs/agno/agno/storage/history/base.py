@@ -0,0 +1,261 @@
+import asyncio
+import json
+import math
+import re
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Set
+
+from agno.embedder.base import Embedder
+from agno.storage.session import Session
+from agno.utils.log import log_debug, log_warning
+
+# Runs waiting for input are indexed when they are continued. Finished runs keep the RUNNING status.
+UNFINISHED_RUN_STATUSES = ("PENDING", "PAUSED")
+
+
+@dataclass
+class HistoryEntry:
+    """A message or tool call of a stored run"""
+
+    session_id: str
+    run_id: str
+    # Position of the entry in its run
+    position: int
+    # "message" or "tool_call"
+    kind: str
+    content: str
+    user_id: Optional[str] = None
+    # Agent or team of the session
+    entity_id: Optional[str] = None
+    # Role of the message
+    role: Optional[str] = None
+    tool_name: Optional[str] = None
+    tool_args: Optional[Dict[str, Any]] = None
+    created_at: Optional[int] = None
+    embedding: Optional[List[float]] = None
+    # Relevance of the entry to the query of a search, higher is more relevant
+    score: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {k: v for k, v in asdict(self).items() if v is not None and k != "embedding"}
+
+
+def get_search_terms(query: str) -> List[str]:
+    """Split a query into the words searched for"""
+    return re.findall(r"\w+", query.lower())
+
+
+def cosine_similarity(a: List[float], b: List[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+class SessionHistoryIndex(ABC):
+    """Full-text index of the messages and tool calls of stored sessions.
+
+    Agents with a history index add the runs of a session to the index when they write the session to storage,
+    so past conversations and tool calls can be searched without loading the sessions.
+
+    Args:
+        embedder: If provided, messages are embedded when indexed and searches are reranked by similarity.
+        max_content_length: Maximum number of characters indexed per message or tool result.
+        num_vector_candidates: With an embedder, number of recent messages compared to the query
+            when the full-text search returns fewer results than requested.
+    """
+
+    def __init__(
+        self,
+        embedder: Optional[Embedder] = None,
+        max_content_length: int = 4000,
+        num_vector_candidates: int = 500,
+    ):
+        self.embedder = embedder
+        self.max_content_length = max_content_length
+        self.num_vector_candidates = num_vector_candidates
+
+    @abstractmethod
+    def create(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_indexed_run_ids(self, session_id: str) -> Set[str]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def add_entries(self, entries: List[HistoryEntry]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def search_text(
+        self,
+        terms: List[str],
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        limit: int = 10,
+    ) -> List[HistoryEntry]:
+        """Return the messages matching any of the terms, most relevant first"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_recent_entries(
+        self,
+        kind: str,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        tool_name: Optional[str] = None,
+        limit: int = 10,
+    ) -> List[HistoryEntry]:
+        """Return the most recent entries of a kind, most recent first"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete_session(self, session_id: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def get_session_entries(self, session: Session, skip_run_ids: Optional[Set[str]] = None) -> List[HistoryEntry]:
+        """Extract the messages and tool calls of the finished runs of a session"""
+        entity_id = getattr(session, "agent_id", None) or getattr(session, "team_id", None)
+        runs = (getattr(session, "memory", None) or {}).get("runs") or []
+        entries: List[HistoryEntry] = []
+        for run in runs:
+            # Runs of the legacy AgentMemory wrap the run response
+            response = run.get("response", run) if isinstance(run, dict) else None
+            if not isinstance(response, dict):
+                continue
+            run_id = response.get("run_id")
+            if run_id is None or (skip_run_ids and run_id in skip_run_ids):
+                continue
+            if response.get("status") in UNFINISHED_RUN_STATUSES:
+                continue
+
+            created_at = response.get("created_at")
+            position = 0
+            for message in response.get("messages") or []:
+                if message.get("from_history") or message.get("role") not in ("user", "assistant"):
+                    continue
+                content = message.get("content")
+                if content is not None and not isinstance(content, str):
+                    content = json.dumps(content, default=str)
+                if not content:
+                    continue
+                entries.append(
+                    HistoryEntry(
+                        session_id=session.session_id,
+                        run_id=run_id,
+                        position=position,
+                        kind="message",
+                        role=message["role"],
+                        content=content[: self.max_content_length],
+                        user_id=session.user_id,
+                        entity_id=entity_id,
+                        created_at=message.get("created_at") or created_at,
+                    )
+                )
+                position += 1
+            for tool in response.get("tools") or []:
+                if not tool.get("tool_name"):
+                    continue
+                entries.append(
+                    HistoryEntry(
+                        session_id=session.session_id,
+                        run_id=run_id,
+                        position=position,
+                        kind="tool_call",
+                        content=str(tool.get("result") or "")[: self.max_content_length],
+                        user_id=session.user_id,
+                        entity_id=entity_id,
+                        tool_name=tool["tool_name"],
+                        tool_args=tool.get("tool_args"),
+                        created_at=tool.get("created_at") or created_at,
+                    )
+                )
+                position += 1
+        return entries
+
+    def index_session(self, session: Session) -> int:
+        """Add the runs of a session that are not indexed yet. Returns the number of entries added."""
+        entries = self.get_session_entries(session, skip_run_ids=self.get_indexed_run_ids(session.session_id))
+        if not entries:
+            return 0
+        if self.embedder is not None:
+            for entry in entries:
+                if entry.kind == "message":
+                    try:
+                        entry.embedding = self.embedder.get_embedding(entry.content)
+                    except Exception as e:
+                        log_warning(f"Error embedding history entry: {e}")
+        self.add_entries(entries)
+        log_debug(f"Indexed {len(entries)} history entries of session {session.session_id}")
+        return len(entries)
+
+    async def aindex_session(self, session: Session) -> int:
+        return await asyncio.to_thread(self.index_session, session)
+
+    def search(
+        self,
+        query: str,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        limit: int = 10,
+    ) -> List[HistoryEntry]:
+        """Search the indexed messages, most relevant first"""
+        terms = get_search_terms(query)
+        if self.embedder is None:
+            return self.search_text(terms, user_id=user_id, entity_id=entity_id, session_id=session_id, limit=limit)
+
+        # Rerank the full-text results, completed with recent messages, by similarity to the query
+        candidates = self.search_text(
+            terms, user_id=user_id, entity_id=entity_id, session_id=session_id, limit=limit * 4
+        )
+        if len(candidates) < limit:
+            candidates += self.get_recent_entries(
+                "message",
+                user_id=user_id,
+                entity_id=entity_id,
+                session_id=session_id,
+                limit=self.num_vector_candidates,
+            )
+        query_embedding = self.embedder.get_embedding(query)
+        unique: Dict[tuple, HistoryEntry] = {}
+        for entry in candidates:
+            if entry.embedding is not None:
+                entry.score = cosine_similarity(query_embedding, entry.embedding)
+                unique[(entry.session_id, entry.run_id, entry.position)] = entry
+        return sorted(unique.values(), key=lambda entry: entry.score or 0.0, reverse=True)[:limit]
+
+    def get_recent_messages(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        limit: int = 10,
+    ) -> List[HistoryEntry]:
+        return self.get_recent_entries(
+            "message", user_id=user_id, entity_id=entity_id, session_id=session_id, limit=limit
+        )
+
+    def get_tool_calls(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        tool_name: Optional[str] = None,
+        limit: int = 10,
+    ) -> List[HistoryEntry]:
+        return self.get_recent_entries(
+            "tool_call",
+            user_id=user_id,
+            entity_id=entity_id,
+            session_id=session_id,
+            tool_name=tool_name,
+            limit=limit,
+        )
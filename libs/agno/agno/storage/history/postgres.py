@@ -0,0 +1,205 @@
+from typing import Any, List, Optional, Set
+
+from agno.embedder.base import Embedder
+from agno.storage.history.base import HistoryEntry, SessionHistoryIndex
+from agno.utils.log import log_debug
+
+try:
+    from sqlalchemy.dialects import postgresql
+    from sqlalchemy.engine import Engine, create_engine
+    from sqlalchemy.orm import scoped_session, sessionmaker
+    from sqlalchemy.schema import Column, Computed, Index, MetaData, Table, UniqueConstraint
+    from sqlalchemy.sql.expression import delete, func, select, text
+    from sqlalchemy.types import BigInteger, Integer, String, Text
+except ImportError:
+    raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
+
+
+class PostgresHistoryIndex(SessionHistoryIndex):
+    """Session history index stored in PostgreSQL, searched with a tsvector column.
+
+    Args:
+        table_name: Name of the entries table.
+        schema: The schema to use for the table. Defaults to "ai".
+        db_url: The database URL to connect to.
+        db_engine: The SQLAlchemy database engine to use.
+        text_search_config: The text search configuration of the tsvector column and queries.
+    """
+
+    def __init__(
+        self,
+        table_name: str = "session_history",
+        schema: Optional[str] = "ai",
+        db_url: Optional[str] = None,
+        db_engine: Optional[Engine] = None,
+        text_search_config: str = "english",
+        embedder: Optional[Embedder] = None,
+        max_content_length: int = 4000,
+        num_vector_candidates: int = 500,
+    ):
+        super().__init__(
+            embedder=embedder, max_content_length=max_content_length, num_vector_candidates=num_vector_candidates
+        )
+        _engine: Optional[Engine] = db_engine
+        if _engine is None and db_url is not None:
+            _engine = create_engine(db_url)
+        if _engine is None:
+            raise ValueError("Must provide either db_url or db_engine")
+
+        self.table_name = table_name
+        self.schema = schema
+        self.db_url = db_url
+        self.db_engine: Engine = _engine
+        self.text_search_config = text_search_config
+        self.metadata = MetaData(schema=self.schema)
+        self.Session: scoped_session = scoped_session(sessionmaker(bind=self.db_engine))
+        self.table: Table = self.get_table()
+        self.create()
+
+    def get_table(self) -> Table:
+        return Table(
+            self.table_name,
+            self.metadata,
+            Column("id", BigInteger, primary_key=True, autoincrement=True),
+            Column("session_id", String, nullable=False, index=True),
+            Column("run_id", String, nullable=False),
+            Column("position", Integer, nullable=False),
+            Column("kind", String, nullable=False),
+            Column("content", Text, nullable=False),
+            Column("user_id", String),
+            Column("entity_id", String),
+            Column("role", String),
+            Column("tool_name", String),
+            Column("tool_args", postgresql.JSONB),
+            Column("created_at", BigInteger),
+            Column("embedding", postgresql.JSONB),
+            Column(
+                "content_tsv",
+                postgresql.TSVECTOR,
+                Computed(f"to_tsvector('{self.text_search_config}', content)", persisted=True),
+            ),
+            UniqueConstraint("session_id", "run_id", "position", name=f"uq_{self.table_name}_entry"),
+            Index(f"idx_{self.table_name}_recent", "kind", "user_id", "created_at"),
+            Index(f"idx_{self.table_name}_tsv", "content_tsv", postgresql_using="gin"),
+            extend_existing=True,
+        )
+
+    def create(self) -> None:
+        with self.Session() as sess, sess.begin():
+            if self.schema is not None:
+                sess.execute(text(f"CREATE SCHEMA IF NOT EXISTS {self.schema};"))
+        self.table.create(self.db_engine, checkfirst=True)
+        log_debug(f"Created PostgresHistoryIndex with table: '{self.table.fullname}'")
+
+    def get_indexed_run_ids(self, session_id: str) -> Set[str]:
+        with self.Session() as sess:
+            stmt = select(self.table.c.run_id).where(self.table.c.session_id == session_id).distinct()
+            return {row[0] for row in sess.execute(stmt).fetchall()}
+
+    def add_entries(self, entries: List[HistoryEntry]) -> None:
+        if not entries:
+            return
+        rows = [
+            {
+                "session_id": entry.session_id,
+                "run_id": entry.run_id,
+                "position": entry.position,
+                "kind": entry.kind,
+                "content": entry.content,
+                "user_id": entry.user_id,
+                "entity_id": entry.entity_id,
+                "role": entry.role,
+                "tool_name": entry.tool_name,
+                "tool_args": entry.tool_args,
+                "created_at": entry.created_at,
+                "embedding": entry.embedding,
+            }
+            for entry in entries
+        ]
+        stmt = postgresql.insert(self.table).values(rows).on_conflict_do_nothing()
+        with self.Session() as sess, sess.begin():
+            sess.execute(stmt)
+
+    def _apply_filters(
+        self,
+        stmt: Any,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        tool_name: Optional[str] = None,
+    ) -> Any:
+        for column, value in (
+            ("user_id", user_id),
+            ("entity_id", entity_id),
+            ("session_id", session_id),
+            ("tool_name", tool_name),
+        ):
+            if value is not None:
+                stmt = stmt.where(self.table.c[column] == value)
+        return stmt
+
+    def _row_to_entry(self, row: Any, score: Optional[float] = None) -> HistoryEntry:
+        return HistoryEntry(
+            session_id=row.session_id,
+            run_id=row.run_id,
+            position=row.position,
+            kind=row.kind,
+            content=row.content,
+            user_id=row.user_id,
+            entity_id=row.entity_id,
+            role=row.role,
+            tool_name=row.tool_name,
+            tool_args=row.tool_args,
+            created_at=row.created_at,
+            embedding=row.embedding,
+            score=score,
+        )
+
+    def _get_columns(self) -> List[Any]:
+        return [column for column in self.table.c if column.name != "content_tsv"]
+
+    def search_text(
+        self,
+        terms: List[str],
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        limit: int = 10,
+    ) -> List[HistoryEntry]:
+        if not terms:
+            return []
+        # The terms only contain word characters, so they are valid lexemes of the query
+        query = func.to_tsquery(self.text_search_config, " | ".join(terms))
+        rank = func.ts_rank(self.table.c.content_tsv, query).label("rank")
+        stmt = select(*self._get_columns(), rank).where(
+            self.table.c.kind == "message", self.table.c.content_tsv.op("@@")(query)
+        )
+        stmt = self._apply_filters(stmt, user_id=user_id, entity_id=entity_id, session_id=session_id)
+        stmt = stmt.order_by(rank.desc()).limit(limit)
+        with self.Session() as sess:
+            return [self._row_to_entry(row, score=row.rank) for row in sess.execute(stmt).fetchall()]
+
+    def get_recent_entries(
+        self,
+        kind: str,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        tool_name: Optional[str] = None,
+        limit: int = 10,
+    ) -> List[HistoryEntry]:
+        stmt = select(*self._get_columns()).where(self.table.c.kind == kind)
+        stmt = self._apply_filters(
+            stmt, user_id=user_id, entity_id=entity_id, session_id=session_id, tool_name=tool_name
+        )
+        stmt = stmt.order_by(self.table.c.created_at.desc(), self.table.c.id.desc()).limit(limit)
+        with self.Session() as sess:
+            return [self._row_to_entry(row) for row in sess.execute(stmt).fetchall()]
+
+    def delete_session(self, session_id: str) -> None:
+        with self.Session() as sess, sess.begin():
+            sess.execute(delete(self.table).where(self.table.c.session_id == session_id))
+
+    def clear(self) -> None:
+        with self.Session() as sess, sess.begin():
+            sess.execute(delete(self.table))
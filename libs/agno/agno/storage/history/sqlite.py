@@ -0,0 +1,194 @@
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, List, Optional, Set, Tuple, Union
+
+from agno.embedder.base import Embedder
+from agno.storage.history.base import HistoryEntry, SessionHistoryIndex
+from agno.utils.log import log_debug
+
+COLUMNS = (
+    "id, session_id, run_id, position, kind, content, user_id, entity_id, role, tool_name, tool_args, created_at, "
+    "embedding"
+)
+
+
+class SqliteHistoryIndex(SessionHistoryIndex):
+    """Session history index stored in SQLite, searched with FTS5.
+
+    Args:
+        db_file: Path of the database file. Defaults to an in-memory database.
+        table_name: Name of the entries table. The full-text index is the `{table_name}_fts` table.
+    """
+
+    def __init__(
+        self,
+        db_file: Optional[Union[str, Path]] = None,
+        table_name: str = "session_history",
+        embedder: Optional[Embedder] = None,
+        max_content_length: int = 4000,
+        num_vector_candidates: int = 500,
+    ):
+        super().__init__(
+            embedder=embedder, max_content_length=max_content_length, num_vector_candidates=num_vector_candidates
+        )
+        if not table_name.isidentifier():
+            raise ValueError(f"Invalid table name: {table_name}")
+        self.db_file = db_file
+        self.table_name = table_name
+        if db_file is not None:
+            Path(db_file).parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(db_file) if db_file is not None else ":memory:", check_same_thread=False)
+        self._lock = threading.Lock()
+        self.create()
+
+    def create(self) -> None:
+        table = self.table_name
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, session_id TEXT NOT NULL, run_id TEXT NOT NULL, "
+                "position INTEGER NOT NULL, kind TEXT NOT NULL, content TEXT NOT NULL, user_id TEXT, entity_id TEXT, "
+                "role TEXT, tool_name TEXT, tool_args TEXT, created_at INTEGER, embedding TEXT, "
+                "UNIQUE (session_id, run_id, position))"
+            )
+            self._connection.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{table}_recent ON {table} (kind, user_id, created_at)"
+            )
+            self._connection.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {table}_fts USING fts5(content, tokenize='porter unicode61')"
+            )
+        log_debug(f"Created SqliteHistoryIndex with table: '{table}'")
+
+    def get_indexed_run_ids(self, session_id: str) -> Set[str]:
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT DISTINCT run_id FROM {self.table_name} WHERE session_id = ?", (session_id,)
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def add_entries(self, entries: List[HistoryEntry]) -> None:
+        with self._lock, self._connection:
+            for entry in entries:
+                cursor = self._connection.execute(
+                    f"INSERT OR IGNORE INTO {self.table_name} "
+                    "(session_id, run_id, position, kind, content, user_id, entity_id, role, tool_name, tool_args, "
+                    "created_at, embedding) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        entry.session_id,
+                        entry.run_id,
+                        entry.position,
+                        entry.kind,
+                        entry.content,
+                        entry.user_id,
+                        entry.entity_id,
+                        entry.role,
+                        entry.tool_name,
+                        json.dumps(entry.tool_args, default=str) if entry.tool_args is not None else None,
+                        entry.created_at,
+                        json.dumps(entry.embedding) if entry.embedding is not None else None,
+                    ),
+                )
+                # Only messages are searched by content
+                if cursor.rowcount and entry.kind == "message":
+                    self._connection.execute(
+                        f"INSERT INTO {self.table_name}_fts (rowid, content) VALUES (?, ?)",
+                        (cursor.lastrowid, entry.content),
+                    )
+
+    def _get_filters(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        tool_name: Optional[str] = None,
+    ) -> Tuple[str, List[Any]]:
+        clauses: List[str] = []
+        params: List[Any] = []
+        for column, value in (
+            ("user_id", user_id),
+            ("entity_id", entity_id),
+            ("session_id", session_id),
+            ("tool_name", tool_name),
+        ):
+            if value is not None:
+                clauses.append(f"h.{column} = ?")
+                params.append(value)
+        return "".join(f" AND {clause}" for clause in clauses), params
+
+    def _row_to_entry(self, row: Tuple, score: Optional[float] = None) -> HistoryEntry:
+        return HistoryEntry(
+            session_id=row[1],
+            run_id=row[2],
+            position=row[3],
+            kind=row[4],
+            content=row[5],
+            user_id=row[6],
+            entity_id=row[7],
+            role=row[8],
+            tool_name=row[9],
+            tool_args=json.loads(row[10]) if row[10] is not None else None,
+            created_at=row[11],
+            embedding=json.loads(row[12]) if row[12] is not None else None,
+            score=score,
+        )
+
+    def search_text(
+        self,
+        terms: List[str],
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        limit: int = 10,
+    ) -> List[HistoryEntry]:
+        if not terms:
+            return []
+        filters, params = self._get_filters(user_id=user_id, entity_id=entity_id, session_id=session_id)
+        # Quote the terms, so that they are not read as FTS5 operators
+        match = " OR ".join('"{}"'.format(term.replace('"', '""')) for term in terms)
+        columns = ", ".join(f"h.{column.strip()}" for column in COLUMNS.split(","))
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT {columns}, bm25({self.table_name}_fts) AS rank FROM {self.table_name}_fts "
+                f"JOIN {self.table_name} h ON h.id = {self.table_name}_fts.rowid "
+                f"WHERE {self.table_name}_fts MATCH ?{filters} ORDER BY rank LIMIT ?",
+                (match, *params, limit),
+            ).fetchall()
+        # bm25 is lower for better matches
+        return [self._row_to_entry(row[:-1], score=-row[-1]) for row in rows]
+
+    def get_recent_entries(
+        self,
+        kind: str,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        tool_name: Optional[str] = None,
+        limit: int = 10,
+    ) -> List[HistoryEntry]:
+        filters, params = self._get_filters(
+            user_id=user_id, entity_id=entity_id, session_id=session_id, tool_name=tool_name
+        )
+        columns = ", ".join(f"h.{column.strip()}" for column in COLUMNS.split(","))
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT {columns} FROM {self.table_name} h WHERE h.kind = ?{filters} "
+                "ORDER BY h.created_at DESC, h.id DESC LIMIT ?",
+                (kind, *params, limit),
+            ).fetchall()
+        return [self._row_to_entry(row) for row in rows]
+
+    def delete_session(self, session_id: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"DELETE FROM {self.table_name}_fts WHERE rowid IN "
+                f"(SELECT id FROM {self.table_name} WHERE session_id = ?)",
+                (session_id,),
+            )
+            self._connection.execute(f"DELETE FROM {self.table_name} WHERE session_id = ?", (session_id,))
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(f"DELETE FROM {self.table_name}_fts")
+            self._connection.execute(f"DELETE FROM {self.table_name}")
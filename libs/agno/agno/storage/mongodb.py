@@ -1,10 +1,11 @@
 from datetime import datetime, timezone
-from typing import List, Literal, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional
 from uuid import UUID
 
 from agno.storage.base import Storage
 from agno.storage.session import Session
 from agno.storage.session.agent import AgentSession
+from agno.storage.session.index import SessionIndexEntry, SessionIndexPage, decode_cursor
 from agno.storage.session.team import TeamSession
 from agno.storage.session.v2.workflow import WorkflowSession as WorkflowSessionV2
 from agno.storage.session.workflow import WorkflowSession
@@ -19,6 +20,23 @@ except ImportError:
     raise ImportError("`pymongo` not installed. Please install it with `pip install pymongo`")
 
 
+if TYPE_CHECKING:
+    from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection
+
+# Summary fields of the session index, with the first run only from the memory
+SESSION_INDEX_PROJECTION = {
+    "_id": 0,
+    "session_id": 1,
+    "user_id": 1,
+    "session_data.session_name": 1,
+    "memory.runs": {"$slice": 1},
+    "runs": {"$slice": 1},
+    "created_at": 1,
+    "updated_at": 1,
+}
+SESSION_INDEX_SORT = [("updated_at", -1), ("session_id", -1)]
+
+
 class MongoDbStorage(Storage):
     def __init__(
         self,
@@ -27,6 +45,7 @@ class MongoDbStorage(Storage):
         db_name: str = "agno",
         client: Optional[MongoClient] = None,
         mode: Optional[Literal["agent", "team", "workflow", "workflow_v2"]] = "agent",
+        async_client: Optional["AsyncIOMotorClient"] = None,
     ):
         """
         This class provides agent storage using MongoDB.
@@ -36,9 +55,16 @@ class MongoDbStorage(Storage):
             db_url: MongoDB connection URL
             db_name: Name of the database
             client: Optional existing MongoDB client
+            async_client: Optional existing motor client, used by the async methods. Defaults to a client
+                connecting to db_url if `motor` is installed and no client is provided. Otherwise the async methods
+                run the sync ones in a thread.
         """
         super().__init__(mode)
         self._client: Optional[MongoClient] = client
+        self._client_is_external: bool = client is not None
+        self._async_client: Optional["AsyncIOMotorClient"] = async_client
+        self._async_client_checked: bool = async_client is not None
+        self.db_url: Optional[str] = db_url
         if self._client is None and db_url is not None:
             self._client = MongoClient(db_url)
         elif self._client is None:
@@ -71,6 +97,75 @@ class MongoDbStorage(Storage):
             logger.error(f"Error creating indexes: {e}")
             raise
 
+    def _get_query(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> Dict[str, Any]:
+        """Build the query filtering sessions by user_id and entity_id."""
+        query: Dict[str, Any] = {}
+        if user_id is not None:
+            query["user_id"] = user_id
+        if entity_id is not None:
+            if self.mode == "agent":
+                query["agent_id"] = entity_id
+            elif self.mode == "team":
+                query["team_id"] = entity_id
+            elif self.mode in ["workflow", "workflow_v2"]:
+                query["workflow_id"] = entity_id
+        return query
+
+    def _doc_to_session(self, doc: Dict[str, Any]) -> Optional[Session]:
+        """Convert a document of the collection to a Session of the storage mode."""
+        # Remove MongoDB _id before converting to Session object
+        doc.pop("_id", None)
+        if self.mode == "agent":
+            return AgentSession.from_dict(doc)
+        elif self.mode == "team":
+            return TeamSession.from_dict(doc)
+        elif self.mode == "workflow":
+            return WorkflowSession.from_dict(doc)
+        elif self.mode == "workflow_v2":
+            return WorkflowSessionV2.from_dict(doc)
+        return None
+
+    def _get_session_index_query(
+        self, user_id: Optional[str] = None, entity_id: Optional[str] = None, cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build the query of the session index, starting after the session of `cursor`."""
+        query = self._get_query(user_id=user_id, entity_id=entity_id)
+        if cursor is not None:
+            after_updated_at, after_session_id = decode_cursor(cursor)
+            query["$or"] = [
+                {"updated_at": {"$lt": after_updated_at}},
+                {"updated_at": after_updated_at, "session_id": {"$lt": after_session_id}},
+            ]
+        return query
+
+    def _doc_to_index_entry(self, doc: Dict[str, Any]) -> SessionIndexEntry:
+        runs = doc.get("runs") or (doc.get("memory") or {}).get("runs")
+        return SessionIndexEntry(
+            session_id=doc["session_id"],
+            user_id=doc.get("user_id"),
+            session_name=(doc.get("session_data") or {}).get("session_name"),
+            first_run=runs[0] if runs else None,
+            created_at=doc.get("created_at"),
+            updated_at=doc.get("updated_at"),
+        )
+
+    def _get_upsert_data(self, session: Session) -> Dict[str, Any]:
+        """Return the fields to set when upserting a session, without created_at."""
+        # Convert session to dict and add timestamps
+        session_dict = session.to_dict()
+
+        # Handle UUID serialization
+        if isinstance(session.session_id, UUID):
+            session_dict["session_id"] = str(session.session_id)
+
+        # Add version field for optimistic locking
+        if "_version" not in session_dict:
+            session_dict["_version"] = 1
+        else:
+            session_dict["_version"] += 1
+
+        return {**session_dict, "updated_at": int(datetime.now(timezone.utc).timestamp())}
+
     def read(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
         """Read a Session from MongoDB
         Args:
@@ -85,18 +180,7 @@ class MongoDbStorage(Storage):
                 query["user_id"] = user_id
 
             doc = self.collection.find_one(query)
-            if doc:
-                # Remove MongoDB _id before converting to AgentSession
-                doc.pop("_id", None)
-                if self.mode == "agent":
-                    return AgentSession.from_dict(doc)
-                elif self.mode == "team":
-                    return TeamSession.from_dict(doc)
-                elif self.mode == "workflow":
-                    return WorkflowSession.from_dict(doc)
-                elif self.mode == "workflow_v2":
-                    return WorkflowSessionV2.from_dict(doc)
-            return None
+            return self._doc_to_session(doc) if doc else None
         except PyMongoError as e:
             logger.error(f"Error reading session: {e}")
             return None
@@ -110,18 +194,7 @@ class MongoDbStorage(Storage):
             List[str]: List of session IDs
         """
         try:
-            query = {}
-            if user_id is not None:
-                query["user_id"] = user_id
-            if entity_id is not None:
-                if self.mode == "agent":
-                    query["agent_id"] = entity_id
-                elif self.mode == "team":
-                    query["team_id"] = entity_id
-                elif self.mode == "workflow":
-                    query["workflow_id"] = entity_id
-                elif self.mode == "workflow_v2":
-                    query["workflow_id"] = entity_id
+            query = self._get_query(user_id=user_id, entity_id=entity_id)
             cursor = self.collection.find(query, {"session_id": 1}).sort("created_at", -1)
 
             return [str(doc["session_id"]) for doc in cursor]
@@ -138,35 +211,12 @@ class MongoDbStorage(Storage):
             List[Session]: List of sessions
         """
         try:
-            query = {}
-            if user_id is not None:
-                query["user_id"] = user_id
-            if entity_id is not None:
-                if self.mode == "agent":
-                    query["agent_id"] = entity_id
-                elif self.mode == "team":
-                    query["team_id"] = entity_id
-                elif self.mode == "workflow":
-                    query["workflow_id"] = entity_id
-                elif self.mode == "workflow_v2":
-                    query["workflow_id"] = entity_id
-            cursor = self.collection.find(query).sort("created_at", -1)
+            cursor = self.collection.find(self._get_query(user_id=user_id, entity_id=entity_id)).sort("created_at", -1)
             sessions: List[Session] = []
             for doc in cursor:
-                # Remove MongoDB _id before converting to AgentSession
-                doc.pop("_id", None)
-                if self.mode == "agent":
-                    _agent_session = AgentSession.from_dict(doc)
-                    if _agent_session is not None:
-                        sessions.append(_agent_session)
-                elif self.mode == "team":
-                    _team_session = TeamSession.from_dict(doc)
-                    if _team_session is not None:
-                        sessions.append(_team_session)
-                elif self.mode == "workflow":
-                    _workflow_session = WorkflowSession.from_dict(doc)
-                    if _workflow_session is not None:
-                        sessions.append(_workflow_session)
+                session = self._doc_to_session(doc)
+                if session is not None:
+                    sessions.append(session)
             return sessions
         except PyMongoError as e:
             logger.error(f"Error getting sessions: {e}")
@@ -189,39 +239,15 @@ class MongoDbStorage(Storage):
             List[Session]: List of most recent sessions
         """
         try:
-            # Build the query
-            query = {}
-            if user_id is not None:
-                query["user_id"] = user_id
-            if entity_id is not None:
-                if self.mode == "agent":
-                    query["agent_id"] = entity_id
-                elif self.mode == "team":
-                    query["team_id"] = entity_id
-                elif self.mode == "workflow":
-                    query["workflow_id"] = entity_id
-                elif self.mode == "workflow_v2":
-                    query["workflow_id"] = entity_id
             # Execute query with sort and limit
-            cursor = self.collection.find(query)
+            cursor = self.collection.find(self._get_query(user_id=user_id, entity_id=entity_id))
             cursor = cursor.sort("created_at", -1)  # Sort by created_at descending
             if limit is not None:
                 cursor = cursor.limit(limit)
 
             sessions: List[Session] = []
             for doc in cursor:
-                # Remove MongoDB _id before converting to Session object
-                doc.pop("_id", None)
-                session: Optional[Session] = None
-
-                if self.mode == "agent":
-                    session = AgentSession.from_dict(doc)
-                elif self.mode == "team":
-                    session = TeamSession.from_dict(doc)
-                elif self.mode == "workflow":
-                    session = WorkflowSession.from_dict(doc)
-                elif self.mode == "workflow_v2":
-                    session = WorkflowSessionV2.from_dict(doc)
+                session = self._doc_to_session(doc)
                 if session is not None:
                     sessions.append(session)
 
@@ -231,6 +257,34 @@ class MongoDbStorage(Storage):
             logger.error(f"Error getting last {limit} sessions: {e}")
             return []
 
+    def get_session_index(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> SessionIndexPage:
+        """Get a page of session summaries, most recently updated first, without loading the memory of the sessions.
+
+        Args:
+            user_id: Filter by user ID
+            entity_id: Filter by entity ID (agent_id, team_id, or workflow_id)
+            limit: Maximum number of sessions in the page. All sessions if None.
+            cursor: `next_cursor` of the previous page
+
+        Returns:
+            SessionIndexPage: The sessions of the page and the cursor of the next page
+        """
+        query = self._get_session_index_query(user_id=user_id, entity_id=entity_id, cursor=cursor)
+        try:
+            docs = self.collection.find(query, SESSION_INDEX_PROJECTION).sort(SESSION_INDEX_SORT)
+            if limit is not None:
+                docs = docs.limit(limit + 1)
+            return SessionIndexPage.from_entries([self._doc_to_index_entry(doc) for doc in docs], limit=limit)
+        except PyMongoError as e:
+            logger.error(f"Error getting session index: {e}")
+            return SessionIndexPage()
+
     def upsert(self, session: Session, create_and_retry: bool = True) -> Optional[Session]:
         """Upsert a session
         Args:
@@ -240,34 +294,19 @@ class MongoDbStorage(Storage):
             Optional[Session]: The upserted session, otherwise None
         """
         try:
-            # Convert session to dict and add timestamps
-            session_dict = session.to_dict()
-            now = datetime.now(timezone.utc)
-            timestamp = int(now.timestamp())
-
-            # Handle UUID serialization
-            if isinstance(session.session_id, UUID):
-                session_dict["session_id"] = str(session.session_id)
-
-            # Add version field for optimistic locking
-            if "_version" not in session_dict:
-                session_dict["_version"] = 1
-            else:
-                session_dict["_version"] += 1
-
-            update_data = {**session_dict, "updated_at": timestamp}
+            update_data = self._get_upsert_data(session)
 
             # For new documents, set created_at
-            query = {"session_id": session_dict["session_id"]}
+            query = {"session_id": update_data["session_id"]}
 
             doc = self.collection.find_one(query)
             if not doc:
-                update_data["created_at"] = timestamp
+                update_data["created_at"] = update_data["updated_at"]
 
             result = self.collection.update_one(query, {"$set": update_data}, upsert=True)
 
             if result.acknowledged:
-                return self.read(session_id=session_dict["session_id"])
+                return self.read(session_id=update_data["session_id"])
             return None
 
         except PyMongoError as e:
@@ -308,6 +347,143 @@ class MongoDbStorage(Storage):
         """Placeholder for schema upgrades"""
         pass
 
+    def _get_async_collection(self) -> Optional["AsyncIOMotorCollection"]:
+        """Return the motor collection, creating the client on first use. None if motor is not installed."""
+        if self._async_client is None and not self._async_client_checked:
+            self._async_client_checked = True
+            if self._client_is_external:
+                # The connection settings of a client passed in are not known
+                log_debug("No async_client provided, MongoDB calls will run in a thread")
+                return None
+            try:
+                from motor.motor_asyncio import AsyncIOMotorClient
+            except ImportError:
+                log_debug("`motor` not installed, MongoDB calls will run in a thread")
+                return None
+            self._async_client = AsyncIOMotorClient(self.db_url) if self.db_url is not None else AsyncIOMotorClient()
+        if self._async_client is None:
+            return None
+        return self._async_client[self.db_name][self.collection_name]
+
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
+        """Async version of `read`."""
+        collection = self._get_async_collection()
+        if collection is None:
+            return await super().aread(session_id, user_id)
+        try:
+            query = {"session_id": session_id}
+            if user_id:
+                query["user_id"] = user_id
+
+            doc = await collection.find_one(query)
+            return self._doc_to_session(doc) if doc else None
+        except PyMongoError as e:
+            logger.error(f"Error reading session: {e}")
+            return None
+
+    async def aget_all_session_ids(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[str]:
+        """Async version of `get_all_session_ids`."""
+        collection = self._get_async_collection()
+        if collection is None:
+            return await super().aget_all_session_ids(user_id, entity_id)
+        try:
+            query = self._get_query(user_id=user_id, entity_id=entity_id)
+            cursor = collection.find(query, {"session_id": 1}).sort("created_at", -1)
+            return [str(doc["session_id"]) async for doc in cursor]
+        except PyMongoError as e:
+            logger.error(f"Error getting session IDs: {e}")
+            return []
+
+    async def aget_all_sessions(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[Session]:
+        """Async version of `get_all_sessions`."""
+        return await self.aget_recent_sessions(user_id=user_id, entity_id=entity_id, limit=None)
+
+    async def aget_recent_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = 2,
+    ) -> List[Session]:
+        """Async version of `get_recent_sessions`."""
+        collection = self._get_async_collection()
+        if collection is None:
+            return await super().aget_recent_sessions(user_id, entity_id, limit)
+        try:
+            cursor = collection.find(self._get_query(user_id=user_id, entity_id=entity_id)).sort("created_at", -1)
+            if limit is not None:
+                cursor = cursor.limit(limit)
+
+            sessions: List[Session] = []
+            async for doc in cursor:
+                session = self._doc_to_session(doc)
+                if session is not None:
+                    sessions.append(session)
+            return sessions
+        except PyMongoError as e:
+            logger.error(f"Error getting sessions: {e}")
+            return []
+
+    async def aget_session_index(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> SessionIndexPage:
+        """Async version of `get_session_index`."""
+        collection = self._get_async_collection()
+        if collection is None:
+            return await super().aget_session_index(user_id, entity_id, limit, cursor)
+        query = self._get_session_index_query(user_id=user_id, entity_id=entity_id, cursor=cursor)
+        try:
+            docs = collection.find(query, SESSION_INDEX_PROJECTION).sort(SESSION_INDEX_SORT)
+            if limit is not None:
+                docs = docs.limit(limit + 1)
+            entries = [self._doc_to_index_entry(doc) async for doc in docs]
+            return SessionIndexPage.from_entries(entries, limit=limit)
+        except PyMongoError as e:
+            logger.error(f"Error getting session index: {e}")
+            return SessionIndexPage()
+
+    async def aupsert(self, session: Session, create_and_retry: bool = True) -> Optional[Session]:
+        """Async version of `upsert`."""
+        collection = self._get_async_collection()
+        if collection is None:
+            return await super().aupsert(session)
+        try:
+            update_data = self._get_upsert_data(session)
+
+            # For new documents, set created_at
+            query = {"session_id": update_data["session_id"]}
+            if not await collection.find_one(query, {"_id": 1}):
+                update_data["created_at"] = update_data["updated_at"]
+
+            result = await collection.update_one(query, {"$set": update_data}, upsert=True)
+            if result.acknowledged:
+                return await self.aread(session_id=update_data["session_id"])
+            return None
+        except PyMongoError as e:
+            logger.warning(f"Error upserting session: {e}")
+            return None
+
+    async def adelete_session(self, session_id: Optional[str] = None) -> None:
+        """Async version of `delete_session`."""
+        collection = self._get_async_collection()
+        if collection is None:
+            return await super().adelete_session(session_id)
+        if session_id is None:
+            logger.warning("No session_id provided for deletion")
+            return
+
+        try:
+            result = await collection.delete_one({"session_id": session_id})
+            if result.deleted_count == 0:
+                log_debug(f"No session found with session_id: {session_id}")
+            else:
+                log_debug(f"Successfully deleted session with session_id: {session_id}")
+        except PyMongoError as e:
+            logger.error(f"Error deleting session: {e}")
+
     def __deepcopy__(self, memo):
         """Create a deep copy of the MongoDbStorage instance"""
         from copy import deepcopy
@@ -319,7 +495,7 @@ class MongoDbStorage(Storage):
 
         # Deep copy attributes
         for k, v in self.__dict__.items():
-            if k in {"_client", "db", "collection"}:
+            if k in {"_client", "_async_client", "db", "collection"}:
                 # Reuse MongoDB connections without copying
                 setattr(copied_obj, k, v)
             else:
@@ -1,9 +1,11 @@
 import time
-from typing import List, Literal, Optional
+from typing import TYPE_CHECKING, List, Literal, Optional
 
+from agno.storage.async_engine import AsyncEngineCache
 from agno.storage.base import Storage
 from agno.storage.session import Session
 from agno.storage.session.agent import AgentSession
+from agno.storage.session.index import SessionIndexEntry, SessionIndexPage, decode_cursor
 from agno.storage.session.team import TeamSession
 from agno.storage.session.v2.workflow import WorkflowSession as WorkflowSessionV2
 from agno.storage.session.workflow import WorkflowSession
@@ -15,12 +17,16 @@ try:
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import scoped_session, sessionmaker
     from sqlalchemy.schema import Column, MetaData, Table
-    from sqlalchemy.sql.expression import select, text
+    from sqlalchemy.sql.expression import and_, func, or_, select, text
     from sqlalchemy.types import BigInteger, String
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
 
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+
 class PostgresStorage(Storage):
     def __init__(
         self,
@@ -31,6 +37,7 @@ class PostgresStorage(Storage):
         schema_version: int = 1,
         auto_upgrade_schema: bool = False,
         mode: Optional[Literal["agent", "team", "workflow"]] = "agent",
+        async_db_engine: Optional["AsyncEngine"] = None,
     ):
         """
         This class provides agent storage using a PostgreSQL table.
@@ -48,6 +55,9 @@ class PostgresStorage(Storage):
             schema_version (int): Version of the schema. Defaults to 1.
             auto_upgrade_schema (bool): Whether to automatically upgrade the schema.
             mode (Optional[Literal["agent", "team", "workflow"]]): The mode of the storage.
+            async_db_engine (Optional[AsyncEngine]): The SQLAlchemy async engine used by the async methods.
+                Defaults to an engine connecting to the same database with psycopg, if `sqlalchemy[asyncio]` is
+                installed. Otherwise the async methods run the sync ones in a thread.
         Raises:
             ValueError: If neither db_url nor db_engine is provided.
         """
@@ -64,6 +74,8 @@ class PostgresStorage(Storage):
         self.schema: Optional[str] = schema
         self.db_url: Optional[str] = db_url
         self.db_engine: Engine = _engine
+        self.async_db_engine: Optional["AsyncEngine"] = async_db_engine
+        self._async_engines = AsyncEngineCache(self.db_engine, async_driver="psycopg")
         self.metadata: MetaData = MetaData(schema=self.schema)
         self.inspector = inspect(self.db_engine)
 
@@ -246,6 +258,94 @@ class PostgresStorage(Storage):
                 logger.error(f"Could not create table: '{self.table.fullname}': {e}")
                 raise
 
+    def _is_missing_table_error(self, e: Exception) -> bool:
+        return "does not exist" in str(e)
+
+    def _filter_sessions(self, stmt, user_id: Optional[str] = None, entity_id: Optional[str] = None):
+        """Filter a select statement by user_id and entity_id, and order it by created_at descending."""
+        if user_id is not None:
+            stmt = stmt.where(self.table.c.user_id == user_id)
+        if entity_id is not None:
+            if self.mode == "agent":
+                stmt = stmt.where(self.table.c.agent_id == entity_id)
+            elif self.mode == "team":
+                stmt = stmt.where(self.table.c.team_id == entity_id)
+            elif self.mode in ["workflow", "workflow_v2"]:
+                stmt = stmt.where(self.table.c.workflow_id == entity_id)
+        return stmt.order_by(self.table.c.created_at.desc())
+
+    def _get_read_stmt(self, session_id: str, user_id: Optional[str] = None):
+        stmt = select(self.table).where(self.table.c.session_id == session_id)
+        if user_id:
+            stmt = stmt.where(self.table.c.user_id == user_id)
+        return stmt
+
+    def _get_recent_sessions_stmt(
+        self, user_id: Optional[str] = None, entity_id: Optional[str] = None, limit: Optional[int] = None
+    ):
+        stmt = self._filter_sessions(select(self.table), user_id=user_id, entity_id=entity_id)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        return stmt
+
+    def _get_session_index_stmt(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ):
+        """Select the summary columns of the sessions, most recently updated first.
+
+        Only the first run is selected from the memory, and one more session than `limit` to know if there is a next page.
+        """
+        if "runs" in self.table.c:
+            first_run = self.table.c.runs[0]
+        else:
+            first_run = self.table.c.memory[("runs", 0)]
+        sort_key = func.coalesce(self.table.c.updated_at, self.table.c.created_at, 0)
+        stmt = select(
+            self.table.c.session_id,
+            self.table.c.user_id,
+            self.table.c.session_data["session_name"].as_string().label("session_name"),
+            first_run.label("first_run"),
+            self.table.c.created_at,
+            self.table.c.updated_at,
+        )
+        stmt = self._filter_sessions(stmt, user_id=user_id, entity_id=entity_id)
+        stmt = stmt.order_by(None).order_by(sort_key.desc(), self.table.c.session_id.desc())
+        if cursor is not None:
+            after_sort_key, after_session_id = decode_cursor(cursor)
+            stmt = stmt.where(
+                or_(
+                    sort_key < after_sort_key,
+                    and_(sort_key == after_sort_key, self.table.c.session_id < after_session_id),
+                )
+            )
+        if limit is not None:
+            stmt = stmt.limit(limit + 1)
+        return stmt
+
+    def _row_to_session(self, row) -> Optional[Session]:
+        """Convert a row of the table to a Session of the storage mode."""
+        if self.mode == "agent":
+            return AgentSession.from_dict(row._mapping)  # type: ignore
+        elif self.mode == "team":
+            return TeamSession.from_dict(row._mapping)  # type: ignore
+        elif self.mode == "workflow":
+            return WorkflowSession.from_dict(row._mapping)  # type: ignore
+        elif self.mode == "workflow_v2":
+            return WorkflowSessionV2.from_dict(row._mapping)  # type: ignore
+        return None
+
+    def _rows_to_sessions(self, rows) -> List[Session]:
+        sessions: List[Session] = []
+        for row in rows:
+            session = self._row_to_session(row)
+            if session is not None:
+                sessions.append(session)
+        return sessions
+
     def read(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
         """
         Read an Session from the database.
@@ -259,20 +359,10 @@ class PostgresStorage(Storage):
         """
         try:
             with self.Session() as sess:
-                stmt = select(self.table).where(self.table.c.session_id == session_id)
-                if user_id:
-                    stmt = stmt.where(self.table.c.user_id == user_id)
-                result = sess.execute(stmt).fetchone()
-                if self.mode == "agent":
-                    return AgentSession.from_dict(result._mapping) if result is not None else None
-                elif self.mode == "team":
-                    return TeamSession.from_dict(result._mapping) if result is not None else None
-                elif self.mode == "workflow":
-                    return WorkflowSession.from_dict(result._mapping) if result is not None else None
-                elif self.mode == "workflow_v2":
-                    return WorkflowSessionV2.from_dict(result._mapping) if result is not None else None
+                result = sess.execute(self._get_read_stmt(session_id, user_id)).fetchone()
+                return self._row_to_session(result) if result is not None else None
         except Exception as e:
-            if "does not exist" in str(e):
+            if self._is_missing_table_error(e):
                 log_debug(f"Table does not exist: {self.table.name}")
                 log_debug("Creating table for future transactions")
                 self.create()
@@ -293,22 +383,7 @@ class PostgresStorage(Storage):
         """
         try:
             with self.Session() as sess, sess.begin():
-                # get all session_ids
-                stmt = select(self.table.c.session_id)
-                if user_id is not None:
-                    stmt = stmt.where(self.table.c.user_id == user_id)
-                if entity_id is not None:
-                    if self.mode == "agent":
-                        stmt = stmt.where(self.table.c.agent_id == entity_id)
-                    elif self.mode == "team":
-                        stmt = stmt.where(self.table.c.team_id == entity_id)
-                    elif self.mode == "workflow":
-                        stmt = stmt.where(self.table.c.workflow_id == entity_id)
-                    elif self.mode == "workflow_v2":
-                        stmt = stmt.where(self.table.c.workflow_id == entity_id)
-                # order by created_at desc
-                stmt = stmt.order_by(self.table.c.created_at.desc())
-                # execute query
+                stmt = self._filter_sessions(select(self.table.c.session_id), user_id=user_id, entity_id=entity_id)
                 rows = sess.execute(stmt).fetchall()
                 return [row[0] for row in rows] if rows is not None else []
         except Exception as e:
@@ -331,32 +406,8 @@ class PostgresStorage(Storage):
         """
         try:
             with self.Session() as sess, sess.begin():
-                # get all sessions
-                stmt = select(self.table)
-                if user_id is not None:
-                    stmt = stmt.where(self.table.c.user_id == user_id)
-                if entity_id is not None:
-                    if self.mode == "agent":
-                        stmt = stmt.where(self.table.c.agent_id == entity_id)
-                    elif self.mode == "team":
-                        stmt = stmt.where(self.table.c.team_id == entity_id)
-                    elif self.mode == "workflow":
-                        stmt = stmt.where(self.table.c.workflow_id == entity_id)
-                    elif self.mode == "workflow_v2":
-                        stmt = stmt.where(self.table.c.workflow_id == entity_id)
-                # order by created_at desc
-                stmt = stmt.order_by(self.table.c.created_at.desc())
-                # execute query
-                rows = sess.execute(stmt).fetchall()
-                if rows is not None:
-                    if self.mode == "agent":
-                        return [AgentSession.from_dict(row._mapping) for row in rows]  # type: ignore
-                    elif self.mode == "team":
-                        return [TeamSession.from_dict(row._mapping) for row in rows]  # type: ignore
-                    else:
-                        return [WorkflowSession.from_dict(row._mapping) for row in rows]  # type: ignore
-                else:
-                    return []
+                rows = sess.execute(self._get_recent_sessions_stmt(user_id=user_id, entity_id=entity_id)).fetchall()
+                return self._rows_to_sessions(rows) if rows is not None else []
         except Exception as e:
             log_debug(f"Exception reading from table: {e}")
             log_debug(f"Table does not exist: {self.table.name}")
@@ -382,47 +433,12 @@ class PostgresStorage(Storage):
         """
         try:
             with self.Session() as sess, sess.begin():
-                # Build the base query
-                stmt = select(self.table)
-
-                # Add filters
-                if user_id is not None:
-                    stmt = stmt.where(self.table.c.user_id == user_id)
-                if entity_id is not None:
-                    if self.mode == "agent":
-                        stmt = stmt.where(self.table.c.agent_id == entity_id)
-                    elif self.mode == "team":
-                        stmt = stmt.where(self.table.c.team_id == entity_id)
-                    elif self.mode == "workflow":
-                        stmt = stmt.where(self.table.c.workflow_id == entity_id)
-                    elif self.mode == "workflow_v2":
-                        stmt = stmt.where(self.table.c.workflow_id == entity_id)
-                # Order by created_at desc and limit results
-                stmt = stmt.order_by(self.table.c.created_at.desc())
-                if limit is not None:
-                    stmt = stmt.limit(limit)
-
-                # Execute query
+                stmt = self._get_recent_sessions_stmt(user_id=user_id, entity_id=entity_id, limit=limit)
                 rows = sess.execute(stmt).fetchall()
-                if rows is not None:
-                    sessions: List[Session] = []
-                    for row in rows:
-                        session: Optional[Session] = None
-                        if self.mode == "agent":
-                            session = AgentSession.from_dict(row._mapping)  # type: ignore
-                        elif self.mode == "team":
-                            session = TeamSession.from_dict(row._mapping)  # type: ignore
-                        elif self.mode == "workflow":
-                            session = WorkflowSession.from_dict(row._mapping)  # type: ignore
-                        elif self.mode == "workflow_v2":
-                            session = WorkflowSessionV2.from_dict(row._mapping)  # type: ignore
-                        if session is not None:
-                            sessions.append(session)
-                    return sessions
-                return []
+                return self._rows_to_sessions(rows) if rows is not None else []
 
         except Exception as e:
-            if "does not exist" in str(e):
+            if self._is_missing_table_error(e):
                 log_debug(f"Table does not exist: {self.table.name}")
                 log_debug("Creating table for future transactions")
                 self.create()
@@ -430,6 +446,39 @@ class PostgresStorage(Storage):
                 log_debug(f"Exception reading from table: {e}")
             return []
 
+    def get_session_index(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> SessionIndexPage:
+        """
+        Get a page of session summaries, most recently updated first, without loading the memory of the sessions.
+
+        Args:
+            user_id: Filter by user ID
+            entity_id: Filter by entity ID (agent_id, team_id, or workflow_id)
+            limit: Maximum number of sessions in the page. All sessions if None.
+            cursor: `next_cursor` of the previous page
+
+        Returns:
+            SessionIndexPage: The sessions of the page and the cursor of the next page
+        """
+        stmt = self._get_session_index_stmt(user_id=user_id, entity_id=entity_id, limit=limit, cursor=cursor)
+        try:
+            with self.Session() as sess, sess.begin():
+                rows = sess.execute(stmt).fetchall()
+                return SessionIndexPage.from_entries([SessionIndexEntry.from_row(row) for row in rows], limit=limit)
+        except Exception as e:
+            if self._is_missing_table_error(e):
+                log_debug(f"Table does not exist: {self.table.name}")
+                log_debug("Creating table for future transactions")
+                self.create()
+            else:
+                log_debug(f"Exception reading from table: {e}")
+        return SessionIndexPage()
+
     def upgrade_schema(self) -> None:
         """
         Upgrade the schema to the latest version.
@@ -468,6 +517,58 @@ class PostgresStorage(Storage):
             logger.error(f"Error during schema upgrade: {e}")
             raise
 
+    def _get_upsert_stmt(self, session: Session):
+        """Build the statement inserting a session, or updating it if the session_id already exists."""
+        if self.mode == "agent":
+            values = dict(
+                agent_id=session.agent_id,  # type: ignore
+                team_session_id=session.team_session_id,  # type: ignore
+                user_id=session.user_id,
+                memory=getattr(session, "memory", None),
+                agent_data=session.agent_data,  # type: ignore
+                session_data=session.session_data,
+                extra_data=session.extra_data,
+            )
+        elif self.mode == "team":
+            values = dict(
+                team_id=session.team_id,  # type: ignore
+                user_id=session.user_id,
+                team_session_id=session.team_session_id,  # type: ignore
+                memory=getattr(session, "memory", None),
+                team_data=session.team_data,  # type: ignore
+                session_data=session.session_data,
+                extra_data=session.extra_data,
+            )
+        elif self.mode == "workflow":
+            values = dict(
+                workflow_id=session.workflow_id,  # type: ignore
+                user_id=session.user_id,
+                memory=getattr(session, "memory", None),
+                workflow_data=session.workflow_data,  # type: ignore
+                session_data=session.session_data,
+                extra_data=session.extra_data,
+            )
+        elif self.mode == "workflow_v2":
+            # Convert session to dict to ensure proper serialization
+            session_dict = session.to_dict()
+            values = dict(
+                workflow_id=session.workflow_id,  # type: ignore
+                workflow_name=session.workflow_name,  # type: ignore
+                user_id=session.user_id,
+                runs=session_dict.get("runs"),
+                workflow_data=session.workflow_data,  # type: ignore
+                session_data=session.session_data,
+                extra_data=session.extra_data,
+            )
+
+        stmt = postgresql.insert(self.table).values(session_id=session.session_id, **values)
+        # Define the upsert if the session_id already exists
+        # See: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#postgresql-insert-on-conflict
+        return stmt.on_conflict_do_update(
+            index_elements=["session_id"],
+            set_=dict(**values, updated_at=int(time.time())),  # The updated value for each column
+        )
+
     def upsert(self, session: Session, create_and_retry: bool = True) -> Optional[Session]:
         """
         Insert or update an Session in the database.
@@ -485,114 +586,7 @@ class PostgresStorage(Storage):
 
         try:
             with self.Session() as sess, sess.begin():
-                # Create an insert statement
-                if self.mode == "agent":
-                    stmt = postgresql.insert(self.table).values(
-                        session_id=session.session_id,
-                        agent_id=session.agent_id,  # type: ignore
-                        team_session_id=session.team_session_id,  # type: ignore
-                        user_id=session.user_id,
-                        memory=getattr(session, "memory", None),
-                        agent_data=session.agent_data,  # type: ignore
-                        session_data=session.session_data,
-                        extra_data=session.extra_data,
-                    )
-                    # Define the upsert if the session_id already exists
-                    # See: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#postgresql-insert-on-conflict
-                    stmt = stmt.on_conflict_do_update(
-                        index_elements=["session_id"],
-                        set_=dict(
-                            agent_id=session.agent_id,  # type: ignore
-                            team_session_id=session.team_session_id,  # type: ignore
-                            user_id=session.user_id,
-                            memory=getattr(session, "memory", None),
-                            agent_data=session.agent_data,  # type: ignore
-                            session_data=session.session_data,
-                            extra_data=session.extra_data,
-                            updated_at=int(time.time()),
-                        ),  # The updated value for each column
-                    )
-                elif self.mode == "team":
-                    stmt = postgresql.insert(self.table).values(
-                        session_id=session.session_id,
-                        team_id=session.team_id,  # type: ignore
-                        user_id=session.user_id,
-                        team_session_id=session.team_session_id,  # type: ignore
-                        memory=getattr(session, "memory", None),
-                        team_data=session.team_data,  # type: ignore
-                        session_data=session.session_data,
-                        extra_data=session.extra_data,
-                    )
-                    # Define the upsert if the session_id already exists
-                    # See: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#postgresql-insert-on-conflict
-                    stmt = stmt.on_conflict_do_update(
-                        index_elements=["session_id"],
-                        set_=dict(
-                            team_id=session.team_id,  # type: ignore
-                            user_id=session.user_id,
-                            team_session_id=session.team_session_id,  # type: ignore
-                            memory=getattr(session, "memory", None),
-                            team_data=session.team_data,  # type: ignore
-                            session_data=session.session_data,
-                            extra_data=session.extra_data,
-                            updated_at=int(time.time()),
-                        ),  # The updated value for each column
-                    )
-                elif self.mode == "workflow":
-                    stmt = postgresql.insert(self.table).values(
-                        session_id=session.session_id,
-                        workflow_id=session.workflow_id,  # type: ignore
-                        user_id=session.user_id,
-                        memory=getattr(session, "memory", None),
-                        workflow_data=session.workflow_data,  # type: ignore
-                        session_data=session.session_data,
-                        extra_data=session.extra_data,
-                    )
-                    # Define the upsert if the session_id already exists
-                    # See: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#postgresql-insert-on-conflict
-                    stmt = stmt.on_conflict_do_update(
-                        index_elements=["session_id"],
-                        set_=dict(
-                            workflow_id=session.workflow_id,  # type: ignore
-                            user_id=session.user_id,
-                            memory=getattr(session, "memory", None),
-                            workflow_data=session.workflow_data,  # type: ignore
-                            session_data=session.session_data,
-                            extra_data=session.extra_data,
-                            updated_at=int(time.time()),
-                        ),  # The updated value for each column
-                    )
-                elif self.mode == "workflow_v2":
-                    # Convert session to dict to ensure proper serialization
-                    session_dict = session.to_dict()
-
-                    stmt = postgresql.insert(self.table).values(
-                        session_id=session.session_id,
-                        workflow_id=session.workflow_id,  # type: ignore
-                        workflow_name=session.workflow_name,  # type: ignore
-                        user_id=session.user_id,
-                        runs=session_dict.get("runs"),
-                        workflow_data=session.workflow_data,  # type: ignore
-                        session_data=session.session_data,
-                        extra_data=session.extra_data,
-                    )
-                    # Define the upsert if the session_id already exists
-                    # See: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#postgresql-insert-on-conflict
-                    stmt = stmt.on_conflict_do_update(
-                        index_elements=["session_id"],
-                        set_=dict(
-                            workflow_id=session.workflow_id,  # type: ignore
-                            workflow_name=session.workflow_name,  # type: ignore
-                            user_id=session.user_id,
-                            runs=session_dict.get("runs"),
-                            workflow_data=session.workflow_data,  # type: ignore
-                            session_data=session.session_data,
-                            extra_data=session.extra_data,
-                            updated_at=int(time.time()),
-                        ),
-                    )
-
-                sess.execute(stmt)
+                sess.execute(self._get_upsert_stmt(session))
         except Exception as e:
             if create_and_retry and not self.table_exists():
                 log_debug(f"Table does not exist: {self.table.name}")
@@ -645,6 +639,144 @@ class PostgresStorage(Storage):
             self.metadata = MetaData(schema=self.schema)
             self.table = self.get_table()
 
+    def _get_async_engine(self) -> Optional["AsyncEngine"]:
+        """Return the async engine, or None if no async driver is installed."""
+        if self.async_db_engine is not None:
+            return self.async_db_engine
+        return self._async_engines.get()
+
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
+        """Async version of `read`."""
+        async_engine = self._get_async_engine()
+        if async_engine is None:
+            return await super().aread(session_id, user_id)
+        try:
+            async with async_engine.connect() as conn:
+                result = (await conn.execute(self._get_read_stmt(session_id, user_id))).fetchone()
+                return self._row_to_session(result) if result is not None else None
+        except Exception as e:
+            if self._is_missing_table_error(e):
+                log_debug(f"Table does not exist: {self.table.name}")
+                await self.acreate()
+            else:
+                log_debug(f"Exception reading from table: {e}")
+        return None
+
+    async def aget_all_session_ids(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[str]:
+        """Async version of `get_all_session_ids`."""
+        async_engine = self._get_async_engine()
+        if async_engine is None:
+            return await super().aget_all_session_ids(user_id, entity_id)
+        try:
+            async with async_engine.connect() as conn:
+                stmt = self._filter_sessions(select(self.table.c.session_id), user_id=user_id, entity_id=entity_id)
+                rows = (await conn.execute(stmt)).fetchall()
+                return [row[0] for row in rows]
+        except Exception as e:
+            if self._is_missing_table_error(e):
+                log_debug(f"Table does not exist: {self.table.name}")
+                await self.acreate()
+            else:
+                log_debug(f"Exception reading from table: {e}")
+        return []
+
+    async def aget_all_sessions(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[Session]:
+        """Async version of `get_all_sessions`."""
+        return await self.aget_recent_sessions(user_id=user_id, entity_id=entity_id, limit=None)
+
+    async def aget_recent_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = 2,
+    ) -> List[Session]:
+        """Async version of `get_recent_sessions`."""
+        async_engine = self._get_async_engine()
+        if async_engine is None:
+            return await super().aget_recent_sessions(user_id, entity_id, limit)
+        try:
+            async with async_engine.connect() as conn:
+                stmt = self._get_recent_sessions_stmt(user_id=user_id, entity_id=entity_id, limit=limit)
+                rows = (await conn.execute(stmt)).fetchall()
+                return self._rows_to_sessions(rows)
+        except Exception as e:
+            if self._is_missing_table_error(e):
+                log_debug(f"Table does not exist: {self.table.name}")
+                await self.acreate()
+            else:
+                log_debug(f"Exception reading from table: {e}")
+        return []
+
+    async def aget_session_index(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> SessionIndexPage:
+        """Async version of `get_session_index`."""
+        async_engine = self._get_async_engine()
+        if async_engine is None:
+            return await super().aget_session_index(user_id, entity_id, limit, cursor)
+        stmt = self._get_session_index_stmt(user_id=user_id, entity_id=entity_id, limit=limit, cursor=cursor)
+        try:
+            async with async_engine.connect() as conn:
+                rows = (await conn.execute(stmt)).fetchall()
+                return SessionIndexPage.from_entries([SessionIndexEntry.from_row(row) for row in rows], limit=limit)
+        except Exception as e:
+            if self._is_missing_table_error(e):
+                log_debug(f"Table does not exist: {self.table.name}")
+                await self.acreate()
+            else:
+                log_debug(f"Exception reading from table: {e}")
+        return SessionIndexPage()
+
+    async def aupsert(self, session: Session, create_and_retry: bool = True) -> Optional[Session]:
+        """Async version of `upsert`."""
+        async_engine = self._get_async_engine()
+        if async_engine is None:
+            return await super().aupsert(session)
+
+        # Perform schema upgrade if auto_upgrade_schema is enabled
+        if self.auto_upgrade_schema and not self._schema_up_to_date:
+            await self.aupgrade_schema()
+
+        try:
+            async with async_engine.begin() as conn:
+                await conn.execute(self._get_upsert_stmt(session))
+        except Exception as e:
+            if create_and_retry and not await self._acall_sync(self.table_exists):
+                log_debug(f"Table does not exist: {self.table.name}")
+                log_debug("Creating table and retrying upsert")
+                await self.acreate()
+                return await self.aupsert(session, create_and_retry=False)
+            else:
+                log_warning(f"Exception upserting into table: {e}")
+                log_warning(
+                    "A table upgrade might be required, please review these docs for more information: https://agno.link/upgrade-schema"
+                )
+                return None
+        return await self.aread(session_id=session.session_id)
+
+    async def adelete_session(self, session_id: Optional[str] = None):
+        """Async version of `delete_session`."""
+        async_engine = self._get_async_engine()
+        if async_engine is None:
+            return await super().adelete_session(session_id)
+        if session_id is None:
+            logger.warning("No session_id provided for deletion.")
+            return
+
+        try:
+            async with async_engine.begin() as conn:
+                result = await conn.execute(self.table.delete().where(self.table.c.session_id == session_id))
+                if result.rowcount == 0:
+                    log_debug(f"No session found with session_id: {session_id}")
+                else:
+                    log_debug(f"Successfully deleted session with session_id: {session_id}")
+        except Exception as e:
+            logger.error(f"Error deleting session: {e}")
+
     def __deepcopy__(self, memo):
         """
         Create a deep copy of the PostgresStorage instance, handling unpickleable attributes.
@@ -666,8 +798,8 @@ class PostgresStorage(Storage):
         for k, v in self.__dict__.items():
             if k in {"metadata", "table", "inspector"}:
                 continue
-            # Reuse db_engine and Session without copying
-            elif k in {"db_engine", "SqlSession"}:
+            # Reuse the engines and Session without copying
+            elif k in {"db_engine", "async_db_engine", "_async_engines", "SqlSession"}:
                 setattr(copied_obj, k, v)
             else:
                 setattr(copied_obj, k, deepcopy(v, memo))
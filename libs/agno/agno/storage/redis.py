@@ -1,7 +1,7 @@
 import json
 import time
 from dataclasses import asdict
-from typing import List, Literal, Optional
+from typing import TYPE_CHECKING, List, Literal, Optional
 from uuid import UUID
 
 from agno.storage.base import Storage
@@ -17,6 +17,12 @@ try:
 except ImportError:
     raise ImportError("`redis` not installed. Please install it using `pip install redis`")
 
+if TYPE_CHECKING:
+    from redis.asyncio import Redis as AsyncRedis
+
+# Number of session values fetched per MGET by the async methods
+MGET_BATCH_SIZE = 100
+
 
 class UUIDEncoder(json.JSONEncoder):
     def default(self, obj):
@@ -53,7 +59,7 @@ class RedisStorage(Storage):
         super().__init__(mode)
         self.prefix = prefix
         self.expire = expire
-        self.redis_client = Redis(
+        self._connection_kwargs = dict(
             host=host,
             port=port,
             db=db,
@@ -61,6 +67,9 @@ class RedisStorage(Storage):
             decode_responses=True,  # Automatically decode responses to str
             ssl=ssl,
         )
+        self.redis_client = Redis(**self._connection_kwargs)
+        # Client of the async methods, created on first use
+        self._async_redis_client: Optional["AsyncRedis"] = None
         log_debug(f"Created RedisStorage with prefix: '{self.prefix}'")
 
     def _get_key(self, session_id: str) -> str:
@@ -88,6 +97,54 @@ class RedisStorage(Storage):
             logger.error(f"Could not connect to Redis: {e}")
             raise
 
+    def _matches(self, data: dict, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> bool:
+        """Check if the session data matches the user_id and entity_id filters."""
+        if user_id and data["user_id"] != user_id:
+            return False
+        if entity_id:
+            if self.mode == "agent":
+                return data["agent_id"] == entity_id
+            elif self.mode == "team":
+                return data["team_id"] == entity_id
+            elif self.mode in ["workflow", "workflow_v2"]:
+                return data["workflow_id"] == entity_id
+        return True
+
+    def _to_session(self, data: dict) -> Optional[Session]:
+        """Convert session data to a Session of the storage mode."""
+        if self.mode == "agent":
+            return AgentSession.from_dict(data)
+        elif self.mode == "team":
+            return TeamSession.from_dict(data)
+        elif self.mode == "workflow":
+            return WorkflowSession.from_dict(data)
+        elif self.mode == "workflow_v2":
+            return WorkflowSessionV2.from_dict(data)
+        return None
+
+    def _to_recent_sessions(self, session_data: List[dict], limit: Optional[int] = None) -> List[Session]:
+        """Sort session data by created_at descending and convert the first `limit` to Sessions."""
+        session_data = sorted(session_data, key=lambda data: data.get("created_at", 0), reverse=True)
+        if limit is not None:
+            session_data = session_data[:limit]
+
+        sessions: List[Session] = []
+        for data in session_data:
+            session = self._to_session(data)
+            if session is not None:
+                sessions.append(session)
+        return sessions
+
+    def _get_upsert_data(self, session: Session) -> dict:
+        if self.mode == "workflow_v2":
+            data = session.to_dict()
+        else:
+            data = asdict(session)
+        data["updated_at"] = int(time.time())
+        if "created_at" not in data:
+            data["created_at"] = data["updated_at"]
+        return data
+
     def read(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
         """Read a Session from Redis."""
         try:
@@ -99,14 +156,7 @@ class RedisStorage(Storage):
             if user_id and session_data.get("user_id") != user_id:
                 return None
 
-            if self.mode == "agent":
-                return AgentSession.from_dict(session_data)
-            elif self.mode == "team":
-                return TeamSession.from_dict(session_data)
-            elif self.mode == "workflow":
-                return WorkflowSession.from_dict(session_data)
-            elif self.mode == "workflow_v2":
-                return WorkflowSessionV2.from_dict(session_data)
+            return self._to_session(session_data)
 
         except Exception as e:
             logger.error(f"Error reading session: {e}")
@@ -120,32 +170,7 @@ class RedisStorage(Storage):
             pattern = f"{self.prefix}:*"
             for key in self.redis_client.scan_iter(match=pattern):
                 data = self.deserialize(self.redis_client.get(key))  # type: ignore
-
-                if user_id or entity_id:
-                    if user_id and entity_id:
-                        if self.mode == "agent" and data["agent_id"] == entity_id and data["user_id"] == user_id:
-                            session_ids.append(data["session_id"])
-                        elif self.mode == "team" and data["team_id"] == entity_id and data["user_id"] == user_id:
-                            session_ids.append(data["session_id"])
-                        elif (
-                            self.mode == "workflow" and data["workflow_id"] == entity_id and data["user_id"] == user_id
-                        ):
-                            session_ids.append(data["session_id"])
-                        elif self.mode == "workflow_v2" and data["workflow_id"] == entity_id:
-                            session_ids.append(data["session_id"])
-                    elif user_id and data["user_id"] == user_id:
-                        session_ids.append(data["session_id"])
-                    elif entity_id:
-                        if self.mode == "agent" and data["agent_id"] == entity_id:
-                            session_ids.append(data["session_id"])
-                        elif self.mode == "team" and data["team_id"] == entity_id:
-                            session_ids.append(data["session_id"])
-                        elif self.mode == "workflow" and data["workflow_id"] == entity_id:
-                            session_ids.append(data["session_id"])
-                        elif self.mode == "workflow_v2" and data["workflow_id"] == entity_id:
-                            session_ids.append(data["session_id"])
-                else:
-                    # No filters applied, add all session_ids
+                if self._matches(data, user_id=user_id, entity_id=entity_id):
                     session_ids.append(data["session_id"])
 
         except Exception as e:
@@ -160,53 +185,8 @@ class RedisStorage(Storage):
             pattern = f"{self.prefix}:*"
             for key in self.redis_client.scan_iter(match=pattern):
                 data = self.deserialize(self.redis_client.get(key))  # type: ignore
-
-                if user_id or entity_id:
-                    _session: Optional[Session] = None
-
-                    if user_id and entity_id:
-                        if self.mode == "agent" and data["agent_id"] == entity_id and data["user_id"] == user_id:
-                            _session = AgentSession.from_dict(data)
-                        elif self.mode == "team" and data["team_id"] == entity_id and data["user_id"] == user_id:
-                            _session = TeamSession.from_dict(data)
-                        elif (
-                            self.mode == "workflow" and data["workflow_id"] == entity_id and data["user_id"] == user_id
-                        ):
-                            _session = WorkflowSession.from_dict(data)
-                        elif self.mode == "workflow_v2" and data["workflow_id"] == entity_id:
-                            _session = WorkflowSessionV2.from_dict(data)
-                    elif user_id and data["user_id"] == user_id:
-                        if self.mode == "agent":
-                            _session = AgentSession.from_dict(data)
-                        elif self.mode == "team":
-                            _session = TeamSession.from_dict(data)
-                        elif self.mode == "workflow":
-                            _session = WorkflowSession.from_dict(data)
-                        elif self.mode == "workflow_v2" and data["workflow_id"] == entity_id:
-                            _session = WorkflowSessionV2.from_dict(data)
-                    elif entity_id:
-                        if self.mode == "agent" and data["agent_id"] == entity_id:
-                            _session = AgentSession.from_dict(data)
-                        elif self.mode == "team" and data["team_id"] == entity_id:
-                            _session = TeamSession.from_dict(data)
-                        elif self.mode == "workflow" and data["workflow_id"] == entity_id:
-                            _session = WorkflowSession.from_dict(data)
-                        elif self.mode == "workflow_v2" and data["workflow_id"] == entity_id:
-                            _session = WorkflowSessionV2.from_dict(data)
-
-                    if _session:
-                        sessions.append(_session)
-                else:
-                    _session = None
-                    # No filters applied, add all sessions
-                    if self.mode == "agent":
-                        _session = AgentSession.from_dict(data)
-                    elif self.mode == "team":
-                        _session = TeamSession.from_dict(data)
-                    elif self.mode == "workflow":
-                        _session = WorkflowSession.from_dict(data)
-                    elif self.mode == "workflow_v2":
-                        _session = WorkflowSessionV2.from_dict(data)
+                if self._matches(data, user_id=user_id, entity_id=entity_id):
+                    _session = self._to_session(data)
                     if _session:
                         sessions.append(_session)
 
@@ -231,72 +211,31 @@ class RedisStorage(Storage):
         Returns:
             List[Session]: List of most recent sessions
         """
-        sessions: List[Session] = []
-        # List of (created_at, data) tuples for sorting
-        session_data: List[tuple[int, dict]] = []
+        session_data: List[dict] = []
 
         try:
             pattern = f"{self.prefix}:*"
             for key in self.redis_client.scan_iter(match=pattern):
                 try:
                     data = self.deserialize(self.redis_client.get(key))  # type: ignore
-
-                    # Apply filters
-                    if user_id and data["user_id"] != user_id:
-                        continue
-
-                    if entity_id:
-                        if self.mode == "agent" and data["agent_id"] != entity_id:
-                            continue
-                        elif self.mode == "team" and data["team_id"] != entity_id:
-                            continue
-                        elif self.mode == "workflow" and data["workflow_id"] != entity_id:
-                            continue
-                        elif self.mode == "workflow_v2" and data["workflow_id"] != entity_id:
-                            continue
-                    # Store with created_at for sorting
-                    created_at = data.get("created_at", 0)
-                    session_data.append((created_at, data))
+                    if self._matches(data, user_id=user_id, entity_id=entity_id):
+                        session_data.append(data)
 
                 except Exception as e:
                     logger.error(f"Error processing session data: {e}")
                     continue
 
-            # Sort by created_at descending and take only num_history_sessions
-            session_data.sort(key=lambda x: x[0], reverse=True)
-            if limit is not None:
-                session_data = session_data[:limit]
-
-            # Convert filtered and sorted data to Session objects
-            for _, data in session_data:
-                session: Optional[Session] = None
-                if self.mode == "agent":
-                    session = AgentSession.from_dict(data)
-                elif self.mode == "team":
-                    session = TeamSession.from_dict(data)
-                elif self.mode == "workflow":
-                    session = WorkflowSession.from_dict(data)
-                elif self.mode == "workflow_v2":
-                    session = WorkflowSessionV2.from_dict(data)
-                if session is not None:
-                    sessions.append(session)
+            return self._to_recent_sessions(session_data, limit=limit)
 
         except Exception as e:
             logger.error(f"Error getting last {limit} sessions: {e}")
 
-        return sessions
+        return []
 
     def upsert(self, session: Session) -> Optional[Session]:
         """Insert or update a Session in Redis."""
         try:
-            if self.mode == "workflow_v2":
-                data = session.to_dict()
-            else:
-                data = asdict(session)
-            data["updated_at"] = int(time.time())
-            if "created_at" not in data:
-                data["created_at"] = data["updated_at"]
-
+            data = self._get_upsert_data(session)
             key = self._get_key(session.session_id)
             if self.expire is not None:
                 self.redis_client.set(key, self.serialize(data), ex=self.expire)
@@ -334,3 +273,131 @@ class RedisStorage(Storage):
         For Redis, this is a no-op as it's schema-less.
         """
         pass
+
+    @property
+    def async_redis_client(self) -> "AsyncRedis":
+        """The redis.asyncio client used by the async methods, created on first use."""
+        if self._async_redis_client is None:
+            from redis.asyncio import Redis as AsyncRedis
+
+            self._async_redis_client = AsyncRedis(**self._connection_kwargs)
+        return self._async_redis_client
+
+    async def _aget_all_data(self) -> List[dict]:
+        """Return the data of all sessions, fetching the values of each batch of scanned keys in one call."""
+        client = self.async_redis_client
+        session_data: List[dict] = []
+        keys: List[str] = []
+        async for key in client.scan_iter(match=f"{self.prefix}:*"):
+            keys.append(key)
+        for i in range(0, len(keys), MGET_BATCH_SIZE):
+            for value in await client.mget(keys[i : i + MGET_BATCH_SIZE]):
+                if value is None:
+                    # Expired or deleted since the scan
+                    continue
+                try:
+                    session_data.append(self.deserialize(value))
+                except Exception as e:
+                    logger.error(f"Error processing session data: {e}")
+        return session_data
+
+    async def acreate(self) -> None:
+        """Async version of `create`."""
+        try:
+            await self.async_redis_client.ping()
+            log_debug("Redis connection successful")
+        except ConnectionError as e:
+            logger.error(f"Could not connect to Redis: {e}")
+            raise
+
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
+        """Async version of `read`."""
+        try:
+            data = await self.async_redis_client.get(self._get_key(session_id))
+            if data is None:
+                return None
+
+            session_data = self.deserialize(data)
+            if user_id and session_data.get("user_id") != user_id:
+                return None
+            return self._to_session(session_data)
+        except Exception as e:
+            logger.error(f"Error reading session: {e}")
+            return None
+
+    async def aget_all_session_ids(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[str]:
+        """Async version of `get_all_session_ids`."""
+        try:
+            return [
+                data["session_id"]
+                for data in await self._aget_all_data()
+                if self._matches(data, user_id=user_id, entity_id=entity_id)
+            ]
+        except Exception as e:
+            logger.error(f"Error getting session IDs: {e}")
+            return []
+
+    async def aget_all_sessions(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[Session]:
+        """Async version of `get_all_sessions`."""
+        try:
+            sessions: List[Session] = []
+            for data in await self._aget_all_data():
+                if self._matches(data, user_id=user_id, entity_id=entity_id):
+                    session = self._to_session(data)
+                    if session is not None:
+                        sessions.append(session)
+            return sessions
+        except Exception as e:
+            logger.error(f"Error getting all sessions: {e}")
+            return []
+
+    async def aget_recent_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = 2,
+    ) -> List[Session]:
+        """Async version of `get_recent_sessions`."""
+        try:
+            session_data = [
+                data
+                for data in await self._aget_all_data()
+                if self._matches(data, user_id=user_id, entity_id=entity_id)
+            ]
+            return self._to_recent_sessions(session_data, limit=limit)
+        except Exception as e:
+            logger.error(f"Error getting last {limit} sessions: {e}")
+            return []
+
+    async def aupsert(self, session: Session) -> Optional[Session]:
+        """Async version of `upsert`."""
+        try:
+            data = self._get_upsert_data(session)
+            await self.async_redis_client.set(self._get_key(session.session_id), self.serialize(data), ex=self.expire)
+            return session
+        except Exception as e:
+            logger.error(f"Error upserting session: {e}")
+            return None
+
+    async def adelete_session(self, session_id: Optional[str] = None):
+        """Async version of `delete_session`."""
+        if session_id is None:
+            return
+        try:
+            await self.async_redis_client.delete(self._get_key(session_id))
+            log_debug(f"Deleted session: {session_id}")
+        except Exception as e:
+            logger.error(f"Error deleting session: {e}")
+
+    async def adrop(self) -> None:
+        """Async version of `drop`."""
+        try:
+            client = self.async_redis_client
+            async for key in client.scan_iter(match=f"{self.prefix}:*"):
+                await client.delete(key)
+            log_info(f"Dropped all sessions with prefix: {self.prefix}")
+        except Exception as e:
+            logger.error(f"Error dropping sessions: {e}")
+
+    async def aupgrade_schema(self) -> None:
+        pass
@@ -0,0 +1,98 @@
+import base64
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from agno.storage.session import Session
+
+
+@dataclass
+class SessionIndexEntry:
+    """Summary of a session, used to list sessions without loading their memory"""
+
+    session_id: str
+    user_id: Optional[str] = None
+    # Name of the session, from session_data
+    session_name: Optional[str] = None
+    # First run of the session, used to title unnamed sessions
+    first_run: Optional[Dict[str, Any]] = None
+    created_at: Optional[int] = None
+    updated_at: Optional[int] = None
+
+    @property
+    def sort_key(self) -> Tuple[int, str]:
+        """Sessions are listed by last update, most recent first"""
+        return (self.updated_at or self.created_at or 0, self.session_id)
+
+    @classmethod
+    def from_session(cls, session: Session) -> "SessionIndexEntry":
+        runs: Optional[List[Any]] = None
+        memory = getattr(session, "memory", None)
+        if memory is not None:
+            runs = memory.get("runs")
+        elif getattr(session, "runs", None):
+            runs = [run.to_dict() for run in session.runs[:1]]  # type: ignore
+        return cls(
+            session_id=session.session_id,
+            user_id=session.user_id,
+            session_name=session.session_data.get("session_name") if session.session_data else None,
+            first_run=runs[0] if runs else None,
+            created_at=session.created_at,
+            updated_at=session.updated_at,
+        )
+
+    @classmethod
+    def from_row(cls, row: Any) -> "SessionIndexEntry":
+        """Create an entry from a row selected by the index statement of a SQL storage"""
+        return cls(
+            session_id=row.session_id,
+            user_id=row.user_id,
+            session_name=row.session_name,
+            first_run=row.first_run if isinstance(row.first_run, dict) else None,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+        )
+
+
+@dataclass
+class SessionIndexPage:
+    """A page of session summaries. Pass `next_cursor` to get the next page, it is None on the last page"""
+
+    sessions: List[SessionIndexEntry] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+    @classmethod
+    def from_entries(cls, entries: List[SessionIndexEntry], limit: Optional[int] = None) -> "SessionIndexPage":
+        """Create a page from sorted entries, fetched with one more entry than `limit` to know if there is a next page"""
+        if limit is None or len(entries) <= limit:
+            return cls(sessions=entries)
+        sessions = entries[:limit]
+        return cls(sessions=sessions, next_cursor=encode_cursor(sessions[-1].sort_key))
+
+
+def encode_cursor(sort_key: Tuple[int, str]) -> str:
+    return base64.urlsafe_b64encode(json.dumps(list(sort_key)).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[int, str]:
+    """Return the sort key of the last session of the previous page.
+
+    Raises:
+        ValueError: If the cursor is invalid.
+    """
+    try:
+        updated_at, session_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return int(updated_at), str(session_id)
+    except Exception as e:
+        raise ValueError(f"Invalid session cursor: {cursor}") from e
+
+
+def paginate_sessions(
+    sessions: List[Session], limit: Optional[int] = None, cursor: Optional[str] = None
+) -> SessionIndexPage:
+    """Build a page of the session index from full sessions, for storages without a native projection"""
+    entries = sorted((SessionIndexEntry.from_session(s) for s in sessions), key=lambda e: e.sort_key, reverse=True)
+    if cursor is not None:
+        after = decode_cursor(cursor)
+        entries = [e for e in entries if e.sort_key < after]
+    return SessionIndexPage.from_entries(entries[: limit + 1] if limit is not None else entries, limit=limit)
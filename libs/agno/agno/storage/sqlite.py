@@ -1,10 +1,12 @@
 import time
 from pathlib import Path
-from typing import List, Literal, Optional
+from typing import TYPE_CHECKING, Any, Callable, List, Literal, Optional
 
-from agno.storage.base import Storage
+from agno.storage.async_engine import AsyncEngineCache
+from agno.storage.base import Storage, T
 from agno.storage.session import Session
 from agno.storage.session.agent import AgentSession
+from agno.storage.session.index import SessionIndexEntry, SessionIndexPage, decode_cursor
 from agno.storage.session.team import TeamSession
 from agno.storage.session.v2.workflow import WorkflowSession as WorkflowSessionV2
 from agno.storage.session.workflow import WorkflowSession
@@ -18,12 +20,16 @@ try:
     from sqlalchemy.orm import sessionmaker
     from sqlalchemy.schema import Column, MetaData, Table
     from sqlalchemy.sql import text
-    from sqlalchemy.sql.expression import select
+    from sqlalchemy.sql.expression import and_, func, or_, select
     from sqlalchemy.types import String
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
 
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+
 class SqliteStorage(Storage):
     def __init__(
         self,
@@ -34,6 +40,7 @@ class SqliteStorage(Storage):
         schema_version: int = 1,
         auto_upgrade_schema: bool = False,
         mode: Optional[Literal["agent", "team", "workflow", "workflow_v2"]] = "agent",
+        async_db_engine: Optional["AsyncEngine"] = None,
     ):
         """
         This class provides agent storage using a sqlite database.
@@ -49,6 +56,9 @@ class SqliteStorage(Storage):
             db_url: The database URL to connect to.
             db_file: The database file to connect to.
             db_engine: The SQLAlchemy database engine to use.
+            async_db_engine: The SQLAlchemy async engine used by the async methods. Defaults to an engine
+                connecting to the same database file with aiosqlite, if `sqlalchemy[asyncio]` is installed.
+                Otherwise the async methods run the sync ones in a thread.
         """
         super().__init__(mode)
         _engine: Optional[Engine] = db_engine
@@ -70,6 +80,8 @@ class SqliteStorage(Storage):
         self.table_name: str = table_name
         self.db_url: Optional[str] = db_url
         self.db_engine: Engine = _engine
+        self.async_db_engine: Optional["AsyncEngine"] = async_db_engine
+        self._async_engines = AsyncEngineCache(self.db_engine, async_driver="aiosqlite")
         self.metadata: MetaData = MetaData()
         self.inspector = inspect(self.db_engine)
 
@@ -227,6 +239,94 @@ class SqliteStorage(Storage):
                 logger.error(f"Error creating table: {e}")
                 raise
 
+    def _is_missing_table_error(self, e: Exception) -> bool:
+        return "no such table" in str(e)
+
+    def _filter_sessions(self, stmt, user_id: Optional[str] = None, entity_id: Optional[str] = None):
+        """Filter a select statement by user_id and entity_id, and order it by created_at descending."""
+        if user_id is not None:
+            stmt = stmt.where(self.table.c.user_id == user_id)
+        if entity_id is not None:
+            if self.mode == "agent":
+                stmt = stmt.where(self.table.c.agent_id == entity_id)
+            elif self.mode == "team":
+                stmt = stmt.where(self.table.c.team_id == entity_id)
+            elif self.mode in ["workflow", "workflow_v2"]:
+                stmt = stmt.where(self.table.c.workflow_id == entity_id)
+        return stmt.order_by(self.table.c.created_at.desc())
+
+    def _get_read_stmt(self, session_id: str, user_id: Optional[str] = None):
+        stmt = select(self.table).where(self.table.c.session_id == session_id)
+        if user_id:
+            stmt = stmt.where(self.table.c.user_id == user_id)
+        return stmt
+
+    def _get_recent_sessions_stmt(
+        self, user_id: Optional[str] = None, entity_id: Optional[str] = None, limit: Optional[int] = None
+    ):
+        stmt = self._filter_sessions(select(self.table), user_id=user_id, entity_id=entity_id)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        return stmt
+
+    def _get_session_index_stmt(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ):
+        """Select the summary columns of the sessions, most recently updated first.
+
+        Only the first run is selected from the memory, and one more session than `limit` to know if there is a next page.
+        """
+        if "runs" in self.table.c:
+            first_run = self.table.c.runs[0]
+        else:
+            first_run = self.table.c.memory[("runs", 0)]
+        sort_key = func.coalesce(self.table.c.updated_at, self.table.c.created_at, 0)
+        stmt = select(
+            self.table.c.session_id,
+            self.table.c.user_id,
+            self.table.c.session_data["session_name"].as_string().label("session_name"),
+            first_run.label("first_run"),
+            self.table.c.created_at,
+            self.table.c.updated_at,
+        )
+        stmt = self._filter_sessions(stmt, user_id=user_id, entity_id=entity_id)
+        stmt = stmt.order_by(None).order_by(sort_key.desc(), self.table.c.session_id.desc())
+        if cursor is not None:
+            after_sort_key, after_session_id = decode_cursor(cursor)
+            stmt = stmt.where(
+                or_(
+                    sort_key < after_sort_key,
+                    and_(sort_key == after_sort_key, self.table.c.session_id < after_session_id),
+                )
+            )
+        if limit is not None:
+            stmt = stmt.limit(limit + 1)
+        return stmt
+
+    def _row_to_session(self, row) -> Optional[Session]:
+        """Convert a row of the table to a Session of the storage mode."""
+        if self.mode == "agent":
+            return AgentSession.from_dict(row._mapping)  # type: ignore
+        elif self.mode == "team":
+            return TeamSession.from_dict(row._mapping)  # type: ignore
+        elif self.mode == "workflow":
+            return WorkflowSession.from_dict(row._mapping)  # type: ignore
+        elif self.mode == "workflow_v2":
+            return WorkflowSessionV2.from_dict(row._mapping)  # type: ignore
+        return None
+
+    def _rows_to_sessions(self, rows) -> List[Session]:
+        sessions: List[Session] = []
+        for row in rows:
+            session = self._row_to_session(row)
+            if session is not None:
+                sessions.append(session)
+        return sessions
+
     def read(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
         """
         Read a Session from the database.
@@ -240,20 +340,10 @@ class SqliteStorage(Storage):
         """
         try:
             with self.SqlSession() as sess:
-                stmt = select(self.table).where(self.table.c.session_id == session_id)
-                if user_id:
-                    stmt = stmt.where(self.table.c.user_id == user_id)
-                result = sess.execute(stmt).fetchone()
-                if self.mode == "agent":
-                    return AgentSession.from_dict(result._mapping) if result is not None else None  # type: ignore
-                elif self.mode == "team":
-                    return TeamSession.from_dict(result._mapping) if result is not None else None  # type: ignore
-                elif self.mode == "workflow":
-                    return WorkflowSession.from_dict(result._mapping) if result is not None else None  # type: ignore
-                elif self.mode == "workflow_v2":
-                    return WorkflowSessionV2.from_dict(result._mapping) if result is not None else None  # type: ignore
+                result = sess.execute(self._get_read_stmt(session_id, user_id)).fetchone()
+                return self._row_to_session(result) if result is not None else None
         except Exception as e:
-            if "no such table" in str(e):
+            if self._is_missing_table_error(e):
                 log_debug(f"Table does not exist: {self.table.name}")
                 self.create()
             else:
@@ -273,26 +363,11 @@ class SqliteStorage(Storage):
         """
         try:
             with self.SqlSession() as sess, sess.begin():
-                # get all session_ids
-                stmt = select(self.table.c.session_id)
-                if user_id is not None:
-                    stmt = stmt.where(self.table.c.user_id == user_id)
-                if entity_id is not None:
-                    if self.mode == "agent":
-                        stmt = stmt.where(self.table.c.agent_id == entity_id)
-                    elif self.mode == "team":
-                        stmt = stmt.where(self.table.c.team_id == entity_id)
-                    elif self.mode == "workflow":
-                        stmt = stmt.where(self.table.c.workflow_id == entity_id)
-                    elif self.mode == "workflow_v2":
-                        stmt = stmt.where(self.table.c.workflow_id == entity_id)
-                # order by created_at desc
-                stmt = stmt.order_by(self.table.c.created_at.desc())
-                # execute query
+                stmt = self._filter_sessions(select(self.table.c.session_id), user_id=user_id, entity_id=entity_id)
                 rows = sess.execute(stmt).fetchall()
                 return [row[0] for row in rows] if rows is not None else []
         except Exception as e:
-            if "no such table" in str(e):
+            if self._is_missing_table_error(e):
                 log_debug(f"Table does not exist: {self.table.name}")
                 self.create()
             else:
@@ -312,34 +387,10 @@ class SqliteStorage(Storage):
         """
         try:
             with self.SqlSession() as sess, sess.begin():
-                # get all sessions
-                stmt = select(self.table)
-                if user_id is not None:
-                    stmt = stmt.where(self.table.c.user_id == user_id)
-                if entity_id is not None:
-                    if self.mode == "agent":
-                        stmt = stmt.where(self.table.c.agent_id == entity_id)
-                    elif self.mode == "team":
-                        stmt = stmt.where(self.table.c.team_id == entity_id)
-                    elif self.mode in ["workflow", "workflow_v2"]:
-                        stmt = stmt.where(self.table.c.workflow_id == entity_id)
-                # order by created_at desc
-                stmt = stmt.order_by(self.table.c.created_at.desc())
-
-                rows = sess.execute(stmt).fetchall()
-                if rows is not None:
-                    if self.mode == "agent":
-                        return [AgentSession.from_dict(row._mapping) for row in rows]  # type: ignore
-                    elif self.mode == "team":
-                        return [TeamSession.from_dict(row._mapping) for row in rows]  # type: ignore
-                    elif self.mode == "workflow":
-                        return [WorkflowSession.from_dict(row._mapping) for row in rows]  # type: ignore
-                    elif self.mode == "workflow_v2":
-                        return [WorkflowSessionV2.from_dict(row._mapping) for row in rows]  # type: ignore
-                else:
-                    return []
+                rows = sess.execute(self._get_recent_sessions_stmt(user_id=user_id, entity_id=entity_id)).fetchall()
+                return self._rows_to_sessions(rows) if rows is not None else []
         except Exception as e:
-            if "no such table" in str(e):
+            if self._is_missing_table_error(e):
                 log_debug(f"Table does not exist: {self.table.name}")
                 self.create()
             else:
@@ -365,43 +416,49 @@ class SqliteStorage(Storage):
         """
         try:
             with self.SqlSession() as sess, sess.begin():
-                # Build the query
-                stmt = select(self.table)
-                if user_id is not None:
-                    stmt = stmt.where(self.table.c.user_id == user_id)
-                if entity_id is not None:
-                    if self.mode == "agent":
-                        stmt = stmt.where(self.table.c.agent_id == entity_id)
-                    elif self.mode == "team":
-                        stmt = stmt.where(self.table.c.team_id == entity_id)
-                    elif self.mode in ["workflow", "workflow_v2"]:
-                        stmt = stmt.where(self.table.c.workflow_id == entity_id)
-
-                # Order by created_at desc and limit to num_history_sessions
-                stmt = stmt.order_by(self.table.c.created_at.desc())
-                if limit is not None:
-                    stmt = stmt.limit(limit)
-
-                # Execute query
+                stmt = self._get_recent_sessions_stmt(user_id=user_id, entity_id=entity_id, limit=limit)
                 rows = sess.execute(stmt).fetchall()
-                if rows is not None:
-                    if self.mode == "agent":  # type: ignore
-                        return [AgentSession.from_dict(row._mapping) for row in rows]  # type: ignore
-                    elif self.mode == "team":
-                        return [TeamSession.from_dict(row._mapping) for row in rows]  # type: ignore
-                    elif self.mode == "workflow":
-                        return [WorkflowSession.from_dict(row._mapping) for row in rows]  # type: ignore
-                    elif self.mode == "workflow_v2":
-                        return [WorkflowSessionV2.from_dict(row._mapping) for row in rows]  # type: ignore
-                return []
+                return self._rows_to_sessions(rows) if rows is not None else []
         except Exception as e:
-            if "no such table" in str(e):
+            if self._is_missing_table_error(e):
                 log_debug(f"Table does not exist: {self.table.name}")
                 self.create()
             else:
                 log_debug(f"Exception reading from table: {e}")
         return []
 
+    def get_session_index(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> SessionIndexPage:
+        """
+        Get a page of session summaries, most recently updated first, without loading the memory of the sessions.
+
+        Args:
+            user_id: Filter by user ID
+            entity_id: Filter by entity ID (agent_id, team_id, or workflow_id)
+            limit: Maximum number of sessions in the page. All sessions if None.
+            cursor: `next_cursor` of the previous page
+
+        Returns:
+            SessionIndexPage: The sessions of the page and the cursor of the next page
+        """
+        stmt = self._get_session_index_stmt(user_id=user_id, entity_id=entity_id, limit=limit, cursor=cursor)
+        try:
+            with self.SqlSession() as sess, sess.begin():
+                rows = sess.execute(stmt).fetchall()
+                return SessionIndexPage.from_entries([SessionIndexEntry.from_row(row) for row in rows], limit=limit)
+        except Exception as e:
+            if self._is_missing_table_error(e):
+                log_debug(f"Table does not exist: {self.table.name}")
+                self.create()
+            else:
+                log_debug(f"Exception reading from table: {e}")
+        return SessionIndexPage()
+
     def upgrade_schema(self) -> None:
         """
         Upgrade the schema of the storage table.
@@ -430,6 +487,58 @@ class SqliteStorage(Storage):
             logger.error(f"Error during schema upgrade: {e}")
             raise
 
+    def _get_upsert_stmt(self, session: Session):
+        """Build the statement inserting a session, or updating it if the session_id already exists."""
+        if self.mode == "agent":
+            values = dict(
+                agent_id=session.agent_id,  # type: ignore
+                team_session_id=session.team_session_id,  # type: ignore
+                user_id=session.user_id,
+                memory=getattr(session, "memory", None),
+                agent_data=session.agent_data,  # type: ignore
+                session_data=session.session_data,
+                extra_data=session.extra_data,
+            )
+        elif self.mode == "team":
+            values = dict(
+                team_id=session.team_id,  # type: ignore
+                user_id=session.user_id,
+                team_session_id=session.team_session_id,  # type: ignore
+                memory=getattr(session, "memory", None),
+                team_data=session.team_data,  # type: ignore
+                session_data=session.session_data,
+                extra_data=session.extra_data,
+            )
+        elif self.mode == "workflow":
+            values = dict(
+                workflow_id=session.workflow_id,  # type: ignore
+                user_id=session.user_id,
+                memory=getattr(session, "memory", None),
+                workflow_data=session.workflow_data,  # type: ignore
+                session_data=session.session_data,
+                extra_data=session.extra_data,
+            )
+        elif self.mode == "workflow_v2":
+            # Convert session to dict to ensure proper serialization
+            session_dict = session.to_dict()
+            values = dict(
+                workflow_id=session.workflow_id,  # type: ignore
+                workflow_name=session.workflow_name,  # type: ignore
+                user_id=session.user_id,
+                runs=session_dict.get("runs"),
+                workflow_data=session.workflow_data,  # type: ignore
+                session_data=session.session_data,
+                extra_data=session.extra_data,
+            )
+
+        stmt = sqlite.insert(self.table).values(session_id=session.session_id, **values)
+        # Define the upsert if the session_id already exists
+        # See: https://docs.sqlalchemy.org/en/20/dialects/sqlite.html#insert-on-conflict-upsert
+        return stmt.on_conflict_do_update(
+            index_elements=["session_id"],
+            set_=dict(**values, updated_at=int(time.time())),
+        )
+
     def upsert(self, session: Session, create_and_retry: bool = True) -> Optional[Session]:
         """
         Insert or update a Session in the database.
@@ -447,119 +556,7 @@ class SqliteStorage(Storage):
 
         try:
             with self.SqlSession() as sess, sess.begin():
-                if self.mode == "agent":
-                    # Create an insert statement
-                    stmt = sqlite.insert(self.table).values(
-                        session_id=session.session_id,
-                        agent_id=session.agent_id,  # type: ignore
-                        team_session_id=session.team_session_id,  # type: ignore
-                        user_id=session.user_id,
-                        memory=getattr(session, "memory", None),
-                        agent_data=session.agent_data,  # type: ignore
-                        session_data=session.session_data,
-                        extra_data=session.extra_data,
-                    )
-
-                    # Define the upsert if the session_id already exists
-                    stmt = stmt.on_conflict_do_update(
-                        index_elements=["session_id"],
-                        set_=dict(
-                            agent_id=session.agent_id,  # type: ignore
-                            team_session_id=session.team_session_id,  # type: ignore
-                            user_id=session.user_id,
-                            memory=getattr(session, "memory", None),
-                            agent_data=session.agent_data,  # type: ignore
-                            session_data=session.session_data,
-                            extra_data=session.extra_data,
-                            updated_at=int(time.time()),
-                        ),
-                    )
-                elif self.mode == "team":
-                    # Create an insert statement
-                    stmt = sqlite.insert(self.table).values(
-                        session_id=session.session_id,
-                        team_id=session.team_id,  # type: ignore
-                        user_id=session.user_id,
-                        team_session_id=session.team_session_id,  # type: ignore
-                        memory=getattr(session, "memory", None),
-                        team_data=session.team_data,  # type: ignore
-                        session_data=session.session_data,
-                        extra_data=session.extra_data,
-                    )
-
-                    # Define the upsert if the session_id already exists
-                    # See: https://docs.sqlalchemy.org/en/20/dialects/sqlite.html#insert-on-conflict-upsert
-                    stmt = stmt.on_conflict_do_update(
-                        index_elements=["session_id"],
-                        set_=dict(
-                            team_id=session.team_id,  # type: ignore
-                            user_id=session.user_id,
-                            team_session_id=session.team_session_id,  # type: ignore
-                            memory=getattr(session, "memory", None),
-                            team_data=session.team_data,  # type: ignore
-                            session_data=session.session_data,
-                            extra_data=session.extra_data,
-                            updated_at=int(time.time()),
-                        ),
-                    )
-                elif self.mode == "workflow":
-                    # Create an insert statement
-                    stmt = sqlite.insert(self.table).values(
-                        session_id=session.session_id,
-                        workflow_id=session.workflow_id,  # type: ignore
-                        user_id=session.user_id,
-                        memory=getattr(session, "memory", None),
-                        workflow_data=session.workflow_data,  # type: ignore
-                        session_data=session.session_data,
-                        extra_data=session.extra_data,
-                    )
-
-                    # Define the upsert if the session_id already exists
-                    # See: https://docs.sqlalchemy.org/en/20/dialects/sqlite.html#insert-on-conflict-upsert
-                    stmt = stmt.on_conflict_do_update(
-                        index_elements=["session_id"],
-                        set_=dict(
-                            workflow_id=session.workflow_id,  # type: ignore
-                            user_id=session.user_id,
-                            memory=getattr(session, "memory", None),
-                            workflow_data=session.workflow_data,  # type: ignore
-                            session_data=session.session_data,
-                            extra_data=session.extra_data,
-                            updated_at=int(time.time()),
-                        ),
-                    )
-                elif self.mode == "workflow_v2":
-                    # Convert session to dict to ensure proper serialization
-                    session_dict = session.to_dict()
-
-                    # Create an insert statement for WorkflowSessionV2
-                    stmt = sqlite.insert(self.table).values(
-                        session_id=session.session_id,
-                        workflow_id=session.workflow_id,  # type: ignore
-                        workflow_name=session.workflow_name,  # type: ignore
-                        user_id=session.user_id,
-                        runs=session_dict.get("runs"),
-                        workflow_data=session.workflow_data,  # type: ignore
-                        session_data=session.session_data,
-                        extra_data=session.extra_data,
-                    )
-
-                    # Define the upsert if the session_id already exists
-                    stmt = stmt.on_conflict_do_update(
-                        index_elements=["session_id"],
-                        set_=dict(
-                            workflow_id=session.workflow_id,  # type: ignore
-                            workflow_name=session.workflow_name,  # type: ignore
-                            user_id=session.user_id,
-                            runs=session_dict.get("runs"),
-                            workflow_data=session.workflow_data,  # type: ignore
-                            session_data=session.session_data,
-                            extra_data=session.extra_data,
-                            updated_at=int(time.time()),
-                        ),
-                    )
-
-                sess.execute(stmt)
+                sess.execute(self._get_upsert_stmt(session))
         except Exception as e:
             if create_and_retry and not self.table_exists():
                 log_debug(f"Table does not exist: {self.table.name}")
@@ -612,6 +609,157 @@ class SqliteStorage(Storage):
             self.metadata = MetaData()
             self.table = self.get_table()
 
+    @property
+    def in_memory(self) -> bool:
+        return self.db_engine.url.database in (None, "", ":memory:")
+
+    async def _acall_sync(self, func: Callable[..., T], *args: Any) -> T:
+        # Each thread gets its own connection, and so its own empty database, when the database is in memory
+        if self.in_memory:
+            return func(*args)
+        return await super()._acall_sync(func, *args)
+
+    def _get_async_engine(self) -> Optional["AsyncEngine"]:
+        """Return the async engine, or None if no async driver is installed."""
+        if self.async_db_engine is not None:
+            return self.async_db_engine
+        # An async engine would connect to another in-memory database
+        if self.in_memory:
+            return None
+        return self._async_engines.get()
+
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
+        """Async version of `read`."""
+        async_engine = self._get_async_engine()
+        if async_engine is None:
+            return await super().aread(session_id, user_id)
+        try:
+            async with async_engine.connect() as conn:
+                result = (await conn.execute(self._get_read_stmt(session_id, user_id))).fetchone()
+                return self._row_to_session(result) if result is not None else None
+        except Exception as e:
+            if self._is_missing_table_error(e):
+                log_debug(f"Table does not exist: {self.table.name}")
+                await self.acreate()
+            else:
+                log_debug(f"Exception reading from table: {e}")
+        return None
+
+    async def aget_all_session_ids(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[str]:
+        """Async version of `get_all_session_ids`."""
+        async_engine = self._get_async_engine()
+        if async_engine is None:
+            return await super().aget_all_session_ids(user_id, entity_id)
+        try:
+            async with async_engine.connect() as conn:
+                stmt = self._filter_sessions(select(self.table.c.session_id), user_id=user_id, entity_id=entity_id)
+                rows = (await conn.execute(stmt)).fetchall()
+                return [row[0] for row in rows]
+        except Exception as e:
+            if self._is_missing_table_error(e):
+                log_debug(f"Table does not exist: {self.table.name}")
+                await self.acreate()
+            else:
+                log_debug(f"Exception reading from table: {e}")
+        return []
+
+    async def aget_all_sessions(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[Session]:
+        """Async version of `get_all_sessions`."""
+        return await self.aget_recent_sessions(user_id=user_id, entity_id=entity_id, limit=None)
+
+    async def aget_recent_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = 2,
+    ) -> List[Session]:
+        """Async version of `get_recent_sessions`."""
+        async_engine = self._get_async_engine()
+        if async_engine is None:
+            return await super().aget_recent_sessions(user_id, entity_id, limit)
+        try:
+            async with async_engine.connect() as conn:
+                stmt = self._get_recent_sessions_stmt(user_id=user_id, entity_id=entity_id, limit=limit)
+                rows = (await conn.execute(stmt)).fetchall()
+                return self._rows_to_sessions(rows)
+        except Exception as e:
+            if self._is_missing_table_error(e):
+                log_debug(f"Table does not exist: {self.table.name}")
+                await self.acreate()
+            else:
+                log_debug(f"Exception reading from table: {e}")
+        return []
+
+    async def aget_session_index(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> SessionIndexPage:
+        """Async version of `get_session_index`."""
+        async_engine = self._get_async_engine()
+        if async_engine is None:
+            return await super().aget_session_index(user_id, entity_id, limit, cursor)
+        stmt = self._get_session_index_stmt(user_id=user_id, entity_id=entity_id, limit=limit, cursor=cursor)
+        try:
+            async with async_engine.connect() as conn:
+                rows = (await conn.execute(stmt)).fetchall()
+                return SessionIndexPage.from_entries([SessionIndexEntry.from_row(row) for row in rows], limit=limit)
+        except Exception as e:
+            if self._is_missing_table_error(e):
+                log_debug(f"Table does not exist: {self.table.name}")
+                await self.acreate()
+            else:
+                log_debug(f"Exception reading from table: {e}")
+        return SessionIndexPage()
+
+    async def aupsert(self, session: Session, create_and_retry: bool = True) -> Optional[Session]:
+        """Async version of `upsert`."""
+        async_engine = self._get_async_engine()
+        if async_engine is None:
+            return await super().aupsert(session)
+
+        # Perform schema upgrade if auto_upgrade_schema is enabled
+        if self.auto_upgrade_schema and not self._schema_up_to_date:
+            await self.aupgrade_schema()
+
+        try:
+            async with async_engine.begin() as conn:
+                await conn.execute(self._get_upsert_stmt(session))
+        except Exception as e:
+            if create_and_retry and not await self._acall_sync(self.table_exists):
+                log_debug(f"Table does not exist: {self.table.name}")
+                log_debug("Creating table and retrying upsert")
+                await self.acreate()
+                return await self.aupsert(session, create_and_retry=False)
+            else:
+                log_warning(f"Exception upserting into table: {e}")
+                log_warning(
+                    "A table upgrade might be required, please review these docs for more information: https://agno.link/upgrade-schema"
+                )
+                return None
+        return await self.aread(session_id=session.session_id)
+
+    async def adelete_session(self, session_id: Optional[str] = None):
+        """Async version of `delete_session`."""
+        async_engine = self._get_async_engine()
+        if async_engine is None:
+            return await super().adelete_session(session_id)
+        if session_id is None:
+            logger.warning("No session_id provided for deletion.")
+            return
+
+        try:
+            async with async_engine.begin() as conn:
+                result = await conn.execute(self.table.delete().where(self.table.c.session_id == session_id))
+                if result.rowcount == 0:
+                    log_debug(f"No session found with session_id: {session_id}")
+                else:
+                    log_debug(f"Successfully deleted session with session_id: {session_id}")
+        except Exception as e:
+            logger.error(f"Error deleting session: {e}")
+
     def __deepcopy__(self, memo):
         """
         Create a deep copy of the SqliteAgentStorage instance, handling unpickleable attributes.
@@ -633,8 +781,8 @@ class SqliteStorage(Storage):
         for k, v in self.__dict__.items():
             if k in {"metadata", "table", "inspector"}:
                 continue
-            # Reuse db_engine and Session without copying
-            elif k in {"db_engine", "SqlSession"}:
+            # Reuse the engines and Session without copying
+            elif k in {"db_engine", "async_db_engine", "_async_engines", "SqlSession"}:
                 setattr(copied_obj, k, v)
             else:
                 setattr(copied_obj, k, deepcopy(v, memo))
@@ -35,15 +35,25 @@ from agno.media import Audio, AudioArtifact, AudioResponse, File, Image, ImageAr
 from agno.memory.agent import AgentMemory
 from agno.memory.team import TeamMemory, TeamRun
 from agno.memory.v2.memory import Memory, SessionSummary
+from agno.memory.v2.processor import MemoryProcessor
 from agno.models.base import Model
 from agno.models.message import Citations, Message, MessageReferences
 from agno.models.response import ModelResponse, ModelResponseEvent, ToolExecution
 from agno.reasoning.step import NextAction, ReasoningStep, ReasoningSteps
 from agno.run.base import RunResponseExtraData, RunStatus
+from agno.run.cancellation import (
+    CancellationToken,
+    aiterate_in_scope,
+    cancellation_scope,
+    close_run_cancellation_token,
+    get_run_cancellation_token,
+    iterate_in_scope,
+)
 from agno.run.messages import RunMessages
 from agno.run.response import RunEvent, RunResponse, RunResponseEvent
 from agno.run.team import TeamRunEvent, TeamRunResponse, TeamRunResponseEvent, ToolCallCompletedEvent
-from agno.storage.base import Storage
+from agno.storage.base import Storage, asession_lock, session_lock
+from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
 from agno.tools.function import Function
 from agno.tools.toolkit import Toolkit
@@ -248,6 +258,9 @@ class Team:
     enable_session_summaries: bool = False
     # If True, the agent adds a reference to the session summaries in the response
     add_session_summary_references: Optional[bool] = None
+    # If provided, user memories and session summaries are created in the background by the processor,
+    # instead of at the end of each run
+    memory_processor: Optional[MemoryProcessor] = None
 
     # --- Team History ---
     # If True, enable the team history (Deprecated in favor of add_history_to_messages)
@@ -354,6 +367,7 @@ class Team:
         add_memory_references: Optional[bool] = None,
         enable_session_summaries: bool = False,
         add_session_summary_references: Optional[bool] = None,
+        memory_processor: Optional[MemoryProcessor] = None,
         enable_team_history: bool = False,
         add_history_to_messages: bool = False,
         num_of_interactions_from_history: Optional[int] = None,
@@ -442,6 +456,7 @@ class Team:
         self.add_memory_references = add_memory_references
         self.enable_session_summaries = enable_session_summaries
         self.add_session_summary_references = add_session_summary_references
+        self.memory_processor = memory_processor
 
         self.enable_team_history = enable_team_history
         self.add_history_to_messages = add_history_to_messages
@@ -736,6 +751,37 @@ class Team:
 
         return session_id, user_id
 
+    def _cancellable_run_stream(
+        self,
+        response_iterator: Iterator[Union[RunResponseEvent, TeamRunResponseEvent]],
+        run_response: TeamRunResponse,
+        cancellation_token: CancellationToken,
+    ) -> Iterator[Union[RunResponseEvent, TeamRunResponseEvent]]:
+        """Yield the events of a streamed run, ending it with a RunCancelled event if the run is cancelled."""
+        try:
+            yield from iterate_in_scope(response_iterator, cancellation_token)
+        except RunCancelledException as e:
+            run_response.status = RunStatus.cancelled
+            yield create_team_run_response_cancelled_event(run_response, str(e))
+        finally:
+            close_run_cancellation_token(cancellation_token)
+
+    async def _acancellable_run_stream(
+        self,
+        response_iterator: AsyncIterator[Union[RunResponseEvent, TeamRunResponseEvent]],
+        run_response: TeamRunResponse,
+        cancellation_token: CancellationToken,
+    ) -> AsyncIterator[Union[RunResponseEvent, TeamRunResponseEvent]]:
+        """Async version of `_cancellable_run_stream`."""
+        try:
+            async for event in aiterate_in_scope(response_iterator, cancellation_token):
+                yield event
+        except RunCancelledException as e:
+            run_response.status = RunStatus.cancelled
+            yield create_team_run_response_cancelled_event(run_response, str(e))
+        finally:
+            close_run_cancellation_token(cancellation_token)
+
     @overload
     def run(
         self,
@@ -752,6 +798,8 @@ class Team:
         videos: Optional[Sequence[Video]] = None,
         files: Optional[Sequence[File]] = None,
         knowledge_filters: Optional[Dict[str, Any]] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
         **kwargs: Any,
     ) -> TeamRunResponse: ...
 
@@ -771,6 +819,8 @@ class Team:
         videos: Optional[Sequence[Video]] = None,
         files: Optional[Sequence[File]] = None,
         knowledge_filters: Optional[Dict[str, Any]] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
         **kwargs: Any,
     ) -> Iterator[Union[RunResponseEvent, TeamRunResponseEvent]]: ...
 
@@ -789,208 +839,229 @@ class Team:
         videos: Optional[Sequence[Video]] = None,
         files: Optional[Sequence[File]] = None,
         knowledge_filters: Optional[Dict[str, Any]] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
         **kwargs: Any,
     ) -> Union[TeamRunResponse, Iterator[Union[RunResponseEvent, TeamRunResponseEvent]]]:
-        """Run the Team and return the response."""
+        """Run the Team and return the response.
 
-        session_id, user_id = self._initialize_session(
-            session_id=session_id, user_id=user_id, session_state=session_state
-        )
-        log_debug(f"Session ID: {session_id}", center=True)
+        The run is cancelled when `cancellation_token` is cancelled or after `timeout` seconds,
+        together with its model requests, tool calls and member runs. A cancelled or timed out run does not raise:
+        it returns a response with the cancelled status, or ends its stream with a RunCancelled event.
+        """
+        cancellation_token = get_run_cancellation_token(cancellation_token, timeout)
+        # A streamed run closes its token when the stream ends
+        stream_owns_token = False
+        try:
+            session_id, user_id = self._initialize_session(
+                session_id=session_id, user_id=user_id, session_state=session_state
+            )
+            log_debug(f"Session ID: {session_id}", center=True)
 
-        # Initialize Team
-        self.initialize_team(session_id=session_id)
+            # Initialize Team
+            self.initialize_team(session_id=session_id)
 
-        # Read existing session from storage
-        self.read_from_storage(session_id=session_id)
+            # Read existing session from storage
+            self.read_from_storage(session_id=session_id)
 
-        # Initialize Knowledge Filters
-        effective_filters = knowledge_filters
+            # Initialize Knowledge Filters
+            effective_filters = knowledge_filters
 
-        # When filters are passed manually
-        if self.knowledge_filters or knowledge_filters:
-            """
-                initialize metadata (specially required in case when load is commented out)
-                when load is not called the reader's document_lists won't be called and metadata filters won't be initialized
-                so we need to call initialize_valid_filters to make sure the filters are initialized
-            """
-            if not self.knowledge.valid_metadata_filters:  # type: ignore
+            # When filters are passed manually
+            if self.knowledge_filters or knowledge_filters:
+                """
+                    initialize metadata (specially required in case when load is commented out)
+                    when load is not called the reader's document_lists won't be called and metadata filters won't be initialized
+                    so we need to call initialize_valid_filters to make sure the filters are initialized
+                """
+                if not self.knowledge.valid_metadata_filters:  # type: ignore
+                    self.knowledge.initialize_valid_filters()  # type: ignore
+
+                effective_filters = self._get_team_effective_filters(knowledge_filters)
+
+            # Agentic filters are enabled
+            if self.enable_agentic_knowledge_filters and not self.knowledge.valid_metadata_filters:  # type: ignore
+                # initialize metadata (specially required in case when load is commented out)
                 self.knowledge.initialize_valid_filters()  # type: ignore
 
-            effective_filters = self._get_team_effective_filters(knowledge_filters)
+            # Use stream override value when necessary
+            if stream is None:
+                stream = False if self.stream is None else self.stream
 
-        # Agentic filters are enabled
-        if self.enable_agentic_knowledge_filters and not self.knowledge.valid_metadata_filters:  # type: ignore
-            # initialize metadata (specially required in case when load is commented out)
-            self.knowledge.initialize_valid_filters()  # type: ignore
+            if stream_intermediate_steps is None:
+                stream_intermediate_steps = (
+                    False if self.stream_intermediate_steps is None else self.stream_intermediate_steps
+                )
 
-        # Use stream override value when necessary
-        if stream is None:
-            stream = False if self.stream is None else self.stream
+            # Can't have stream_intermediate_steps if stream is False
+            if stream is False:
+                stream_intermediate_steps = False
 
-        if stream_intermediate_steps is None:
-            stream_intermediate_steps = (
-                False if self.stream_intermediate_steps is None else self.stream_intermediate_steps
+            self.stream = self.stream or stream
+            self.stream_intermediate_steps = self.stream_intermediate_steps or (
+                stream_intermediate_steps and self.stream
             )
 
-        # Can't have stream_intermediate_steps if stream is False
-        if stream is False:
-            stream_intermediate_steps = False
+            # Read existing session from storage
+            if self.context is not None:
+                self._resolve_run_context()
 
-        self.stream = self.stream or stream
-        self.stream_intermediate_steps = self.stream_intermediate_steps or (stream_intermediate_steps and self.stream)
+            # Configure the model for runs
+            self._set_default_model()
+            response_format: Optional[Union[Dict, Type[BaseModel]]] = (
+                self._get_response_format() if self.parser_model is None else None
+            )
 
-        # Read existing session from storage
-        if self.context is not None:
-            self._resolve_run_context()
+            self.model = cast(Model, self.model)
+            self.determine_tools_for_model(
+                model=self.model,
+                session_id=session_id,
+                user_id=user_id,
+                async_mode=False,
+                knowledge_filters=effective_filters,
+                message=message,
+                images=images,
+                videos=videos,
+                audio=audio,
+                files=files,
+            )
 
-        # Configure the model for runs
-        self._set_default_model()
-        response_format: Optional[Union[Dict, Type[BaseModel]]] = (
-            self._get_response_format() if self.parser_model is None else None
-        )
+            # Create a run_id for this specific run
+            run_id = str(uuid4())
 
-        self.model = cast(Model, self.model)
-        self.determine_tools_for_model(
-            model=self.model,
-            session_id=session_id,
-            user_id=user_id,
-            async_mode=False,
-            knowledge_filters=effective_filters,
-            message=message,
-            images=images,
-            videos=videos,
-            audio=audio,
-            files=files,
-        )
+            # Create a new run_response for this attempt
+            run_response = TeamRunResponse(
+                run_id=run_id,
+                session_id=session_id,
+                team_session_id=self.team_session_id,
+                team_id=self.team_id,
+                team_name=self.name,
+            )
 
-        # Create a run_id for this specific run
-        run_id = str(uuid4())
+            run_response.model = self.model.id if self.model is not None else None
+            run_response.model_provider = self.model.provider if self.model is not None else None
 
-        # Create a new run_response for this attempt
-        run_response = TeamRunResponse(
-            run_id=run_id,
-            session_id=session_id,
-            team_session_id=self.team_session_id,
-            team_id=self.team_id,
-            team_name=self.name,
-        )
+            self.run_response = run_response
+            self.run_id = run_id
 
-        run_response.model = self.model.id if self.model is not None else None
-        run_response.model_provider = self.model.provider if self.model is not None else None
+            retries = retries or 3
 
-        self.run_response = run_response
-        self.run_id = run_id
+            # Run the team
+            last_exception = None
+            num_attempts = retries + 1
 
-        retries = retries or 3
+            for attempt in range(num_attempts):
+                # Initialize the current run
 
-        # Run the team
-        last_exception = None
-        num_attempts = retries + 1
+                log_debug(f"Team Run Start: {self.run_id}", center=True)
+                log_debug(f"Mode: '{self.mode}'", center=True)
 
-        for attempt in range(num_attempts):
-            # Initialize the current run
+                # Set run_input
+                if message is not None:
+                    if isinstance(message, str):
+                        self.run_input = message
+                    elif isinstance(message, Message):
+                        self.run_input = message.to_dict()
+                    else:
+                        self.run_input = message
 
-            log_debug(f"Team Run Start: {self.run_id}", center=True)
-            log_debug(f"Mode: '{self.mode}'", center=True)
+                # Run the team
+                try:
+                    # Prepare run messages
+                    if self.mode == "route":
+                        run_messages: RunMessages = self.get_run_messages(
+                            session_id=session_id,
+                            user_id=user_id,
+                            message=message,
+                            audio=audio,
+                            images=images,
+                            videos=videos,
+                            files=files,
+                            knowledge_filters=effective_filters,
+                            **kwargs,
+                        )
+                    else:
+                        run_messages = self.get_run_messages(
+                            session_id=session_id,
+                            user_id=user_id,
+                            message=message,
+                            audio=audio,
+                            images=images,
+                            videos=videos,
+                            files=files,
+                            knowledge_filters=effective_filters,
+                            **kwargs,
+                        )
+                    self.run_messages = run_messages
+                    if len(run_messages.messages) == 0:
+                        log_error("No messages to be sent to the model.")
+
+                    if stream:
+                        response_iterator = self._run_stream(
+                            run_response=self.run_response,
+                            run_messages=run_messages,
+                            stream_intermediate_steps=stream_intermediate_steps,
+                            session_id=session_id,
+                            user_id=user_id,
+                            response_format=response_format,
+                        )
+                        if cancellation_token is not None:
+                            stream_owns_token = True
+                            return self._cancellable_run_stream(response_iterator, run_response, cancellation_token)
+                        return response_iterator
+                    else:
+                        with cancellation_scope(cancellation_token):
+                            return self._run(
+                                run_response=self.run_response,
+                                run_messages=run_messages,
+                                session_id=session_id,
+                                user_id=user_id,
+                                response_format=response_format,
+                            )
 
-            # Set run_input
-            if message is not None:
-                if isinstance(message, str):
-                    self.run_input = message
-                elif isinstance(message, Message):
-                    self.run_input = message.to_dict()
-                else:
-                    self.run_input = message
+                except ModelProviderError as e:
+                    import time
 
-            # Run the team
-            try:
-                # Prepare run messages
-                if self.mode == "route":
-                    run_messages: RunMessages = self.get_run_messages(
-                        session_id=session_id,
-                        user_id=user_id,
-                        message=message,
-                        audio=audio,
-                        images=images,
-                        videos=videos,
-                        files=files,
-                        knowledge_filters=effective_filters,
-                        **kwargs,
-                    )
-                else:
-                    run_messages = self.get_run_messages(
-                        session_id=session_id,
-                        user_id=user_id,
-                        message=message,
-                        audio=audio,
-                        images=images,
-                        videos=videos,
-                        files=files,
-                        knowledge_filters=effective_filters,
-                        **kwargs,
-                    )
-                self.run_messages = run_messages
-                if len(run_messages.messages) == 0:
-                    log_error("No messages to be sent to the model.")
+                    log_warning(f"Attempt {attempt + 1}/{num_attempts} failed: {str(e)}")
 
-                if stream:
-                    response_iterator = self._run_stream(
-                        run_response=self.run_response,
-                        run_messages=run_messages,
-                        stream_intermediate_steps=stream_intermediate_steps,
-                        session_id=session_id,
-                        user_id=user_id,
-                        response_format=response_format,
-                    )
+                    last_exception = e
+                    if attempt < num_attempts - 1:
+                        time.sleep(2**attempt)
+                except (KeyboardInterrupt, RunCancelledException) as e:
+                    reason = str(e) if isinstance(e, RunCancelledException) else "Operation cancelled by user"
+                    if stream:
+                        return generator_wrapper(create_team_run_response_cancelled_event(run_response, reason))
+                    else:
+                        return self._create_run_response(
+                            run_state=RunStatus.cancelled,
+                            content=reason,
+                            from_run_response=run_response,
+                            session_id=session_id,
+                        )
+                finally:
+                    self._reset_session_state()
 
-                    return response_iterator
-                else:
-                    return self._run(
-                        run_response=self.run_response,
-                        run_messages=run_messages,
-                        session_id=session_id,
-                        user_id=user_id,
-                        response_format=response_format,
+            # If we get here, all retries failed
+            if last_exception is not None:
+                log_error(
+                    f"Failed after {num_attempts} attempts. Last error using {last_exception.model_name}({last_exception.model_id})"
+                )
+                if stream:
+                    return generator_wrapper(
+                        create_team_run_response_error_event(run_response, error=str(last_exception))
                     )
 
-            except ModelProviderError as e:
-                import time
-
-                log_warning(f"Attempt {attempt + 1}/{num_attempts} failed: {str(e)}")
-
-                last_exception = e
-                if attempt < num_attempts - 1:
-                    time.sleep(2**attempt)
-            except (KeyboardInterrupt, RunCancelledException):
+                raise last_exception
+            else:
                 if stream:
                     return generator_wrapper(
-                        create_team_run_response_cancelled_event(run_response, "Operation cancelled by user")
+                        create_team_run_response_error_event(run_response, error=str(last_exception))
                     )
-                else:
-                    return self._create_run_response(
-                        run_state=RunStatus.cancelled,
-                        content="Operation cancelled by user",
-                        from_run_response=run_response,
-                        session_id=session_id,
-                    )
-            finally:
-                self._reset_session_state()
 
-        # If we get here, all retries failed
-        if last_exception is not None:
-            log_error(
-                f"Failed after {num_attempts} attempts. Last error using {last_exception.model_name}({last_exception.model_id})"
-            )
-            if stream:
-                return generator_wrapper(create_team_run_response_error_event(run_response, error=str(last_exception)))
-
-            raise last_exception
-        else:
-            if stream:
-                return generator_wrapper(create_team_run_response_error_event(run_response, error=str(last_exception)))
-
-            raise Exception(f"Failed after {num_attempts} attempts.")
+                raise Exception(f"Failed after {num_attempts} attempts.")
+        finally:
+            if not stream_owns_token:
+                close_run_cancellation_token(cancellation_token)
 
     def _run(
         self,
@@ -1156,6 +1227,8 @@ class Team:
         videos: Optional[Sequence[Video]] = None,
         files: Optional[Sequence[File]] = None,
         knowledge_filters: Optional[Dict[str, Any]] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
         **kwargs: Any,
     ) -> TeamRunResponse: ...
 
@@ -1175,6 +1248,8 @@ class Team:
         videos: Optional[Sequence[Video]] = None,
         files: Optional[Sequence[File]] = None,
         knowledge_filters: Optional[Dict[str, Any]] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
         **kwargs: Any,
     ) -> AsyncIterator[Union[RunResponseEvent, TeamRunResponseEvent]]: ...
 
@@ -1193,197 +1268,220 @@ class Team:
         videos: Optional[Sequence[Video]] = None,
         files: Optional[Sequence[File]] = None,
         knowledge_filters: Optional[Dict[str, Any]] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
         **kwargs: Any,
     ) -> Union[TeamRunResponse, AsyncIterator[Union[RunResponseEvent, TeamRunResponseEvent]]]:
-        """Run the Team asynchronously and return the response."""
-        session_id, user_id = self._initialize_session(
-            session_id=session_id, user_id=user_id, session_state=session_state
-        )
-        log_debug(f"Session ID: {session_id}", center=True)
+        """Run the Team asynchronously and return the response.
 
-        # Initialize Team
-        self.initialize_team(session_id=session_id)
+        The run is cancelled when `cancellation_token` is cancelled or after `timeout` seconds,
+        together with its model requests, tool calls and member runs. A cancelled or timed out run does not raise:
+        it returns a response with the cancelled status, or ends its stream with a RunCancelled event.
+        """
+        cancellation_token = get_run_cancellation_token(cancellation_token, timeout)
+        # A streamed run closes its token when the stream ends
+        stream_owns_token = False
+        try:
+            session_id, user_id = self._initialize_session(
+                session_id=session_id, user_id=user_id, session_state=session_state
+            )
+            log_debug(f"Session ID: {session_id}", center=True)
 
-        # Read existing session from storage
-        self.read_from_storage(session_id=session_id)
+            # Initialize Team
+            self.initialize_team(session_id=session_id)
 
-        effective_filters = knowledge_filters
+            # Read existing session from storage
+            await self.aread_from_storage(session_id=session_id)
 
-        # When filters are passed manually
-        if self.knowledge_filters or knowledge_filters:
-            """
-                initialize metadata (specially required in case when load is commented out)
-                when load is not called the reader's document_lists won't be called and metadata filters won't be initialized
-                so we need to call initialize_valid_filters to make sure the filters are initialized
-            """
-            if not self.knowledge.valid_metadata_filters:  # type: ignore
-                self.knowledge.initialize_valid_filters()  # type: ignore
+            effective_filters = knowledge_filters
 
-            effective_filters = self._get_team_effective_filters(knowledge_filters)
+            # When filters are passed manually
+            if self.knowledge_filters or knowledge_filters:
+                """
+                    initialize metadata (specially required in case when load is commented out)
+                    when load is not called the reader's document_lists won't be called and metadata filters won't be initialized
+                    so we need to call initialize_valid_filters to make sure the filters are initialized
+                """
+                if not self.knowledge.valid_metadata_filters:  # type: ignore
+                    self.knowledge.initialize_valid_filters()  # type: ignore
 
-        # Use stream override value when necessary
-        if stream is None:
-            stream = False if self.stream is None else self.stream
+                effective_filters = self._get_team_effective_filters(knowledge_filters)
 
-        if stream_intermediate_steps is None:
-            stream_intermediate_steps = (
-                False if self.stream_intermediate_steps is None else self.stream_intermediate_steps
-            )
+            # Use stream override value when necessary
+            if stream is None:
+                stream = False if self.stream is None else self.stream
 
-        # Can't have stream_intermediate_steps if stream is False
-        if stream is False:
-            stream_intermediate_steps = False
+            if stream_intermediate_steps is None:
+                stream_intermediate_steps = (
+                    False if self.stream_intermediate_steps is None else self.stream_intermediate_steps
+                )
 
-        self.stream = self.stream or stream
-        self.stream_intermediate_steps = self.stream_intermediate_steps or (stream_intermediate_steps and self.stream)
+            # Can't have stream_intermediate_steps if stream is False
+            if stream is False:
+                stream_intermediate_steps = False
 
-        # Read existing session from storage
-        if self.context is not None:
-            self._resolve_run_context()
+            self.stream = self.stream or stream
+            self.stream_intermediate_steps = self.stream_intermediate_steps or (
+                stream_intermediate_steps and self.stream
+            )
 
-        # Configure the model for runs
-        self._set_default_model()
-        response_format: Optional[Union[Dict, Type[BaseModel]]] = (
-            self._get_response_format() if self.parser_model is None else None
-        )
+            # Read existing session from storage
+            if self.context is not None:
+                self._resolve_run_context()
 
-        self.model = cast(Model, self.model)
-        self.determine_tools_for_model(
-            model=self.model,
-            session_id=session_id,
-            user_id=user_id,
-            async_mode=True,
-            knowledge_filters=effective_filters,
-            message=message,
-            images=images,
-            videos=videos,
-            audio=audio,
-            files=files,
-        )
+            # Configure the model for runs
+            self._set_default_model()
+            response_format: Optional[Union[Dict, Type[BaseModel]]] = (
+                self._get_response_format() if self.parser_model is None else None
+            )
 
-        # Create a run_id for this specific run
-        run_id = str(uuid4())
+            self.model = cast(Model, self.model)
+            self.determine_tools_for_model(
+                model=self.model,
+                session_id=session_id,
+                user_id=user_id,
+                async_mode=True,
+                knowledge_filters=effective_filters,
+                message=message,
+                images=images,
+                videos=videos,
+                audio=audio,
+                files=files,
+            )
 
-        # Create a new run_response for this attempt
-        run_response = TeamRunResponse(
-            run_id=run_id,
-            session_id=session_id,
-            team_session_id=self.team_session_id,
-            team_id=self.team_id,
-            team_name=self.name,
-        )
+            # Create a run_id for this specific run
+            run_id = str(uuid4())
 
-        run_response.model = self.model.id if self.model is not None else None
-        run_response.model_provider = self.model.provider if self.model is not None else None
+            # Create a new run_response for this attempt
+            run_response = TeamRunResponse(
+                run_id=run_id,
+                session_id=session_id,
+                team_session_id=self.team_session_id,
+                team_id=self.team_id,
+                team_name=self.name,
+            )
 
-        self.run_response = run_response
-        self.run_id = run_id
+            run_response.model = self.model.id if self.model is not None else None
+            run_response.model_provider = self.model.provider if self.model is not None else None
 
-        retries = retries or 3
+            self.run_response = run_response
+            self.run_id = run_id
 
-        # Run the team
-        last_exception = None
-        num_attempts = retries + 1
+            retries = retries or 3
 
-        for attempt in range(num_attempts):
-            log_debug(f"Team Run Start: {self.run_id}", center=True)
-            log_debug(f"Mode: '{self.mode}'", center=True)
+            # Run the team
+            last_exception = None
+            num_attempts = retries + 1
+
+            for attempt in range(num_attempts):
+                log_debug(f"Team Run Start: {self.run_id}", center=True)
+                log_debug(f"Mode: '{self.mode}'", center=True)
+
+                # Set run_input
+                if message is not None:
+                    if isinstance(message, str):
+                        self.run_input = message
+                    elif isinstance(message, Message):
+                        self.run_input = message.to_dict()
+                    else:
+                        self.run_input = message
 
-            # Set run_input
-            if message is not None:
-                if isinstance(message, str):
-                    self.run_input = message
-                elif isinstance(message, Message):
-                    self.run_input = message.to_dict()
-                else:
-                    self.run_input = message
+                # Run the team
+                try:
+                    # Prepare run messages
+                    if self.mode == "route":
+                        # In route mode the model shouldn't get images/audio/video
+                        run_messages: RunMessages = self.get_run_messages(
+                            session_id=session_id,
+                            user_id=user_id,
+                            message=message,
+                            audio=audio,
+                            images=images,
+                            videos=videos,
+                            files=files,
+                            knowledge_filters=effective_filters,
+                            **kwargs,
+                        )
+                    else:
+                        run_messages = self.get_run_messages(
+                            session_id=session_id,
+                            user_id=user_id,
+                            message=message,
+                            audio=audio,
+                            images=images,
+                            videos=videos,
+                            files=files,
+                            knowledge_filters=effective_filters,
+                            **kwargs,
+                        )
 
-            # Run the team
-            try:
-                # Prepare run messages
-                if self.mode == "route":
-                    # In route mode the model shouldn't get images/audio/video
-                    run_messages: RunMessages = self.get_run_messages(
-                        session_id=session_id,
-                        user_id=user_id,
-                        message=message,
-                        audio=audio,
-                        images=images,
-                        videos=videos,
-                        files=files,
-                        knowledge_filters=effective_filters,
-                        **kwargs,
-                    )
-                else:
-                    run_messages = self.get_run_messages(
-                        session_id=session_id,
-                        user_id=user_id,
-                        message=message,
-                        audio=audio,
-                        images=images,
-                        videos=videos,
-                        files=files,
-                        knowledge_filters=effective_filters,
-                        **kwargs,
-                    )
+                    if stream:
+                        response_iterator = self._arun_stream(
+                            run_response=self.run_response,
+                            run_messages=run_messages,
+                            session_id=session_id,
+                            user_id=user_id,
+                            response_format=response_format,
+                            stream_intermediate_steps=stream_intermediate_steps,
+                        )
+                        if cancellation_token is not None:
+                            stream_owns_token = True
+                            return self._acancellable_run_stream(response_iterator, run_response, cancellation_token)
+                        return response_iterator
+                    else:
+                        run_coroutine = self._arun(
+                            run_response=self.run_response,
+                            run_messages=run_messages,
+                            session_id=session_id,
+                            user_id=user_id,
+                            response_format=response_format,
+                        )
+                        if cancellation_token is None:
+                            return await run_coroutine
+                        with cancellation_scope(cancellation_token):
+                            # The run is a task in the cancellation scope, cancelled with the token
+                            return await cancellation_token.acall(run_coroutine)
+
+                except ModelProviderError as e:
+                    log_warning(f"Attempt {attempt + 1}/{num_attempts} failed: {str(e)}")
+                    last_exception = e
+                    if attempt < num_attempts - 1:
+                        await asyncio.sleep(2**attempt)
+                except (KeyboardInterrupt, RunCancelledException) as e:
+                    reason = str(e) if isinstance(e, RunCancelledException) else "Operation cancelled by user"
+                    if stream:
+                        return async_generator_wrapper(create_team_run_response_cancelled_event(run_response, reason))
+                    else:
+                        return self._create_run_response(
+                            run_state=RunStatus.cancelled,
+                            content=reason,
+                            from_run_response=run_response,
+                            session_id=session_id,
+                        )
+                finally:
+                    self._reset_session_state()
 
+            # If we get here, all retries failed
+            if last_exception is not None:
+                log_error(
+                    f"Failed after {num_attempts} attempts. Last error using {last_exception.model_name}({last_exception.model_id})"
+                )
                 if stream:
-                    response_iterator = self._arun_stream(
-                        run_response=self.run_response,
-                        run_messages=run_messages,
-                        session_id=session_id,
-                        user_id=user_id,
-                        response_format=response_format,
-                        stream_intermediate_steps=stream_intermediate_steps,
-                    )
-                    return response_iterator
-                else:
-                    return await self._arun(
-                        run_response=self.run_response,
-                        run_messages=run_messages,
-                        session_id=session_id,
-                        user_id=user_id,
-                        response_format=response_format,
+                    return async_generator_wrapper(
+                        create_team_run_response_error_event(run_response, error=str(last_exception))
                     )
 
-            except ModelProviderError as e:
-                log_warning(f"Attempt {attempt + 1}/{num_attempts} failed: {str(e)}")
-                last_exception = e
-                if attempt < num_attempts - 1:
-                    await asyncio.sleep(2**attempt)
-            except (KeyboardInterrupt, RunCancelledException):
+                raise last_exception
+            else:
                 if stream:
                     return async_generator_wrapper(
-                        create_team_run_response_cancelled_event(run_response, "Operation cancelled by user")
-                    )
-                else:
-                    return self._create_run_response(
-                        run_state=RunStatus.cancelled,
-                        content="Operation cancelled by user",
-                        from_run_response=run_response,
-                        session_id=session_id,
+                        create_team_run_response_error_event(run_response, error=str(last_exception))
                     )
-            finally:
-                self._reset_session_state()
-
-        # If we get here, all retries failed
-        if last_exception is not None:
-            log_error(
-                f"Failed after {num_attempts} attempts. Last error using {last_exception.model_name}({last_exception.model_id})"
-            )
-            if stream:
-                return async_generator_wrapper(
-                    create_team_run_response_error_event(run_response, error=str(last_exception))
-                )
 
-            raise last_exception
-        else:
-            if stream:
-                return async_generator_wrapper(
-                    create_team_run_response_error_event(run_response, error=str(last_exception))
-                )
-
-            raise Exception(f"Failed after {num_attempts} attempts.")
+                raise Exception(f"Failed after {num_attempts} attempts.")
+        finally:
+            if not stream_owns_token:
+                close_run_cancellation_token(cancellation_token)
 
     async def _arun(
         self,
@@ -1448,7 +1546,7 @@ class Team:
         self._convert_response_to_structured_format(run_response=run_response)
 
         # 7. Save session to storage
-        self.write_to_storage(session_id=session_id, user_id=user_id)
+        await self.awrite_to_storage(session_id=session_id, user_id=user_id)
 
         # 8. Log Team Run
         await self._alog_team_run(session_id=session_id, user_id=user_id)
@@ -1527,7 +1625,7 @@ class Team:
             )
 
         # 5. Save session to storage
-        self.write_to_storage(session_id=session_id, user_id=user_id)
+        await self.awrite_to_storage(session_id=session_id, user_id=user_id)
 
         # 6. Log Team Run
         await self._alog_team_run(session_id=session_id, user_id=user_id)
@@ -2128,11 +2226,54 @@ class Team:
             else:
                 log_warning("Something went wrong. Member run response content is not a string")
 
+    def _enqueue_memories_and_summaries(
+        self, run_messages: RunMessages, session_id: str, user_id: Optional[str] = None
+    ) -> None:
+        """Enqueue the user memories and session summary of the run to the memory processor"""
+        self.memory_processor = cast(MemoryProcessor, self.memory_processor)
+
+        messages = []
+        if self.enable_user_memories and run_messages.user_message is not None:
+            if run_messages.user_message.get_content_string():
+                messages.append(run_messages.user_message)
+
+        if messages or self.enable_session_summaries:
+            log_debug("Enqueuing user memories and session summary.")
+            self.memory_processor.enqueue(
+                session_id=session_id,
+                user_id=user_id,
+                messages=messages,
+                create_session_summary=self.enable_session_summaries,
+                memory=cast(Memory, self.memory),
+                on_summary=lambda summary: self._save_session_summary(session_id, user_id, summary),
+            )
+
+    def _save_session_summary(self, session_id: str, user_id: Optional[str], summary: SessionSummary) -> None:
+        """Save a session summary created by the memory processor to the session in storage.
+
+        The summary is created after the run saved its session, and would otherwise be replaced by the stored
+        summaries when the session is loaded again.
+        """
+        if self.storage is None:
+            return
+        with session_lock(session_id):
+            session = self.storage.read(session_id=session_id)
+            if not isinstance(session, (AgentSession, TeamSession)):
+                return
+            session.memory = dict(session.memory or {})
+            summaries = session.memory.setdefault("summaries", {}).setdefault(user_id or "default", {})
+            summaries[session_id] = summary.to_dict()
+            self.storage.upsert(session=session)
+
     def _make_memories_and_summaries(
         self, run_messages: RunMessages, session_id: str, user_id: Optional[str] = None
     ) -> Iterator[TeamRunResponseEvent]:
         from concurrent.futures import ThreadPoolExecutor, as_completed
 
+        if self.memory_processor is not None:
+            self._enqueue_memories_and_summaries(run_messages, session_id, user_id)
+            return
+
         self.run_response = cast(TeamRunResponse, self.run_response)
         self.memory = cast(Memory, self.memory)
 
@@ -2175,6 +2316,10 @@ class Team:
     async def _amake_memories_and_summaries(
         self, run_messages: RunMessages, session_id: str, user_id: Optional[str] = None
     ) -> AsyncIterator[TeamRunResponseEvent]:
+        if self.memory_processor is not None:
+            self._enqueue_memories_and_summaries(run_messages, session_id, user_id)
+            return
+
         self.memory = cast(Memory, self.memory)
         self.run_response = cast(TeamRunResponse, self.run_response)
         tasks = []
@@ -6853,9 +6998,34 @@ class Team:
             Optional[TeamSession]: The saved TeamSession or None if not saved.
         """
         if self.storage is not None:
-            self.team_session = cast(
-                TeamSession, self.storage.upsert(session=self._get_team_session(session_id=session_id, user_id=user_id))
-            )
+            with session_lock(session_id):
+                self.team_session = cast(
+                    TeamSession,
+                    self.storage.upsert(session=self._get_team_session(session_id=session_id, user_id=user_id)),
+                )
+
+        # Remove session from memory
+        if not self.cache_session:
+            if self.memory is not None and self.memory.runs is not None and session_id in self.memory.runs:
+                self.memory.runs.pop(session_id)  # type: ignore
+        return self.team_session
+
+    async def aread_from_storage(self, session_id: str) -> Optional[TeamSession]:
+        """Async version of `read_from_storage`, which does not block the event loop on storage I/O."""
+        if self.storage is not None and session_id is not None:
+            self.team_session = cast(TeamSession, await self.storage.aread(session_id=session_id))
+            if self.team_session is not None:
+                self.load_team_session(session=self.team_session)
+        return self.team_session
+
+    async def awrite_to_storage(self, session_id: str, user_id: Optional[str] = None) -> Optional[TeamSession]:
+        """Async version of `write_to_storage`, which does not block the event loop on storage I/O."""
+        if self.storage is not None:
+            async with asession_lock(session_id):
+                self.team_session = cast(
+                    TeamSession,
+                    await self.storage.aupsert(session=self._get_team_session(session_id=session_id, user_id=user_id)),
+                )
 
         # Remove session from memory
         if not self.cache_session:
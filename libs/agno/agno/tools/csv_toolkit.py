@@ -1,7 +1,9 @@
 import csv
 import json
+import sys
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
 
 from agno.tools import Toolkit
 from agno.utils.log import log_debug, log_info, logger
@@ -18,6 +20,9 @@ class CsvTools(Toolkit):
         read_column_names: bool = True,
         duckdb_connection: Optional[Any] = None,
         duckdb_kwargs: Optional[Dict[str, Any]] = None,
+        parquet_cache_dir: Optional[Union[str, Path]] = None,
+        output_format: str = "json",
+        max_result_bytes: Optional[int] = None,
         **kwargs,
     ):
         self.csvs: List[Path] = []
@@ -32,6 +37,17 @@ class CsvTools(Toolkit):
         self.row_limit = row_limit
         self.duckdb_connection: Optional[Any] = duckdb_connection
         self.duckdb_kwargs: Optional[Dict[str, Any]] = duckdb_kwargs
+        # If provided, csv files are converted to parquet once and queried from the cache
+        self.parquet_cache_dir: Optional[Path] = Path(parquet_cache_dir) if parquet_cache_dir is not None else None
+        if output_format not in ("json", "columnar", "markdown"):
+            raise ValueError(f"Invalid output format: {output_format}")
+        # Format used by read_csv_file: json (list of row dicts), columnar (column -> values) or markdown
+        self.output_format: str = output_format
+        # Maximum size of a tool result in bytes. Rows beyond this budget are dropped.
+        self.max_result_bytes: Optional[int] = max_result_bytes
+
+        # Map of csv name -> modification time of the file when it was registered in duckdb
+        self._registered_csvs: Dict[str, float] = {}
 
         tools: List[Any] = []
         if read_csvs:
@@ -75,16 +91,12 @@ class CsvTools(Toolkit):
             log_info(f"Reading file: {csv_name}")
             file_path = [_csv for _csv in self.csvs if _csv.stem == csv_name][0]
 
-            # Read the csv file
-            csv_data = []
+            # Stream the csv file, stopping at the row limit or once the byte budget is used up
             _row_limit = row_limit or self.row_limit
             with open(str(file_path), newline="") as csvfile:
-                reader = csv.DictReader(csvfile)
-                if _row_limit is not None:
-                    csv_data = [row for row in reader][:_row_limit]
-                else:
-                    csv_data = [row for row in reader]
-            return json.dumps(csv_data)
+                reader = csv.reader(csvfile)
+                columns = next(reader, [])
+                return self._format_rows(columns, islice(reader, _row_limit) if _row_limit is not None else reader)
         except Exception as e:
             logger.error(f"Error reading csv: {e}")
             return f"Error reading csv: {e}"
@@ -115,6 +127,133 @@ class CsvTools(Toolkit):
             logger.error(f"Error getting columns: {e}")
             return f"Error getting columns: {e}"
 
+    def get_duckdb_connection(self) -> Any:
+        """Returns the duckdb connection, creating it on first use.
+
+        The connection is kept for the lifetime of the toolkit so csv files only need to be loaded once.
+        """
+        if self.duckdb_connection is None:
+            import duckdb
+
+            self.duckdb_connection = duckdb.connect(**(self.duckdb_kwargs or {}))
+        return self.duckdb_connection
+
+    def _register_csv(self, con: Any, csv_name: str) -> None:
+        """Load the csv file `csv_name` into duckdb as a table with the same name.
+
+        The file is only (re)loaded if it was not loaded before or if it has been modified since.
+        When `parquet_cache_dir` is set, the csv is converted to a parquet file and exposed as a view over it.
+        """
+        file_path = [_csv for _csv in self.csvs if _csv.stem == csv_name][0]
+        mtime = file_path.stat().st_mtime
+        if self._registered_csvs.get(csv_name) == mtime:
+            log_debug(f"Using cached table for csv file: {csv_name}")
+            return
+
+        log_info(f"Loading csv file: {csv_name}")
+        read_csv_stmt = f"read_csv('{file_path}', ignore_errors=false, auto_detect=true)"
+        if self.parquet_cache_dir is not None:
+            self.parquet_cache_dir.mkdir(parents=True, exist_ok=True)
+            parquet_path = self.parquet_cache_dir.joinpath(f"{csv_name}.parquet")
+            if not parquet_path.exists() or parquet_path.stat().st_mtime < mtime:
+                log_debug(f"Writing parquet cache: {parquet_path}")
+                con.execute(f"COPY (SELECT * FROM {read_csv_stmt}) TO '{parquet_path}' (FORMAT PARQUET)")
+            con.execute(f"CREATE OR REPLACE VIEW \"{csv_name}\" AS SELECT * FROM read_parquet('{parquet_path}')")
+        else:
+            con.execute(f'CREATE OR REPLACE TABLE "{csv_name}" AS SELECT * FROM {read_csv_stmt}')
+        self._registered_csvs[csv_name] = mtime
+
+    def _format_rows(self, columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> str:
+        """Format rows as json, columnar json or markdown, keeping the result within `max_result_bytes`.
+
+        Rows are consumed lazily, so rows beyond the byte budget are never read. When rows are dropped, json
+        results become `{"rows": [...], "truncated": true}`, columnar results get `"truncated": true` and
+        markdown results end with a note.
+        """
+
+        def get_values(row: Sequence[Any]) -> List[Any]:
+            return [row[i] if i < len(row) else None for i in range(len(columns))]
+
+        def get_markdown_line(values: Sequence[Any]) -> str:
+            return "| " + " | ".join(str(v) for v in values) + " |"
+
+        truncated = False
+        kept_rows: List[List[Any]] = []
+        if self.max_result_bytes is None:
+            kept_rows = [get_values(row) for row in rows]
+        else:
+            # Each row is measured as it is serialized, after reserving the size of the result without rows
+            if self.output_format == "markdown":
+                used = len(get_markdown_line(columns).encode("utf-8")) + len(get_markdown_line(["---"] * len(columns)))
+                used += len(f"\n\nShowing the first {sys.maxsize} rows, the result was truncated.")
+            elif self.output_format == "columnar":
+                used = len(json.dumps({"columns": list(columns), "data": {c: [] for c in columns}, "truncated": True}))
+            else:
+                used = len(json.dumps({"rows": [], "truncated": True}))
+            for row in rows:
+                values = get_values(row)
+                if self.output_format == "markdown":
+                    used += len(get_markdown_line(values).encode("utf-8")) + 1
+                elif self.output_format == "columnar":
+                    used += sum(len(json.dumps(v, default=str).encode("utf-8")) + 2 for v in values)
+                else:
+                    used += len(json.dumps(dict(zip(columns, values)), default=str).encode("utf-8")) + 2
+                if used > self.max_result_bytes:
+                    truncated = True
+                    break
+                kept_rows.append(values)
+
+        if self.output_format == "markdown":
+            lines = [get_markdown_line(columns), get_markdown_line(["---" for _ in columns])]
+            lines.extend(get_markdown_line(values) for values in kept_rows)
+            result = "\n".join(lines)
+            if truncated:
+                result += f"\n\nShowing the first {len(kept_rows)} rows, the result was truncated."
+            return result
+
+        if self.output_format == "columnar":
+            data: Dict[str, Any] = {
+                "columns": list(columns),
+                "data": {col: [values[i] for values in kept_rows] for i, col in enumerate(columns)},
+            }
+            if truncated:
+                data["truncated"] = True
+            return json.dumps(data, default=str)
+
+        json_rows = [dict(zip(columns, values)) for values in kept_rows]
+        if truncated:
+            return json.dumps({"rows": json_rows, "truncated": True}, default=str)
+        return json.dumps(json_rows, default=str)
+
+    def _format_query_result(self, query_result: Any) -> str:
+        """Format a duckdb query result as csv text, fetching rows in batches until `max_result_bytes` is reached."""
+        header = ",".join(query_result.columns)
+        result_rows: List[str] = []
+        budget = self.max_result_bytes - len(header) if self.max_result_bytes is not None else None
+        truncated = False
+        while True:
+            batch = query_result.fetchmany(1000)
+            if not batch:
+                break
+            for row in batch:
+                if len(row) == 1:
+                    row_str = str(row[0])
+                else:
+                    row_str = ",".join(str(x) for x in row)
+                if budget is not None:
+                    budget -= len(row_str.encode("utf-8")) + 1
+                    if budget < 0:
+                        truncated = True
+                        break
+                result_rows.append(row_str)
+            if truncated:
+                break
+
+        result_output = header + "\n" + "\n".join(result_rows)
+        if truncated:
+            result_output += f"\n... truncated after {len(result_rows)} rows, refine the query or add a LIMIT."
+        return result_output
+
     def query_csv_file(self, csv_name: str, sql_query: str) -> str:
         """Use this function to run a SQL query on csv file `csv_name` without the extension.
         The Table name is the name of the csv file without the extension.
@@ -131,27 +270,17 @@ class CsvTools(Toolkit):
             str: The query results if successful, otherwise returns an error message.
         """
         try:
-            import duckdb
-
             if csv_name not in [_csv.stem for _csv in self.csvs]:
                 return f"File: {csv_name} not found, please use one of {self.list_csv_files()}"
 
-            # Load the csv file into duckdb
-            log_info(f"Loading csv file: {csv_name}")
-            file_path = [_csv for _csv in self.csvs if _csv.stem == csv_name][0]
-
             # Create duckdb connection
-            con = self.duckdb_connection
-            if not self.duckdb_connection:
-                con = duckdb.connect(**(self.duckdb_kwargs or {}))
+            con = self.get_duckdb_connection()
             if con is None:
                 logger.error("Error connecting to DuckDB")
                 return "Error connecting to DuckDB, please check the connection."
 
-            # Create a table from the csv file
-            con.execute(
-                f"CREATE TABLE {csv_name} AS SELECT * FROM read_csv('{file_path}', ignore_errors=false, auto_detect=true)"
-            )
+            # Register the csv file in duckdb, this is a no-op if the file has not changed
+            self._register_csv(con, csv_name)
 
             # -*- Format the SQL Query
             # Remove backticks
@@ -164,16 +293,7 @@ class CsvTools(Toolkit):
             result_output = "No output"
             if query_result is not None:
                 try:
-                    results_as_python_objects = query_result.fetchall()
-                    result_rows = []
-                    for row in results_as_python_objects:
-                        if len(row) == 1:
-                            result_rows.append(str(row[0]))
-                        else:
-                            result_rows.append(",".join(str(x) for x in row))
-
-                    result_data = "\n".join(result_rows)
-                    result_output = ",".join(query_result.columns) + "\n" + result_data
+                    result_output = self._format_query_result(query_result)
                 except AttributeError:
                     result_output = str(query_result)
 
@@ -2,6 +2,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from agno.tools import Toolkit
 from agno.utils.log import log_debug, log_info, logger
+from agno.utils.query_result import iter_batches, shape_query_result
 
 try:
     import duckdb
@@ -22,6 +23,9 @@ class DuckDbTools(Toolkit):
         create_tables: bool = True,
         summarize_tables: bool = True,
         export_tables: bool = False,
+        max_result_rows: Optional[int] = None,
+        max_result_tokens: Optional[int] = None,
+        spill_dir: Optional[str] = None,
         **kwargs,
     ):
         self.db_path: Optional[str] = db_path
@@ -29,6 +33,11 @@ class DuckDbTools(Toolkit):
         self.config: Optional[dict] = config
         self._connection: Optional[duckdb.DuckDBPyConnection] = connection
         self.init_commands: Optional[List] = init_commands
+        # Budget for query results returned to the model. Rows are streamed until the budget is reached.
+        self.max_result_rows: Optional[int] = max_result_rows
+        self.max_result_tokens: Optional[int] = max_result_tokens
+        # If set, truncated results are written in full to a csv file in this directory
+        self.spill_dir: Optional[str] = spill_dir
 
         tools: List[Any] = []
         tools.append(self.show_tables)
@@ -134,7 +143,19 @@ class DuckDbTools(Toolkit):
 
             query_result = self.connection.sql(formatted_sql)
             result_output = "No output"
-            if query_result is not None:
+            if query_result is not None and self._use_result_budget():
+                try:
+                    shaped_result = shape_query_result(
+                        columns=query_result.columns,
+                        rows=iter_batches(query_result.fetchmany),
+                        max_rows=self.max_result_rows,
+                        max_tokens=self.max_result_tokens,
+                        spill_dir=self.spill_dir,
+                    )
+                    result_output = shaped_result.to_csv()
+                except AttributeError:
+                    result_output = str(query_result)
+            elif query_result is not None:
                 try:
                     results_as_python_objects = query_result.fetchall()
                     result_rows = []
@@ -158,6 +179,9 @@ class DuckDbTools(Toolkit):
         except Exception as e:
             return str(e)
 
+    def _use_result_budget(self) -> bool:
+        return self.max_result_rows is not None or self.max_result_tokens is not None or self.spill_dir is not None
+
     def summarize_table(self, table: str) -> str:
         """Function to compute a number of aggregates over a table.
         The function launches a query that computes a number of aggregates over all columns,
@@ -0,0 +1,262 @@
+"""Dedicated execution pools for tools.
+
+By default, the sync tools of async runs share the default thread pool of the event loop, and the tools of sync
+runs run in the thread of the run. A `ToolExecutor` gives a toolkit or function its own pool, so slow or heavy tools
+can't starve the other tools, and rejects calls when too many are waiting.
+
+With `processes=True`, the tool entrypoints run in worker processes, started once and reused, which is useful for
+CPU-bound tools held back by the GIL. The toolkit, arguments and result of every call are pickled, so the changes a
+tool makes to its toolkit in the worker process are not visible in the agent process, and tools taking the agent
+or team as argument can't run in a process.
+"""
+
+import asyncio
+import contextvars
+import importlib
+import pickle
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from inspect import unwrap
+from io import BytesIO
+from time import perf_counter
+from types import FunctionType
+from typing import Any, Callable, Dict, Optional
+
+from agno.exceptions import ToolExecutorOverloadedError
+from agno.utils.log import log_debug
+
+
+@dataclass
+class ToolExecutorMetrics:
+    """Counters of a tool executor. Times are in seconds."""
+
+    submitted: int = 0
+    # Calls rejected because the executor was full
+    rejected: int = 0
+    completed: int = 0
+    failed: int = 0
+    # Time between the submission of a call and its start
+    total_queue_time: float = 0.0
+    max_queue_time: float = 0.0
+    total_run_time: float = 0.0
+    max_run_time: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        finished = self.completed + self.failed
+        return {
+            "submitted": self.submitted,
+            "rejected": self.rejected,
+            "completed": self.completed,
+            "failed": self.failed,
+            "mean_queue_time": self.total_queue_time / finished if finished else 0.0,
+            "max_queue_time": self.max_queue_time,
+            "mean_run_time": self.total_run_time / finished if finished else 0.0,
+            "max_run_time": self.max_run_time,
+        }
+
+
+def _new_toolkit(cls):
+    return cls.__new__(cls)
+
+
+def _get_module_attribute(module_name: str, qualname: str) -> Any:
+    obj: Any = importlib.import_module(module_name)
+    for name in qualname.split("."):
+        obj = getattr(obj, name)
+    return obj
+
+
+def _get_tool_function(module_name: str, qualname: str) -> Any:
+    """Return the function decorated with @tool at `module_name.qualname`, whose name is bound to its Function"""
+    from agno.tools.function import Function
+
+    obj = _get_module_attribute(module_name, qualname)
+    if isinstance(obj, Function) and obj.entrypoint is not None:
+        return unwrap(obj.entrypoint)
+    return obj
+
+
+def _is_decorated_tool(func: FunctionType) -> bool:
+    """Whether the name of `func` in its module is bound to the Function made of it by @tool"""
+    from agno.tools.function import Function
+
+    if "<locals>" in func.__qualname__:
+        return False
+    try:
+        obj = _get_module_attribute(func.__module__, func.__qualname__)
+    except (ImportError, AttributeError):
+        return False
+    return isinstance(obj, Function) and obj.entrypoint is not None and unwrap(obj.entrypoint) is func
+
+
+class _ToolPickler(pickle.Pickler):
+    """Pickles toolkits without their functions, which hold the agent and unpicklable wrappers,
+    executors as executors running the calls inline, and functions decorated with @tool by the name of their Function,
+    as their own name is rebound to it"""
+
+    def reducer_override(self, obj):
+        from agno.tools.toolkit import Toolkit
+
+        if isinstance(obj, FunctionType) and _is_decorated_tool(obj):
+            return _get_tool_function, (obj.__module__, obj.__qualname__)
+        if isinstance(obj, Toolkit):
+            state = {k: v for k, v in obj.__dict__.items() if k != "functions"}
+            return _new_toolkit, (type(obj),), state
+        if isinstance(obj, ToolExecutor):
+            return ToolExecutor, (obj.name, obj.max_workers, obj.max_pending)
+        return NotImplemented
+
+
+def _dumps(obj: Any) -> bytes:
+    buffer = BytesIO()
+    _ToolPickler(buffer).dump(obj)
+    return buffer.getvalue()
+
+
+def _call_in_process(payload: bytes, arguments: Dict[str, Any]) -> Any:
+    """Runs a tool entrypoint in a worker process"""
+    from pydantic import validate_call
+
+    func = pickle.loads(payload)
+    return validate_call(func, config=dict(arbitrary_types_allowed=True))(**arguments)  # type: ignore
+
+
+def _noop() -> None:
+    return None
+
+
+class ToolExecutor:
+    """Runs the calls of the tools using it on a dedicated pool.
+
+    Args:
+        name: Name of the executor, used in logs and errors.
+        max_workers: Number of calls running at the same time.
+        max_pending: Number of calls waiting for a worker before new calls are rejected. None for no limit.
+        processes: If True, run the tool entrypoints in worker processes.
+    """
+
+    def __init__(
+        self,
+        name: str = "tools",
+        max_workers: int = 4,
+        max_pending: Optional[int] = 16,
+        processes: bool = False,
+    ):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.processes = processes
+        self.metrics = ToolExecutorMetrics()
+
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._running = 0
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+
+    def start(self) -> None:
+        """Start the pools and the worker processes. Called on the first call."""
+        with self._lock:
+            if self._thread_pool is not None:
+                return
+            self._thread_pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=f"agno-{self.name}")
+            if self.processes:
+                self._process_pool = ProcessPoolExecutor(max_workers=self.max_workers)
+                # Start the worker processes now rather than on the first calls
+                for future in [self._process_pool.submit(_noop) for _ in range(self.max_workers)]:
+                    future.result()
+                log_debug(f"Started {self.max_workers} worker processes for {self.name}")
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """Submit a call to the pool.
+
+        Raises:
+            ToolExecutorOverloadedError: If `max_pending` calls are already waiting for a worker.
+        """
+        if self._thread_pool is None:
+            self.start()
+
+        with self._lock:
+            in_flight = self._pending + self._running
+            if self.max_pending is not None and in_flight >= self.max_workers + self.max_pending:
+                self.metrics.rejected += 1
+                raise ToolExecutorOverloadedError(
+                    f"Tool executor {self.name} is overloaded: {self._pending} calls are waiting"
+                )
+            self._pending += 1
+            self.metrics.submitted += 1
+        submitted_at = perf_counter()
+
+        def run() -> Any:
+            started_at = perf_counter()
+            with self._lock:
+                self._pending -= 1
+                self._running += 1
+            failed = True
+            try:
+                result = fn(*args, **kwargs)
+                # Function calls return a failure result rather than raising
+                failed = getattr(result, "status", None) == "failure"
+                return result
+            finally:
+                run_time = perf_counter() - started_at
+                queue_time = started_at - submitted_at
+                with self._lock:
+                    self._running -= 1
+                    if failed:
+                        self.metrics.failed += 1
+                    else:
+                        self.metrics.completed += 1
+                    self.metrics.total_queue_time += queue_time
+                    self.metrics.max_queue_time = max(self.metrics.max_queue_time, queue_time)
+                    self.metrics.total_run_time += run_time
+                    self.metrics.max_run_time = max(self.metrics.max_run_time, run_time)
+
+        # Run the call in the context of the caller, like asyncio.to_thread, e.g. for the cancellation token of the run
+        context = contextvars.copy_context()
+        return self._thread_pool.submit(context.run, run)  # type: ignore
+
+    def run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a call on the pool and wait for its result"""
+        return self.submit(fn, *args, **kwargs).result()
+
+    async def arun(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a call on the pool without blocking the event loop"""
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def call_entrypoint(self, entrypoint: Callable[..., Any], arguments: Dict[str, Any]) -> Any:
+        """Call a tool entrypoint, in a worker process if the executor uses processes"""
+        if not self.processes:
+            return entrypoint(**arguments)
+        if "agent" in arguments or "team" in arguments:
+            raise ValueError("Tools taking the agent or team as argument can't run in a process")
+        if self._process_pool is None:
+            self.start()
+        # Send the entrypoint without its validation wrapper, which can't be pickled
+        payload = _dumps(unwrap(entrypoint))
+        return self._process_pool.submit(_call_in_process, payload, arguments).result()  # type: ignore
+
+    def get_metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            metrics = self.metrics.to_dict()
+            metrics["pending"] = self._pending
+            metrics["running"] = self._running
+        return metrics
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the pools and the worker processes"""
+        with self._lock:
+            thread_pool, self._thread_pool = self._thread_pool, None
+            process_pool, self._process_pool = self._process_pool, None
+        if thread_pool is not None:
+            thread_pool.shutdown(wait=wait)
+        if process_pool is not None:
+            process_pool.shutdown(wait=wait)
+
+    def __deepcopy__(self, memo):
+        # Copies of agents and tools share the pools
+        return self
+
+    def __copy__(self):
+        return self
@@ -1,11 +1,13 @@
+from contextlib import nullcontext
 from dataclasses import dataclass
 from functools import partial
-from typing import Any, Callable, Dict, List, Literal, Optional, Type, TypeVar, get_type_hints
+from typing import Any, Callable, Dict, FrozenSet, List, Literal, Optional, Tuple, Type, TypeVar, get_type_hints
 
 from docstring_parser import parse
-from pydantic import BaseModel, Field, validate_call
+from pydantic import BaseModel, Field, PrivateAttr, validate_call
 
-from agno.exceptions import AgentRunException
+from agno.exceptions import AgentRunException, RunCancelledException
+from agno.run.cancellation import get_cancellation_token
 from agno.utils.log import log_debug, log_error, log_exception, log_warning
 
 T = TypeVar("T")
@@ -116,11 +118,19 @@ class Function(BaseModel):
     cache_dir: Optional[str] = None
     cache_ttl: int = 3600
 
+    # The ToolExecutor running the function calls. Defaults to the thread of the run, or the default thread pool
+    # of the event loop for async runs.
+    executor: Optional[Any] = None
+
     # --*-- FOR INTERNAL USE ONLY --*--
     # The agent that the function is associated with
     _agent: Optional[Any] = None
     # The team that the function is associated with
     _team: Optional[Any] = None
+    # Parameter names of the entrypoint and hooks, by id of the callable
+    _parameter_names: Dict[int, Tuple[Callable, FrozenSet[str]]] = PrivateAttr(default_factory=dict)
+    # Compiled hook chains, sync and async, with the entrypoint and hooks they were compiled for
+    _hook_chains: Dict[bool, Tuple[Tuple[Any, ...], Callable]] = PrivateAttr(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
         return self.model_dump(
@@ -343,6 +353,132 @@ class Function(BaseModel):
             name for name in self.parameters["properties"] if name not in ["agent", "team", "self"]
         ]
 
+    def get_parameter_names(self, func: Callable) -> FrozenSet[str]:
+        """Returns the parameter names of the entrypoint or a hook, inspected once per callable."""
+        from inspect import signature
+
+        # Read the private attribute directly, pydantic's attribute lookup for private attributes is slow
+        parameter_names = self.__pydantic_private__["_parameter_names"]  # type: ignore
+        cached = parameter_names.get(id(func))
+        if cached is None or cached[0] is not func:
+            cached = (func, frozenset(signature(func).parameters))
+            parameter_names[id(func)] = cached
+        return cached[1]
+
+    def _get_hook_chain(self, async_mode: bool = False) -> Callable:
+        """Returns the nested chain of the tool hooks, compiled once for the entrypoint and hooks of the function.
+
+        The chain is called with the FunctionCall and its entrypoint arguments, then the name, function and arguments.
+        """
+        key = (self.entrypoint, *(self.tool_hooks or []))
+        hook_chains = self.__pydantic_private__["_hook_chains"]  # type: ignore
+        cached = hook_chains.get(async_mode)
+        if cached is None or len(cached[0]) != len(key) or any(a is not b for a, b in zip(cached[0], key)):
+            cached = (key, self._compile_hook_chain_async() if async_mode else self._compile_hook_chain())
+            hook_chains[async_mode] = cached
+        return cached[1]
+
+    def _compile_hook_chain(self) -> Callable:
+        from functools import reduce
+        from inspect import iscoroutinefunction
+
+        def execute_entrypoint(fc, entrypoint_args, name, func, args):
+            """Execute the entrypoint function."""
+            arguments = entrypoint_args.copy()
+            if fc.arguments is not None:
+                arguments.update(fc.arguments)
+            return fc._call_entrypoint(arguments)
+
+        # If no hooks, just return the entrypoint execution function
+        if not self.tool_hooks:
+            return execute_entrypoint
+
+        def create_hook_wrapper(inner_func, hook):
+            """Create a nested wrapper for the hook."""
+
+            def wrapper(fc, entrypoint_args, name, func, args):
+                # Pass the inner function as next_func to the hook
+                # The hook will call next_func to continue the chain
+                def next_func(**kwargs):
+                    return inner_func(fc, entrypoint_args, name, func, kwargs)
+
+                hook_args = fc._build_hook_args(hook, name, next_func, args)
+
+                return hook(**hook_args)
+
+            return wrapper
+
+        # Remove coroutine hooks
+        final_hooks = []
+        for hook in self.tool_hooks:
+            if iscoroutinefunction(hook):
+                log_warning(f"Cannot use async hooks with sync function calls. Skipping hook: {hook.__name__}")
+            else:
+                final_hooks.append(hook)
+
+        # Build the chain from inside out - reverse the hooks to start from the innermost
+        hooks = list(reversed(final_hooks))
+        return reduce(create_hook_wrapper, hooks, execute_entrypoint)
+
+    def _compile_hook_chain_async(self) -> Callable:
+        from functools import reduce
+        from inspect import isasyncgen, isasyncgenfunction, iscoroutinefunction
+
+        async def execute_entrypoint_async(fc, entrypoint_args, name, func, args):
+            """Execute the entrypoint function asynchronously."""
+            arguments = entrypoint_args.copy()
+            if fc.arguments is not None:
+                arguments.update(fc.arguments)
+
+            result = self.entrypoint(**arguments)  # type: ignore
+            if iscoroutinefunction(self.entrypoint) and not (
+                isasyncgen(self.entrypoint) or isasyncgenfunction(self.entrypoint)
+            ):
+                result = await result
+            return result
+
+        def execute_entrypoint(fc, entrypoint_args, name, func, args):
+            """Execute the entrypoint function synchronously."""
+            arguments = entrypoint_args.copy()
+            if fc.arguments is not None:
+                arguments.update(fc.arguments)
+            return self.entrypoint(**arguments)  # type: ignore
+
+        # If no hooks, just return the entrypoint execution function
+        if not self.tool_hooks:
+            return execute_entrypoint
+
+        def create_hook_wrapper(inner_func, hook):
+            """Create a nested wrapper for the hook."""
+
+            async def wrapper(fc, entrypoint_args, name, func, args):
+                """Create a nested wrapper for the hook."""
+
+                # Pass the inner function as next_func to the hook
+                # The hook will call next_func to continue the chain
+                async def next_func(**kwargs):
+                    if iscoroutinefunction(inner_func):
+                        return await inner_func(fc, entrypoint_args, name, func, kwargs)
+                    else:
+                        return inner_func(fc, entrypoint_args, name, func, kwargs)
+
+                hook_args = fc._build_hook_args(hook, name, next_func, args)
+
+                if iscoroutinefunction(hook):
+                    return await hook(**hook_args)
+                else:
+                    return hook(**hook_args)
+
+            return wrapper
+
+        # Build the chain from inside out - reverse the hooks to start from the innermost
+        hooks = list(reversed(self.tool_hooks))
+
+        # Handle async and sync entrypoints
+        if iscoroutinefunction(self.entrypoint):
+            return reduce(create_hook_wrapper, hooks, execute_entrypoint_async)
+        return reduce(create_hook_wrapper, hooks, execute_entrypoint)
+
     def _get_cache_key(self, entrypoint_args: Dict[str, Any], call_args: Optional[Dict[str, Any]] = None) -> str:
         """Generate a cache key based on function name and arguments."""
         from hashlib import md5
@@ -459,17 +595,16 @@ class FunctionCall(BaseModel):
         """Handles the pre-hook for the function call."""
         if self.function.pre_hook is not None:
             try:
-                from inspect import signature
-
+                parameters = self.function.get_parameter_names(self.function.pre_hook)
                 pre_hook_args = {}
                 # Check if the pre-hook has and agent argument
-                if "agent" in signature(self.function.pre_hook).parameters:
+                if "agent" in parameters:
                     pre_hook_args["agent"] = self.function._agent
                 # Check if the pre-hook has an team argument
-                if "team" in signature(self.function.pre_hook).parameters:
+                if "team" in parameters:
                     pre_hook_args["team"] = self.function._team
                 # Check if the pre-hook has an fc argument
-                if "fc" in signature(self.function.pre_hook).parameters:
+                if "fc" in parameters:
                     pre_hook_args["fc"] = self
                 self.function.pre_hook(**pre_hook_args)
             except AgentRunException as e:
@@ -484,17 +619,16 @@ class FunctionCall(BaseModel):
         """Handles the post-hook for the function call."""
         if self.function.post_hook is not None:
             try:
-                from inspect import signature
-
+                parameters = self.function.get_parameter_names(self.function.post_hook)
                 post_hook_args = {}
                 # Check if the post-hook has and agent argument
-                if "agent" in signature(self.function.post_hook).parameters:
+                if "agent" in parameters:
                     post_hook_args["agent"] = self.function._agent
                 # Check if the post-hook has an team argument
-                if "team" in signature(self.function.post_hook).parameters:
+                if "team" in parameters:
                     post_hook_args["team"] = self.function._team
                 # Check if the post-hook has an fc argument
-                if "fc" in signature(self.function.post_hook).parameters:
+                if "fc" in parameters:
                     post_hook_args["fc"] = self
                 self.function.post_hook(**post_hook_args)
             except AgentRunException as e:
@@ -507,45 +641,43 @@ class FunctionCall(BaseModel):
 
     def _build_entrypoint_args(self) -> Dict[str, Any]:
         """Builds the arguments for the entrypoint."""
-        from inspect import signature
-
+        parameters = self.function.get_parameter_names(self.function.entrypoint)  # type: ignore
         entrypoint_args = {}
         # Check if the entrypoint has an agent argument
-        if "agent" in signature(self.function.entrypoint).parameters:  # type: ignore
+        if "agent" in parameters:
             entrypoint_args["agent"] = self.function._agent
         # Check if the entrypoint has an team argument
-        if "team" in signature(self.function.entrypoint).parameters:  # type: ignore
+        if "team" in parameters:
             entrypoint_args["team"] = self.function._team
         # Check if the entrypoint has an fc argument
-        if "fc" in signature(self.function.entrypoint).parameters:  # type: ignore
+        if "fc" in parameters:
             entrypoint_args["fc"] = self
         return entrypoint_args
 
     def _build_hook_args(self, hook: Callable, name: str, func: Callable, args: Dict[str, Any]) -> Dict[str, Any]:
         """Build the arguments for the hook."""
-        from inspect import signature
-
+        parameters = self.function.get_parameter_names(hook)
         hook_args = {}
         # Check if the hook has an agent argument
-        if "agent" in signature(hook).parameters:
+        if "agent" in parameters:
             hook_args["agent"] = self.function._agent
         # Check if the hook has an team argument
-        if "team" in signature(hook).parameters:
+        if "team" in parameters:
             hook_args["team"] = self.function._team
 
-        if "name" in signature(hook).parameters:
+        if "name" in parameters:
             hook_args["name"] = name
-        if "function_name" in signature(hook).parameters:
+        if "function_name" in parameters:
             hook_args["function_name"] = name
-        if "function" in signature(hook).parameters:
+        if "function" in parameters:
             hook_args["function"] = func
-        if "func" in signature(hook).parameters:
+        if "func" in parameters:
             hook_args["func"] = func
-        if "function_call" in signature(hook).parameters:
+        if "function_call" in parameters:
             hook_args["function_call"] = func
-        if "args" in signature(hook).parameters:
+        if "args" in parameters:
             hook_args["args"] = args
-        if "arguments" in signature(hook).parameters:
+        if "arguments" in parameters:
             hook_args["arguments"] = args
         return hook_args
 
@@ -554,48 +686,15 @@ class FunctionCall(BaseModel):
 
         This creates a chain where each hook wraps the next one, with the function call
         at the innermost level. Returns bubble back up through each hook.
+        The chain is compiled once per Function and bound to this call.
         """
-        from functools import reduce
-        from inspect import iscoroutinefunction
-
-        def execute_entrypoint(name, func, args):
-            """Execute the entrypoint function."""
-            arguments = entrypoint_args.copy()
-            if self.arguments is not None:
-                arguments.update(self.arguments)
-            return self.function.entrypoint(**arguments)  # type: ignore
-
-        # If no hooks, just return the entrypoint execution function
-        if not self.function.tool_hooks:
-            return execute_entrypoint
-
-        def create_hook_wrapper(inner_func, hook):
-            """Create a nested wrapper for the hook."""
-
-            def wrapper(name, func, args):
-                # Pass the inner function as next_func to the hook
-                # The hook will call next_func to continue the chain
-                def next_func(**kwargs):
-                    return inner_func(name, func, kwargs)
-
-                hook_args = self._build_hook_args(hook, name, next_func, args)
-
-                return hook(**hook_args)
-
-            return wrapper
-
-        # Remove coroutine hooks
-        final_hooks = []
-        for hook in self.function.tool_hooks:
-            if iscoroutinefunction(hook):
-                log_warning(f"Cannot use async hooks with sync function calls. Skipping hook: {hook.__name__}")
-            else:
-                final_hooks.append(hook)
+        return partial(self.function._get_hook_chain(), self, entrypoint_args)
 
-        # Build the chain from inside out - reverse the hooks to start from the innermost
-        hooks = list(reversed(final_hooks))
-        chain = reduce(create_hook_wrapper, hooks, execute_entrypoint)
-        return chain
+    def _call_entrypoint(self, arguments: Dict[str, Any]) -> Any:
+        """Calls the entrypoint, in a worker process if the executor of the function uses processes."""
+        if self.function.executor is not None:
+            return self.function.executor.call_entrypoint(self.function.entrypoint, arguments)
+        return self.function.entrypoint(**arguments)  # type: ignore
 
     def execute(self) -> FunctionExecutionResult:
         """Runs the function call."""
@@ -623,16 +722,19 @@ class FunctionCall(BaseModel):
                 return FunctionExecutionResult(status="success", result=cached_result)
 
         # Execute function
+        cancellation_token = get_cancellation_token()
         try:
-            # Build and execute the nested chain of hooks
-            if self.function.tool_hooks is not None:
-                execution_chain = self._build_nested_execution_chain(entrypoint_args=entrypoint_args)
-                result = execution_chain(self.function.name, self.function.entrypoint, self.arguments or {})
-            else:
-                arguments = entrypoint_args
-                if self.arguments is not None:
-                    arguments.update(self.arguments)
-                result = self.function.entrypoint(**arguments)
+            # Interrupt the function if the run is cancelled while it runs
+            with cancellation_token.interruptible() if cancellation_token is not None else nullcontext():
+                # Build and execute the nested chain of hooks
+                if self.function.tool_hooks is not None:
+                    execution_chain = self._build_nested_execution_chain(entrypoint_args=entrypoint_args)
+                    result = execution_chain(self.function.name, self.function.entrypoint, self.arguments or {})
+                else:
+                    arguments = entrypoint_args
+                    if self.arguments is not None:
+                        arguments.update(self.arguments)
+                    result = self._call_entrypoint(arguments)
 
             # Handle generator case
             if isgenerator(result):
@@ -645,6 +747,9 @@ class FunctionCall(BaseModel):
                     cache_file = self.function._get_cache_file_path(cache_key)
                     self.function._save_to_cache(cache_file, self.result)
 
+        except RunCancelledException:
+            self.error = "Run cancelled"
+            raise
         except AgentRunException as e:
             log_debug(f"{e.__class__.__name__}: {e}")
             self.error = str(e)
@@ -664,17 +769,16 @@ class FunctionCall(BaseModel):
         """Handles the async pre-hook for the function call."""
         if self.function.pre_hook is not None:
             try:
-                from inspect import signature
-
+                parameters = self.function.get_parameter_names(self.function.pre_hook)
                 pre_hook_args = {}
                 # Check if the pre-hook has an agent argument
-                if "agent" in signature(self.function.pre_hook).parameters:
+                if "agent" in parameters:
                     pre_hook_args["agent"] = self.function._agent
                 # Check if the pre-hook has an team argument
-                if "team" in signature(self.function.pre_hook).parameters:
+                if "team" in parameters:
                     pre_hook_args["team"] = self.function._team
                 # Check if the pre-hook has an fc argument
-                if "fc" in signature(self.function.pre_hook).parameters:
+                if "fc" in parameters:
                     pre_hook_args["fc"] = self
 
                 await self.function.pre_hook(**pre_hook_args)
@@ -690,17 +794,16 @@ class FunctionCall(BaseModel):
         """Handles the async post-hook for the function call."""
         if self.function.post_hook is not None:
             try:
-                from inspect import signature
-
+                parameters = self.function.get_parameter_names(self.function.post_hook)
                 post_hook_args = {}
                 # Check if the post-hook has an agent argument
-                if "agent" in signature(self.function.post_hook).parameters:
+                if "agent" in parameters:
                     post_hook_args["agent"] = self.function._agent
                 # Check if the post-hook has an team argument
-                if "team" in signature(self.function.post_hook).parameters:
+                if "team" in parameters:
                     post_hook_args["team"] = self.function._team
                 # Check if the post-hook has an fc argument
-                if "fc" in signature(self.function.post_hook).parameters:
+                if "fc" in parameters:
                     post_hook_args["fc"] = self
 
                 await self.function.post_hook(**post_hook_args)
@@ -717,65 +820,7 @@ class FunctionCall(BaseModel):
 
         Similar to _build_nested_execution_chain but for async execution.
         """
-        from functools import reduce
-        from inspect import isasyncgen, isasyncgenfunction, iscoroutinefunction
-
-        async def execute_entrypoint_async(name, func, args):
-            """Execute the entrypoint function asynchronously."""
-            arguments = entrypoint_args.copy()
-            if self.arguments is not None:
-                arguments.update(self.arguments)
-
-            result = self.function.entrypoint(**arguments)  # type: ignore
-            if iscoroutinefunction(self.function.entrypoint) and not (
-                isasyncgen(self.function.entrypoint) or isasyncgenfunction(self.function.entrypoint)
-            ):
-                result = await result
-            return result
-
-        def execute_entrypoint(name, func, args):
-            """Execute the entrypoint function synchronously."""
-            arguments = entrypoint_args.copy()
-            if self.arguments is not None:
-                arguments.update(self.arguments)
-            return self.function.entrypoint(**arguments)  # type: ignore
-
-        # If no hooks, just return the entrypoint execution function
-        if not self.function.tool_hooks:
-            return execute_entrypoint
-
-        def create_hook_wrapper(inner_func, hook):
-            """Create a nested wrapper for the hook."""
-
-            async def wrapper(name, func, args):
-                """Create a nested wrapper for the hook."""
-
-                # Pass the inner function as next_func to the hook
-                # The hook will call next_func to continue the chain
-                async def next_func(**kwargs):
-                    if iscoroutinefunction(inner_func):
-                        return await inner_func(name, func, kwargs)
-                    else:
-                        return inner_func(name, func, kwargs)
-
-                hook_args = self._build_hook_args(hook, name, next_func, args)
-
-                if iscoroutinefunction(hook):
-                    return await hook(**hook_args)
-                else:
-                    return hook(**hook_args)
-
-            return wrapper
-
-        # Build the chain from inside out - reverse the hooks to start from the innermost
-        hooks = list(reversed(self.function.tool_hooks))
-
-        # Handle async and sync entrypoints
-        if iscoroutinefunction(self.function.entrypoint):
-            chain = reduce(create_hook_wrapper, hooks, execute_entrypoint_async)
-        else:
-            chain = reduce(create_hook_wrapper, hooks, execute_entrypoint)
-        return chain
+        return partial(self.function._get_hook_chain(async_mode=True), self, entrypoint_args)
 
     async def aexecute(self) -> FunctionExecutionResult:
         """Runs the function call asynchronously."""
@@ -829,6 +874,9 @@ class FunctionCall(BaseModel):
                 cache_file = self.function._get_cache_file_path(cache_key)
                 self.function._save_to_cache(cache_file, self.result)
 
+        except RunCancelledException:
+            self.error = "Run cancelled"
+            raise
         except AgentRunException as e:
             log_debug(f"{e.__class__.__name__}: {e}")
             self.error = str(e)
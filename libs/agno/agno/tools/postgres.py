@@ -1,4 +1,6 @@
+from itertools import chain
 from typing import Any, Dict, List, Optional
+from uuid import uuid4
 
 try:
     import psycopg2
@@ -9,6 +11,7 @@ except ImportError:
 
 from agno.tools import Toolkit
 from agno.utils.log import log_debug, log_info
+from agno.utils.query_result import iter_batches, shape_query_result
 
 
 class PostgresTools(Toolkit):
@@ -27,6 +30,9 @@ class PostgresTools(Toolkit):
         summarize_tables: bool = True,
         export_tables: bool = False,
         table_schema: str = "public",
+        max_result_rows: Optional[int] = None,
+        max_result_tokens: Optional[int] = None,
+        spill_dir: Optional[str] = None,
         **kwargs,
     ):
         self._connection: Optional[psycopg2.extensions.connection] = connection
@@ -36,6 +42,11 @@ class PostgresTools(Toolkit):
         self.host: Optional[str] = host
         self.port: Optional[int] = port
         self.table_schema: str = table_schema
+        # Budget for query results returned to the model. Rows are streamed until the budget is reached.
+        self.max_result_rows: Optional[int] = max_result_rows
+        self.max_result_tokens: Optional[int] = max_result_tokens
+        # If set, truncated results are written in full to a csv file in this directory
+        self.spill_dir: Optional[str] = spill_dir
 
         tools: List[Any] = []
         tools.append(self.show_tables)
@@ -204,6 +215,38 @@ class PostgresTools(Toolkit):
 
         return result
 
+    def _use_result_budget(self) -> bool:
+        return self.max_result_rows is not None or self.max_result_tokens is not None or self.spill_dir is not None
+
+    def _run_query_with_budget(self, query: str) -> str:
+        """Run a query and stream its rows until the result budget is reached.
+
+        SELECT queries use a server-side (named) cursor, so rows beyond the budget are never sent by the server
+        unless they need to be spilled to a file.
+        """
+        is_select = query.lstrip().lower().startswith(("select", "with", "values", "table"))
+        cursor_name = f"agno_{uuid4().hex}" if is_select else None
+        with self.connection.cursor(name=cursor_name) as cursor:
+            if cursor_name is not None:
+                cursor.itersize = 1000
+            cursor.execute(query)
+            if cursor_name is None and cursor.description is None:
+                return "No output"
+            # Named cursors only populate the description after the first fetch
+            first_batch = cursor.fetchmany(1000)
+            columns = [column[0] for column in cursor.description] if cursor.description else []
+            rows = chain(first_batch, iter_batches(cursor.fetchmany))
+            shaped_result = shape_query_result(
+                columns=columns,
+                rows=rows,
+                max_rows=self.max_result_rows,
+                max_tokens=self.max_result_tokens,
+                spill_dir=self.spill_dir,
+            )
+        result_output = shaped_result.to_csv()
+        log_debug(f"Query result: {result_output}")
+        return result_output
+
     def run_query(self, query: str) -> str:
         """Function that runs a query and returns the result.
 
@@ -220,6 +263,9 @@ class PostgresTools(Toolkit):
         try:
             log_info(f"Running: {formatted_sql}")
 
+            if self._use_result_budget():
+                return self._run_query_with_budget(formatted_sql)
+
             cursor = self.connection.cursor()
             cursor.execute(query)
             query_result = cursor.fetchall()
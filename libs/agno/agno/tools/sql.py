@@ -3,6 +3,7 @@ from typing import Any, Dict, List, Optional
 
 from agno.tools import Toolkit
 from agno.utils.log import log_debug, logger
+from agno.utils.query_result import iter_batches, shape_query_result
 
 try:
     from sqlalchemy import Engine, create_engine
@@ -28,6 +29,8 @@ class SQLTools(Toolkit):
         list_tables: bool = True,
         describe_table: bool = True,
         run_sql_query: bool = True,
+        max_result_tokens: Optional[int] = None,
+        spill_dir: Optional[str] = None,
         **kwargs,
     ):
         # Get the database engine
@@ -52,6 +55,11 @@ class SQLTools(Toolkit):
         # Tables this toolkit can access
         self.tables: Optional[Dict[str, Any]] = tables
 
+        # Budget for query results returned to the model. Rows are streamed until the budget is reached.
+        self.max_result_tokens: Optional[int] = max_result_tokens
+        # If set, truncated results are written in full to a csv file in this directory
+        self.spill_dir: Optional[str] = spill_dir
+
         tools: List[Any] = []
         if list_tables:
             tools.append(self.list_tables)
@@ -121,6 +129,8 @@ class SQLTools(Toolkit):
         """
 
         try:
+            if self.max_result_tokens is not None or self.spill_dir is not None:
+                return self.run_sql_with_budget(sql=query, limit=limit)
             return json.dumps(self.run_sql(sql=query, limit=limit), default=str)
         except Exception as e:
             logger.error(f"Error running query: {e}")
@@ -151,3 +161,44 @@ class SQLTools(Toolkit):
             except Exception as e:
                 logger.error(f"Error while executing SQL: {e}")
                 return []
+
+    def run_sql_with_budget(self, sql: str, limit: Optional[int] = None) -> str:
+        """Internal function to run a sql query, streaming rows until the row limit or token budget is reached.
+
+        Args:
+            sql (str): The sql query to run.
+            limit (int, optional): The number of rows to return. Defaults to None.
+
+        Returns:
+            str: The rows of the query as JSON. If the result was truncated, a JSON object with the rows
+                and truncation metadata.
+        """
+        log_debug(f"Running sql with result budget |\n{sql}")
+
+        with self.Session() as sess, sess.begin():
+            result = sess.execute(text(sql).execution_options(stream_results=True))
+            if not getattr(result, "returns_rows", True):
+                return json.dumps([])
+
+            shaped_result = shape_query_result(
+                columns=list(result.keys()),
+                rows=iter_batches(result.fetchmany),
+                max_rows=limit or None,
+                max_tokens=self.max_result_tokens,
+                spill_dir=self.spill_dir,
+            )
+            rows = [dict(zip(shaped_result.columns, row)) for row in shaped_result.rows]
+
+        if not shaped_result.truncated:
+            return json.dumps(rows, default=str)
+        return json.dumps(
+            {
+                "rows": rows,
+                "truncated": True,
+                "returned_rows": len(rows),
+                "total_rows": shaped_result.total_rows,
+                "spill_file": shaped_result.spill_file,
+                "note": shaped_result.truncation_note(),
+            },
+            default=str,
+        )
@@ -1,5 +1,10 @@
+import sys
 from dataclasses import asdict
-from typing import Any, List, Optional, Type
+from typing import Any, Dict, List, Optional, Type
+
+# Keyword arguments of @dataclass giving instances __slots__ instead of a __dict__, on Python 3.10+.
+# Slotted instances are about half the size and faster to create.
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 def isinstanceany(obj: Any, class_list: List[Type]) -> bool:
@@ -0,0 +1,92 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from agno.document import Document
+from agno.utils.string import safe_content_hash
+
+# Constant of reciprocal rank fusion, dampens the weight of the top ranks
+RRF_K = 60
+
+
+def _document_key(document: Document) -> str:
+    return safe_content_hash(document.content)
+
+
+def _get_weights(num_rankings: int, weights: Optional[Sequence[float]]) -> Sequence[float]:
+    if weights is None:
+        return [1.0] * num_rankings
+    if len(weights) != num_rankings:
+        raise ValueError(f"Expected {num_rankings} weights, got {len(weights)}")
+    return weights
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[Document]],
+    k: int = RRF_K,
+    weights: Optional[Sequence[float]] = None,
+) -> List[Tuple[Document, float]]:
+    """Merge ranked lists of documents by reciprocal rank fusion.
+
+    Each document scores `weight / (k + rank)` in every list it appears in, summed over the lists.
+    Documents with the same content are merged, keeping the first occurrence.
+
+    Args:
+        rankings: Lists of documents, each ordered from most to least relevant.
+        k: Fusion constant. Larger values flatten the differences between ranks.
+        weights: Optional weight of each list.
+
+    Returns:
+        List of (document, fused score), ordered by decreasing score.
+    """
+    documents: Dict[str, Document] = {}
+    scores: Dict[str, float] = {}
+    for ranking, weight in zip(rankings, _get_weights(len(rankings), weights)):
+        seen_in_ranking = set()
+        for rank, document in enumerate(ranking, start=1):
+            key = _document_key(document)
+            if key in seen_in_ranking:
+                continue
+            seen_in_ranking.add(key)
+            documents.setdefault(key, document)
+            scores[key] = scores.get(key, 0.0) + weight / (k + rank)
+    return sorted(((documents[key], score) for key, score in scores.items()), key=lambda x: x[1], reverse=True)
+
+
+def normalized_score_fusion(
+    scored_rankings: Sequence[Sequence[Tuple[Document, float]]],
+    weights: Optional[Sequence[float]] = None,
+) -> List[Tuple[Document, float]]:
+    """Merge scored lists of documents by min-max normalizing the scores of each list and summing them.
+
+    Higher scores must mean more relevant. Documents with the same content are merged, keeping the first occurrence.
+
+    Args:
+        scored_rankings: Lists of (document, score).
+        weights: Optional weight of each list.
+
+    Returns:
+        List of (document, fused score), ordered by decreasing score.
+    """
+    documents: Dict[str, Document] = {}
+    scores: Dict[str, float] = {}
+    for ranking, weight in zip(scored_rankings, _get_weights(len(scored_rankings), weights)):
+        if not ranking:
+            continue
+        values = [score for _, score in ranking]
+        low, high = min(values), max(values)
+        seen_in_ranking = set()
+        for document, score in ranking:
+            key = _document_key(document)
+            if key in seen_in_ranking:
+                continue
+            seen_in_ranking.add(key)
+            documents.setdefault(key, document)
+            normalized = (score - low) / (high - low) if high > low else 1.0
+            scores[key] = scores.get(key, 0.0) + weight * normalized
+    return sorted(((documents[key], score) for key, score in scores.items()), key=lambda x: x[1], reverse=True)
+
+
+def rank_scores(ranking: Sequence[Document]) -> List[Tuple[Document, float]]:
+    """Pair documents with a relevance score: their reranking score if all have one, otherwise a score from their rank."""
+    if ranking and all(document.reranking_score is not None for document in ranking):
+        return [(document, float(document.reranking_score)) for document in ranking]  # type: ignore[arg-type]
+    return [(document, 1.0 / rank) for rank, document in enumerate(ranking, start=1)]
@@ -0,0 +1,174 @@
+"""Measure the import time of agno modules with `python -X importtime`, and check it against a budget.
+
+Usage:
+    python -m agno.utils.import_time                       # check the default budgets
+    python -m agno.utils.import_time agno.agent --runs 10  # measure a module
+"""
+
+import argparse
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from statistics import median
+from time import perf_counter
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from agno.utils.log import log_warning
+
+# Import time budgets in milliseconds, generous enough to not fail on slower machines
+DEFAULT_IMPORT_BUDGETS_MS: Dict[str, float] = {
+    "agno": 50,
+    "agno.agent": 1500,
+    "agno.team": 2000,
+    "agno.memory.v2": 1000,
+    "agno.app.fastapi": 3000,
+    "agno.playground": 3000,
+}
+
+# Modules that must stay out of the imports of a module, because they are loaded lazily
+LAZY_IMPORTS: Dict[str, List[str]] = {
+    "agno.memory.v2.memory": ["agno.memory.agent", "agno.memory.team"],
+    "agno.models.base": ["agno.cache"],
+    "agno.vectordb.search": ["agno.vectordb.search.hybrid", "agno.vectordb.search.bm25", "agno.reranker"],
+    "agno.app.fastapi": ["agno.app.fastapi.async_router", "agno.app.fastapi.sync_router"],
+    "agno.playground": ["agno.app.playground.async_router", "agno.app.playground.sync_router"],
+}
+
+
+@dataclass
+class ImportTimeResult:
+    module: str
+    # Median import time over the runs, in milliseconds
+    total_ms: float
+    # Import times of every run, in milliseconds
+    run_times_ms: List[float] = field(default_factory=list)
+    # Modules with the highest self import time, as (module, milliseconds)
+    slowest: List[Tuple[str, float]] = field(default_factory=list)
+    # Modules imported by the module
+    imported: Set[str] = field(default_factory=set)
+
+
+def parse_importtime(output: str, module: str) -> Tuple[float, Dict[str, float], Set[str]]:
+    """Parse the stderr of `python -X importtime -c "import <module>"`.
+
+    Returns the import time of the module in milliseconds (its cumulative time and the one of its parent packages),
+    the self time of every imported module in milliseconds, and the modules imported by the module.
+    """
+    parts = module.split(".")
+    targets = {".".join(parts[: i + 1]) for i in range(len(parts))}
+    total_us = 0
+    self_times: Dict[str, float] = {}
+    imported: Set[str] = set()
+    # Imports are printed after the imports they trigger, so every line at depth 0 closes a group of lines
+    group: List[Tuple[str, float]] = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            # Header line
+            continue
+        name_field = fields[2]
+        name = name_field.strip()
+        group.append((name, int(fields[0]) / 1000))
+        if len(name_field) - len(name_field.lstrip()) > 1:
+            continue
+        # Groups of other modules at depth 0 are imported by the interpreter startup
+        if name in targets:
+            total_us += int(fields[1])
+            for group_name, self_ms in group:
+                imported.add(group_name)
+                self_times[group_name] = self_ms
+        group = []
+    return total_us / 1000, self_times, imported
+
+
+def measure_import_time(module: str, runs: int = 5, num_slowest: int = 10) -> ImportTimeResult:
+    """Measure the import time of a module in fresh interpreters, keeping the median run."""
+    run_results: List[Tuple[float, Dict[str, float], Set[str]]] = []
+    for _ in range(runs):
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+        )
+        if process.returncode != 0:
+            error = process.stderr.strip().splitlines()[-1] if process.stderr.strip() else ""
+            raise ImportError(f"Could not import {module}: {error}")
+        run_results.append(parse_importtime(process.stderr, module))
+
+    run_times_ms = [total for total, _, _ in run_results]
+    total_ms = median(run_times_ms)
+    _, self_times, imported = min(run_results, key=lambda result: abs(result[0] - total_ms))
+    slowest = sorted(self_times.items(), key=lambda item: item[1], reverse=True)[:num_slowest]
+    return ImportTimeResult(
+        module=module, total_ms=total_ms, run_times_ms=run_times_ms, slowest=slowest, imported=imported
+    )
+
+
+def check_import_budgets(
+    budgets: Optional[Dict[str, float]] = None,
+    lazy_imports: Optional[Dict[str, List[str]]] = None,
+    runs: int = 5,
+) -> List[str]:
+    """Measure the import time of modules and return the budget violations.
+
+    Args:
+        budgets: Import time budgets in milliseconds, by module. Defaults to DEFAULT_IMPORT_BUDGETS_MS.
+        lazy_imports: Modules that must not be imported, by module. Defaults to LAZY_IMPORTS.
+        runs: Number of runs of every measure.
+    """
+    budgets = DEFAULT_IMPORT_BUDGETS_MS if budgets is None else budgets
+    lazy_imports = LAZY_IMPORTS if lazy_imports is None else lazy_imports
+    violations: List[str] = []
+    for module in dict.fromkeys([*budgets, *lazy_imports]):
+        try:
+            result = measure_import_time(module, runs=runs)
+        except ImportError as e:
+            # Modules of optional dependencies that are not installed
+            log_warning(f"Skipping {module}: {e}")
+            continue
+        budget = budgets.get(module)
+        if budget is not None and result.total_ms > budget:
+            slowest = ", ".join(f"{name} ({ms:.1f}ms)" for name, ms in result.slowest[:5])
+            violations.append(f"{module} imports in {result.total_ms:.1f}ms, over its {budget:.0f}ms budget: {slowest}")
+        for lazy_module in lazy_imports.get(module, []):
+            eager = sorted(
+                name for name in result.imported if name == lazy_module or name.startswith(lazy_module + ".")
+            )
+            if eager:
+                violations.append(f"{module} imports {', '.join(eager)}, which should be imported lazily")
+    return violations
+
+
+def get_cold_start_time() -> float:
+    """Return the seconds elapsed since the agno package started importing."""
+    from agno import _IMPORT_STARTED_AT
+
+    return perf_counter() - _IMPORT_STARTED_AT
+
+
+def main(args: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure the import time of agno modules.")
+    parser.add_argument("modules", nargs="*", help="Modules to measure. Checks the default budgets if not set.")
+    parser.add_argument("--runs", type=int, default=5, help="Number of runs of every measure.")
+    parsed = parser.parse_args(args)
+
+    if not parsed.modules:
+        violations = check_import_budgets(runs=parsed.runs)
+        for violation in violations:
+            print(violation)
+        if not violations:
+            print("All import time budgets are met.")
+        return 1 if violations else 0
+
+    for module in parsed.modules:
+        result = measure_import_time(module, runs=parsed.runs)
+        print(f"{module}: {result.total_ms:.1f}ms (median of {parsed.runs} runs)")
+        for name, ms in result.slowest:
+            print(f"  {ms:8.1f}ms  {name}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,45 @@
+import sys
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Tuple
+
+# Lazy exports of every package using `lazy_exports`: package name -> {attribute name: module it is defined in}
+LAZY_EXPORTS: Dict[str, Dict[str, str]] = {}
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Return the module `__getattr__` and `__dir__` (PEP 562) of a package that imports its exports on first access.
+
+    Usage, in the `__init__.py` of a package:
+
+        __getattr__, __dir__ = lazy_exports(__name__, {"AgentMemory": "agno.memory.agent"})
+
+    Exports are registered in `LAZY_EXPORTS`, so they can be checked with `verify_lazy_exports`.
+    """
+    LAZY_EXPORTS[package] = exports
+
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(module_name), name)
+        # Cache the value on the package, so later lookups do not go through __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
+
+
+def verify_lazy_exports() -> Dict[str, str]:
+    """Import every registered lazy export and return the errors, as {"package.name": error}."""
+    errors: Dict[str, str] = {}
+    for package, exports in list(LAZY_EXPORTS.items()):
+        module = import_module(package)
+        for name in exports:
+            try:
+                getattr(module, name)
+            except Exception as e:
+                errors[f"{package}.{name}"] = f"{type(e).__name__}: {e}"
+    return errors
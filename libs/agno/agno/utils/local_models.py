@@ -0,0 +1,243 @@
+import threading
+import weakref
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from queue import Empty, Queue
+from time import monotonic
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Set, Tuple
+
+from agno.utils.log import log_debug, logger
+
+
+@dataclass
+class BatcherMetrics:
+    """Counters of a micro-batcher, used to tune `max_batch_size` and `max_wait_ms`."""
+
+    requests: int = 0
+    items: int = 0
+    batches: int = 0
+    largest_batch: int = 0
+    last_batch_size: int = 0
+    errors: int = 0
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.items / self.batches if self.batches else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "items": self.items,
+            "batches": self.batches,
+            "largest_batch": self.largest_batch,
+            "last_batch_size": self.last_batch_size,
+            "mean_batch_size": self.mean_batch_size,
+            "errors": self.errors,
+        }
+
+
+@dataclass
+class _BatchRequest:
+    items: List[Any]
+    future: Future = field(default_factory=Future)
+
+
+class MicroBatcher:
+    """Runs a batch function on a dedicated worker thread, coalescing concurrent requests into micro-batches.
+
+    Requests submitted while the worker is busy, or within `max_wait_ms` of the first request of a batch,
+    are run together in a single call to `batch_fn`, up to `max_batch_size` items.
+
+    Args:
+        batch_fn: Maps a list of inputs to a sequence of outputs of the same length.
+        max_batch_size: Maximum number of items passed to `batch_fn` at once. A single larger request is
+            run as its own batch.
+        max_wait_ms: How long the worker waits for more requests before running a batch.
+        name: Name of the worker thread.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[Any]], Sequence[Any]],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        name: str = "agno-micro-batcher",
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.metrics = BatcherMetrics()
+        # A None entry stops the worker
+        self._queue: "Queue[Optional[_BatchRequest]]" = Queue()
+        # Request that did not fit the previous batch
+        self._carry_over: Optional[_BatchRequest] = None
+        self._metrics_lock = threading.Lock()
+        self._worker = threading.Thread(target=self._run, name=name, daemon=True)
+        self._worker.start()
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of requests waiting to be batched."""
+        return self._queue.qsize()
+
+    def submit(self, items: List[Any]) -> List[Any]:
+        """Run the batch function on `items`, batched with concurrent requests, and wait for the results."""
+        if not items:
+            return []
+        request = _BatchRequest(items=list(items))
+        with self._metrics_lock:
+            self.metrics.requests += 1
+        self._queue.put(request)
+        return request.future.result()
+
+    def _collect(self) -> Optional[List[_BatchRequest]]:
+        """Block for the first request, then collect more until the batch is full or the wait window ends."""
+        first = self._carry_over or self._queue.get()
+        self._carry_over = None
+        if first is None:
+            return None
+        requests = [first]
+        num_items = len(first.items)
+        deadline = monotonic() + self.max_wait_ms / 1000
+        while num_items < self.max_batch_size:
+            timeout = deadline - monotonic()
+            try:
+                request = self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+            except Empty:
+                break
+            if request is None:
+                self._queue.put(None)
+                break
+            if num_items + len(request.items) > self.max_batch_size:
+                self._carry_over = request
+                break
+            requests.append(request)
+            num_items += len(request.items)
+        return requests
+
+    def _run(self) -> None:
+        while True:
+            requests = self._collect()
+            if requests is None:
+                return
+            self._run_batch(requests)
+
+    def close(self) -> None:
+        """Stop the worker thread once the queued requests have run."""
+        self._queue.put(None)
+
+    def _run_batch(self, requests: List[_BatchRequest]) -> None:
+        inputs = [item for request in requests for item in request.items]
+        try:
+            outputs = list(self.batch_fn(inputs))
+            if len(outputs) != len(inputs):
+                raise ValueError(f"Batch function returned {len(outputs)} results for {len(inputs)} inputs")
+        except Exception as e:
+            logger.warning(f"Micro-batch of {len(inputs)} items failed: {e}")
+            with self._metrics_lock:
+                self.metrics.errors += 1
+            for request in requests:
+                request.future.set_exception(e)
+            return
+
+        with self._metrics_lock:
+            self.metrics.batches += 1
+            self.metrics.items += len(inputs)
+            self.metrics.last_batch_size = len(inputs)
+            self.metrics.largest_batch = max(self.metrics.largest_batch, len(inputs))
+        start = 0
+        for request in requests:
+            request.future.set_result(outputs[start : start + len(request.items)])
+            start += len(request.items)
+
+
+class LocalModelRegistry:
+    """Process-wide registry of loaded local models and their micro-batchers.
+
+    Each model is loaded once per key, the first time it is requested. Concurrent requests for a model
+    that is still loading wait for the load instead of loading it again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._models: Dict[Hashable, Any] = {}
+        self._model_locks: Dict[Hashable, threading.Lock] = {}
+        self._batchers: Dict[Hashable, MicroBatcher] = {}
+        # Ids of the owners of private batchers that are still alive
+        self._owners: Set[int] = set()
+
+    def get_model(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Return the model loaded for `key`, calling `loader` to load it on first use."""
+        model = self._models.get(key)
+        if model is not None:
+            return model
+        with self._lock:
+            model_lock = self._model_locks.setdefault(key, threading.Lock())
+        with model_lock:
+            if key not in self._models:
+                log_debug(f"Loading local model: {key}")
+                self._models[key] = loader()
+            return self._models[key]
+
+    def get_batcher(
+        self,
+        key: Hashable,
+        batch_fn: Callable[[List[Any]], Sequence[Any]],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        owner: Optional[Any] = None,
+    ) -> MicroBatcher:
+        """Return the micro-batcher for `key`, starting one with `batch_fn` on first use.
+
+        With an `owner`, the batcher is private to the owner and stopped when the owner is garbage collected.
+        `batch_fn` must not reference the owner, or the owner is never collected.
+        """
+        if owner is not None:
+            key = (key, ("owner", id(owner)))
+        with self._lock:
+            batcher = self._batchers.get(key)
+            if batcher is None:
+                batcher = MicroBatcher(
+                    batch_fn=batch_fn, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms, name=f"agno-{key}"
+                )
+                self._batchers[key] = batcher
+                if owner is not None and id(owner) not in self._owners:
+                    self._owners.add(id(owner))
+                    weakref.finalize(owner, self._close_owned_batchers, id(owner))
+            return batcher
+
+    def _close_owned_batchers(self, owner_id: int) -> None:
+        """Stop the private batchers of an owner that was garbage collected."""
+        with self._lock:
+            self._owners.discard(owner_id)
+            batcher_keys = [k for k in self._batchers if isinstance(k, tuple) and k[-1:] == (("owner", owner_id),)]
+            for batcher_key in batcher_keys:
+                self._batchers.pop(batcher_key).close()
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Return the queue depth and batch metrics of every micro-batcher."""
+        with self._lock:
+            batchers: List[Tuple[Hashable, MicroBatcher]] = list(self._batchers.items())
+        return {
+            str(key): {"queue_depth": batcher.queue_depth, **batcher.metrics.to_dict()} for key, batcher in batchers
+        }
+
+    def unload(self, key: Optional[Hashable] = None) -> None:
+        """Unload a model and stop its batchers, or all models and batchers if no key is given.
+
+        Batcher keys are expected to start with the key of their model, e.g. `(model_key, "normalized")`.
+        """
+        with self._lock:
+            if key is None:
+                self._models.clear()
+                batcher_keys = list(self._batchers)
+            else:
+                self._models.pop(key, None)
+                batcher_keys = [k for k in self._batchers if k == key or (isinstance(k, tuple) and k[:1] == (key,))]
+            for batcher_key in batcher_keys:
+                self._batchers.pop(batcher_key).close()
+
+
+local_model_registry = LocalModelRegistry()
@@ -0,0 +1,132 @@
+import csv
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, Optional, Sequence
+from uuid import uuid4
+
+from agno.utils.log import log_debug
+
+# Rough number of characters per token, used to estimate the size of a result without a tokenizer
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of tokens in a string."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def iter_batches(fetchmany: Callable[[int], Sequence[Any]], batch_size: int = 1000) -> Iterator[Any]:
+    """Yield rows from a cursor-like `fetchmany` function, one batch at a time."""
+    while True:
+        batch = fetchmany(batch_size)
+        if not batch:
+            break
+        yield from batch
+
+
+def format_row(row: Sequence[Any]) -> str:
+    """Format a row as a single line of comma separated values."""
+    if len(row) == 1:
+        return str(row[0])
+    return ",".join(str(x) for x in row)
+
+
+@dataclass
+class ShapedQueryResult:
+    """The rows of a query result that fit the row and token budget, with truncation metadata."""
+
+    columns: List[str]
+    rows: List[Sequence[Any]] = field(default_factory=list)
+    truncated: bool = False
+    # Total number of rows in the result. Only known if the result was not truncated or was spilled to a file.
+    total_rows: Optional[int] = None
+    spill_file: Optional[str] = None
+
+    def truncation_note(self) -> Optional[str]:
+        if not self.truncated:
+            return None
+        note = f"[Result truncated: showing {len(self.rows)}"
+        if self.total_rows is not None:
+            note += f" of {self.total_rows}"
+        note += " rows."
+        if self.spill_file is not None:
+            note += f" Full result saved to {self.spill_file}."
+        else:
+            note += " Refine the query or add a LIMIT to see more."
+        return note + "]"
+
+    def to_csv(self) -> str:
+        """Return the result as comma separated text, followed by a truncation note if needed."""
+        output = ",".join(self.columns) + "\n" + "\n".join(format_row(row) for row in self.rows)
+        note = self.truncation_note()
+        if note is not None:
+            output += "\n" + note
+        return output
+
+
+def shape_query_result(
+    columns: Sequence[str],
+    rows: Iterator[Sequence[Any]],
+    max_rows: Optional[int] = None,
+    max_tokens: Optional[int] = None,
+    spill_dir: Optional[str] = None,
+) -> ShapedQueryResult:
+    """Consume rows until the row or token budget is exhausted.
+
+    Rows are pulled lazily from `rows`, so when no `spill_dir` is set the remaining rows are never fetched.
+    If `spill_dir` is set, the complete result is written to a csv file in that directory and its path is
+    returned with the shaped result.
+
+    Args:
+        columns: The column names of the result.
+        rows: An iterator over the rows of the result.
+        max_rows: Maximum number of rows to keep.
+        max_tokens: Maximum estimated number of tokens of the kept rows.
+        spill_dir: Directory to write the full result to when it is truncated.
+    """
+    result = ShapedQueryResult(columns=list(columns))
+    tokens_used = estimate_tokens(",".join(result.columns))
+
+    spill_path: Optional[Path] = None
+    spill_file = None
+    spill_writer = None
+    if spill_dir is not None:
+        spill_path = Path(spill_dir).joinpath(f"query_result_{uuid4().hex}.csv")
+        spill_path.parent.mkdir(parents=True, exist_ok=True)
+        spill_file = spill_path.open("w", newline="")
+        spill_writer = csv.writer(spill_file)
+        spill_writer.writerow(result.columns)
+
+    num_rows = 0
+    try:
+        for row in rows:
+            num_rows += 1
+            if spill_writer is not None:
+                spill_writer.writerow(row)
+            if result.truncated:
+                continue
+
+            row_tokens = estimate_tokens(format_row(row)) + 1
+            if (max_rows is not None and len(result.rows) >= max_rows) or (
+                max_tokens is not None and tokens_used + row_tokens > max_tokens
+            ):
+                result.truncated = True
+                if spill_writer is None:
+                    break
+                continue
+            result.rows.append(row)
+            tokens_used += row_tokens
+    finally:
+        if spill_file is not None:
+            spill_file.close()
+
+    if not result.truncated or spill_writer is not None:
+        result.total_rows = num_rows
+    if spill_path is not None:
+        if result.truncated:
+            result.spill_file = str(spill_path)
+            log_debug(f"Spilled {num_rows} rows to {spill_path}")
+        else:
+            # The full result fits the budget, no need to keep a copy
+            spill_path.unlink()
+    return result
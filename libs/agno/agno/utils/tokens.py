@@ -0,0 +1,118 @@
+import json
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple
+
+from agno.utils.log import log_debug
+
+if TYPE_CHECKING:
+    from agno.models.base import Model
+    from agno.models.message import Message
+
+# Rough number of characters per token, used when no tokenizer is available
+CHARS_PER_TOKEN = 4
+# Tokens added by the chat format for every message (role, separators)
+MESSAGE_OVERHEAD_TOKENS = 4
+# Context window used when the model's is unknown
+DEFAULT_CONTEXT_WINDOW = 32_768
+# Output tokens reserved when the model does not set max_tokens
+DEFAULT_RESERVED_OUTPUT_TOKENS = 4096
+
+# Context windows by model id prefix. The longest matching prefix wins.
+CONTEXT_WINDOWS = {
+    "gpt-3.5": 16_385,
+    "gpt-4": 8_192,
+    "gpt-4-turbo": 128_000,
+    "gpt-4o": 128_000,
+    "gpt-4.1": 1_047_576,
+    "gpt-5": 400_000,
+    "o1": 200_000,
+    "o3": 200_000,
+    "o4": 200_000,
+    "claude": 200_000,
+    "gemini": 1_048_576,
+    "llama": 128_000,
+    "meta-llama": 128_000,
+    "mistral": 32_000,
+    "mistral-large": 128_000,
+    "deepseek": 64_000,
+    "command-r": 128_000,
+    "qwen": 32_768,
+}
+
+
+def _approximate_token_count(text: str) -> int:
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+@lru_cache(maxsize=32)
+def get_tokenizer(model_id: Optional[str] = None) -> Callable[[str], int]:
+    """Return a function counting the tokens of a text for a model.
+
+    Uses tiktoken when it is installed and its encoding files are available (they are cached locally
+    after the first download). Otherwise falls back to an estimate of one token per 4 characters,
+    so counting works offline and without extra dependencies.
+    """
+    try:
+        import tiktoken
+
+        try:
+            encoding = tiktoken.encoding_for_model(model_id) if model_id else tiktoken.get_encoding("cl100k_base")
+        except KeyError:
+            encoding = tiktoken.get_encoding("o200k_base")
+        return lambda text: len(encoding.encode(text, disallowed_special=()))
+    except Exception as e:
+        log_debug(f"Using approximate token counts for model {model_id}: {e}")
+        return _approximate_token_count
+
+
+def count_tokens(text: str, model_id: Optional[str] = None) -> int:
+    """Count the tokens of a text."""
+    if not text:
+        return 0
+    return get_tokenizer(model_id)(text)
+
+
+def _message_text(message: "Message") -> str:
+    text = message.get_content_string()
+    if message.tool_calls:
+        text += json.dumps(message.tool_calls, default=str)
+    return text
+
+
+def count_message_tokens(message: "Message", model_id: Optional[str] = None) -> int:
+    """Count the tokens of a message, caching the count on the message.
+
+    The cached count is reused as long as the model and the message text do not change.
+    Media is not counted.
+    """
+    text = _message_text(message)
+    cache_key: Tuple[Optional[str], int] = (model_id, hash(text))
+    cached = message._token_count
+    if cached is not None and cached[0] == cache_key:
+        return cached[1]
+    num_tokens = count_tokens(text, model_id) + MESSAGE_OVERHEAD_TOKENS
+    message._token_count = (cache_key, num_tokens)
+    return num_tokens
+
+
+def count_messages_tokens(messages: List["Message"], model_id: Optional[str] = None) -> int:
+    return sum(count_message_tokens(message, model_id) for message in messages)
+
+
+def get_context_window(model: "Model") -> int:
+    """Return the context window of a model, from `model.context_window` or the known model ids."""
+    if model.context_window is not None:
+        return model.context_window
+    model_id = (model.id or "").lower().split("/")[-1]
+    matches = [prefix for prefix in CONTEXT_WINDOWS if model_id.startswith(prefix)]
+    if not matches:
+        log_debug(f"Unknown context window for model {model.id}, using {DEFAULT_CONTEXT_WINDOW}")
+        return DEFAULT_CONTEXT_WINDOW
+    return CONTEXT_WINDOWS[max(matches, key=len)]
+
+
+def get_input_token_budget(model: "Model") -> int:
+    """Return the number of input tokens available: the context window minus the reserved output tokens."""
+    max_output_tokens: Any = getattr(model, "max_completion_tokens", None) or getattr(model, "max_tokens", None)
+    reserved = max_output_tokens if isinstance(max_output_tokens, int) else DEFAULT_RESERVED_OUTPUT_TOKENS
+    return max(get_context_window(model) - reserved, 0)
@@ -1,12 +1,26 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
 
 from agno.document import Document
+from agno.utils.log import log_info
+from agno.vectordb.index import IndexSpec, SearchParams
+
+# Search params set for the current context using `VectorDb.using_search_params`, by id of the vector db
+_search_params_overrides: ContextVar[Optional[Dict[int, SearchParams]]] = ContextVar(
+    "search_params_overrides", default=None
+)
 
 
 class VectorDb(ABC):
     """Base class for Vector Databases"""
 
+    # Index configuration, used by backends that support index management
+    index_spec: Optional[IndexSpec] = None
+    # Number of rows written since the index was last built
+    rows_since_index_build: int = 0
+
     @abstractmethod
     def create(self) -> None:
         raise NotImplementedError
@@ -91,6 +105,47 @@ class VectorDb(ABC):
     def optimize(self) -> None:
         raise NotImplementedError
 
+    def exact_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        """Search without using the approximate index. Used as ground truth when benchmarking recall."""
+        raise NotImplementedError
+
+    def get_index_spec(self) -> Optional[IndexSpec]:
+        return self.index_spec
+
+    def create_index(self, index_spec: Optional[IndexSpec] = None, force_recreate: bool = False) -> None:
+        """Build the approximate nearest neighbour index described by `index_spec`, or the current index if None."""
+        raise NotImplementedError
+
+    def get_search_params(self) -> SearchParams:
+        """Return the search params for the current query: the context override, else the index defaults."""
+        override = (_search_params_overrides.get() or {}).get(id(self))
+        if override is not None:
+            return override
+        index_spec = self.get_index_spec()
+        if index_spec is not None:
+            return index_spec.search_params
+        return SearchParams()
+
+    @contextmanager
+    def using_search_params(self, search_params: SearchParams) -> Iterator[None]:
+        """Use `search_params` for searches of this vector db made in this context (thread or task)."""
+        token = _search_params_overrides.set({**(_search_params_overrides.get() or {}), id(self): search_params})
+        try:
+            yield
+        finally:
+            _search_params_overrides.reset(token)
+
+    def record_writes(self, num_rows: int) -> None:
+        """Track written rows and rebuild the index once `index_spec.rebuild_threshold` is reached."""
+        self.rows_since_index_build += num_rows
+        index_spec = self.get_index_spec()
+        if index_spec is None or index_spec.rebuild_threshold is None:
+            return
+        if self.rows_since_index_build >= index_spec.rebuild_threshold:
+            log_info(f"{self.rows_since_index_build} rows written since last index build, rebuilding index")
+            self.create_index(force_recreate=True)
+            self.rows_since_index_build = 0
+
     @abstractmethod
     def delete(self) -> bool:
         raise NotImplementedError
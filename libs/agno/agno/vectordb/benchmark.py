@@ -0,0 +1,203 @@
+from dataclasses import dataclass, field
+from statistics import mean, median
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+from agno.document import Document
+from agno.utils.log import log_debug
+from agno.utils.string import safe_content_hash
+from agno.vectordb.base import VectorDb
+from agno.vectordb.index import SearchParams
+
+
+@dataclass
+class RecallBenchmarkResult:
+    """Recall@k and latency of approximate search compared to exact search on the same data."""
+
+    k: int
+    num_queries: int
+    recall_at_k: float
+    mean_latency_ms: float
+    p50_latency_ms: float
+    p95_latency_ms: float
+    exact_mean_latency_ms: float
+    search_params: Optional[SearchParams] = None
+    per_query_recall: List[float] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "k": self.k,
+            "num_queries": self.num_queries,
+            "recall_at_k": self.recall_at_k,
+            "mean_latency_ms": self.mean_latency_ms,
+            "p50_latency_ms": self.p50_latency_ms,
+            "p95_latency_ms": self.p95_latency_ms,
+            "exact_mean_latency_ms": self.exact_mean_latency_ms,
+            "search_params": self.search_params.model_dump() if self.search_params is not None else None,
+        }
+
+
+def _document_key(document: Document) -> str:
+    return document.id or safe_content_hash(document.content)
+
+
+def _percentile(values: Sequence[float], percentile: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(percentile / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def recall_at_k(approximate: Sequence[Document], exact: Sequence[Document], k: int) -> float:
+    """Fraction of the exact top-k documents found in the approximate top-k."""
+    exact_keys = {_document_key(doc) for doc in exact[:k]}
+    if not exact_keys:
+        return 1.0
+    approximate_keys = {_document_key(doc) for doc in approximate[:k]}
+    return len(exact_keys & approximate_keys) / len(exact_keys)
+
+
+def benchmark_recall(
+    vector_db: VectorDb,
+    queries: Sequence[str],
+    k: int = 10,
+    filters: Optional[Dict[str, Any]] = None,
+    search_params: Optional[Sequence[SearchParams]] = None,
+) -> List[RecallBenchmarkResult]:
+    """Measure recall@k and latency of `vector_db.search` against `vector_db.exact_search`.
+
+    Exact results are computed once per query. Approximate search is then run once per entry in
+    `search_params` (or once with the default params), so a single call can sweep e.g. `ef_search` values.
+
+    Args:
+        vector_db: The vector db to benchmark. It must implement `exact_search`.
+        queries: The queries to run.
+        k: The number of results to compare.
+        filters: Filters applied to both the exact and approximate searches.
+        search_params: The query-time params to benchmark. Defaults to the vector db's default params.
+
+    Returns:
+        List[RecallBenchmarkResult]: One result per entry in `search_params`.
+    """
+    exact_results: List[List[Document]] = []
+    exact_latencies: List[float] = []
+    for query in queries:
+        start = perf_counter()
+        exact_results.append(vector_db.exact_search(query=query, limit=k, filters=filters))
+        exact_latencies.append((perf_counter() - start) * 1000)
+
+    results: List[RecallBenchmarkResult] = []
+    params_to_run: List[Optional[SearchParams]] = list(search_params) if search_params else [None]
+    for params in params_to_run:
+        latencies: List[float] = []
+        recalls: List[float] = []
+        for query, exact in zip(queries, exact_results):
+            start = perf_counter()
+            if params is not None:
+                with vector_db.using_search_params(params):
+                    approximate = vector_db.search(query=query, limit=k, filters=filters)
+            else:
+                approximate = vector_db.search(query=query, limit=k, filters=filters)
+            latencies.append((perf_counter() - start) * 1000)
+            recalls.append(recall_at_k(approximate, exact, k))
+
+        result = RecallBenchmarkResult(
+            k=k,
+            num_queries=len(queries),
+            recall_at_k=mean(recalls) if recalls else 1.0,
+            mean_latency_ms=mean(latencies) if latencies else 0.0,
+            p50_latency_ms=median(latencies) if latencies else 0.0,
+            p95_latency_ms=_percentile(latencies, 95),
+            exact_mean_latency_ms=mean(exact_latencies) if exact_latencies else 0.0,
+            search_params=params,
+            per_query_recall=recalls,
+        )
+        log_debug(f"Recall benchmark: {result.to_dict()}")
+        results.append(result)
+    return results
+
+
+@dataclass
+class SearchBenchmarkResult:
+    """Recall@k and latency of a search against labelled relevant documents."""
+
+    name: str
+    k: int
+    num_queries: int
+    recall_at_k: float
+    mean_latency_ms: float
+    p50_latency_ms: float
+    p95_latency_ms: float
+    per_query_recall: List[float] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "k": self.k,
+            "num_queries": self.num_queries,
+            "recall_at_k": self.recall_at_k,
+            "mean_latency_ms": self.mean_latency_ms,
+            "p50_latency_ms": self.p50_latency_ms,
+            "p95_latency_ms": self.p95_latency_ms,
+        }
+
+
+def benchmark_search(
+    searches: Dict[str, VectorDb],
+    queries: Sequence[str],
+    relevant: Sequence[Sequence[str]],
+    k: int = 10,
+    filters: Optional[Dict[str, Any]] = None,
+) -> List[SearchBenchmarkResult]:
+    """Measure recall@k and latency of searches against the documents known to be relevant to each query.
+
+    Unlike `benchmark_recall`, results are compared to labels rather than to exact vector search, so vector,
+    keyword and hybrid searches, on any vector db, can be compared on the same queries.
+
+    Args:
+        searches: The vector dbs to benchmark, by name, e.g. a vector db and a HybridSearch wrapping it.
+        queries: The queries to run.
+        relevant: For each query, the ids, names or contents of its relevant documents.
+        k: The number of results to compare.
+        filters: Filters applied to all searches.
+
+    Returns:
+        List[SearchBenchmarkResult]: One result per entry in `searches`.
+    """
+    if len(relevant) != len(queries):
+        raise ValueError("relevant must have one entry per query")
+
+    results: List[SearchBenchmarkResult] = []
+    for name, vector_db in searches.items():
+        latencies: List[float] = []
+        recalls: List[float] = []
+        for query, query_relevant in zip(queries, relevant):
+            start = perf_counter()
+            documents = vector_db.search(query=query, limit=k, filters=filters)
+            latencies.append((perf_counter() - start) * 1000)
+            relevant_keys: Set[str] = set(query_relevant)
+            if not relevant_keys:
+                recalls.append(1.0)
+                continue
+            found = {
+                key
+                for document in documents[:k]
+                for key in (document.id, document.name, document.content)
+                if key in relevant_keys
+            }
+            recalls.append(len(found) / len(relevant_keys))
+
+        result = SearchBenchmarkResult(
+            name=name,
+            k=k,
+            num_queries=len(queries),
+            recall_at_k=mean(recalls) if recalls else 1.0,
+            mean_latency_ms=mean(latencies) if latencies else 0.0,
+            p50_latency_ms=median(latencies) if latencies else 0.0,
+            p95_latency_ms=_percentile(latencies, 95),
+            per_query_recall=recalls,
+        )
+        log_debug(f"Search benchmark: {result.to_dict()}")
+        results.append(result)
+    return results
@@ -0,0 +1,39 @@
+from enum import Enum
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel
+
+
+class IndexType(str, Enum):
+    flat = "flat"
+    ivfflat = "ivfflat"
+    hnsw = "hnsw"
+
+
+class SearchParams(BaseModel):
+    """Per-query knobs trading recall against latency. Unset values use the backend defaults."""
+
+    # HNSW: size of the dynamic candidate list at query time
+    ef_search: Optional[int] = None
+    # IVF: number of lists/partitions to probe at query time
+    probes: Optional[int] = None
+    # Bypass the index and run an exact (brute-force) search
+    exact: bool = False
+
+
+class IndexSpec(BaseModel):
+    """Backend-agnostic description of an approximate nearest neighbour index."""
+
+    index_type: IndexType = IndexType.hnsw
+    name: Optional[str] = None
+    # HNSW build parameters
+    m: int = 16
+    ef_construction: int = 200
+    # IVF build parameters
+    lists: int = 100
+    # Rebuild the index once this many rows have been written since the last build
+    rebuild_threshold: Optional[int] = None
+    # Default query-time parameters
+    search_params: SearchParams = SearchParams()
+    # Backend specific configuration
+    configuration: Dict[str, Any] = {}
@@ -14,6 +14,7 @@ from agno.reranker.base import Reranker
 from agno.utils.log import log_debug, log_info, logger
 from agno.vectordb.base import VectorDb
 from agno.vectordb.distance import Distance
+from agno.vectordb.index import IndexSpec, IndexType, SearchParams
 from agno.vectordb.search import SearchType
 
 
@@ -37,6 +38,7 @@ class LanceDb(VectorDb):
         use_tantivy: Whether to use Tantivy for full text search.
         on_bad_vectors: What to do if the vector is bad. One of "error", "drop", "fill", "null".
         fill_value: The value to fill the vector with if on_bad_vectors is "fill".
+        index_spec: The vector index configuration and default search params.
     """
 
     def __init__(
@@ -56,6 +58,7 @@ class LanceDb(VectorDb):
         use_tantivy: bool = True,
         on_bad_vectors: Optional[str] = None,  # One of "error", "drop", "fill", "null".
         fill_value: Optional[float] = None,  # Only used if on_bad_vectors is "fill"
+        index_spec: Optional[IndexSpec] = None,
     ):
         # Embedder for embedding the document contents
         if embedder is None:
@@ -114,6 +117,7 @@ class LanceDb(VectorDb):
         self.nprobes: Optional[int] = nprobes
         self.on_bad_vectors: Optional[str] = on_bad_vectors
         self.fill_value: Optional[float] = fill_value
+        self.index_spec: Optional[IndexSpec] = index_spec
         self.fts_index_exists = False
         self.use_tantivy = use_tantivy
 
@@ -261,6 +265,7 @@ class LanceDb(VectorDb):
             self.table.add(data)
 
         log_debug(f"Inserted {len(data)} documents")
+        self.record_writes(len(data))
 
     async def async_insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         """
@@ -467,12 +472,84 @@ class LanceDb(VectorDb):
             query=query_embedding,
             vector_column_name=self._vector_col,
         ).limit(limit)
-
-        if self.nprobes:
-            results.nprobes(self.nprobes)
+        self._apply_search_params(results)
 
         return results.to_pandas()
 
+    def exact_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        """
+        Search the vectors without using the vector index.
+
+        Args:
+            query (str): Query string to search for
+            limit (int): Maximum number of results to return
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search
+
+        Returns:
+            List[Document]: List of matching documents
+        """
+        if filters and self.table is not None:
+            # The meta_data only lives in the JSON payload, so it cannot go into a where clause:
+            # rank every row and filter before cutting the results down to the limit.
+            search_limit = max(self.table.count_rows(), limit)
+        else:
+            search_limit = limit
+        with self.using_search_params(SearchParams(exact=True)):
+            results = self.vector_search(query, search_limit)
+        if results is None:
+            return []
+        search_results = self._build_search_results(results)
+        if filters:
+            search_results = [
+                doc
+                for doc in search_results
+                if doc.meta_data is not None and all(doc.meta_data.get(k) == v for k, v in filters.items())
+            ]
+        return search_results[:limit]
+
+    def _apply_search_params(self, results: Any) -> None:
+        search_params = self.get_search_params()
+        if search_params.exact:
+            results.bypass_vector_index()
+            return
+        nprobes = search_params.probes or self.nprobes
+        if nprobes:
+            results.nprobes(nprobes)
+        if search_params.ef_search:
+            results.ef(search_params.ef_search)
+
+    def create_index(self, index_spec: Optional[IndexSpec] = None, force_recreate: bool = False) -> None:
+        """
+        Build the vector index of the table.
+
+        Args:
+            index_spec (Optional[IndexSpec]): The index configuration. If None, the current configuration is used.
+            force_recreate (bool): Replace the index if it already exists.
+        """
+        if index_spec is not None:
+            self.index_spec = index_spec
+        if self.index_spec is None or self.table is None:
+            return
+
+        if self.index_spec.index_type == IndexType.flat:
+            log_debug("Flat index configured, skipping vector index creation")
+            return
+
+        metric = {Distance.l2: "l2", Distance.max_inner_product: "dot"}.get(self.distance, "cosine")
+        index_type = "IVF_FLAT" if self.index_spec.index_type == IndexType.ivfflat else "IVF_HNSW_SQ"
+        log_debug(f"Creating {index_type} index on table {self.table_name}")
+        self.table.create_index(
+            metric=metric,
+            num_partitions=self.index_spec.lists,
+            vector_column_name=self._vector_col,
+            replace=force_recreate,
+            index_type=index_type,  # type: ignore
+            m=self.index_spec.m,
+            ef_construction=self.index_spec.ef_construction,
+            name=self.index_spec.name,
+        )
+        self.rows_since_index_build = 0
+
     def hybrid_search(self, query: str, limit: int = 5) -> List[Document]:
         query_embedding = self.embedder.get_embedding(query)
         if query_embedding is None:
@@ -496,9 +573,7 @@ class LanceDb(VectorDb):
             .text(query)
             .limit(limit)
         )
-
-        if self.nprobes:
-            results.nprobes(self.nprobes)
+        self._apply_search_params(results)
 
         return results.to_pandas()
 
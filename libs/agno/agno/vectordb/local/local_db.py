@@ -0,0 +1,650 @@
+import asyncio
+import json
+import shutil
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError("`numpy` not installed. Please install using `pip install numpy`")
+
+from agno.document import Document
+from agno.embedder import Embedder
+from agno.reranker.base import Reranker
+from agno.utils.log import log_debug, log_info, logger
+from agno.utils.string import safe_content_hash
+from agno.vectordb.base import VectorDb
+from agno.vectordb.distance import Distance
+from agno.vectordb.index import IndexSpec, IndexType, SearchParams
+from agno.vectordb.quantization import (
+    Quantization,
+    dequantize_int8,
+    hamming_similarity,
+    quantize_binary,
+    quantize_int8,
+)
+
+# Number of vectors scored at once, bounds the memory used by a search
+SCORE_CHUNK_SIZE = 65536
+
+# File suffix of the stored vectors for each quantization
+VECTOR_FILE_SUFFIX = {
+    Quantization.none: "float32",
+    Quantization.half: "float16",
+    Quantization.int8: "int8",
+    Quantization.binary: "binary",
+}
+
+
+class LocalVectorDb(VectorDb):
+    """
+    In-process vector database backed by memory-mapped files, for small to medium knowledge bases.
+
+    Vectors are appended to a binary file that is memory-mapped for search, so the collection does not need to
+    fit in RAM. Document contents and metadata are kept in an append-only JSON lines log, with an inverted index
+    over metadata values used for filtering. An optional IVF index narrows searches to the closest clusters.
+
+    Writes are serialized by a lock and should come from a single process. Readers do not block each other,
+    and readers in other processes pick up appended rows on their next search.
+
+    Args:
+        collection: Name of the collection.
+        path: Directory where collections are stored.
+        embedder: The embedder used to embed documents and queries.
+        distance: Distance metric used to compare vectors.
+        quantization: How vectors are stored: full precision, float16, int8 (4x smaller) or binary (32x smaller).
+        rescore_multiplier: If set with a quantization, full precision vectors are kept alongside the quantized
+            ones and the top `limit * rescore_multiplier` candidates are re-scored exactly.
+        index_spec: Optional index configuration. Supports `IndexType.flat` and `IndexType.ivfflat`.
+        reranker: Optional reranker for the search results.
+    """
+
+    def __init__(
+        self,
+        collection: str,
+        path: Union[str, Path] = "tmp/local_vectordb",
+        embedder: Optional[Embedder] = None,
+        distance: Distance = Distance.cosine,
+        quantization: Quantization = Quantization.none,
+        rescore_multiplier: Optional[int] = None,
+        index_spec: Optional[IndexSpec] = None,
+        reranker: Optional[Reranker] = None,
+    ):
+        if not collection:
+            raise ValueError("Collection name must be provided.")
+        if rescore_multiplier is not None and rescore_multiplier < 1:
+            raise ValueError("rescore_multiplier must be at least 1")
+        if index_spec is not None and index_spec.index_type == IndexType.hnsw:
+            raise ValueError("LocalVectorDb does not support hnsw indexes, use IndexType.ivfflat or IndexType.flat")
+
+        # Embedder for embedding the document contents
+        if embedder is None:
+            from agno.embedder.openai import OpenAIEmbedder
+
+            embedder = OpenAIEmbedder()
+            log_info("Embedder not provided, using OpenAIEmbedder as default.")
+        self.embedder: Embedder = embedder
+        self.dimensions: Optional[int] = self.embedder.dimensions
+        if self.dimensions is None:
+            raise ValueError("Embedder.dimensions must be set.")
+
+        self.collection: str = collection
+        self.path: Path = Path(path).joinpath(collection)
+        self.distance: Distance = distance
+        self.quantization: Quantization = Quantization(quantization)
+        self.rescore_multiplier: Optional[int] = rescore_multiplier if self.quantization != Quantization.none else None
+        self.index_spec: Optional[IndexSpec] = index_spec
+        self.reranker: Optional[Reranker] = reranker
+
+        # Serializes writes. Readers work on snapshots of the in-memory state.
+        self._lock = threading.RLock()
+        self._reset_state()
+
+    @property
+    def _vectors_file(self) -> Path:
+        return self.path.joinpath(f"vectors.{VECTOR_FILE_SUFFIX[self.quantization]}")
+
+    @property
+    def _full_vectors_file(self) -> Path:
+        return self.path.joinpath("vectors_full.float32")
+
+    @property
+    def _scales_file(self) -> Path:
+        return self.path.joinpath("scales.float32")
+
+    @property
+    def _records_file(self) -> Path:
+        return self.path.joinpath("records.jsonl")
+
+    @property
+    def _index_file(self) -> Path:
+        return self.path.joinpath("ivf_index.npz")
+
+    def _reset_state(self) -> None:
+        # Row number -> record (id, name, content, meta_data, usage, content_hash)
+        self._records: List[Dict[str, Any]] = []
+        self._deleted: Set[int] = set()
+        self._id_to_row: Dict[str, int] = {}
+        self._hash_to_row: Dict[str, int] = {}
+        self._name_counts: Dict[str, int] = {}
+        # Inverted index over metadata: key -> json encoded value -> rows
+        self._meta_index: Dict[str, Dict[str, List[int]]] = {}
+        # Offset of the records log that has been loaded
+        self._records_offset: int = 0
+        # Memory-mapped vectors, int8 scales and full precision vectors, reopened when rows are added
+        self._vectors: Optional[np.ndarray] = None
+        self._scales: Optional[np.ndarray] = None
+        self._full_vectors: Optional[np.ndarray] = None
+        # IVF index: centroids and the list of each row indexed at build time
+        self._centroids: Optional[np.ndarray] = None
+        self._assignments: Optional[np.ndarray] = None
+
+    def create(self) -> None:
+        """Create the collection directory if it does not exist and load the collection."""
+        with self._lock:
+            if not self.exists():
+                log_debug(f"Creating collection: {self.collection} at {self.path}")
+                self.path.mkdir(parents=True, exist_ok=True)
+                self._records_file.touch()
+                self._vectors_file.touch()
+                if self.quantization == Quantization.int8:
+                    self._scales_file.touch()
+                if self.rescore_multiplier is not None:
+                    self._full_vectors_file.touch()
+            self._refresh()
+
+    async def async_create(self) -> None:
+        """Create the collection asynchronously by running in a thread."""
+        await asyncio.to_thread(self.create)
+
+    def _refresh(self) -> None:
+        """Load records appended to the log since the last refresh, including those written by other processes."""
+        if not self._records_file.exists():
+            return
+        if self._records_file.stat().st_size == self._records_offset:
+            return
+        with self._lock:
+            with self._records_file.open("rb") as f:
+                f.seek(self._records_offset)
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        # Partially written line, it is picked up on the next refresh
+                        break
+                    self._records_offset += len(line)
+                    self._apply_log_entry(json.loads(line))
+            self._vectors = None
+            self._scales = None
+            self._full_vectors = None
+            if self._centroids is None and self._index_file.exists():
+                self._load_index()
+
+    def _apply_log_entry(self, entry: Dict[str, Any]) -> None:
+        if "deleted" in entry:
+            row = entry["deleted"]
+            self._deleted.add(row)
+            record = self._records[row]
+            if self._id_to_row.get(record["id"]) == row:
+                del self._id_to_row[record["id"]]
+            if self._hash_to_row.get(record["content_hash"]) == row:
+                del self._hash_to_row[record["content_hash"]]
+            if record.get("name") is not None:
+                self._name_counts[record["name"]] -= 1
+            return
+
+        row = len(self._records)
+        self._records.append(entry)
+        self._id_to_row[entry["id"]] = row
+        self._hash_to_row[entry["content_hash"]] = row
+        if entry.get("name") is not None:
+            self._name_counts[entry["name"]] = self._name_counts.get(entry["name"], 0) + 1
+        for key, value in (entry.get("meta_data") or {}).items():
+            self._meta_index.setdefault(key, {}).setdefault(json.dumps(value, sort_keys=True), []).append(row)
+
+    def _get_vectors(self) -> np.ndarray:
+        """Return the memory-mapped (possibly quantized) vectors of the loaded rows."""
+        num_rows = len(self._records)
+        dimensions = int(self.dimensions or 0)
+        width = (dimensions + 7) // 8 if self.quantization == Quantization.binary else dimensions
+        if num_rows == 0:
+            return np.zeros((0, width), dtype=np.float32)
+        if self._vectors is None or self._vectors.shape[0] != num_rows:
+            # Only the rows of loaded records are mapped, vectors written ahead of their records are ignored
+            dtype = {
+                Quantization.none: np.float32,
+                Quantization.half: np.float16,
+                Quantization.int8: np.int8,
+                Quantization.binary: np.uint8,
+            }[self.quantization]
+            self._vectors = np.memmap(self._vectors_file, dtype=dtype, mode="r", shape=(num_rows, width))
+            if self.quantization == Quantization.int8:
+                self._scales = np.memmap(self._scales_file, dtype=np.float32, mode="r", shape=(num_rows,))
+            if self.rescore_multiplier is not None:
+                self._full_vectors = np.memmap(
+                    self._full_vectors_file, dtype=np.float32, mode="r", shape=(num_rows, dimensions)
+                )
+        return self._vectors
+
+    def _dequantize(self, rows: np.ndarray) -> np.ndarray:
+        """Return the vectors of the rows as float32, at full precision if it is stored."""
+        # The arrays are read under the lock, a concurrent write reopens them
+        with self._lock:
+            vectors = self._get_vectors()[rows]
+            if self._full_vectors is not None:
+                return np.asarray(self._full_vectors[rows])
+            scales = self._scales[rows] if self._scales is not None else None
+        if self.quantization == Quantization.int8 and scales is not None:
+            return dequantize_int8(vectors, scales)
+        if self.quantization == Quantization.binary:
+            # Map bits to +-1, scaled to unit length
+            signs = np.unpackbits(vectors, axis=-1)[:, : self.dimensions].astype(np.float32) * 2 - 1
+            return signs / np.sqrt(self.dimensions or 1)
+        return np.asarray(vectors, dtype=np.float32)
+
+    def _quantized_score(self, rows: np.ndarray, query_vector: np.ndarray) -> np.ndarray:
+        """Similarity of the stored (quantized) vectors of the rows to the query, higher is closer."""
+        with self._lock:
+            vectors = self._get_vectors()[rows]
+            scales = self._scales[rows] if self._scales is not None else None
+        if self.quantization == Quantization.binary:
+            return hamming_similarity(vectors, quantize_binary(query_vector[None, :])[0])
+        if self.quantization == Quantization.int8 and scales is not None:
+            return self._score(dequantize_int8(vectors, scales), query_vector)
+        return self._score(np.asarray(vectors, dtype=np.float32), query_vector)
+
+    def _prepare_vector(self, embedding: List[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        if vector.shape != (self.dimensions,):
+            raise ValueError(f"Embedding has {vector.shape[0]} dimensions, expected {self.dimensions}")
+        if self.distance == Distance.cosine:
+            norm = np.linalg.norm(vector)
+            if norm > 0:
+                vector = vector / norm
+        return vector
+
+    def _truncate_vectors(self, num_rows: int) -> None:
+        """Drop vector rows beyond the records, left by a write interrupted before its records were appended."""
+        dimensions = int(self.dimensions or 0)
+        row_sizes = [
+            (
+                self._vectors_file,
+                {
+                    Quantization.none: dimensions * 4,
+                    Quantization.half: dimensions * 2,
+                    Quantization.int8: dimensions,
+                    Quantization.binary: (dimensions + 7) // 8,
+                }[self.quantization],
+            )
+        ]
+        if self.quantization == Quantization.int8:
+            row_sizes.append((self._scales_file, 4))
+        if self.rescore_multiplier is not None:
+            row_sizes.append((self._full_vectors_file, dimensions * 4))
+        for file, row_size in row_sizes:
+            if file.exists() and file.stat().st_size > num_rows * row_size:
+                log_debug(f"Dropping vectors without records from {file}")
+                with file.open("r+b") as f:
+                    f.truncate(num_rows * row_size)
+
+    def _append_rows(self, records: List[Dict[str, Any]], vectors: List[np.ndarray], deleted_rows: List[int]) -> None:
+        """Append vectors and records to the collection files. Vectors are written before the records referencing them."""
+        if not self.exists():
+            self.create()
+        self._refresh()
+        # The row of a vector is its position in the file, so it must follow the vectors of the loaded records
+        self._truncate_vectors(len(self._records))
+        matrix = np.vstack(vectors) if vectors else np.zeros((0, int(self.dimensions or 0)), dtype=np.float32)
+        with self._vectors_file.open("ab") as f:
+            if self.quantization == Quantization.int8:
+                codes, scales = quantize_int8(matrix)
+                f.write(codes.tobytes())
+                with self._scales_file.open("ab") as scales_f:
+                    scales_f.write(scales.tobytes())
+            elif self.quantization == Quantization.binary:
+                f.write(quantize_binary(matrix).tobytes())
+            elif self.quantization == Quantization.half:
+                f.write(matrix.astype(np.float16).tobytes())
+            else:
+                f.write(matrix.astype(np.float32).tobytes())
+        if self.rescore_multiplier is not None:
+            with self._full_vectors_file.open("ab") as f:
+                f.write(matrix.astype(np.float32).tobytes())
+
+        with self._records_file.open("a", encoding="utf-8") as f:
+            for row in deleted_rows:
+                f.write(json.dumps({"deleted": row}) + "\n")
+            for record in records:
+                f.write(json.dumps(record, default=str) + "\n")
+        self._refresh()
+        self.record_writes(len(records))
+
+    def _write_documents(self, documents: List[Document], filters: Optional[Dict[str, Any]], upsert: bool) -> None:
+        with self._lock:
+            self._refresh()
+            records: List[Dict[str, Any]] = []
+            vectors: List[np.ndarray] = []
+            deleted_rows: List[int] = []
+            seen_ids: Set[str] = set()
+            for document in documents:
+                try:
+                    document.embed(embedder=self.embedder)
+                    if document.embedding is None:
+                        logger.error(f"Error embedding document: {document.name}")
+                        continue
+                    # Validated before anything is recorded, so a bad embedding leaves no record without a vector
+                    vector = self._prepare_vector(document.embedding)
+                    cleaned_content = document.content.replace("\x00", "\ufffd")
+                    content_hash = safe_content_hash(document.content)
+                    doc_id = content_hash if upsert else (document.id or content_hash)
+                    if doc_id in seen_ids:
+                        continue
+                    if doc_id in self._id_to_row and not upsert:
+                        log_debug(f"Document {doc_id} already exists, skipping")
+                        continue
+
+                    meta_data = dict(document.meta_data or {})
+                    if filters:
+                        meta_data.update(filters)
+                    record = {
+                        "id": doc_id,
+                        "name": document.name,
+                        "content": cleaned_content,
+                        "meta_data": meta_data,
+                        "usage": document.usage,
+                        "content_hash": content_hash,
+                    }
+                except Exception as e:
+                    logger.error(f"Error processing document '{document.name}': {e}")
+                    continue
+
+                seen_ids.add(doc_id)
+                if doc_id in self._id_to_row:
+                    deleted_rows.append(self._id_to_row[doc_id])
+                records.append(record)
+                vectors.append(vector)
+
+            if records or deleted_rows:
+                self._append_rows(records, vectors, deleted_rows)
+            log_debug(f"Wrote {len(records)} documents to collection {self.collection}")
+
+    def doc_exists(self, document: Document) -> bool:
+        self._refresh()
+        return safe_content_hash(document.content) in self._hash_to_row
+
+    async def async_doc_exists(self, document: Document) -> bool:
+        return self.doc_exists(document)
+
+    def name_exists(self, name: str) -> bool:
+        self._refresh()
+        return self._name_counts.get(name, 0) > 0
+
+    async def async_name_exists(self, name: str) -> bool:
+        return self.name_exists(name)
+
+    def id_exists(self, id: str) -> bool:
+        self._refresh()
+        return id in self._id_to_row
+
+    def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """Insert documents, skipping those whose id already exists.
+
+        Args:
+            documents (List[Document]): List of documents to insert
+            filters (Optional[Dict[str, Any]]): Filters to merge with document metadata
+        """
+        self._write_documents(documents, filters, upsert=False)
+
+    async def async_insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """Insert documents asynchronously by running in a thread."""
+        await asyncio.to_thread(self.insert, documents, filters)
+
+    def upsert_available(self) -> bool:
+        return True
+
+    def upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """Insert documents, replacing existing documents with the same content.
+
+        Args:
+            documents (List[Document]): List of documents to upsert
+            filters (Optional[Dict[str, Any]]): Filters to merge with document metadata
+        """
+        self._write_documents(documents, filters, upsert=True)
+
+    async def async_upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """Upsert documents asynchronously by running in a thread."""
+        await asyncio.to_thread(self.upsert, documents, filters)
+
+    def _filter_rows(self, filters: Optional[Dict[str, Any]]) -> np.ndarray:
+        """Return the live rows matching all filters. A list value matches any of its items."""
+        num_rows = len(self._records)
+        mask = np.ones(num_rows, dtype=bool)
+        if self._deleted:
+            mask[list(self._deleted)] = False
+        for key, value in (filters or {}).items():
+            values = value if isinstance(value, (list, tuple)) else [value]
+            key_mask = np.zeros(num_rows, dtype=bool)
+            key_index = self._meta_index.get(key, {})
+            for v in values:
+                rows = key_index.get(json.dumps(v, sort_keys=True))
+                if rows:
+                    key_mask[rows] = True
+            mask &= key_mask
+        return np.nonzero(mask)[0]
+
+    def _candidate_rows(self, rows: np.ndarray, query_vector: np.ndarray, search_params: SearchParams) -> np.ndarray:
+        """Narrow the rows to those in the IVF lists closest to the query."""
+        if search_params.exact or self._centroids is None or self._assignments is None:
+            return rows
+        probes = min(search_params.probes or 10, len(self._centroids))
+        closest_lists = np.argsort(self._score(self._centroids, query_vector))[::-1][:probes]
+        indexed_rows = len(self._assignments)
+        in_probed_lists = np.isin(self._assignments, closest_lists)
+        # Rows added after the index was built are always searched
+        keep = np.ones(len(rows), dtype=bool)
+        is_indexed = rows < indexed_rows
+        keep[is_indexed] = in_probed_lists[rows[is_indexed]]
+        return rows[keep]
+
+    def _score(self, vectors: np.ndarray, query_vector: np.ndarray) -> np.ndarray:
+        """Similarity of each vector to the query, higher is closer."""
+        if self.distance == Distance.l2:
+            return -np.sum((vectors - query_vector) ** 2, axis=1)
+        return vectors @ query_vector
+
+    def _vector_search(self, query: str, limit: int, filters: Optional[Dict[str, Any]]) -> List[Document]:
+        query_embedding = self.embedder.get_embedding(query)
+        if query_embedding is None:
+            logger.error(f"Error getting embedding for Query: {query}")
+            return []
+
+        self._refresh()
+        query_vector = self._prepare_vector(query_embedding)
+        search_params = self.get_search_params()
+        rows = self._candidate_rows(self._filter_rows(filters), query_vector, search_params)
+        if len(rows) == 0:
+            return []
+
+        self._get_vectors()
+        if search_params.exact and self._full_vectors is not None:
+            # Exact search compares full precision vectors
+            best_rows, best_scores = self._top_rows(
+                rows, limit, lambda chunk: self._score(self._dequantize(chunk), query_vector)
+            )
+        else:
+            num_candidates = limit * self.rescore_multiplier if self.rescore_multiplier else limit
+            best_rows, best_scores = self._top_rows(
+                rows, num_candidates, lambda chunk: self._quantized_score(chunk, query_vector)
+            )
+            if self.rescore_multiplier:
+                # Re-score the quantized candidates at full precision
+                best_scores = self._score(self._dequantize(best_rows), query_vector)
+                if len(best_rows) > limit:
+                    top = np.argpartition(-best_scores, limit)[:limit]
+                    best_rows, best_scores = best_rows[top], best_scores[top]
+        order = np.argsort(-best_scores)
+
+        search_results: List[Document] = []
+        for i in order:
+            row = int(best_rows[i])
+            record = self._records[row]
+            search_results.append(
+                Document(
+                    id=record["id"],
+                    name=record.get("name"),
+                    meta_data=record.get("meta_data") or {},
+                    content=record["content"],
+                    embedder=self.embedder,
+                    embedding=self._dequantize(np.array([row]))[0].tolist(),
+                    usage=record.get("usage"),
+                )
+            )
+        return search_results
+
+    def _top_rows(
+        self, rows: np.ndarray, limit: int, score_fn: Callable[[np.ndarray], np.ndarray]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Score the rows in chunks and keep the best `limit` rows and their scores."""
+        best_rows = np.zeros(0, dtype=np.int64)
+        best_scores = np.zeros(0, dtype=np.float32)
+        for start in range(0, len(rows), SCORE_CHUNK_SIZE):
+            chunk = rows[start : start + SCORE_CHUNK_SIZE]
+            best_rows = np.concatenate([best_rows, chunk])
+            best_scores = np.concatenate([best_scores, score_fn(chunk)])
+            if len(best_rows) > limit:
+                top = np.argpartition(-best_scores, limit)[:limit]
+                best_rows, best_scores = best_rows[top], best_scores[top]
+        return best_rows, best_scores
+
+    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        """Search the collection for the documents closest to the query.
+
+        Args:
+            query (str): Query to search for.
+            limit (int): Number of results to return.
+            filters (Optional[Dict[str, Any]]): Metadata filters. A list value matches any of its items.
+
+        Returns:
+            List[Document]: List of search results.
+        """
+        search_results = self._vector_search(query, limit, filters)
+        if self.reranker and search_results:
+            search_results = self.reranker.rerank(query=query, documents=search_results)
+
+        log_info(f"Found {len(search_results)} documents")
+        return search_results
+
+    async def async_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        """Search asynchronously by running in a thread."""
+        return await asyncio.to_thread(self.search, query, limit, filters)
+
+    def vector_search(self, query: str, limit: int = 5) -> List[Document]:
+        return self._vector_search(query, limit, None)
+
+    def exact_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        """Search all vectors without using the IVF index, at full precision if it is stored."""
+        with self.using_search_params(SearchParams(exact=True)):
+            return self._vector_search(query, limit, filters)
+
+    def create_index(self, index_spec: Optional[IndexSpec] = None, force_recreate: bool = False) -> None:
+        """Build an IVF index by clustering the vectors with k-means.
+
+        Args:
+            index_spec (Optional[IndexSpec]): The index configuration. If None, the current configuration is used.
+            force_recreate (bool): Rebuild the index even if it already exists.
+        """
+        if index_spec is not None:
+            if index_spec.index_type == IndexType.hnsw:
+                raise ValueError("LocalVectorDb does not support hnsw indexes, use IndexType.ivfflat")
+            self.index_spec = index_spec
+        if self.index_spec is None or self.index_spec.index_type != IndexType.ivfflat:
+            return
+
+        with self._lock:
+            self._refresh()
+            if self._centroids is not None and not force_recreate:
+                log_debug("IVF index already exists, skipping")
+                return
+
+            rows = self._filter_rows(None)
+            num_lists = min(self.index_spec.lists, len(rows))
+            if num_lists == 0:
+                return
+            log_debug(f"Building IVF index with {num_lists} lists over {len(rows)} vectors")
+
+            # Train centroids on a sample of the vectors
+            rng = np.random.default_rng(0)
+            sample = rows if len(rows) <= num_lists * 50 else rng.choice(rows, num_lists * 50, replace=False)
+            sample_vectors = self._dequantize(np.sort(sample))
+            centroids = sample_vectors[rng.choice(len(sample_vectors), num_lists, replace=False)]
+            for _ in range(10):
+                labels = self._assign(sample_vectors, centroids)
+                for list_id in range(num_lists):
+                    members = sample_vectors[labels == list_id]
+                    if len(members) > 0:
+                        centroids[list_id] = members.mean(axis=0)
+                if self.distance == Distance.cosine:
+                    norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+                    centroids = centroids / np.where(norms == 0, 1, norms)
+
+            # Assign every row, deleted rows included, so assignments can be indexed by row number
+            all_rows = np.arange(len(self._records))
+            assignments = np.concatenate(
+                [
+                    self._assign(self._dequantize(all_rows[i : i + SCORE_CHUNK_SIZE]), centroids)
+                    for i in range(0, len(all_rows), SCORE_CHUNK_SIZE)
+                ]
+            ).astype(np.int32)
+            np.savez(self._index_file, centroids=centroids, assignments=assignments)
+            self._centroids, self._assignments = centroids, assignments
+            self.rows_since_index_build = 0
+
+    def _assign(self, vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        if self.distance == Distance.l2:
+            distances = (
+                np.sum(vectors**2, axis=1)[:, None] - 2 * vectors @ centroids.T + np.sum(centroids**2, axis=1)[None, :]
+            )
+            return np.argmin(distances, axis=1)
+        return np.argmax(vectors @ centroids.T, axis=1)
+
+    def _load_index(self) -> None:
+        with np.load(self._index_file) as index:
+            self._centroids = index["centroids"]
+            self._assignments = index["assignments"]
+
+    def drop(self) -> None:
+        """Delete the collection and its files."""
+        with self._lock:
+            if self.path.exists():
+                log_debug(f"Deleting collection: {self.collection}")
+                shutil.rmtree(self.path)
+            self._reset_state()
+
+    async def async_drop(self) -> None:
+        await asyncio.to_thread(self.drop)
+
+    def exists(self) -> bool:
+        return self._records_file.exists()
+
+    async def async_exists(self) -> bool:
+        return self.exists()
+
+    def get_count(self) -> int:
+        self._refresh()
+        return len(self._records) - len(self._deleted)
+
+    def optimize(self) -> None:
+        """Rebuild the IVF index, if configured."""
+        self.create_index(force_recreate=True)
+
+    def delete(self) -> bool:
+        """Delete all documents in the collection, keeping the collection itself."""
+        try:
+            self.drop()
+            self.create()
+            return True
+        except Exception as e:
+            logger.error(f"Error clearing collection: {e}")
+            return False
@@ -14,7 +14,7 @@ except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install using `pip install sqlalchemy psycopg`")
 
 try:
-    from pgvector.sqlalchemy import Vector
+    from pgvector.sqlalchemy import BIT, HALFVEC, Vector
 except ImportError:
     raise ImportError("`pgvector` not installed. Please install using `pip install pgvector`")
 
@@ -25,7 +25,9 @@ from agno.utils.log import log_debug, log_info, logger
 from agno.utils.string import safe_content_hash
 from agno.vectordb.base import VectorDb
 from agno.vectordb.distance import Distance
+from agno.vectordb.index import IndexSpec, IndexType, SearchParams
 from agno.vectordb.pgvector.index import HNSW, Ivfflat
+from agno.vectordb.quantization import Quantization
 from agno.vectordb.search import SearchType
 
 
@@ -45,7 +47,10 @@ class PgVector(VectorDb):
         db_engine: Optional[Engine] = None,
         embedder: Optional[Embedder] = None,
         search_type: SearchType = SearchType.vector,
-        vector_index: Union[Ivfflat, HNSW] = HNSW(),
+        vector_index: Optional[Union[Ivfflat, HNSW]] = HNSW(),
+        index_rebuild_threshold: Optional[int] = None,
+        quantization: Quantization = Quantization.none,
+        rescore_multiplier: Optional[int] = None,
         distance: Distance = Distance.cosine,
         prefix_match: bool = False,
         vector_score_weight: float = 0.5,
@@ -64,7 +69,11 @@ class PgVector(VectorDb):
             db_engine (Optional[Engine]): SQLAlchemy database engine.
             embedder (Optional[Embedder]): Embedder instance for creating embeddings.
             search_type (SearchType): Type of search to perform.
-            vector_index (Union[Ivfflat, HNSW]): Vector index configuration.
+            vector_index (Optional[Union[Ivfflat, HNSW]]): Vector index configuration. None uses exact search.
+            index_rebuild_threshold (Optional[int]): Rebuild the vector index after this many rows are written.
+            quantization (Quantization): Build the vector index over halfvec or binary quantized embeddings.
+            rescore_multiplier (Optional[int]): Re-score the top `limit * rescore_multiplier` quantized candidates
+                with the full precision embeddings.
             distance (Distance): Distance metric for vector comparisons.
             prefix_match (bool): Enable prefix matching for full-text search.
             vector_score_weight (float): Weight for vector similarity in hybrid search.
@@ -78,6 +87,11 @@ class PgVector(VectorDb):
         if db_engine is None and db_url is None:
             raise ValueError("Either 'db_url' or 'db_engine' must be provided.")
 
+        if quantization == Quantization.int8:
+            raise ValueError(
+                "pgvector does not support int8 quantization, use Quantization.half or Quantization.binary"
+            )
+
         if db_engine is None:
             if db_url is None:
                 raise ValueError("Must provide 'db_url' if 'db_engine' is None.")
@@ -111,7 +125,13 @@ class PgVector(VectorDb):
         # Distance metric
         self.distance: Distance = distance
         # Index for the table
-        self.vector_index: Union[Ivfflat, HNSW] = vector_index
+        self.vector_index: Optional[Union[Ivfflat, HNSW]] = vector_index
+        # Rebuild the vector index after this many rows are written
+        self.index_rebuild_threshold: Optional[int] = index_rebuild_threshold
+        # Quantization of the indexed embeddings. The table keeps the full precision embeddings.
+        self.quantization: Quantization = Quantization(quantization)
+        # Number of quantized candidates re-scored per result
+        self.rescore_multiplier: Optional[int] = rescore_multiplier
         # Enable prefix matching for full-text search
         self.prefix_match: bool = prefix_match
         # Weight for the vector similarity score in hybrid search
@@ -338,6 +358,7 @@ class PgVector(VectorDb):
                         sess.execute(insert_stmt, batch_records)
                         sess.commit()  # Commit batch independently
                         log_info(f"Inserted batch of {len(batch_records)} documents.")
+                        self.record_writes(len(batch_records))
                     except Exception as e:
                         logger.error(f"Error with batch starting at index {i}: {e}")
                         sess.rollback()  # Rollback the current batch if there's an error
@@ -422,6 +443,7 @@ class PgVector(VectorDb):
                         sess.execute(upsert_stmt)
                         sess.commit()  # Commit batch independently
                         log_info(f"Upserted batch of {len(batch_records)} documents.")
+                        self.record_writes(len(batch_records))
                     except Exception as e:
                         logger.error(f"Error with batch starting at index {i}: {e}")
                         sess.rollback()  # Rollback the current batch if there's an error
@@ -500,17 +522,34 @@ class PgVector(VectorDb):
 
             # Order the results based on the distance metric
             if self.distance == Distance.l2:
-                stmt = stmt.order_by(self.table.c.embedding.l2_distance(query_embedding))
+                distance = self.table.c.embedding.l2_distance(query_embedding)
             elif self.distance == Distance.cosine:
-                stmt = stmt.order_by(self.table.c.embedding.cosine_distance(query_embedding))
+                distance = self.table.c.embedding.cosine_distance(query_embedding)
             elif self.distance == Distance.max_inner_product:
-                stmt = stmt.order_by(self.table.c.embedding.max_inner_product(query_embedding))
+                distance = self.table.c.embedding.max_inner_product(query_embedding)
             else:
                 logger.error(f"Unknown distance metric: {self.distance}")
                 return []
 
-            # Limit the number of results
-            stmt = stmt.limit(limit)
+            if self.quantization == Quantization.none or self.get_search_params().exact:
+                stmt = stmt.order_by(distance).limit(limit)
+            elif self.rescore_multiplier:
+                # Find candidates with the quantized index, then order them by the full precision distance
+                candidates = (
+                    select(self.table.c.id)
+                    .order_by(self._get_quantized_distance(query_embedding))
+                    .limit(limit * self.rescore_multiplier)
+                )
+                if filters is not None:
+                    candidates = candidates.where(self.table.c.meta_data.contains(filters))
+                candidates_subquery = candidates.subquery()
+                stmt = (
+                    stmt.join(candidates_subquery, self.table.c.id == candidates_subquery.c.id)
+                    .order_by(distance)
+                    .limit(limit)
+                )
+            else:
+                stmt = stmt.order_by(self._get_quantized_distance(query_embedding)).limit(limit)
 
             # Log the query for debugging
             log_debug(f"Vector search query: {stmt}")
@@ -518,11 +557,7 @@ class PgVector(VectorDb):
             # Execute the query
             try:
                 with self.Session() as sess, sess.begin():
-                    if self.vector_index is not None:
-                        if isinstance(self.vector_index, Ivfflat):
-                            sess.execute(text(f"SET LOCAL ivfflat.probes = {self.vector_index.probes}"))
-                        elif isinstance(self.vector_index, HNSW):
-                            sess.execute(text(f"SET LOCAL hnsw.ef_search = {self.vector_index.ef_search}"))
+                    self._set_search_params(sess)
                     results = sess.execute(stmt).fetchall()
             except Exception as e:
                 logger.error(f"Error performing semantic search: {e}")
@@ -554,6 +589,75 @@ class PgVector(VectorDb):
             logger.error(f"Error during vector search: {e}")
             return []
 
+    def exact_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        """
+        Perform a vector search without using the vector index.
+
+        Args:
+            query (str): The search query.
+            limit (int): Maximum number of results to return.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+
+        Returns:
+            List[Document]: List of matching documents.
+        """
+        with self.using_search_params(SearchParams(exact=True)):
+            return self.vector_search(query=query, limit=limit, filters=filters)
+
+    def _get_quantized_distance(self, query_embedding: List[float]):
+        """
+        Distance between the quantized embeddings and the query, matching the expression of the vector index.
+
+        Args:
+            query_embedding (List[float]): The query embedding.
+        """
+        if self.quantization == Quantization.binary:
+            query_vector = bindparam("query_embedding", query_embedding, type_=Vector(self.dimensions))
+            query_bits = func.binary_quantize(query_vector.cast(Vector(self.dimensions))).cast(BIT(self.dimensions))
+            return func.binary_quantize(self.table.c.embedding).cast(BIT(self.dimensions)).hamming_distance(query_bits)
+
+        embedding = self.table.c.embedding.cast(HALFVEC(self.dimensions))
+        query_halfvec = bindparam("query_embedding", query_embedding, type_=HALFVEC(self.dimensions))
+        query = query_halfvec.cast(HALFVEC(self.dimensions))
+        if self.distance == Distance.l2:
+            return embedding.l2_distance(query)
+        if self.distance == Distance.max_inner_product:
+            return embedding.max_inner_product(query)
+        return embedding.cosine_distance(query)
+
+    def _get_index_expression(self) -> str:
+        """
+        Return the indexed expression and operator class of the vector index.
+        """
+        if self.quantization == Quantization.binary:
+            return f"(binary_quantize(embedding)::bit({self.dimensions})) bit_hamming_ops"
+        index_distance = {
+            Distance.l2: "l2_ops",
+            Distance.max_inner_product: "ip_ops",
+            Distance.cosine: "cosine_ops",
+        }.get(self.distance, "cosine_ops")
+        if self.quantization == Quantization.half:
+            return f"(embedding::halfvec({self.dimensions})) halfvec_{index_distance}"
+        return f"embedding vector_{index_distance}"
+
+    def _set_search_params(self, sess: Session) -> None:
+        """
+        Apply the query-time index parameters to the current transaction.
+
+        Args:
+            sess (Session): SQLAlchemy session.
+        """
+        search_params = self.get_search_params()
+        if search_params.exact:
+            sess.execute(text("SET LOCAL enable_indexscan = off"))
+            return
+        if isinstance(self.vector_index, Ivfflat):
+            probes = search_params.probes or self.vector_index.probes
+            sess.execute(text(f"SET LOCAL ivfflat.probes = {int(probes)}"))
+        elif isinstance(self.vector_index, HNSW):
+            ef_search = search_params.ef_search or self.vector_index.ef_search
+            sess.execute(text(f"SET LOCAL hnsw.ef_search = {int(ef_search)}"))
+
     def enable_prefix_matching(self, query: str) -> str:
         """
         Preprocess the query for prefix matching.
@@ -741,11 +845,7 @@ class PgVector(VectorDb):
             # Execute the query
             try:
                 with self.Session() as sess, sess.begin():
-                    if self.vector_index is not None:
-                        if isinstance(self.vector_index, Ivfflat):
-                            sess.execute(text(f"SET LOCAL ivfflat.probes = {self.vector_index.probes}"))
-                        elif isinstance(self.vector_index, HNSW):
-                            sess.execute(text(f"SET LOCAL hnsw.ef_search = {self.vector_index.ef_search}"))
+                    self._set_search_params(sess)
                     results = sess.execute(stmt).fetchall()
             except Exception as e:
                 logger.error(f"Error performing hybrid search: {e}")
@@ -832,6 +932,69 @@ class PgVector(VectorDb):
         self._create_gin_index(force_recreate=force_recreate)
         log_debug("==== Optimized Vector DB ====")
 
+    def get_index_spec(self) -> Optional[IndexSpec]:
+        """
+        Get the vector index configuration as an IndexSpec.
+
+        Returns:
+            Optional[IndexSpec]: The index spec, or None if no vector index is configured.
+        """
+        if isinstance(self.vector_index, Ivfflat):
+            return IndexSpec(
+                index_type=IndexType.ivfflat,
+                name=self.vector_index.name,
+                lists=self.vector_index.lists,
+                rebuild_threshold=self.index_rebuild_threshold,
+                search_params=SearchParams(probes=self.vector_index.probes),
+                configuration=self.vector_index.configuration,
+            )
+        if isinstance(self.vector_index, HNSW):
+            return IndexSpec(
+                index_type=IndexType.hnsw,
+                name=self.vector_index.name,
+                m=self.vector_index.m,
+                ef_construction=self.vector_index.ef_construction,
+                rebuild_threshold=self.index_rebuild_threshold,
+                search_params=SearchParams(ef_search=self.vector_index.ef_search),
+                configuration=self.vector_index.configuration,
+            )
+        return None
+
+    def create_index(self, index_spec: Optional[IndexSpec] = None, force_recreate: bool = False) -> None:
+        """
+        Create the vector index described by the index spec, replacing the configured vector index.
+
+        Args:
+            index_spec (Optional[IndexSpec]): The index to create. If None, the configured vector index is created.
+            force_recreate (bool): If True, existing index will be dropped and recreated.
+        """
+        if index_spec is not None:
+            # Drop the current vector index, it is replaced by the one described in the spec
+            if self.vector_index is not None and self.vector_index.name is not None:
+                self._drop_index(self.vector_index.name)
+            configuration = index_spec.configuration or {"maintenance_work_mem": "2GB"}
+            if index_spec.index_type == IndexType.ivfflat:
+                self.vector_index = Ivfflat(
+                    name=index_spec.name,
+                    lists=index_spec.lists,
+                    probes=index_spec.search_params.probes or 10,
+                    dynamic_lists=False,
+                    configuration=configuration,
+                )
+            elif index_spec.index_type == IndexType.hnsw:
+                self.vector_index = HNSW(
+                    name=index_spec.name,
+                    m=index_spec.m,
+                    ef_construction=index_spec.ef_construction,
+                    ef_search=index_spec.search_params.ef_search or 5,
+                    configuration=configuration,
+                )
+            else:
+                self.vector_index = None
+            self.index_rebuild_threshold = index_spec.rebuild_threshold
+        self._create_vector_index(force_recreate=force_recreate)
+        self.rows_since_index_build = 0
+
     def _index_exists(self, index_name: str) -> bool:
         """
         Check if an index with the given name exists.
@@ -846,6 +1009,29 @@ class PgVector(VectorDb):
         indexes = inspector.get_indexes(self.table.name, schema=self.schema)
         return any(idx["name"] == index_name for idx in indexes)
 
+    def _vector_index_matches(self, index_name: str, index_method: str, index_distance: str) -> bool:
+        """
+        Check if an existing vector index uses the given index method and operator class.
+
+        Args:
+            index_name (str): The name of the index to check.
+            index_method (str): The index access method, ivfflat or hnsw.
+            index_distance (str): Indexed expression and distance operator class.
+
+        Returns:
+            bool: True if the index definition matches, False otherwise.
+        """
+        with self.Session() as sess:
+            index_definition = sess.execute(
+                text("SELECT indexdef FROM pg_indexes WHERE schemaname = :schema AND indexname = :index_name;"),
+                {"schema": self.schema, "index_name": index_name},
+            ).scalar()
+        if not isinstance(index_definition, str):
+            return True
+        # The operator class changes with the quantization and the distance, e.g. vector_cosine_ops or bit_hamming_ops
+        operator_class = index_distance.split()[-1]
+        return f"USING {index_method} " in index_definition and f" {operator_class})" in index_definition
+
     def _drop_index(self, index_name: str) -> None:
         """
         Drop the index with the given name.
@@ -877,12 +1063,8 @@ class PgVector(VectorDb):
             index_type = "ivfflat" if isinstance(self.vector_index, Ivfflat) else "hnsw"
             self.vector_index.name = f"{self.table_name}_{index_type}_index"
 
-        # Determine index distance operator
-        index_distance = {
-            Distance.l2: "vector_l2_ops",
-            Distance.max_inner_product: "vector_ip_ops",
-            Distance.cosine: "vector_cosine_ops",
-        }.get(self.distance, "vector_cosine_ops")
+        # Determine the indexed expression and distance operator
+        index_distance = self._get_index_expression()
 
         # Get the fully qualified table name
         table_fullname = self.table.fullname  # includes schema if any
@@ -892,7 +1074,14 @@ class PgVector(VectorDb):
 
         if vector_index_exists:
             log_info(f"Vector index '{self.vector_index.name}' already exists.")
-            if force_recreate:
+            index_method = "ivfflat" if isinstance(self.vector_index, Ivfflat) else "hnsw"
+            if not self._vector_index_matches(self.vector_index.name, index_method, index_distance):
+                log_info(
+                    f"Vector index '{self.vector_index.name}' does not match the index type or quantization. "
+                    "Dropping existing index."
+                )
+                self._drop_index(self.vector_index.name)
+            elif force_recreate:
                 log_info(f"Force recreating vector index '{self.vector_index.name}'. Dropping existing index.")
                 self._drop_index(self.vector_index.name)
             else:
@@ -926,7 +1115,7 @@ class PgVector(VectorDb):
         Args:
             sess (Session): SQLAlchemy session.
             table_fullname (str): Fully qualified table name.
-            index_distance (str): Distance metric for the index.
+            index_distance (str): Indexed expression and distance operator class.
         """
         # Cast index to Ivfflat for type hinting
         self.vector_index = cast(Ivfflat, self.vector_index)
@@ -953,7 +1142,7 @@ class PgVector(VectorDb):
         # Create index
         create_index_sql = text(
             f'CREATE INDEX "{self.vector_index.name}" ON {table_fullname} '
-            f"USING ivfflat (embedding {index_distance}) "
+            f"USING ivfflat ({index_distance}) "
             f"WITH (lists = :num_lists);"
         )
         sess.execute(create_index_sql, {"num_lists": num_lists})
@@ -965,7 +1154,7 @@ class PgVector(VectorDb):
         Args:
             sess (Session): SQLAlchemy session.
             table_fullname (str): Fully qualified table name.
-            index_distance (str): Distance metric for the index.
+            index_distance (str): Indexed expression and distance operator class.
         """
         # Cast index to HNSW for type hinting
         self.vector_index = cast(HNSW, self.vector_index)
@@ -979,7 +1168,7 @@ class PgVector(VectorDb):
         # Create index
         create_index_sql = text(
             f'CREATE INDEX "{self.vector_index.name}" ON {table_fullname} '
-            f"USING hnsw (embedding {index_distance}) "
+            f"USING hnsw ({index_distance}) "
             f"WITH (m = :m, ef_construction = :ef_construction);"
         )
         sess.execute(create_index_sql, {"m": self.vector_index.m, "ef_construction": self.vector_index.ef_construction})
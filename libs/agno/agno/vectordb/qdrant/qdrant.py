@@ -15,6 +15,7 @@ from agno.reranker.base import Reranker
 from agno.utils.log import log_debug, log_info
 from agno.vectordb.base import VectorDb
 from agno.vectordb.distance import Distance
+from agno.vectordb.index import IndexSpec, IndexType, SearchParams
 from agno.vectordb.search import SearchType
 
 DEFAULT_DENSE_VECTOR_NAME = "dense"
@@ -47,6 +48,7 @@ class Qdrant(VectorDb):
         sparse_vector_name: str = DEFAULT_SPARSE_VECTOR_NAME,
         hybrid_fusion_strategy: models.Fusion = models.Fusion.RRF,
         fastembed_kwargs: Optional[dict] = None,
+        index_spec: Optional[IndexSpec] = None,
         **kwargs,
     ):
         """
@@ -71,6 +73,7 @@ class Qdrant(VectorDb):
             sparse_vector_name (str): Sparse vector name.
             hybrid_fusion_strategy (models.Fusion): Strategy for hybrid fusion.
             fastembed_kwargs (Optional[dict]): Keyword args for `fastembed.SparseTextEmbedding.__init__()`.
+            index_spec (Optional[IndexSpec]): HNSW index configuration and default search params.
             **kwargs: Keyword args for `qdrant_client.QdrantClient.__init__()`.
         """
         # Collection attributes
@@ -119,6 +122,11 @@ class Qdrant(VectorDb):
         self.sparse_vector_name = sparse_vector_name
         self.hybrid_fusion_strategy = hybrid_fusion_strategy
 
+        # Index configuration. Qdrant only supports HNSW indexes, `IndexType.flat` disables the index.
+        if index_spec is not None and index_spec.index_type == IndexType.ivfflat:
+            raise ValueError("Qdrant does not support ivfflat indexes, use IndexType.hnsw or IndexType.flat")
+        self.index_spec: Optional[IndexSpec] = index_spec
+
         # TODO(v2.0.0): Remove backward compatibility for unnamed vectors
         # TODO(v2.0.0): Make named vectors mandatory and simplify the codebase
         self.use_named_vectors = search_type in [SearchType.hybrid]
@@ -200,6 +208,7 @@ class Qdrant(VectorDb):
             self.client.create_collection(
                 collection_name=self.collection,
                 vectors_config=vectors_config,
+                hnsw_config=self._get_hnsw_config(),
                 sparse_vectors_config={self.sparse_vector_name: models.SparseVectorParams()}
                 if self.search_type in [SearchType.keyword, SearchType.hybrid]
                 else None,
@@ -228,6 +237,7 @@ class Qdrant(VectorDb):
             await self.async_client.create_collection(
                 collection_name=self.collection,
                 vectors_config=vectors_config,
+                hnsw_config=self._get_hnsw_config(),
                 sparse_vectors_config={self.sparse_vector_name: models.SparseVectorParams()}
                 if self.search_type in [SearchType.keyword, SearchType.hybrid]
                 else None,
@@ -522,6 +532,7 @@ class Qdrant(VectorDb):
                 limit=limit,
                 query_filter=filters,
                 using=self.dense_vector_name,
+                search_params=self._get_search_params(),
             )
         else:
             # Backward compatibility mode - use unnamed vector
@@ -532,6 +543,7 @@ class Qdrant(VectorDb):
                 with_payload=True,
                 limit=limit,
                 query_filter=filters,
+                search_params=self._get_search_params(),
             )
         return call.points
 
@@ -571,6 +583,7 @@ class Qdrant(VectorDb):
                 limit=limit,
                 query_filter=filters,
                 using=self.dense_vector_name,
+                search_params=self._get_search_params(),
             )
         else:
             # Backward compatibility mode - use unnamed vector
@@ -581,6 +594,7 @@ class Qdrant(VectorDb):
                 with_payload=True,
                 limit=limit,
                 query_filter=filters,
+                search_params=self._get_search_params(),
             )
         return call.points
 
@@ -628,6 +642,52 @@ class Qdrant(VectorDb):
         )
         return call.points
 
+    def exact_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        """
+        Search the dense vectors without using the HNSW index.
+
+        Args:
+            query (str): Query to search for
+            limit (int): Number of search results to return
+            filters (Optional[Dict[str, Any]]): Filters to apply while searching
+        """
+        with self.using_search_params(SearchParams(exact=True)):
+            results = self._run_vector_search_sync(query, limit, self._format_filters(filters or {}))  # type: ignore
+        return self._build_search_results(results, query)
+
+    def _get_hnsw_config(self) -> Optional[models.HnswConfigDiff]:
+        if self.index_spec is None:
+            return None
+        if self.index_spec.index_type == IndexType.flat:
+            # m=0 disables building the HNSW graph
+            return models.HnswConfigDiff(m=0)
+        return models.HnswConfigDiff(m=self.index_spec.m, ef_construct=self.index_spec.ef_construction)
+
+    def _get_search_params(self) -> Optional[models.SearchParams]:
+        search_params = self.get_search_params()
+        if search_params.ef_search is None and not search_params.exact:
+            return None
+        return models.SearchParams(hnsw_ef=search_params.ef_search, exact=search_params.exact)
+
+    def create_index(self, index_spec: Optional[IndexSpec] = None, force_recreate: bool = False) -> None:
+        """
+        Update the HNSW configuration of the collection. Qdrant rebuilds the index in the background.
+
+        Args:
+            index_spec (Optional[IndexSpec]): The index configuration. If None, the current configuration is applied.
+            force_recreate (bool): Unused, Qdrant rebuilds the index when its configuration changes.
+        """
+        if index_spec is not None:
+            if index_spec.index_type == IndexType.ivfflat:
+                raise ValueError("Qdrant does not support ivfflat indexes, use IndexType.hnsw or IndexType.flat")
+            self.index_spec = index_spec
+        hnsw_config = self._get_hnsw_config()
+        if hnsw_config is None:
+            return
+        log_debug(f"Updating HNSW config of collection {self.collection}: {hnsw_config}")
+        self.client.update_collection(collection_name=self.collection, hnsw_config=hnsw_config)
+        self.rows_since_index_build = 0
+
     def _build_search_results(self, results, query: str) -> List[Document]:
         search_results: List[Document] = []
 
@@ -0,0 +1,134 @@
+from enum import Enum
+from typing import Any, Dict, Optional, Tuple
+
+from agno.utils.log import log_debug
+
+
+class Quantization(str, Enum):
+    """How vectors are compressed for storage and indexing.
+
+    - none: full precision float32 vectors.
+    - half: float16 vectors (2x smaller).
+    - int8: scalar quantization with one scale per vector (4x smaller).
+    - binary: one bit per dimension (32x smaller). Use with exact re-scoring of the top candidates.
+    """
+
+    none = "none"
+    half = "half"
+    int8 = "int8"
+    binary = "binary"
+
+
+def quantize_int8(vectors: Any) -> Tuple[Any, Any]:
+    """Quantize float vectors to int8 codes with a float32 scale per vector.
+
+    Args:
+        vectors: A 2D numpy array of float vectors.
+
+    Returns:
+        Tuple of the int8 codes and the scale of each vector.
+    """
+    import numpy as np
+
+    scales = np.abs(vectors).max(axis=1) / 127.0
+    scales[scales == 0] = 1.0
+    codes = np.clip(np.round(vectors / scales[:, None]), -127, 127).astype(np.int8)
+    return codes, scales.astype(np.float32)
+
+
+def dequantize_int8(codes: Any, scales: Any) -> Any:
+    """Reconstruct float32 vectors from int8 codes and scales."""
+    import numpy as np
+
+    return np.asarray(codes, dtype=np.float32) * np.asarray(scales, dtype=np.float32)[:, None]
+
+
+def quantize_binary(vectors: Any) -> Any:
+    """Quantize float vectors to one bit per dimension (1 if positive), packed into uint8 bytes."""
+    import numpy as np
+
+    return np.packbits(np.asarray(vectors) > 0, axis=-1)
+
+
+def hamming_similarity(packed_vectors: Any, packed_query: Any) -> Any:
+    """Negative hamming distance between packed binary vectors and a packed query, higher is closer."""
+    import numpy as np
+
+    return -np.unpackbits(np.bitwise_xor(packed_vectors, packed_query), axis=-1).sum(axis=-1).astype(np.float32)
+
+
+def evaluate_quantization(
+    vectors: Any,
+    queries: Any,
+    k: int = 10,
+    quantization: Quantization = Quantization.int8,
+    rescore_multiplier: Optional[int] = None,
+    dimensions: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Offline benchmark of the recall impact of quantization and dimension truncation.
+
+    Ranks `vectors` for each query by inner product, using full precision as ground truth and the
+    quantized (and optionally truncated) vectors as the candidate ranking.
+
+    Args:
+        vectors: 2D array of the stored vectors, normalized for cosine similarity.
+        queries: 2D array of query vectors.
+        k: Number of results compared.
+        quantization: The quantization to evaluate.
+        rescore_multiplier: If set, the top `k * rescore_multiplier` quantized candidates are re-scored at full precision.
+        dimensions: If set, vectors are truncated to this many dimensions (Matryoshka) before quantization.
+
+    Returns:
+        Dict with the mean recall@k and the bytes used per vector.
+    """
+    import numpy as np
+
+    vectors = np.asarray(vectors, dtype=np.float32)
+    queries = np.asarray(queries, dtype=np.float32)
+    stored, stored_queries = vectors, queries
+    if dimensions is not None:
+        stored = vectors[:, :dimensions] / np.maximum(
+            np.linalg.norm(vectors[:, :dimensions], axis=1, keepdims=True), 1e-12
+        )
+        stored_queries = queries[:, :dimensions] / np.maximum(
+            np.linalg.norm(queries[:, :dimensions], axis=1, keepdims=True), 1e-12
+        )
+    num_dimensions = stored.shape[1]
+
+    if quantization == Quantization.int8:
+        codes, scales = quantize_int8(stored)
+        approx_vectors = dequantize_int8(codes, scales)
+        bytes_per_vector = num_dimensions + 4
+    elif quantization == Quantization.half:
+        approx_vectors = stored.astype(np.float16).astype(np.float32)
+        bytes_per_vector = num_dimensions * 2
+    elif quantization == Quantization.binary:
+        packed = quantize_binary(stored)
+        bytes_per_vector = packed.shape[1]
+    else:
+        approx_vectors = stored
+        bytes_per_vector = num_dimensions * 4
+
+    recalls = []
+    num_candidates = k * rescore_multiplier if rescore_multiplier else k
+    for query, stored_query in zip(queries, stored_queries):
+        exact_top = set(np.argsort(-(vectors @ query))[:k].tolist())
+        if quantization == Quantization.binary:
+            scores = hamming_similarity(packed, quantize_binary(stored_query[None, :])[0])
+        else:
+            scores = approx_vectors @ stored_query
+        candidates = np.argsort(-scores, kind="stable")[:num_candidates]
+        if rescore_multiplier:
+            candidates = candidates[np.argsort(-(vectors[candidates] @ query))]
+        recalls.append(len(exact_top & set(candidates[:k].tolist())) / len(exact_top))
+
+    result = {
+        "quantization": quantization.value,
+        "dimensions": num_dimensions,
+        "rescore_multiplier": rescore_multiplier,
+        "recall_at_k": float(np.mean(recalls)) if recalls else 1.0,
+        "bytes_per_vector": bytes_per_vector,
+        "compression_ratio": (vectors.shape[1] * 4) / bytes_per_vector,
+    }
+    log_debug(f"Quantization benchmark: {result}")
+    return result
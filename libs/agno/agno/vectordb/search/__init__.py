@@ -0,0 +1,19 @@
+from typing import TYPE_CHECKING
+
+from agno.utils.lazy import lazy_exports
+from agno.vectordb.search.search_type import SearchType
+
+if TYPE_CHECKING:
+    from agno.vectordb.search.bm25 import BM25Index
+    from agno.vectordb.search.hybrid import HybridSearch
+
+# Imported on first access, so that importing SearchType does not load the hybrid search and its dependencies
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BM25Index": "agno.vectordb.search.bm25",
+        "HybridSearch": "agno.vectordb.search.hybrid",
+    },
+)
+
+__all__ = ["BM25Index", "HybridSearch", "SearchType"]
@@ -0,0 +1,191 @@
+import json
+import math
+import re
+import threading
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from agno.document import Document
+from agno.utils.log import log_debug
+from agno.utils.string import safe_content_hash
+
+
+def tokenize(text: str) -> List[str]:
+    """Split a text into lowercase words"""
+    return re.findall(r"\w+", text.lower())
+
+
+def get_document_key(document: Document) -> str:
+    return document.id or safe_content_hash(document.content)
+
+
+def matches_filters(meta_data: Optional[Dict[str, Any]], filters: Optional[Dict[str, Any]]) -> bool:
+    """Whether metadata matches the filters. A list value matches any of its items."""
+    if not filters:
+        return True
+    meta_data = meta_data or {}
+    for key, value in filters.items():
+        if isinstance(value, list):
+            if meta_data.get(key) not in value:
+                return False
+        elif meta_data.get(key) != value:
+            return False
+    return True
+
+
+class BM25Index:
+    """In-process BM25 keyword index, for vector dbs without full-text search.
+
+    Documents are kept in memory with an inverted index of their words. If a `path` is given, documents are also
+    appended to a JSON lines log, replayed when the index is opened, so the index survives restarts.
+
+    Args:
+        path: File of the log. Defaults to an index kept only in memory.
+        k1: Term frequency saturation. Higher values give more weight to repeated words.
+        b: Document length normalization, between 0 (none) and 1 (full).
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, k1: float = 1.5, b: float = 0.75):
+        self.path: Optional[Path] = Path(path) if path is not None else None
+        self.k1 = k1
+        self.b = b
+
+        self._lock = threading.RLock()
+        self._documents: Dict[str, Document] = {}
+        # document key -> word counts
+        self._term_counts: Dict[str, Counter] = {}
+        # document key -> number of words
+        self._lengths: Dict[str, int] = {}
+        # word -> keys of the documents containing it
+        self._postings: Dict[str, Set[str]] = defaultdict(set)
+        self._total_length = 0
+
+        if self.path is not None and self.path.exists():
+            self._replay()
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def has_document(self, document: Document) -> bool:
+        return get_document_key(document) in self._documents
+
+    def _replay(self) -> None:
+        with self.path.open("r", encoding="utf-8") as f:  # type: ignore
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                if "deleted" in entry:
+                    self._remove(entry["deleted"])
+                else:
+                    self._add(Document(**entry))
+        log_debug(f"Loaded {len(self)} documents into BM25 index from {self.path}")
+
+    def _append_log(self, entries: List[Dict[str, Any]]) -> None:
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as f:
+            for entry in entries:
+                f.write(json.dumps(entry, default=str) + "\n")
+
+    def _add(self, document: Document) -> str:
+        key = get_document_key(document)
+        self._remove(key)
+        term_counts = Counter(tokenize(document.content))
+        self._documents[key] = document
+        self._term_counts[key] = term_counts
+        self._lengths[key] = sum(term_counts.values())
+        for term in term_counts:
+            self._postings[term].add(key)
+        self._total_length += self._lengths[key]
+        return key
+
+    def _remove(self, key: str) -> None:
+        term_counts = self._term_counts.pop(key, None)
+        if term_counts is None:
+            return
+        self._documents.pop(key, None)
+        for term in term_counts:
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.discard(key)
+                if not postings:
+                    del self._postings[term]
+        self._total_length -= self._lengths.pop(key)
+
+    def add(self, documents: Iterable[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """Add documents to the index, replacing the documents with the same id or content.
+
+        `filters` are added to the metadata of the documents, like the vector dbs do.
+        """
+        entries: List[Dict[str, Any]] = []
+        with self._lock:
+            for document in documents:
+                meta_data = {**(document.meta_data or {}), **(filters or {})}
+                indexed = Document(content=document.content, id=document.id, name=document.name, meta_data=meta_data)
+                self._add(indexed)
+                entries.append(
+                    {"content": indexed.content, "id": indexed.id, "name": indexed.name, "meta_data": meta_data}
+                )
+            self._append_log(entries)
+
+    def delete(self, keys: Iterable[str]) -> None:
+        """Remove documents by id, or by content hash for documents without id"""
+        with self._lock:
+            keys = list(keys)
+            for key in keys:
+                self._remove(key)
+            self._append_log([{"deleted": key} for key in keys])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._documents.clear()
+            self._term_counts.clear()
+            self._lengths.clear()
+            self._postings.clear()
+            self._total_length = 0
+            if self.path is not None and self.path.exists():
+                self.path.unlink()
+
+    def search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[Document, float]]:
+        """Return the documents matching the words of the query, with their BM25 score, best first"""
+        terms = set(tokenize(query))
+        with self._lock:
+            num_documents = len(self._documents)
+            if num_documents == 0 or not terms:
+                return []
+            average_length = self._total_length / num_documents
+            scores: Dict[str, float] = defaultdict(float)
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (num_documents - len(postings) + 0.5) / (len(postings) + 0.5))
+                for key in postings:
+                    frequency = self._term_counts[key][term]
+                    length_norm = 1 - self.b + self.b * self._lengths[key] / average_length
+                    scores[key] += idf * frequency * (self.k1 + 1) / (frequency + self.k1 * length_norm)
+            ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+            results: List[Tuple[Document, float]] = []
+            for key, score in ranked:
+                document = self._documents[key]
+                if not matches_filters(document.meta_data, filters):
+                    continue
+                results.append(
+                    (
+                        Document(
+                            content=document.content,
+                            id=document.id,
+                            name=document.name,
+                            meta_data=dict(document.meta_data),
+                        ),
+                        score,
+                    )
+                )
+                if len(results) >= limit:
+                    break
+        return results
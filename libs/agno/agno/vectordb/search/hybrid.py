@@ -0,0 +1,352 @@
+import asyncio
+import contextvars
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from inspect import signature
+from typing import Any, Callable, Dict, Iterator, List, Literal, Optional, Set, Tuple, TypeVar
+
+from agno.document import Document
+from agno.reranker.base import Reranker
+from agno.utils.fusion import RRF_K, normalized_score_fusion, rank_scores, reciprocal_rank_fusion
+from agno.utils.log import log_debug, log_warning, logger
+from agno.vectordb.base import VectorDb
+from agno.vectordb.index import IndexSpec, SearchParams
+from agno.vectordb.search.bm25 import BM25Index, get_document_key, matches_filters
+
+T = TypeVar("T")
+
+
+class HybridSearch(VectorDb):
+    """Hybrid search over any vector db, fusing its vector search with a keyword search.
+
+    The vector and keyword searches run concurrently and their results are fused by reciprocal rank fusion
+    or by summing min-max normalized scores. The keyword search is the full-text search of the vector db,
+    or a `BM25Index` for vector dbs without one. Documents written through the hybrid search are added to
+    the vector db and to the keyword index.
+
+    Use it as the vector db of a knowledge base. The wrapped vector db should use vector search, its other
+    attributes are available on the hybrid search.
+
+    A `BM25Index` without a path starts empty in every process. Documents already in the vector db are reported
+    as missing until they are in the index, so loading the knowledge base again rebuilds the index without
+    writing them to the vector db again.
+
+    Args:
+        vector_db: The vector db to search.
+        keyword_index: Local keyword index. Required if the vector db has no `keyword_search`.
+        fusion: How results are merged: "rrf" for reciprocal rank fusion, "score" to sum min-max normalized scores.
+        vector_weight: Weight of the vector search results in the fusion.
+        keyword_weight: Weight of the keyword search results in the fusion.
+        rrf_k: Constant of reciprocal rank fusion.
+        candidates_multiplier: Each search returns `limit * candidates_multiplier` candidates to fuse.
+        reranker: Reranker applied once to the fused results.
+    """
+
+    def __init__(
+        self,
+        vector_db: VectorDb,
+        keyword_index: Optional[BM25Index] = None,
+        fusion: Literal["rrf", "score"] = "rrf",
+        vector_weight: float = 1.0,
+        keyword_weight: float = 1.0,
+        rrf_k: int = RRF_K,
+        candidates_multiplier: int = 2,
+        reranker: Optional[Reranker] = None,
+    ):
+        if keyword_index is None and getattr(vector_db.keyword_search, "__func__", None) is VectorDb.keyword_search:
+            raise ValueError(f"{type(vector_db).__name__} has no keyword search, provide a keyword_index")
+        if candidates_multiplier < 1:
+            raise ValueError("candidates_multiplier must be at least 1")
+
+        self.vector_db = vector_db
+        self.keyword_index = keyword_index
+        self.fusion = fusion
+        self.vector_weight = vector_weight
+        self.keyword_weight = keyword_weight
+        self.rrf_k = rrf_k
+        self.candidates_multiplier = candidates_multiplier
+        self.reranker = reranker
+
+        self._keyword_search_filters = (
+            keyword_index is None and "filters" in signature(vector_db.keyword_search).parameters
+        )
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Keys of documents in the vector db but not in the keyword index, only added to the index when written
+        self._unindexed_keys: Set[str] = set()
+        self._warned_empty_index = False
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "HybridSearch":
+        # Copies of knowledge bases share the vector db and the keyword index, and start their own search threads
+        copied = self.__class__.__new__(self.__class__)
+        copied.__dict__.update(self.__dict__)
+        copied._executor = None
+        memo[id(self)] = copied
+        return copied
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not found on the hybrid search, e.g. the table name of the vector db
+        if name == "vector_db":
+            raise AttributeError(name)
+        return getattr(self.vector_db, name)
+
+    # -*- Search
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="agno-hybrid-search")
+        return self._executor
+
+    def _submit(self, fn: Callable[..., T], *args: Any) -> "Future[T]":
+        # Run in the context of the caller, like asyncio.to_thread, e.g. for the search params of `using_search_params`
+        return self._get_executor().submit(contextvars.copy_context().run, fn, *args)
+
+    def close(self) -> None:
+        """Stop the threads running the searches. They are started again by the next search."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _vector_search(self, query: str, limit: int, filters: Optional[Dict[str, Any]]) -> List[Tuple[Document, float]]:
+        return rank_scores(self.vector_db.search(query=query, limit=limit, filters=filters))
+
+    def _keyword_search(
+        self, query: str, limit: int, filters: Optional[Dict[str, Any]]
+    ) -> List[Tuple[Document, float]]:
+        if self.keyword_index is not None:
+            return self.keyword_index.search(query=query, limit=limit, filters=filters)
+        if self._keyword_search_filters:
+            documents = self.vector_db.keyword_search(query=query, limit=limit, filters=filters)  # type: ignore[call-arg]
+        else:
+            # The keyword search of the vector db does not filter, filter its results on their metadata
+            documents = [
+                document
+                for document in self.vector_db.keyword_search(query=query, limit=limit)
+                if matches_filters(document.meta_data, filters)
+            ]
+        return rank_scores(documents)
+
+    def _fuse(
+        self,
+        query: str,
+        limit: int,
+        vector_results: Optional[List[Tuple[Document, float]]],
+        keyword_results: Optional[List[Tuple[Document, float]]],
+    ) -> List[Document]:
+        """Merge the results of the searches that succeeded, and rerank the merged results."""
+        if (
+            self.keyword_index is not None
+            and len(self.keyword_index) == 0
+            and vector_results
+            and not self._warned_empty_index
+        ):
+            log_warning(
+                "The keyword index is empty but the vector db has documents: load the knowledge base again "
+                "to rebuild the index, or give the BM25Index a path to keep it between processes"
+            )
+            self._warned_empty_index = True
+        answered = [
+            (results, weight)
+            for results, weight in ((vector_results, self.vector_weight), (keyword_results, self.keyword_weight))
+            if results is not None
+        ]
+        if not answered:
+            return []
+
+        weights = [weight for _, weight in answered]
+        if self.fusion == "score":
+            fused = normalized_score_fusion([results for results, _ in answered], weights=weights)
+        else:
+            fused = reciprocal_rank_fusion(
+                [[document for document, _ in results] for results, _ in answered], k=self.rrf_k, weights=weights
+            )
+        documents = [document for document, _ in fused]
+
+        if self.reranker is not None and documents:
+            try:
+                documents = self.reranker.rerank(query=query, documents=documents)
+            except Exception as e:
+                logger.warning(f"Reranking fused results failed: {e}")
+        log_debug(f"Fused {sum(len(results) for results, _ in answered)} vector and keyword results")
+        return documents[:limit]
+
+    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        """Search the vector db and the keyword index concurrently and fuse the results.
+
+        If one of the searches fails, the results of the other are returned.
+        """
+        num_candidates = limit * self.candidates_multiplier
+        vector_future = self._submit(self._vector_search, query, num_candidates, filters)
+
+        keyword_results: Optional[List[Tuple[Document, float]]] = None
+        try:
+            if self.keyword_index is not None:
+                # The local index is searched in this thread while the vector db is queried
+                keyword_results = self._keyword_search(query, num_candidates, filters)
+            else:
+                keyword_results = self._submit(self._keyword_search, query, num_candidates, filters).result()
+        except Exception as e:
+            logger.warning(f"Keyword search failed: {e}")
+
+        vector_results: Optional[List[Tuple[Document, float]]] = None
+        try:
+            vector_results = vector_future.result()
+        except Exception as e:
+            logger.warning(f"Vector search failed: {e}")
+        return self._fuse(query, limit, vector_results, keyword_results)
+
+    async def _avector_search(
+        self, query: str, limit: int, filters: Optional[Dict[str, Any]]
+    ) -> List[Tuple[Document, float]]:
+        try:
+            documents = await self.vector_db.async_search(query=query, limit=limit, filters=filters)
+        except NotImplementedError:
+            documents = await asyncio.to_thread(self.vector_db.search, query, limit, filters)
+        return rank_scores(documents)
+
+    async def async_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        num_candidates = limit * self.candidates_multiplier
+        answers = await asyncio.gather(
+            self._avector_search(query, num_candidates, filters),
+            asyncio.to_thread(self._keyword_search, query, num_candidates, filters),
+            return_exceptions=True,
+        )
+        results: List[Optional[List[Tuple[Document, float]]]] = []
+        for leg, answer in zip(("Vector", "Keyword"), answers):
+            if isinstance(answer, BaseException):
+                logger.warning(f"{leg} search failed: {answer}")
+                results.append(None)
+            else:
+                results.append(answer)
+        return self._fuse(query, limit, results[0], results[1])
+
+    def vector_search(self, query: str, limit: int = 5) -> List[Document]:
+        return self.vector_db.search(query=query, limit=limit)
+
+    def keyword_search(self, query: str, limit: int = 5) -> List[Document]:
+        return [document for document, _ in self._keyword_search(query, limit, None)]
+
+    def hybrid_search(self, query: str, limit: int = 5) -> List[Document]:
+        return self.search(query=query, limit=limit)
+
+    def exact_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        return self.vector_db.exact_search(query=query, limit=limit, filters=filters)
+
+    # -*- Writes, also added to the keyword index
+
+    def _split_unindexed(self, documents: List[Document]) -> Tuple[List[Document], List[Document]]:
+        """Split the documents into those to write to the vector db and those only missing from the keyword index"""
+        if not self._unindexed_keys:
+            return documents, []
+        new_documents: List[Document] = []
+        unindexed: List[Document] = []
+        for document in documents:
+            if get_document_key(document) in self._unindexed_keys:
+                unindexed.append(document)
+            else:
+                new_documents.append(document)
+        return new_documents, unindexed
+
+    def _add_to_keyword_index(self, documents: List[Document], filters: Optional[Dict[str, Any]]) -> None:
+        if self.keyword_index is None:
+            return
+        self.keyword_index.add(documents, filters=filters)
+        self._unindexed_keys.difference_update(get_document_key(document) for document in documents)
+
+    def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        new_documents, unindexed = self._split_unindexed(documents)
+        if new_documents:
+            self.vector_db.insert(documents=new_documents, filters=filters)
+        self._add_to_keyword_index(new_documents + unindexed, filters)
+
+    async def async_insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        new_documents, unindexed = self._split_unindexed(documents)
+        if new_documents:
+            await self.vector_db.async_insert(documents=new_documents, filters=filters)
+        self._add_to_keyword_index(new_documents + unindexed, filters)
+
+    def upsert_available(self) -> bool:
+        return self.vector_db.upsert_available()
+
+    def upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        self.vector_db.upsert(documents=documents, filters=filters)
+        self._add_to_keyword_index(documents, filters)
+
+    async def async_upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        await self.vector_db.async_upsert(documents=documents, filters=filters)
+        self._add_to_keyword_index(documents, filters)
+
+    def _clear_keyword_index(self) -> None:
+        self.close()
+        self._unindexed_keys.clear()
+        if self.keyword_index is not None:
+            self.keyword_index.clear()
+
+    def drop(self) -> None:
+        self.vector_db.drop()
+        self._clear_keyword_index()
+
+    async def async_drop(self) -> None:
+        await self.vector_db.async_drop()
+        self._clear_keyword_index()
+
+    def delete(self) -> bool:
+        deleted = self.vector_db.delete()
+        self._clear_keyword_index()
+        return deleted
+
+    # -*- Delegated to the vector db
+
+    def create(self) -> None:
+        self.vector_db.create()
+
+    async def async_create(self) -> None:
+        await self.vector_db.async_create()
+
+    def _in_keyword_index(self, document: Document, in_vector_db: bool) -> bool:
+        """Whether a document of the vector db is in the keyword index. Documents missing from it are remembered,
+        to only be added to the index when they are written again."""
+        if not in_vector_db or self.keyword_index is None or self.keyword_index.has_document(document):
+            return in_vector_db
+        self._unindexed_keys.add(get_document_key(document))
+        return False
+
+    def doc_exists(self, document: Document) -> bool:
+        return self._in_keyword_index(document, self.vector_db.doc_exists(document))
+
+    async def async_doc_exists(self, document: Document) -> bool:
+        return self._in_keyword_index(document, await self.vector_db.async_doc_exists(document))
+
+    def name_exists(self, name: str) -> bool:
+        return self.vector_db.name_exists(name)
+
+    def async_name_exists(self, name: str) -> bool:
+        return self.vector_db.async_name_exists(name)
+
+    def id_exists(self, id: str) -> bool:
+        return self.vector_db.id_exists(id)
+
+    def exists(self) -> bool:
+        return self.vector_db.exists()
+
+    async def async_exists(self) -> bool:
+        return await self.vector_db.async_exists()
+
+    def optimize(self) -> None:
+        self.vector_db.optimize()
+
+    def get_index_spec(self) -> Optional[IndexSpec]:
+        return self.vector_db.get_index_spec()
+
+    def get_search_params(self) -> SearchParams:
+        return self.vector_db.get_search_params()
+
+    @contextmanager
+    def using_search_params(self, search_params: SearchParams) -> Iterator[None]:
+        """Use `search_params` for the vector searches made in this context (thread or task)."""
+        with self.vector_db.using_search_params(search_params):
+            yield
+
+    def create_index(self, index_spec: Optional[IndexSpec] = None, force_recreate: bool = False) -> None:
+        self.vector_db.create_index(index_spec=index_spec, force_recreate=force_recreate)
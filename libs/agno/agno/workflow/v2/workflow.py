@@ -7,8 +7,18 @@ from uuid import uuid4
 from pydantic import BaseModel
 
 from agno.agent.agent import Agent
+from agno.exceptions import RunCancelledException
 from agno.media import Audio, AudioArtifact, Image, ImageArtifact, Video, VideoArtifact
 from agno.run.base import RunStatus
+from agno.run.cancellation import (
+    CancellationToken,
+    aiterate_in_scope,
+    cancellation_scope,
+    close_run_cancellation_token,
+    get_run_cancellation_token,
+    iterate_in_scope,
+    raise_if_cancelled,
+)
 from agno.run.v2.workflow import (
     ConditionExecutionCompletedEvent,
     ConditionExecutionStartedEvent,
@@ -25,6 +35,7 @@ from agno.run.v2.workflow import (
     StepsExecutionCompletedEvent,
     StepsExecutionStartedEvent,
     StepStartedEvent,
+    WorkflowCancelledEvent,
     WorkflowCompletedEvent,
     WorkflowRunEvent,
     WorkflowRunResponse,
@@ -454,6 +465,7 @@ class Workflow:
                 output_audio: List[AudioArtifact] = (execution_input.audio or []).copy()  # Start with input audio
 
                 for i, step in enumerate(self.steps):  # type: ignore[arg-type]
+                    raise_if_cancelled()
                     step_name = getattr(step, "name", f"step_{i + 1}")
                     log_debug(f"Executing step {i + 1}/{self._get_step_count()}: {step_name}")
 
@@ -505,6 +517,9 @@ class Workflow:
 
                     self._collect_workflow_session_state_from_agents_and_teams()
 
+                # A step may have stopped early because the run was cancelled
+                raise_if_cancelled()
+
                 # Update the workflow_run_response with completion data
                 if collected_step_outputs:
                     workflow_run_response.workflow_metrics = self._aggregate_workflow_metrics(collected_step_outputs)
@@ -524,6 +539,11 @@ class Workflow:
                 workflow_run_response.audio = output_audio
                 workflow_run_response.status = RunStatus.completed
 
+            except RunCancelledException as e:
+                log_debug(f"Workflow run cancelled: {e}")
+                workflow_run_response.status = RunStatus.cancelled
+                workflow_run_response.content = str(e)
+
             except Exception as e:
                 import traceback
 
@@ -593,6 +613,7 @@ class Workflow:
                 early_termination = False
 
                 for i, step in enumerate(self.steps):  # type: ignore[arg-type]
+                    raise_if_cancelled()
                     step_name = getattr(step, "name", f"step_{i + 1}")
                     log_debug(f"Streaming step {i + 1}/{self._get_step_count()}: {step_name}")
 
@@ -669,6 +690,9 @@ class Workflow:
 
                     self._collect_workflow_session_state_from_agents_and_teams()
 
+                # A step may have stopped early because the run was cancelled
+                raise_if_cancelled()
+
                 # Update the workflow_run_response with completion data
                 if collected_step_outputs:
                     workflow_run_response.workflow_metrics = self._aggregate_workflow_metrics(collected_step_outputs)
@@ -688,6 +712,13 @@ class Workflow:
                 workflow_run_response.audio = output_audio
                 workflow_run_response.status = RunStatus.completed
 
+            except RunCancelledException as e:
+                log_debug(f"Workflow run cancelled: {e}")
+                yield self._create_cancelled_event(str(e))
+
+                workflow_run_response.content = str(e)
+                workflow_run_response.status = RunStatus.cancelled
+
             except Exception as e:
                 logger.error(f"Workflow execution failed: {e}")
 
@@ -823,6 +854,7 @@ class Workflow:
                 output_audio: List[AudioArtifact] = (execution_input.audio or []).copy()  # Start with input audio
 
                 for i, step in enumerate(self.steps):  # type: ignore[arg-type]
+                    raise_if_cancelled()
                     step_name = getattr(step, "name", f"step_{i + 1}")
                     log_debug(f"Async Executing step {i + 1}/{self._get_step_count()}: {step_name}")
 
@@ -873,6 +905,9 @@ class Workflow:
 
                     self._collect_workflow_session_state_from_agents_and_teams()
 
+                # A step may have stopped early because the run was cancelled
+                raise_if_cancelled()
+
                 # Update the workflow_run_response with completion data
                 if collected_step_outputs:
                     workflow_run_response.workflow_metrics = self._aggregate_workflow_metrics(collected_step_outputs)
@@ -892,6 +927,11 @@ class Workflow:
                 workflow_run_response.audio = output_audio
                 workflow_run_response.status = RunStatus.completed
 
+            except RunCancelledException as e:
+                log_debug(f"Workflow run cancelled: {e}")
+                workflow_run_response.status = RunStatus.cancelled
+                workflow_run_response.content = str(e)
+
             except Exception as e:
                 logger.error(f"Workflow execution failed: {e}")
                 workflow_run_response.status = RunStatus.error
@@ -967,6 +1007,7 @@ class Workflow:
                 early_termination = False
 
                 for i, step in enumerate(self.steps):  # type: ignore[arg-type]
+                    raise_if_cancelled()
                     step_name = getattr(step, "name", f"step_{i + 1}")
                     log_debug(f"Async streaming step {i + 1}/{self._get_step_count()}: {step_name}")
 
@@ -1042,6 +1083,9 @@ class Workflow:
 
                     self._collect_workflow_session_state_from_agents_and_teams()
 
+                # A step may have stopped early because the run was cancelled
+                raise_if_cancelled()
+
                 # Update the workflow_run_response with completion data
                 if collected_step_outputs:
                     workflow_run_response.workflow_metrics = self._aggregate_workflow_metrics(collected_step_outputs)
@@ -1061,6 +1105,13 @@ class Workflow:
                 workflow_run_response.audio = output_audio
                 workflow_run_response.status = RunStatus.completed
 
+            except RunCancelledException as e:
+                log_debug(f"Workflow run cancelled: {e}")
+                yield self._create_cancelled_event(str(e))
+
+                workflow_run_response.content = str(e)
+                workflow_run_response.status = RunStatus.cancelled
+
             except Exception as e:
                 logger.error(f"Workflow execution failed: {e}")
 
@@ -1116,6 +1167,48 @@ class Workflow:
 
         return self.workflow_session_state
 
+    def _create_cancelled_event(self, reason: str) -> WorkflowCancelledEvent:
+        return WorkflowCancelledEvent(
+            run_id=self.run_id or "",
+            workflow_id=self.workflow_id,
+            workflow_name=self.name,
+            session_id=self.session_id,
+            reason=reason,
+        )
+
+    def _cancellable_execute_stream(
+        self,
+        response_iterator: Iterator[WorkflowRunResponseEvent],
+        workflow_run_response: WorkflowRunResponse,
+        cancellation_token: CancellationToken,
+    ) -> Iterator[WorkflowRunResponseEvent]:
+        """Yield the events of a streamed run, ending it with a WorkflowCancelled event if the run is cancelled."""
+        try:
+            yield from iterate_in_scope(response_iterator, cancellation_token)
+        except RunCancelledException as e:
+            workflow_run_response.status = RunStatus.cancelled
+            workflow_run_response.content = str(e)
+            yield self._create_cancelled_event(str(e))
+        finally:
+            close_run_cancellation_token(cancellation_token)
+
+    async def _acancellable_execute_stream(
+        self,
+        response_iterator: AsyncIterator[WorkflowRunResponseEvent],
+        workflow_run_response: WorkflowRunResponse,
+        cancellation_token: CancellationToken,
+    ) -> AsyncIterator[WorkflowRunResponseEvent]:
+        """Async version of `_cancellable_execute_stream`."""
+        try:
+            async for event in aiterate_in_scope(response_iterator, cancellation_token):
+                yield event
+        except RunCancelledException as e:
+            workflow_run_response.status = RunStatus.cancelled
+            workflow_run_response.content = str(e)
+            yield self._create_cancelled_event(str(e))
+        finally:
+            close_run_cancellation_token(cancellation_token)
+
     @overload
     def run(
         self,
@@ -1128,6 +1221,8 @@ class Workflow:
         videos: Optional[List[Video]] = None,
         stream: Literal[False] = False,
         stream_intermediate_steps: Optional[bool] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
     ) -> WorkflowRunResponse: ...
 
     @overload
@@ -1142,6 +1237,8 @@ class Workflow:
         videos: Optional[List[Video]] = None,
         stream: Literal[True] = True,
         stream_intermediate_steps: Optional[bool] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
     ) -> Iterator[WorkflowRunResponseEvent]: ...
 
     def run(
@@ -1155,76 +1252,100 @@ class Workflow:
         videos: Optional[List[Video]] = None,
         stream: bool = False,
         stream_intermediate_steps: Optional[bool] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
         **kwargs: Any,
     ) -> Union[WorkflowRunResponse, Iterator[WorkflowRunResponseEvent]]:
-        """Execute the workflow synchronously with optional streaming"""
-        self._set_debug()
+        """Execute the workflow synchronously with optional streaming
 
-        log_debug(f"Workflow Run Start: {self.name}", center=True)
+        Args:
+            cancellation_token: Token to cancel the run with. The steps, and the agents and teams they run, stop
+                as soon as it is cancelled.
+            timeout: Seconds the run has to finish, after which it is cancelled.
 
-        # Use simple defaults
-        stream = stream or self.stream or False
-        stream_intermediate_steps = stream_intermediate_steps or self.stream_intermediate_steps or False
+        A cancelled or timed out run does not raise: it returns a response with the cancelled status,
+        or ends its stream with a WorkflowCancelled event.
+        """
+        self._set_debug()
+        cancellation_token = get_run_cancellation_token(cancellation_token, timeout)
+        # A streamed run closes its token when the stream ends
+        stream_owns_token = False
+        try:
+            log_debug(f"Workflow Run Start: {self.name}", center=True)
 
-        # Can't have stream_intermediate_steps if stream is False
-        if not stream:
-            stream_intermediate_steps = False
+            # Use simple defaults
+            stream = stream or self.stream or False
+            stream_intermediate_steps = stream_intermediate_steps or self.stream_intermediate_steps or False
 
-        log_debug(f"Stream: {stream}")
-        log_debug(f"Total steps: {self._get_step_count()}")
+            # Can't have stream_intermediate_steps if stream is False
+            if not stream:
+                stream_intermediate_steps = False
 
-        if user_id is not None:
-            self.user_id = user_id
-            log_debug(f"User ID: {user_id}")
-        if session_id is not None:
-            self.session_id = session_id
-            log_debug(f"Session ID: {session_id}")
+            log_debug(f"Stream: {stream}")
+            log_debug(f"Total steps: {self._get_step_count()}")
 
-        if self.session_id is None:
-            self.session_id = str(uuid4())
+            if user_id is not None:
+                self.user_id = user_id
+                log_debug(f"User ID: {user_id}")
+            if session_id is not None:
+                self.session_id = session_id
+                log_debug(f"Session ID: {session_id}")
 
-        self.run_id = str(uuid4())
+            if self.session_id is None:
+                self.session_id = str(uuid4())
 
-        self.initialize_workflow()
+            self.run_id = str(uuid4())
 
-        # Load or create session
-        self.load_session()
+            self.initialize_workflow()
 
-        # Prepare steps
-        self._prepare_steps()
+            # Load or create session
+            self.load_session()
 
-        # Create workflow run response that will be updated by reference
-        workflow_run_response = WorkflowRunResponse(
-            run_id=self.run_id,
-            session_id=self.session_id,
-            workflow_id=self.workflow_id,
-            workflow_name=self.name,
-            created_at=int(datetime.now().timestamp()),
-        )
-        self.run_response = workflow_run_response
-
-        inputs = WorkflowExecutionInput(
-            message=message,
-            additional_data=additional_data,
-            audio=audio,  # type: ignore
-            images=images,  # type: ignore
-            videos=videos,  # type: ignore
-        )
-        log_debug(
-            f"Created pipeline input with session state keys: {list(self.workflow_session_state.keys()) if self.workflow_session_state else 'None'}"
-        )
+            # Prepare steps
+            self._prepare_steps()
 
-        self.update_agents_and_teams_session_info()
+            # Create workflow run response that will be updated by reference
+            workflow_run_response = WorkflowRunResponse(
+                run_id=self.run_id,
+                session_id=self.session_id,
+                workflow_id=self.workflow_id,
+                workflow_name=self.name,
+                created_at=int(datetime.now().timestamp()),
+            )
+            self.run_response = workflow_run_response
 
-        if stream:
-            return self._execute_stream(
-                execution_input=inputs,  # type: ignore[arg-type]
-                workflow_run_response=workflow_run_response,
-                stream_intermediate_steps=stream_intermediate_steps,
-                **kwargs,
+            inputs = WorkflowExecutionInput(
+                message=message,
+                additional_data=additional_data,
+                audio=audio,  # type: ignore
+                images=images,  # type: ignore
+                videos=videos,  # type: ignore
             )
-        else:
-            return self._execute(execution_input=inputs, workflow_run_response=workflow_run_response, **kwargs)
+            log_debug(
+                f"Created pipeline input with session state keys: {list(self.workflow_session_state.keys()) if self.workflow_session_state else 'None'}"
+            )
+
+            self.update_agents_and_teams_session_info()
+
+            if stream:
+                response_iterator = self._execute_stream(
+                    execution_input=inputs,  # type: ignore[arg-type]
+                    workflow_run_response=workflow_run_response,
+                    stream_intermediate_steps=stream_intermediate_steps,
+                    **kwargs,
+                )
+                if cancellation_token is not None:
+                    stream_owns_token = True
+                    return self._cancellable_execute_stream(
+                        response_iterator, workflow_run_response, cancellation_token
+                    )
+                return response_iterator
+            else:
+                with cancellation_scope(cancellation_token):
+                    return self._execute(execution_input=inputs, workflow_run_response=workflow_run_response, **kwargs)
+        finally:
+            if not stream_owns_token:
+                close_run_cancellation_token(cancellation_token)
 
     @overload
     async def arun(
@@ -1238,6 +1359,8 @@ class Workflow:
         videos: Optional[List[Video]] = None,
         stream: Literal[False] = False,
         stream_intermediate_steps: Optional[bool] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
     ) -> WorkflowRunResponse: ...
 
     @overload
@@ -1252,6 +1375,8 @@ class Workflow:
         videos: Optional[List[Video]] = None,
         stream: Literal[True] = True,
         stream_intermediate_steps: Optional[bool] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
     ) -> AsyncIterator[WorkflowRunResponseEvent]: ...
 
     async def arun(
@@ -1265,76 +1390,115 @@ class Workflow:
         videos: Optional[List[Video]] = None,
         stream: bool = False,
         stream_intermediate_steps: Optional[bool] = False,
+        cancellation_token: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
         **kwargs: Any,
     ) -> Union[WorkflowRunResponse, AsyncIterator[WorkflowRunResponseEvent]]:
-        """Execute the workflow synchronously with optional streaming"""
-        self._set_debug()
+        """Execute the workflow asynchronously with optional streaming
 
-        log_debug(f"Async Workflow Run Start: {self.name}", center=True)
+        Args:
+            cancellation_token: Token to cancel the run with. The steps, and the agents and teams they run, stop
+                as soon as it is cancelled.
+            timeout: Seconds the run has to finish, after which it is cancelled.
 
-        # Use simple defaults
-        stream = stream or self.stream or False
-        stream_intermediate_steps = stream_intermediate_steps or self.stream_intermediate_steps or False
+        A cancelled or timed out run does not raise: it returns a response with the cancelled status,
+        or ends its stream with a WorkflowCancelled event.
+        """
+        self._set_debug()
+        cancellation_token = get_run_cancellation_token(cancellation_token, timeout)
+        # A streamed run closes its token when the stream ends
+        stream_owns_token = False
+        try:
+            log_debug(f"Async Workflow Run Start: {self.name}", center=True)
 
-        # Can't have stream_intermediate_steps if stream is False
-        if not stream:
-            stream_intermediate_steps = False
+            # Use simple defaults
+            stream = stream or self.stream or False
+            stream_intermediate_steps = stream_intermediate_steps or self.stream_intermediate_steps or False
 
-        log_debug(f"Stream: {stream}")
+            # Can't have stream_intermediate_steps if stream is False
+            if not stream:
+                stream_intermediate_steps = False
 
-        # Set user_id and session_id if provided
-        if user_id is not None:
-            self.user_id = user_id
-            log_debug(f"User ID: {user_id}")
-        if session_id is not None:
-            self.session_id = session_id
-            log_debug(f"Session ID: {session_id}")
+            log_debug(f"Stream: {stream}")
 
-        if self.session_id is None:
-            self.session_id = str(uuid4())
+            # Set user_id and session_id if provided
+            if user_id is not None:
+                self.user_id = user_id
+                log_debug(f"User ID: {user_id}")
+            if session_id is not None:
+                self.session_id = session_id
+                log_debug(f"Session ID: {session_id}")
 
-        self.run_id = str(uuid4())
+            if self.session_id is None:
+                self.session_id = str(uuid4())
 
-        self.initialize_workflow()
+            self.run_id = str(uuid4())
 
-        # Load or create session
-        self.load_session()
+            self.initialize_workflow()
 
-        # Prepare steps
-        self._prepare_steps()
+            # Load or create session
+            self.load_session()
 
-        # Create workflow run response that will be updated by reference
-        workflow_run_response = WorkflowRunResponse(
-            run_id=self.run_id,
-            session_id=self.session_id,
-            workflow_id=self.workflow_id,
-            workflow_name=self.name,
-            created_at=int(datetime.now().timestamp()),
-        )
-        self.run_response = workflow_run_response
-
-        inputs = WorkflowExecutionInput(
-            message=message,
-            additional_data=additional_data,
-            audio=audio,  # type: ignore
-            images=images,  # type: ignore
-            videos=videos,  # type: ignore
-        )
-        log_debug(
-            f"Created async pipeline input with session state keys: {list(self.workflow_session_state.keys()) if self.workflow_session_state else 'None'}"
-        )
+            # Prepare steps
+            self._prepare_steps()
 
-        self.update_agents_and_teams_session_info()
+            # Create workflow run response that will be updated by reference
+            workflow_run_response = WorkflowRunResponse(
+                run_id=self.run_id,
+                session_id=self.session_id,
+                workflow_id=self.workflow_id,
+                workflow_name=self.name,
+                created_at=int(datetime.now().timestamp()),
+            )
+            self.run_response = workflow_run_response
 
-        if stream:
-            return self._aexecute_stream(
-                execution_input=inputs,
-                workflow_run_response=workflow_run_response,
-                stream_intermediate_steps=stream_intermediate_steps,
-                **kwargs,
+            inputs = WorkflowExecutionInput(
+                message=message,
+                additional_data=additional_data,
+                audio=audio,  # type: ignore
+                images=images,  # type: ignore
+                videos=videos,  # type: ignore
             )
-        else:
-            return await self._aexecute(execution_input=inputs, workflow_run_response=workflow_run_response, **kwargs)
+            log_debug(
+                f"Created async pipeline input with session state keys: {list(self.workflow_session_state.keys()) if self.workflow_session_state else 'None'}"
+            )
+
+            self.update_agents_and_teams_session_info()
+
+            if stream:
+                response_iterator = self._aexecute_stream(
+                    execution_input=inputs,
+                    workflow_run_response=workflow_run_response,
+                    stream_intermediate_steps=stream_intermediate_steps,
+                    **kwargs,
+                )
+                if cancellation_token is not None:
+                    stream_owns_token = True
+                    return self._acancellable_execute_stream(
+                        response_iterator, workflow_run_response, cancellation_token
+                    )
+                return response_iterator
+            elif cancellation_token is None:
+                return await self._aexecute(
+                    execution_input=inputs, workflow_run_response=workflow_run_response, **kwargs
+                )
+            else:
+                with cancellation_scope(cancellation_token):
+                    run_coroutine = self._aexecute(
+                        execution_input=inputs, workflow_run_response=workflow_run_response, **kwargs
+                    )
+                    try:
+                        return await cancellation_token.acall(run_coroutine)
+                    except RunCancelledException as e:
+                        workflow_run_response.status = RunStatus.cancelled
+                        workflow_run_response.content = str(e)
+                        if self.workflow_session:
+                            self.workflow_session.add_run(workflow_run_response)
+                        self.write_to_storage()
+                        return workflow_run_response
+        finally:
+            if not stream_owns_token:
+                close_run_cancellation_token(cancellation_token)
 
     def _prepare_steps(self):
         """Prepare the steps for execution"""
@@ -0,0 +1,97 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+import pytest
+
+from agno.cache import InMemoryCache, ResponseCache
+from agno.cache.sqlite import SqliteCache
+from agno.embedder.base import Embedder
+from agno.models.message import Message
+from agno.models.response import ModelResponse
+from tests.unit.stub_model import StubModel
+
+
+@dataclass
+class EchoModel(StubModel):
+    """Model answering with the number of calls and the last user message"""
+
+    id: str = "echo"
+
+    def get_reply(self, messages: List[Message]) -> Any:
+        return f"answer {self.calls}: {messages[-1].content}"
+
+
+@dataclass
+class KeywordEmbedder(Embedder):
+    """Embeds texts by the keywords they contain"""
+
+    dimensions: int = 3
+
+    def get_embedding(self, text: str) -> List[float]:
+        return [float(word in text) for word in ("refund", "shipping", "password")]
+
+
+def get_messages(prompt: str, system: str = "You are a support agent") -> List[Message]:
+    return [Message(role="system", content=system), Message(role="user", content=prompt)]
+
+
+@pytest.mark.parametrize("backend", [InMemoryCache(), SqliteCache()], ids=["in_memory", "sqlite"])
+def test_exact_match(backend):
+    cache = ResponseCache(backend=backend)
+    model = EchoModel(response_cache=cache)
+
+    first = model.response(messages=get_messages("How do I get a refund?"))
+    messages = get_messages("  how do I get a REFUND? ")
+    second = model.response(messages=messages)
+    other = model.response(messages=get_messages("How do I get a refund?", system="You are a sales agent"))
+
+    assert model.calls == 2
+    assert second.content == first.content
+    assert messages[-1].role == "assistant" and messages[-1].content == first.content
+    assert other.content != first.content
+    assert cache.get_metrics()["hits"] == 1
+    assert cache.get_metrics()["hit_rate"] == pytest.approx(1 / 3)
+
+
+def test_similar_match():
+    cache = ResponseCache(embedder=KeywordEmbedder(), similarity_threshold=0.9)
+    model = EchoModel(response_cache=cache)
+
+    first = model.response(messages=get_messages("I want a refund"))
+    similar = model.response(messages=get_messages("Can I have a refund please"))
+    different = model.response(messages=get_messages("I forgot my password"))
+
+    assert similar.content == first.content
+    assert different.content != first.content
+    assert cache.metrics.similar_hits == 1
+
+
+def test_ttl_and_tool_runs_bypass():
+    cache = ResponseCache(ttl=0)
+    model = EchoModel(response_cache=cache)
+    model.response(messages=get_messages("hello"))
+    model.response(messages=get_messages("hello"))
+    assert model.calls == 2
+
+    cache = ResponseCache()
+    key = cache.get_key(model, get_messages("hello"))
+    assert key is not None
+    cache.set(key, ModelResponse(content="used a tool"), called_tools=True)
+    assert cache.get(key) is None
+    assert cache.metrics.bypassed == 1
+
+
+@pytest.mark.asyncio
+async def test_async_and_stream_responses():
+    cache = ResponseCache()
+    model = EchoModel(response_cache=cache)
+
+    first = await model.aresponse(messages=get_messages("hi"))
+    second = await model.aresponse(messages=get_messages("hi"))
+    streamed: List[Dict[str, Any]] = [
+        {"content": r.content} for r in model.response_stream(messages=get_messages("hi")) if r.content
+    ]
+
+    assert model.calls == 1
+    assert second.content == first.content
+    assert streamed == [{"content": first.content}]
@@ -0,0 +1,88 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from agno.cache import RetrievalCache
+from agno.cache.sqlite import SqliteCache
+from agno.document import Document
+from agno.knowledge.agent import AgentKnowledge
+from agno.reranker.base import Reranker
+from agno.vectordb.base import VectorDb
+
+
+class TopReranker(Reranker):
+    top_n: int = 1
+    api_key: str = "secret"
+
+
+def get_vector_db(table_name: str = "docs") -> MagicMock:
+    vector_db = MagicMock(spec=VectorDb)
+    vector_db.table_name = table_name
+    vector_db.reranker = None
+    vector_db.search.side_effect = lambda query, limit, filters=None: [
+        Document(content=f"{query} {i}", meta_data={"i": i}) for i in range(limit)
+    ]
+    vector_db.async_search.side_effect = NotImplementedError
+    vector_db.upsert_available.return_value = True
+    return vector_db
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_search_results_are_cached_until_documents_are_loaded(backend, tmp_path):
+    cache = RetrievalCache(backend=SqliteCache(db_file=tmp_path / "cache.db") if backend == "sqlite" else None)
+    vector_db = get_vector_db()
+    knowledge = AgentKnowledge(vector_db=vector_db, search_cache=cache, num_documents=2)
+
+    first = knowledge.search("Thai  Recipes")
+    second = knowledge.search("thai recipes")
+    assert [document.content for document in second] == [document.content for document in first]
+    assert vector_db.search.call_count == 1
+
+    # Changing a cached document does not change the cache
+    second[0].meta_data["i"] = 10
+    assert knowledge.search("thai recipes")[0].meta_data == {"i": 0}
+
+    # The filters and number of documents are part of the key
+    knowledge.search("thai recipes", filters={"cuisine": "thai"})
+    knowledge.search("thai recipes", num_documents=3)
+    assert vector_db.search.call_count == 3
+
+    knowledge.load_documents([Document(content="Pad thai")], upsert=True)
+    knowledge.search("thai recipes")
+    assert vector_db.search.call_count == 4
+
+    metrics = cache.get_metrics()
+    assert metrics["hits"] == 2
+    assert metrics["misses"] == 4
+    assert metrics["invalidations"] == 1
+
+
+def test_cache_key_depends_on_knowledge_base_and_reranker():
+    cache = RetrievalCache()
+    reranked_db = get_vector_db()
+    reranked_db.reranker = TopReranker()
+    knowledge = AgentKnowledge(vector_db=get_vector_db(), search_cache=cache)
+    reranked = AgentKnowledge(vector_db=reranked_db, search_cache=cache)
+    other = AgentKnowledge(vector_db=get_vector_db(table_name="other_docs"), search_cache=cache)
+
+    assert knowledge.get_knowledge_id() == reranked.get_knowledge_id() != other.get_knowledge_id()
+    assert knowledge._get_search_cache_key("q", 5) != reranked._get_search_cache_key("q", 5)
+    assert "secret" not in str(cache.get_key("docs", "q", reranker=reranked_db.reranker))
+
+    knowledge.search("q")
+    other.search("q")
+    other.invalidate_search_cache()
+    knowledge.search("q")
+    assert cache.get_metrics()["hits"] == 1
+
+
+def test_async_search_uses_the_cache():
+    cache = RetrievalCache()
+    vector_db = get_vector_db()
+    knowledge = AgentKnowledge(vector_db=vector_db, search_cache=cache)
+
+    asyncio.run(knowledge.async_search("q"))
+    asyncio.run(knowledge.async_search("q"))
+    assert vector_db.search.call_count == 1
+    assert cache.get_metrics()["hit_rate"] == 0.5
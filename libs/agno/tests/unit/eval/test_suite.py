@@ -0,0 +1,95 @@
+import asyncio
+import json
+from dataclasses import dataclass
+from typing import Any
+
+from agno.agent import Agent
+from agno.cache.in_memory import InMemoryCache
+from agno.eval.accuracy import AccuracyEval
+from agno.eval.performance import PerformanceEval
+from agno.eval.reliability import ReliabilityEval
+from agno.eval.suite import EvalSuite
+from agno.models.message import Message
+from agno.run.response import RunResponse
+from tests.unit.stub_model import StubModel
+
+CALLS = {"agent": 0, "evaluator": 0, "running": 0, "max_running": 0}
+
+
+@dataclass
+class SlowModel(StubModel):
+    id: str = "slow"
+    reply: str = "4"
+    kind: str = "agent"
+
+    async def ainvoke(self, *args, **kwargs) -> Any:
+        CALLS[self.kind] += 1
+        CALLS["running"] += 1
+        CALLS["max_running"] = max(CALLS["max_running"], CALLS["running"])
+        await asyncio.sleep(0.05)
+        CALLS["running"] -= 1
+        return await super().ainvoke(*args, **kwargs)
+
+
+def get_suite(tmp_path, cache) -> EvalSuite:
+    agent = Agent(agent_id="math", model=SlowModel(kind="agent"))
+    evaluator_model = SlowModel(kind="evaluator", reply='{"accuracy_score": 9, "accuracy_reason": "Correct"}')
+    accuracy_evals = [
+        AccuracyEval(
+            name=f"sum-{i}",
+            input=f"What is {i} + 2?",
+            expected_output=str(i + 2),
+            agent=agent,
+            model=evaluator_model,
+            num_iterations=2,
+            monitoring=False,
+        )
+        for i in range(4)
+    ]
+    tool_call_message = Message(role="assistant", tool_calls=[{"id": "1", "function": {"name": "add"}}])
+    reliability_eval = ReliabilityEval(
+        name="tools",
+        agent_response=RunResponse(messages=[tool_call_message]),
+        expected_tool_calls=["add"],
+        monitoring=False,
+    )
+    performance_eval = PerformanceEval(name="noop", func=lambda: None, num_iterations=2, monitoring=False)
+    return EvalSuite(
+        evals=[performance_eval, *accuracy_evals, reliability_eval],
+        max_concurrency=4,
+        output_cache=cache,
+        report_path=str(tmp_path / "report.jsonl"),
+    )
+
+
+def test_eval_suite_runs_concurrently_and_caches_outputs(tmp_path):
+    CALLS.update(agent=0, evaluator=0, running=0, max_running=0)
+    cache = InMemoryCache()
+
+    suite = get_suite(tmp_path, cache)
+    result = suite.run()
+
+    assert [case.name for case in result.results] == ["noop", "sum-0", "sum-1", "sum-2", "sum-3", "tools"]
+    assert result.failed == []
+    assert result.results[1].result["avg_score"] == 9
+    assert result.results[-1].result["eval_status"] == "PASSED"
+    assert CALLS["agent"] == 8
+    assert CALLS["max_running"] > 1
+    report = [json.loads(line) for line in (tmp_path / "report.jsonl").read_text().splitlines()]
+    assert len(report) == 6
+    assert report[-1]["name"] == "noop"
+
+    # A second run only runs the evaluator
+    result = get_suite(tmp_path, cache).run()
+    assert CALLS["agent"] == 8
+    assert CALLS["evaluator"] == 16
+    assert result.cache_metrics["hits"] == 8
+    assert sum(case.cached_outputs for case in result.results) == 8
+
+
+def test_eval_suite_records_errors(tmp_path):
+    suite = EvalSuite(evals=[AccuracyEval(input="a", expected_output="b", monitoring=False)])
+    result = suite.run()
+
+    assert result.results[0].status == "error"
+    assert len(result.failed) == 1
@@ -0,0 +1,100 @@
+import time
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from agno.document import Document
+from agno.knowledge.agent import AgentKnowledge
+from agno.knowledge.combined import CombinedKnowledgeBase
+from agno.utils.fusion import normalized_score_fusion, reciprocal_rank_fusion
+
+
+class StaticKnowledge(AgentKnowledge):
+    """Knowledge base returning fixed results"""
+
+    results: List[str] = []
+    delay: float = 0.0
+    fail: bool = False
+
+    def search(
+        self, query: str, num_documents: Optional[int] = None, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        if self.delay:
+            time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("source unavailable")
+        return [Document(content=content) for content in self.results[: num_documents or self.num_documents]]
+
+    async def async_search(
+        self, query: str, num_documents: Optional[int] = None, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        return self.search(query=query, num_documents=num_documents, filters=filters)
+
+
+def test_reciprocal_rank_fusion_merges_duplicates():
+    first = [Document(content="a"), Document(content="b"), Document(content="c")]
+    second = [Document(content="b"), Document(content="d")]
+
+    fused = reciprocal_rank_fusion([first, second], k=60)
+
+    assert [document.content for document, _ in fused] == ["b", "a", "d", "c"]
+    assert fused[0][1] == pytest.approx(1 / 62 + 1 / 61)
+
+
+def test_normalized_score_fusion():
+    fused = normalized_score_fusion(
+        [
+            [(Document(content="a"), 0.9), (Document(content="b"), 0.7), (Document(content="e"), 0.5)],
+            [(Document(content="b"), 12.0), (Document(content="c"), 2.0)],
+        ]
+    )
+
+    assert [document.content for document, _ in fused] == ["b", "a", "e", "c"]
+    assert fused[0][1] == pytest.approx(1.5)
+
+
+def test_combined_search_fans_out_and_fuses():
+    knowledge_base = CombinedKnowledgeBase(
+        sources=[
+            StaticKnowledge(results=["a", "b", "c"]),
+            StaticKnowledge(results=["b", "d"]),
+            StaticKnowledge(results=["x"], fail=True),
+        ]
+    )
+
+    documents = knowledge_base.search("query", num_documents=3)
+
+    assert [document.content for document in documents] == ["b", "a", "d"]
+
+
+def test_combined_search_skips_slow_sources():
+    knowledge_base = CombinedKnowledgeBase(
+        sources=[StaticKnowledge(results=["fast"]), StaticKnowledge(results=["slow"], delay=1.0)],
+        source_timeout=0.1,
+    )
+
+    start = time.perf_counter()
+    documents = knowledge_base.search("query")
+
+    assert time.perf_counter() - start < 0.8
+    assert [document.content for document in documents] == ["fast"]
+
+
+@pytest.mark.asyncio
+async def test_combined_async_search():
+    knowledge_base = CombinedKnowledgeBase(
+        sources=[StaticKnowledge(results=["a", "b"]), StaticKnowledge(results=["b", "c"])],
+        source_weights=[1.0, 2.0],
+    )
+
+    documents = await knowledge_base.async_search("query")
+
+    assert [document.content for document in documents] == ["b", "c", "a"]
+
+
+def test_source_weights_must_match_sources():
+    with pytest.raises(ValueError, match="one weight per source"):
+        CombinedKnowledgeBase(
+            sources=[StaticKnowledge(results=["a"]), StaticKnowledge(results=["b"])],
+            source_weights=[1.0],
+        )
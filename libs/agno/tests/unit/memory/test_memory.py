@@ -759,3 +759,56 @@ def test_clear(memory_with_model, sample_user_memory):
     # Verify data is cleared
     assert memory_with_model.memories == {}
     assert memory_with_model.summaries == {}
+
+
+def get_run(run_id: str, question: str, answer: str) -> RunResponse:
+    return RunResponse(
+        run_id=run_id,
+        messages=[Message(role="user", content=question), Message(role="assistant", content=answer)],
+    )
+
+
+def test_session_summary_is_updated_with_new_runs(mock_model):
+    summarizer = SessionSummarizer(model=mock_model, min_new_runs=2)
+    memory = Memory(model=mock_model, summarizer=summarizer)
+    memory.add_run("test_session", get_run("run-1", "I live in Paris", "Noted"))
+
+    with patch.object(summarizer, "run") as mock_run:
+        mock_run.return_value = MagicMock(summary="The user lives in Paris", topics=["location"])
+        summary = memory.create_session_summary("test_session", "test_user")
+        assert summary.last_run_id == "run-1"
+        assert mock_run.call_args.kwargs["previous_summary"] is None
+        assert len(mock_run.call_args.kwargs["conversation"]) == 2
+
+        # A single new run is below the threshold
+        memory.add_run("test_session", get_run("run-2", "I have a dog", "Nice"))
+        assert memory.create_session_summary("test_session", "test_user") is summary
+        assert mock_run.call_count == 1
+
+        memory.add_run("test_session", get_run("run-3", "My dog is called Rex", "Great name"))
+        mock_run.return_value = MagicMock(summary="The user lives in Paris with a dog, Rex", topics=["location"])
+        updated_summary = memory.create_session_summary("test_session", "test_user")
+        assert updated_summary.last_run_id == "run-3"
+        assert mock_run.call_args.kwargs["previous_summary"] is summary
+        # Only the messages of the runs since the previous summary are summarized
+        assert [message.content for message in mock_run.call_args.kwargs["conversation"]] == [
+            "I have a dog",
+            "Nice",
+            "My dog is called Rex",
+            "Great name",
+        ]
+
+
+def test_session_summary_token_threshold_and_system_message(mock_model):
+    mock_model.id = "gpt-4o"
+    summarizer = SessionSummarizer(model=mock_model, min_new_runs=10, min_new_tokens=50)
+    previous_summary = SessionSummary(summary="The user lives in Paris", topics=["location"], last_run_id="run-1")
+
+    assert not summarizer.should_update_summary(1, [Message(role="user", content="Hi")])
+    assert summarizer.should_update_summary(1, [Message(role="user", content="word " * 100)])
+
+    system_message = summarizer.get_system_message(
+        [Message(role="user", content="I have a dog")], {"type": "json_object"}, previous_summary=previous_summary
+    )
+    assert "<previous_summary>\nThe user lives in Paris\n</previous_summary>" in system_message.content
+    assert "User: I have a dog" in system_message.content
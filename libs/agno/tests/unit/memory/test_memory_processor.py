@@ -0,0 +1,194 @@
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from agno.cache.sqlite import SqliteCache
+from agno.memory.v2.processor import MemoryProcessor
+from agno.models.message import Message
+
+
+class FakeMemory:
+    def __init__(self, fail: int = 0):
+        self.calls = []
+        self.summaries = []
+        self.fail = fail
+        self.fail_summary = 0
+        self.release = threading.Event()
+        self.release.set()
+
+    def create_user_memories(self, messages=None, user_id=None):
+        self.release.wait()
+        if self.fail > 0:
+            self.fail -= 1
+            raise ValueError("Model error")
+        self.calls.append((user_id, [m.content for m in messages]))
+
+    def create_session_summary(self, session_id, user_id=None):
+        if self.fail_summary > 0:
+            self.fail_summary -= 1
+            raise ValueError("Model error")
+        self.summaries.append(session_id)
+
+
+@pytest.fixture
+def memory():
+    return FakeMemory()
+
+
+def test_runs_of_a_session_are_coalesced(memory):
+    processor = MemoryProcessor(coalesce_delay=60)
+    for i in range(3):
+        processor.enqueue(
+            session_id="s1",
+            user_id="u1",
+            messages=[Message(role="user", content=f"message {i}")],
+            create_session_summary=True,
+            memory=memory,
+        )
+    processor.enqueue(session_id="s2", user_id="u1", messages=[Message(role="user", content="other")], memory=memory)
+
+    assert memory.calls == []
+    assert processor.get_staleness("s1", "u1") > 0
+    assert processor.flush(timeout=5)
+
+    assert sorted(memory.calls) == [("u1", ["message 0", "message 1", "message 2"]), ("u1", ["other"])]
+    assert memory.summaries == ["s1"]
+    assert processor.get_staleness("s1", "u1") == 0
+    metrics = processor.get_metrics()
+    assert metrics["enqueued_runs"] == 4
+    assert metrics["coalesced_runs"] == 2
+    assert metrics["processed_jobs"] == 2
+    assert metrics["pending_jobs"] == 0
+    processor.shutdown()
+
+
+def test_runs_enqueued_during_processing_are_kept(memory):
+    processor = MemoryProcessor(memory=memory, coalesce_delay=0)
+    memory.release.clear()
+    processor.enqueue(session_id="s1", messages=[Message(role="user", content="first")])
+    while not processor._running:
+        threading.Event().wait(0.01)
+    processor.enqueue(session_id="s1", messages=[Message(role="user", content="second")])
+    memory.release.set()
+
+    assert processor.flush(timeout=5)
+    assert memory.calls == [(None, ["first"]), (None, ["second"])]
+    processor.shutdown()
+
+
+def test_failed_jobs_are_retried(memory):
+    memory.fail = 1
+    processor = MemoryProcessor(memory=memory, coalesce_delay=0, max_retries=1)
+    processor.enqueue(session_id="s1", messages=[Message(role="user", content="hello")])
+
+    assert processor.flush(timeout=5)
+    assert memory.calls == [(None, ["hello"])]
+    assert processor.get_metrics()["retried_jobs"] == 1
+
+    memory.fail = 2
+    processor.enqueue(session_id="s2", messages=[Message(role="user", content="lost")])
+    assert processor.flush(timeout=5)
+    assert processor.get_metrics()["failed_jobs"] == 1
+    processor.shutdown()
+
+
+def test_retries_only_rerun_the_failed_steps(memory):
+    memory.fail_summary = 1
+    processor = MemoryProcessor(memory=memory, coalesce_delay=0, max_retries=1)
+    processor.enqueue(session_id="s1", messages=[Message(role="user", content="hello")], create_session_summary=True)
+
+    assert processor.flush(timeout=5)
+    assert memory.calls == [(None, ["hello"])]
+    assert memory.summaries == ["s1"]
+    assert processor.get_metrics()["retried_jobs"] == 1
+    processor.shutdown()
+
+
+def test_pending_jobs_are_resumed(memory, tmp_path):
+    backend = SqliteCache(db_file=str(tmp_path / "jobs.db"))
+    processor = MemoryProcessor(memory=memory, backend=backend, coalesce_delay=60)
+    processor.enqueue(session_id="s1", user_id="u1", messages=[Message(role="user", content="hello")])
+    processor.shutdown(wait=False)
+    assert memory.calls == []
+
+    processor = MemoryProcessor(memory=memory, backend=SqliteCache(db_file=str(tmp_path / "jobs.db")))
+    processor.start()
+    assert processor.flush(timeout=5)
+    assert memory.calls == [("u1", ["hello"])]
+    processor.shutdown()
+
+
+def test_agent_enqueues_memories():
+    from agno.agent import Agent
+    from agno.agent.agent import RunMessages
+
+    memory = FakeMemory()
+    processor = MemoryProcessor(coalesce_delay=60)
+    agent = Agent(memory_processor=processor, enable_user_memories=True, enable_session_summaries=True)
+    agent.memory = memory  # type: ignore
+    run_messages = RunMessages(user_message=Message(role="user", content="I like tea"))
+
+    assert list(agent._make_memories_and_summaries(run_messages, session_id="s1", user_id="u1")) == []
+    assert processor.get_metrics()["pending_jobs"] == 1
+    assert processor.flush(timeout=5)
+    assert memory.calls == [("u1", ["I like tea"])]
+    assert memory.summaries == ["s1"]
+    processor.shutdown()
+
+
+def test_agent_saves_background_summaries_to_storage(tmp_path):
+    from agno.agent import Agent
+    from agno.agent.agent import RunMessages
+    from agno.memory.v2.memory import Memory
+    from agno.run.response import RunResponse
+    from agno.storage.sqlite import SqliteStorage
+
+    summarizer = Mock(incremental=False)
+    summarizer.run.return_value = Mock(summary="The user likes tea", topics=["tea"])
+    storage = SqliteStorage(table_name="agent_sessions", db_file=str(tmp_path / "sessions.db"))
+    processor = MemoryProcessor(coalesce_delay=60)
+    agent = Agent(
+        agent_id="agent-1",
+        memory=Memory(summarizer=summarizer),
+        storage=storage,
+        memory_processor=processor,
+        enable_session_summaries=True,
+    )
+    message = Message(role="user", content="I like tea")
+    agent.memory.add_run("s1", RunResponse(run_id="run-1", agent_id="agent-1", messages=[message]))  # type: ignore
+    # The run saves its session before the summary is created
+    agent.write_to_storage(session_id="s1", user_id="u1")
+    list(agent._make_memories_and_summaries(RunMessages(user_message=message), session_id="s1", user_id="u1"))
+    assert processor.flush(timeout=5)
+    processor.shutdown()
+
+    stored = storage.read(session_id="s1")
+    assert stored.memory["summaries"]["u1"]["s1"]["summary"] == "The user likes tea"  # type: ignore
+    # The summary survives loading the session in the next run
+    agent.load_agent_session(stored)  # type: ignore
+    assert agent.memory.summaries["u1"]["s1"].summary == "The user likes tea"  # type: ignore
+
+
+def test_saving_a_summary_waits_for_the_session_writes(tmp_path):
+    from agno.agent import Agent
+    from agno.memory.v2.schema import SessionSummary
+    from agno.storage.base import session_lock
+    from agno.storage.sqlite import SqliteStorage
+
+    storage = SqliteStorage(table_name="agent_sessions", db_file=str(tmp_path / "sessions.db"))
+    agent = Agent(agent_id="agent-1", storage=storage)
+    agent.write_to_storage(session_id="s1", user_id="u1")
+
+    with session_lock("s1"):
+        # A run of the session is writing it, the summary is saved once the write is done
+        saver = threading.Thread(
+            target=agent._save_session_summary, args=("s1", "u1", SessionSummary(summary="The user likes tea"))
+        )
+        saver.start()
+        saver.join(timeout=0.1)
+        assert saver.is_alive()
+    saver.join(timeout=5)
+
+    stored = storage.read(session_id="s1")
+    assert stored.memory["summaries"]["u1"]["s1"]["summary"] == "The user likes tea"  # type: ignore
@@ -0,0 +1,110 @@
+import time
+from dataclasses import dataclass, field
+from typing import Any, List
+
+import pytest
+
+from agno.models.hedging import HedgingPolicy, LatencyTracker, get_latency_key
+from agno.models.message import Message
+from tests.unit.stub_model import StubModel
+
+
+@dataclass
+class DelayedModel(StubModel):
+    """Model answering with its id after the next delay"""
+
+    id: str = "delayed"
+    delays: List[float] = field(default_factory=list)
+
+    def get_delay(self) -> float:
+        return self.delays.pop(0) if self.delays else 0.0
+
+    def get_reply(self, messages: List[Message]) -> Any:
+        return self.id
+
+    def invoke_stream(self, *args, **kwargs):
+        yield from super().invoke_stream(*args, **kwargs)
+        yield " done"
+
+    async def ainvoke_stream(self, *args, **kwargs):
+        async for chunk in super().ainvoke_stream(*args, **kwargs):
+            yield chunk
+        yield " done"
+
+
+def get_messages() -> List[Message]:
+    return [Message(role="user", content="hi")]
+
+
+def test_latency_percentile():
+    tracker = LatencyTracker(window=100)
+    for latency in range(1, 101):
+        tracker.record(latency / 100)
+
+    assert tracker.percentile(95) == pytest.approx(0.95)
+    assert tracker.percentile(50) == pytest.approx(0.5)
+
+
+def test_hedge_to_fallback_model():
+    fallback = DelayedModel(id="fallback")
+    model = DelayedModel(
+        delays=[1.0], hedging=HedgingPolicy(initial_delay=0.05, min_delay=0.0, fallback_model=fallback)
+    )
+
+    start = time.perf_counter()
+    response = model.response(messages=get_messages())
+
+    assert time.perf_counter() - start < 0.8
+    assert response.content == "fallback"
+    assert len(model.hedging.get_tracker(get_latency_key(model, "response"))) == 1  # type: ignore
+
+
+def test_no_hedge_when_fast():
+    fallback = DelayedModel(id="fallback")
+    model = DelayedModel(hedging=HedgingPolicy(initial_delay=0.5, fallback_model=fallback))
+    messages = get_messages()
+
+    response = model.response(messages=messages)
+
+    assert response.content == "delayed"
+    assert messages[-1].metrics.hedged_requests == 0
+
+
+@pytest.mark.asyncio
+async def test_async_hedge_metrics():
+    fallback = DelayedModel(id="fallback")
+    model = DelayedModel(
+        delays=[5.0], hedging=HedgingPolicy(initial_delay=0.05, min_delay=0.0, fallback_model=fallback)
+    )
+    messages = get_messages()
+
+    response = await model.aresponse(messages=messages)
+
+    assert response.content == "fallback"
+    assert messages[-1].metrics.hedged_requests == 1
+    assert messages[-1].metrics.hedged_input_tokens > 0
+
+
+def test_stream_hedges_on_first_token():
+    fallback = DelayedModel(id="fallback")
+    model = DelayedModel(
+        delays=[1.0], hedging=HedgingPolicy(initial_delay=0.05, min_delay=0.0, fallback_model=fallback)
+    )
+
+    start = time.perf_counter()
+    content = "".join(r.content for r in model.response_stream(messages=get_messages()) if r.content)
+
+    assert time.perf_counter() - start < 0.8
+    assert content == "fallback done"
+
+
+@pytest.mark.asyncio
+async def test_async_stream_hedges_on_first_token():
+    fallback = DelayedModel(id="fallback")
+    model = DelayedModel(
+        delays=[5.0], hedging=HedgingPolicy(initial_delay=0.05, min_delay=0.0, fallback_model=fallback)
+    )
+
+    content = "".join([r.content async for r in model.aresponse_stream(messages=get_messages()) if r.content])
+
+    assert content == "fallback done"
@@ -0,0 +1,48 @@
+import copy
+import json
+import pickle
+import sys
+
+import pytest
+
+from agno.models.message import Message, MessageMetrics
+from agno.models.response import ToolExecution
+from agno.run.response import RunResponseContentEvent
+from agno.run.team import RunResponseCompletedEvent as TeamRunResponseCompletedEvent
+from agno.run.team import RunResponseContentEvent as TeamRunResponseContentEvent
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10")
+@pytest.mark.parametrize(
+    "obj",
+    [MessageMetrics(), ToolExecution(), RunResponseContentEvent(content="a"), TeamRunResponseContentEvent(content="a")],
+)
+def test_slotted_objects(obj):
+    assert not hasattr(obj, "__dict__")
+    assert copy.deepcopy(obj) == obj
+    assert pickle.loads(pickle.dumps(obj)) == obj
+
+
+def test_message_metrics_in_message():
+    message = Message(role="assistant", metrics={"input_tokens": 5})
+    message.metrics.output_tokens += 2
+
+    assert message.metrics.to_dict() == {"input_tokens": 5, "output_tokens": 2}
+    assert copy.deepcopy(message).metrics == message.metrics
+
+
+def test_message_role_is_interned():
+    first = Message.model_validate(json.loads('{"role": "assistant"}'))
+    second = Message.model_validate(json.loads('{"role": "assistant"}'))
+
+    assert first.role is second.role
+
+
+def test_team_event_from_dict():
+    event = TeamRunResponseContentEvent.from_dict({"content": "a", "member_responses": [{"agent_id": "x"}]})
+    assert event.content == "a"
+
+    completed = TeamRunResponseCompletedEvent.from_dict(
+        {"content": "b", "member_responses": [{"agent_id": "x", "content": "c"}]}
+    )
+    assert completed.member_responses[0].content == "c"
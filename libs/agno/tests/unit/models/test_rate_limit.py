@@ -0,0 +1,111 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, List
+
+import pytest
+
+from agno.exceptions import ModelProviderError
+from agno.models.message import Message
+from agno.models.rate_limit import AdaptiveConcurrencyLimiter, RateLimiter, TokenBucket, _parse_duration
+from tests.unit.stub_model import StubModel
+
+
+@dataclass
+class SlowModel(StubModel):
+    """Model tracking the number of concurrent requests"""
+
+    id: str = "slow"
+    delay: float = 0.02
+    fail_with_status: int = 0
+    in_flight: int = 0
+    max_in_flight: int = 0
+
+    def __post_init__(self):
+        super().__post_init__()
+        self._lock = threading.Lock()
+
+    def invoke(self, *args, **kwargs) -> Any:
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            return super().invoke(*args, **kwargs)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    async def ainvoke(self, *args, **kwargs) -> Any:
+        return self.invoke(*args, **kwargs)
+
+    def get_reply(self, messages: List[Message]) -> Any:
+        if self.fail_with_status:
+            raise ModelProviderError("Too many requests", status_code=self.fail_with_status)
+        return self.reply
+
+
+def test_token_bucket_spaces_out_requests():
+    bucket = TokenBucket(rate_per_minute=600, capacity=1)
+
+    waits = [bucket.reserve() for _ in range(3)]
+
+    assert waits[0] == 0
+    assert waits[1] == pytest.approx(0.1, abs=0.01)
+    assert waits[2] == pytest.approx(0.2, abs=0.01)
+
+
+def test_aimd_concurrency_limit():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=5)
+
+    for _ in range(8):
+        limiter.on_success()
+    assert limiter.limit == pytest.approx(5)
+
+    limiter.on_overload()
+    assert limiter.limit == pytest.approx(2.5)
+    assert limiter.try_acquire() and limiter.try_acquire()
+    assert not limiter.try_acquire()
+
+
+def test_limits_from_headers():
+    rate_limiter = RateLimiter(max_concurrent_requests=8)
+
+    rate_limiter.update_from_headers(
+        {
+            "x-ratelimit-limit-requests": "500",
+            "x-ratelimit-remaining-requests": "499",
+            "x-ratelimit-limit-tokens": "30000",
+            "x-ratelimit-remaining-tokens": "0",
+            "x-ratelimit-reset-tokens": "1m30s",
+        }
+    )
+
+    assert rate_limiter.requests is not None and rate_limiter.requests.rate_per_minute == 500
+    assert rate_limiter.tokens is not None and rate_limiter.tokens.reserve(1) == pytest.approx(90, abs=1)
+    assert rate_limiter.concurrency is not None and rate_limiter.concurrency.limit == 4
+    assert _parse_duration("120ms") == pytest.approx(0.12)
+
+
+def test_model_concurrency_is_limited():
+    model = SlowModel(id="slow-concurrency", max_concurrent_requests=2)
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        list(executor.map(lambda _: model.response(messages=[Message(role="user", content="hi")]), range(6)))
+
+    metrics = model.get_rate_limiter().get_metrics()  # type: ignore
+    assert model.max_in_flight <= 2
+    assert metrics["requests"] == 6
+    assert metrics["queued"] >= 1
+    assert metrics["in_flight"] == 0
+
+
+def test_model_backs_off_on_rate_limit():
+    model = SlowModel(id="slow-429", max_concurrent_requests=4, fail_with_status=429)
+
+    with pytest.raises(ModelProviderError):
+        model.response(messages=[Message(role="user", content="hi")])
+
+    rate_limiter = model.get_rate_limiter()
+    assert rate_limiter is not None
+    assert rate_limiter.get_metrics()["rate_limited"] == 1
+    assert rate_limiter.concurrency is not None and rate_limiter.concurrency.limit == 2
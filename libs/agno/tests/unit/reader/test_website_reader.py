@@ -271,3 +271,91 @@ async def test_async_crawl_max_depth(mock_html_content, mock_html_content_with_a
         assert len(result) == 2
         assert "https://example.com" in result
         assert "https://example.com/page1" in result
+
+
+def _mock_site(num_pages: int, requests: list):
+    """A site where every page links to the next two pages, with ETags."""
+    import httpx
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        page = int(request.url.path.strip("/") or 0)
+        etag = f'"page-{page}"'
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        links = "".join(
+            f'<a href="/{linked}">Page {linked}</a>' for linked in (2 * page + 1, 2 * page + 2) if linked < num_pages
+        )
+        html = f"<html><body><main>Content of page {page}</main>{links}</body></html>"
+        return httpx.Response(200, content=html.encode(), headers={"ETag": etag})
+
+    original_client = httpx.AsyncClient
+    return patch(
+        "agno.document.reader.website_reader.httpx.AsyncClient",
+        side_effect=lambda **kwargs: original_client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_crawl_concurrent_frontier():
+    requests: list = []
+    reader = WebsiteReader(max_depth=5, max_links=20, max_concurrency=4, per_host_delay=0)
+
+    with _mock_site(15, requests):
+        result = await reader.async_crawl("https://example.com/")
+
+    assert len(result) == 15
+    assert result["https://example.com/3"] == "Content of page 3"
+    # Every page is fetched exactly once
+    assert len(requests) == 15
+
+
+@pytest.mark.asyncio
+async def test_async_crawl_respects_max_links_and_revalidates():
+    requests: list = []
+    reader = WebsiteReader(max_depth=5, max_links=3, max_concurrency=4, per_host_delay=0)
+
+    with _mock_site(15, requests):
+        first = await reader.async_crawl("https://example.com/")
+        assert len(first) == 3
+
+        requests.clear()
+        second = await reader.async_crawl("https://example.com/")
+
+    # Pages crawled before are revalidated and unchanged pages reuse the cached content
+    assert second == first
+    assert requests[0].headers["If-None-Match"] == '"page-0"'
+
+
+@pytest.mark.asyncio
+async def test_async_fetch_page_waits_for_the_host_delay_without_holding_the_lock():
+    import asyncio
+    import time
+
+    import httpx
+
+    request_times: list = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        request_times.append(time.monotonic())
+        return httpx.Response(200, content=b"<html><body><main>Content</main></body></html>")
+
+    reader = WebsiteReader(per_host_delay=0.1)
+    host_locks: dict = {}
+    host_next_request: dict = {}
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+
+        def fetch(page: int):
+            return reader._async_fetch_page(
+                client, f"https://example.com/{page}", "example.com", host_locks, host_next_request
+            )
+
+        await fetch(0)
+        pending = asyncio.gather(fetch(1), fetch(2))
+        await asyncio.sleep(0.02)
+        # The fetches wait for their request slots, but the host lock is free
+        assert not host_locks["example.com"].locked()
+        await pending
+
+    assert len(request_times) == 3
+    assert all(later - earlier >= 0.09 for earlier, later in zip(request_times, request_times[1:]))
@@ -0,0 +1,221 @@
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+
+import pytest
+
+from agno.agent import Agent
+from agno.exceptions import RunCancelledException, RunTimeoutException
+from agno.run.base import RunStatus
+from agno.run.cancellation import (
+    CancellationToken,
+    cancellation_scope,
+    get_cancellation_token,
+    get_run_cancellation_token,
+    iterate_in_scope,
+)
+from agno.run.response import RunEvent
+from tests.unit.stub_model import StubModel
+
+
+@dataclass
+class SlowModel(StubModel):
+    """Model answering after `delay` seconds, streams start right away"""
+
+    id: str = "slow"
+    reply: str = "done"
+    delay: float = 5.0
+
+    def invoke_stream(self, *args, **kwargs):
+        yield "started"
+        yield from super().invoke_stream(*args, **kwargs)
+
+    async def ainvoke_stream(self, *args, **kwargs):
+        yield "started"
+        async for chunk in super().ainvoke_stream(*args, **kwargs):
+            yield chunk
+
+
+def test_token_timeout():
+    token = CancellationToken(timeout=0.05)
+    assert not token.is_cancelled
+    assert token.wait(1)
+    assert token.timed_out
+    with pytest.raises(RunTimeoutException):
+        token.raise_if_cancelled()
+
+
+def test_token_cancel_runs_callbacks_once():
+    calls = []
+    token = CancellationToken()
+    token.add_callback(lambda: calls.append(1))
+    token.cancel("stop")
+    token.cancel("again")
+
+    assert calls == [1]
+    assert token.reason == "stop"
+    with pytest.raises(RunCancelledException, match="stop"):
+        token.raise_if_cancelled()
+
+
+def test_child_token_follows_parent():
+    parent = CancellationToken(timeout=10)
+    child = CancellationToken(timeout=60, parent=parent)
+    assert child.deadline == parent.deadline
+
+    parent.cancel("leader stopped")
+    assert child.is_cancelled
+    assert child.reason == "leader stopped"
+
+
+def test_run_token_is_linked_to_current_token():
+    parent = CancellationToken()
+    with cancellation_scope(parent):
+        assert get_run_cancellation_token() is parent
+        child = get_run_cancellation_token(timeout=10)
+    assert get_cancellation_token() is None
+
+    parent.cancel()
+    assert child is not None and child.is_cancelled
+
+
+def test_close_releases_timer_and_parent_callbacks():
+    parent = CancellationToken()
+    child = CancellationToken(timeout=600, parent=parent)
+    assert child._timer is not None and child._timer.is_alive()
+
+    timer = child._timer
+    child.close()
+    timer.join(1)
+    assert not timer.is_alive()
+    assert parent._callbacks == []
+    assert not child.is_cancelled
+
+
+def test_call_returns_when_cancelled():
+    token = CancellationToken(timeout=0.1)
+    start = time.perf_counter()
+    with pytest.raises(RunTimeoutException):
+        token.call(lambda: time.sleep(5))
+    assert time.perf_counter() - start < 1
+
+
+def test_call_runs_in_scope():
+    token = CancellationToken()
+    with cancellation_scope(token):
+        assert token.call(get_cancellation_token) is token
+
+
+def test_acall_cancels_task():
+    cancelled = []
+
+    async def slow():
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def main():
+        token = CancellationToken(timeout=0.1)
+        with pytest.raises(RunTimeoutException):
+            await token.acall(slow())
+
+    asyncio.run(main())
+    assert cancelled == [True]
+
+
+def test_interruptible_stops_busy_thread():
+    token = CancellationToken()
+    outcome = []
+
+    def busy():
+        try:
+            with token.interruptible():
+                while True:
+                    pass
+        except RunCancelledException:
+            outcome.append("interrupted")
+
+    thread = threading.Thread(target=busy)
+    thread.start()
+    time.sleep(0.05)
+    token.cancel()
+    thread.join(2)
+
+    assert outcome == ["interrupted"]
+
+
+def test_iterate_in_scope_stops_and_closes_iterator():
+    closed = []
+    token = CancellationToken()
+
+    def numbers():
+        try:
+            for i in range(10):
+                assert get_cancellation_token() is token
+                yield i
+        finally:
+            closed.append(True)
+
+    items = []
+    with pytest.raises(RunCancelledException):
+        for item in iterate_in_scope(numbers(), token):
+            items.append(item)
+            if item == 2:
+                token.cancel()
+
+    assert items == [0, 1, 2]
+    assert closed == [True]
+
+
+def test_agent_run_timeout():
+    agent = Agent(model=SlowModel(), telemetry=False)
+    start = time.perf_counter()
+    response = agent.run("hi", timeout=0.2)
+
+    assert time.perf_counter() - start < 2
+    assert response.status == RunStatus.cancelled
+    assert response.content == "Run timed out"
+
+
+def test_agent_run_stream_cancel():
+    agent = Agent(model=SlowModel(), telemetry=False)
+    token = CancellationToken()
+    events = []
+    for event in agent.run("hi", stream=True, cancellation_token=token):
+        events.append(event)
+        if event.event == RunEvent.run_response_content.value:
+            token.cancel()
+
+    assert events[-1].event == RunEvent.run_cancelled.value
+
+
+def test_agent_arun_timeout():
+    agent = Agent(model=SlowModel(), telemetry=False)
+    start = time.perf_counter()
+    response = asyncio.run(agent.arun("hi", timeout=0.2))
+
+    assert time.perf_counter() - start < 2
+    assert response.status == RunStatus.cancelled
+
+
+def _alive_timers() -> int:
+    return sum(isinstance(thread, threading.Timer) for thread in threading.enumerate())
+
+
+def test_agent_runs_release_their_tokens():
+    agent = Agent(model=SlowModel(delay=0), telemetry=False)
+    parent = CancellationToken()
+    timers = _alive_timers()
+    with cancellation_scope(parent):
+        for _ in range(5):
+            assert agent.run("hi", stream=False, timeout=600).status != RunStatus.cancelled
+        for _ in agent.run("hi", stream=True, timeout=600):
+            pass
+        asyncio.run(agent.arun("hi", stream=False, timeout=600))
+
+    time.sleep(0.1)
+    assert _alive_timers() == timers
+    assert parent._callbacks == []
@@ -0,0 +1,80 @@
+import asyncio
+import threading
+from pathlib import Path
+
+from agno.agent import Agent
+from agno.storage.json import JsonStorage
+from agno.storage.session.agent import AgentSession
+from agno.storage.sqlite import SqliteStorage
+from tests.unit.stub_model import StubModel
+
+
+def get_session(session_id: str, user_id: str = "user-1") -> AgentSession:
+    return AgentSession(session_id=session_id, agent_id="agent-1", user_id=user_id, memory={}, session_data={})
+
+
+def test_sqlite_async_crud(tmp_path: Path):
+    storage = SqliteStorage(table_name="agent_sessions", db_file=str(tmp_path / "agno.db"))
+
+    async def main():
+        assert await storage.aread("missing") is None
+        await storage.aupsert(get_session("s1"))
+        await storage.aupsert(get_session("s2", user_id="user-2"))
+
+        session = await storage.aread("s1")
+        assert session is not None and session.agent_id == "agent-1"
+        assert set(await storage.aget_all_session_ids()) == {"s1", "s2"}
+        assert [s.session_id for s in await storage.aget_all_sessions(user_id="user-2")] == ["s2"]
+        assert len(await storage.aget_recent_sessions(limit=1)) == 1
+
+        await storage.adelete_session("s1")
+        assert await storage.aread("s1") is None
+
+    asyncio.run(main())
+    # The sync and async methods share the table
+    assert storage.get_all_session_ids() == ["s2"]
+
+
+def test_sqlite_in_memory_async_uses_same_database():
+    storage = SqliteStorage(table_name="agent_sessions")
+    storage.upsert(get_session("s1"))
+
+    assert asyncio.run(storage.aread("s1")) is not None
+
+
+def test_sync_storage_runs_off_the_event_loop(tmp_path: Path):
+    storage = JsonStorage(dir_path=tmp_path)
+    threads = []
+    read = storage.read
+
+    def tracked_read(*args, **kwargs):
+        threads.append(threading.current_thread())
+        return read(*args, **kwargs)
+
+    storage.read = tracked_read  # type: ignore
+
+    async def main():
+        await storage.aupsert(get_session("s1"))
+        return await storage.aread("s1")
+
+    assert asyncio.run(main()) is not None
+    assert threads and threads[0] is not threading.main_thread()
+
+
+def test_agent_arun_uses_async_storage(tmp_path: Path):
+    storage = SqliteStorage(table_name="agent_sessions", db_file=str(tmp_path / "agno.db"))
+    calls = []
+    aupsert = storage.aupsert
+
+    async def tracked_aupsert(session, *args, **kwargs):
+        calls.append(session.session_id)
+        return await aupsert(session, *args, **kwargs)
+
+    storage.aupsert = tracked_aupsert  # type: ignore
+    agent = Agent(model=StubModel(reply="hello"), storage=storage, telemetry=False)
+
+    response = asyncio.run(agent.arun("hi", session_id="s1"))
+
+    assert response.content == "hello"
+    assert calls == ["s1"]
+    assert storage.read("s1") is not None
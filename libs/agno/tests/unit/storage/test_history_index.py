@@ -0,0 +1,113 @@
+import json
+from typing import Dict, List, Optional, Tuple
+
+from agno.agent import Agent
+from agno.embedder.base import Embedder
+from agno.memory.v2.memory import Memory
+from agno.models.message import Message
+from agno.run.response import RunResponse
+from agno.storage.history import SqliteHistoryIndex
+from agno.storage.session.agent import AgentSession
+from agno.storage.sqlite import SqliteStorage
+
+
+def get_run(run_id: str, question: str, answer: str, created_at: int, status: str = "RUNNING", tools=None) -> Dict:
+    return {
+        "run_id": run_id,
+        "status": status,
+        "created_at": created_at,
+        "messages": [
+            {"role": "system", "content": "You are a helpful assistant"},
+            {"role": "user", "content": "earlier question", "from_history": True},
+            {"role": "user", "content": question},
+            {"role": "assistant", "content": answer},
+        ],
+        "tools": tools or [],
+    }
+
+
+def get_session(session_id: str, runs: List[Dict], user_id: str = "user-1") -> AgentSession:
+    return AgentSession(session_id=session_id, agent_id="agent-1", user_id=user_id, memory={"runs": runs})
+
+
+def test_index_session_is_incremental(tmp_path):
+    index = SqliteHistoryIndex(db_file=tmp_path / "history.db")
+    runs = [get_run("run-1", "Where did I park the car?", "Level 3 of the garage", 100, status="COMPLETED")]
+    assert index.index_session(get_session("session-1", runs)) == 2
+
+    runs.append(get_run("run-2", "What is the weather in Paris?", "Sunny", 200, status="PAUSED"))
+    assert index.index_session(get_session("session-1", runs)) == 0
+
+    runs[1]["status"] = "COMPLETED"
+    assert index.index_session(get_session("session-1", runs)) == 2
+    assert index.get_indexed_run_ids("session-1") == {"run-1", "run-2"}
+
+    results = index.search("parking cars")
+    assert [entry.content for entry in results][0] == "Where did I park the car?"
+    assert all(entry.content != "earlier question" for entry in index.get_recent_messages(limit=10))
+
+    index.delete_session("session-1")
+    assert index.search("car") == []
+
+
+def test_search_filters_and_tool_calls():
+    index = SqliteHistoryIndex()
+    tools = [{"tool_name": "get_weather", "tool_args": {"city": "Paris"}, "result": "Sunny", "created_at": 110}]
+    index.index_session(get_session("session-1", [get_run("run-1", "Weather in Paris?", "Sunny", 100, tools=tools)]))
+    index.index_session(
+        get_session("session-2", [get_run("run-2", "Weather in Rome?", "Rainy", 200)], user_id="user-2")
+    )
+
+    assert {entry.session_id for entry in index.search("weather")} == {"session-1", "session-2"}
+    assert [entry.session_id for entry in index.search("weather", user_id="user-2")] == ["session-2"]
+    # Terms are not read as FTS5 syntax
+    assert index.search('weather" OR NOT (') != []
+
+    tool_calls = index.get_tool_calls(user_id="user-1", tool_name="get_weather")
+    assert len(tool_calls) == 1
+    assert tool_calls[0].tool_args == {"city": "Paris"}
+    assert tool_calls[0].content == "Sunny"
+
+
+class KeywordEmbedder(Embedder):
+    keywords: Tuple[str, ...] = ("car", "vehicle", "weather")
+
+    def get_embedding(self, text: str) -> List[float]:
+        text = text.lower().replace("vehicle", "car")
+        return [float(keyword in text) for keyword in self.keywords]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+
+def test_search_with_embedder_finds_messages_without_matching_terms():
+    index = SqliteHistoryIndex(embedder=KeywordEmbedder())
+    runs = [
+        get_run("run-1", "Where did I park the car?", "Level 3", 100),
+        get_run("run-2", "What is the weather?", "Sunny", 200),
+    ]
+    index.index_session(get_session("session-1", runs))
+
+    results = index.search("vehicle", limit=1)
+    assert [entry.content for entry in results] == ["Where did I park the car?"]
+    assert results[0].score == 1.0
+
+
+def test_agent_indexes_sessions_and_searches_previous_sessions(tmp_path):
+    index = SqliteHistoryIndex()
+    agent = Agent(
+        agent_id="agent-1",
+        memory=Memory(),
+        storage=SqliteStorage(table_name="agent_sessions", db_file=str(tmp_path / "sessions.db")),
+        history_index=index,
+        search_previous_sessions_history=True,
+    )
+    messages = [Message(role="user", content="Where did I park the car?"), Message(role="assistant", content="Level 3")]
+    agent.memory.add_run("session-1", RunResponse(run_id="run-1", agent_id="agent-1", messages=messages))  # type: ignore
+    agent.write_to_storage(session_id="session-1", user_id="user-1")
+    assert index.get_indexed_run_ids("session-1") == {"run-1"}
+
+    search = agent.get_search_previous_sessions_function(user_id="user-1")
+    assert json.loads(search("car"))[0]["content"] == "Where did I park the car?"
+    assert agent.get_search_previous_sessions_function(user_id="user-2")("car") == "No history found"
+    assert agent.get_previous_tool_calls_function(user_id="user-1")() == "No tool calls found"
@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from agno.agent import Agent
+from agno.playground import Playground
+from agno.storage.json import JsonStorage
+from agno.storage.session.agent import AgentSession
+from agno.storage.sqlite import SqliteStorage
+
+
+def get_session(index: int, session_name=None) -> AgentSession:
+    runs = [
+        {"agent_id": "agent-1", "content": "hi", "messages": [{"role": "user", "content": f"question {index}"}]},
+        {"agent_id": "agent-1", "content": "x" * 1000, "messages": []},
+    ]
+    return AgentSession(
+        session_id=f"session-{index}",
+        agent_id="agent-1",
+        user_id="user-1",
+        memory={"runs": runs},
+        session_data={"session_name": session_name} if session_name else {},
+        created_at=1000 + index,
+        updated_at=2000 + index,
+    )
+
+
+@pytest.fixture(params=["sqlite", "json"])
+def storage(request, tmp_path):
+    if request.param == "sqlite":
+        storage = SqliteStorage(table_name="agent_sessions", db_file=str(tmp_path / "sessions.db"))
+    else:
+        storage = JsonStorage(dir_path=tmp_path / "sessions")
+    storage.create()
+    for index in range(5):
+        storage.upsert(get_session(index, session_name="Named" if index == 2 else None))
+    if request.param == "sqlite":
+        # Upserts set updated_at, use fixed timestamps to check the order
+        with storage.SqlSession() as sess, sess.begin():
+            for index in range(5):
+                stmt = storage.table.update().where(storage.table.c.session_id == f"session-{index}")
+                sess.execute(stmt.values(updated_at=2000 + index))
+    return storage
+
+
+def test_session_index_pages(storage):
+    first_page = storage.get_session_index(user_id="user-1", entity_id="agent-1", limit=2)
+    assert [entry.session_id for entry in first_page.sessions] == ["session-4", "session-3"]
+    assert first_page.sessions[0].first_run["messages"][0]["content"] == "question 4"
+    assert first_page.next_cursor is not None
+
+    second_page = storage.get_session_index(
+        user_id="user-1", entity_id="agent-1", limit=2, cursor=first_page.next_cursor
+    )
+    assert [entry.session_id for entry in second_page.sessions] == ["session-2", "session-1"]
+    assert second_page.sessions[0].session_name == "Named"
+
+    last_page = asyncio.run(
+        storage.aget_session_index(user_id="user-1", entity_id="agent-1", limit=2, cursor=second_page.next_cursor)
+    )
+    assert [entry.session_id for entry in last_page.sessions] == ["session-0"]
+    assert last_page.next_cursor is None
+
+
+def test_session_index_filters(storage):
+    assert storage.get_session_index(entity_id="agent-2").sessions == []
+    assert len(storage.get_session_index(user_id="user-1").sessions) == 5
+
+
+def test_session_index_invalid_cursor(storage):
+    with pytest.raises(ValueError):
+        storage.get_session_index(cursor="not-a-cursor")
+
+
+def test_playground_sessions_route(storage):
+    agent = Agent(agent_id="agent-1", storage=storage)
+    client = TestClient(Playground(agents=[agent]).get_app(use_async=False))
+
+    response = client.get("/v1/playground/agents/agent-1/sessions", params={"user_id": "user-1", "limit": 3})
+    assert response.status_code == 200
+    assert [session["title"] for session in response.json()] == ["question 4", "question 3", "Named"]
+
+    response = client.get(
+        "/v1/playground/agents/agent-1/sessions",
+        params={"user_id": "user-1", "cursor": response.headers["X-Next-Cursor"]},
+    )
+    assert [session["session_id"] for session in response.json()] == ["session-1", "session-0"]
+    assert "X-Next-Cursor" not in response.headers
+
+    response = client.get("/v1/playground/agents/agent-1/sessions", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
@@ -0,0 +1,46 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, List
+
+from agno.models.base import Model
+from agno.models.message import Message
+from agno.models.response import ModelResponse
+
+
+@dataclass
+class StubModel(Model):
+    """Model answering with `reply` after `delay` seconds, counting its calls"""
+
+    id: str = "stub"
+    reply: str = "ok"
+    delay: float = 0.0
+    calls: int = 0
+
+    def get_reply(self, messages: List[Message]) -> Any:
+        return self.reply
+
+    def get_delay(self) -> float:
+        return self.delay
+
+    def invoke(self, *args, **kwargs) -> Any:
+        self.calls += 1
+        time.sleep(self.get_delay())
+        return self.get_reply(kwargs["messages"])
+
+    async def ainvoke(self, *args, **kwargs) -> Any:
+        self.calls += 1
+        await asyncio.sleep(self.get_delay())
+        return self.get_reply(kwargs["messages"])
+
+    def invoke_stream(self, *args, **kwargs):
+        yield self.invoke(*args, **kwargs)
+
+    async def ainvoke_stream(self, *args, **kwargs):
+        yield await self.ainvoke(*args, **kwargs)
+
+    def parse_provider_response(self, response: Any, **kwargs) -> ModelResponse:
+        return ModelResponse(role="assistant", content=response)
+
+    def parse_provider_response_delta(self, response: Any) -> ModelResponse:
+        return ModelResponse(role="assistant", content=response)
@@ -0,0 +1,105 @@
+import json
+import os
+
+import pytest
+
+from agno.tools.csv_toolkit import CsvTools
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "people.csv"
+    rows = ["name,age"] + [f"person_{i},{20 + i}" for i in range(100)]
+    path.write_text("\n".join(rows) + "\n")
+    return path
+
+
+def test_read_csv_file_row_limit(csv_file):
+    tools = CsvTools(csvs=[csv_file])
+    result = json.loads(tools.read_csv_file("people", row_limit=3))
+    assert result == [
+        {"name": "person_0", "age": "20"},
+        {"name": "person_1", "age": "21"},
+        {"name": "person_2", "age": "22"},
+    ]
+
+
+def test_read_csv_file_columnar(csv_file):
+    tools = CsvTools(csvs=[csv_file], output_format="columnar", row_limit=2)
+    result = json.loads(tools.read_csv_file("people"))
+    assert result == {"columns": ["name", "age"], "data": {"name": ["person_0", "person_1"], "age": ["20", "21"]}}
+
+
+def test_read_csv_file_markdown_with_byte_budget(csv_file):
+    tools = CsvTools(csvs=[csv_file], output_format="markdown", max_result_bytes=200)
+    result = tools.read_csv_file("people")
+    assert result.startswith("| name | age |\n| --- | --- |")
+    assert "the result was truncated" in result
+    assert "person_99" not in result
+
+
+def test_read_csv_file_stops_reading_at_byte_budget(csv_file):
+    tools = CsvTools(csvs=[csv_file], max_result_bytes=100)
+    rows = iter([f"person_{i}", str(20 + i)] for i in range(100))
+    result = json.loads(tools._format_rows(["name", "age"], rows))
+
+    assert result["truncated"] is True
+    assert 0 < len(result["rows"]) < 10
+    # Rows after the first one over the budget are not read
+    assert len(list(rows)) == 100 - len(result["rows"]) - 1
+
+
+@pytest.mark.parametrize("output_format", ["json", "columnar", "markdown"])
+def test_read_csv_file_result_fits_in_byte_budget(tmp_path, output_format):
+    columns = ["customer_identifier", "customer_full_name", "customer_email_address"]
+    path = tmp_path / "customers.csv"
+    rows = [",".join(columns)] + [f"{i},Customer {i},customer_{i}@example.com" for i in range(100)]
+    path.write_text("\n".join(rows) + "\n")
+    tools = CsvTools(csvs=[path], output_format=output_format, max_result_bytes=500)
+
+    result = tools.read_csv_file("customers")
+
+    assert len(result.encode("utf-8")) <= 500
+    assert "truncated" in result
+
+
+def test_invalid_output_format():
+    with pytest.raises(ValueError):
+        CsvTools(output_format="xml")
+
+
+def test_query_csv_file_loads_once(csv_file):
+    pytest.importorskip("duckdb")
+    tools = CsvTools(csvs=[csv_file])
+    assert tools.query_csv_file("people", "SELECT count(*) FROM people") == "count_star()\n100"
+    mtime = tools._registered_csvs["people"]
+    assert tools.query_csv_file("people", "SELECT max(age) FROM people") == "max(age)\n119"
+    assert tools._registered_csvs["people"] == mtime
+
+
+def test_query_csv_file_reloads_modified_file(csv_file):
+    pytest.importorskip("duckdb")
+    tools = CsvTools(csvs=[csv_file])
+    assert tools.query_csv_file("people", "SELECT count(*) FROM people") == "count_star()\n100"
+
+    csv_file.write_text("name,age\nsomeone,1\n")
+    stat = csv_file.stat()
+    os.utime(csv_file, (stat.st_atime, stat.st_mtime + 10))
+    assert tools.query_csv_file("people", "SELECT count(*) FROM people") == "count_star()\n1"
+
+
+def test_query_csv_file_parquet_cache(csv_file, tmp_path):
+    pytest.importorskip("duckdb")
+    cache_dir = tmp_path / "cache"
+    tools = CsvTools(csvs=[csv_file], parquet_cache_dir=cache_dir)
+    assert tools.query_csv_file("people", "SELECT count(*) FROM people") == "count_star()\n100"
+    assert (cache_dir / "people.parquet").exists()
+
+
+def test_query_csv_file_byte_budget(csv_file):
+    pytest.importorskip("duckdb")
+    tools = CsvTools(csvs=[csv_file], max_result_bytes=100)
+    result = tools.query_csv_file("people", "SELECT * FROM people")
+    assert result.startswith("name,age\nperson_0,20")
+    assert "truncated" in result
+    assert "person_99" not in result
@@ -344,3 +344,12 @@ def test_custom_table_name_with_special_chars(duckdb_tools_instance, mock_duckdb
     assert result == custom_table
     call_args = mock_duckdb_connection.sql.call_args[0][0]
     assert f"CREATE TABLE IF NOT EXISTS {custom_table} AS" in call_args
+
+
+def test_run_query_with_result_budget():
+    """Test that run_query streams rows up to the result budget and reports truncation."""
+    tools = DuckDbTools(max_result_rows=3)
+    result = tools.run_query("SELECT range AS id FROM range(100)")
+
+    assert result.startswith("id\n0\n1\n2\n")
+    assert "[Result truncated: showing 3 rows." in result
@@ -423,6 +423,39 @@ def test_function_call_with_tool_hooks():
     assert hook_calls[1][2] == "processed-value1"
 
 
+def test_function_call_reuses_compiled_hook_chain():
+    """Test that the hook chain is compiled once per function, and again when the hooks change."""
+    hook_calls = []
+
+    def first_hook(function_name: str, function_call: Callable, arguments: Dict[str, Any]):
+        hook_calls.append("first")
+        return function_call(**arguments)
+
+    def second_hook(function_call: Callable, arguments: Dict[str, Any], agent=None):
+        hook_calls.append("second")
+        return function_call(**arguments)
+
+    @tool(tool_hooks=[first_hook])
+    def test_func(param1: str) -> str:
+        return f"processed-{param1}"
+
+    test_func.process_entrypoint()
+
+    results = [FunctionCall(function=test_func, arguments={"param1": str(i)}).execute().result for i in range(2)]
+    assert results == ["processed-0", "processed-1"]
+    chain = test_func._get_hook_chain()
+    assert FunctionCall(function=test_func, arguments={"param1": "a"}).execute().status == "success"
+    assert test_func._get_hook_chain() is chain
+    assert hook_calls == ["first"] * 3
+
+    hook_calls.clear()
+    test_func.tool_hooks = [first_hook, second_hook]
+    assert FunctionCall(function=test_func, arguments={"param1": "b"}).execute().result == "processed-b"
+    assert test_func._get_hook_chain() is not chain
+    assert hook_calls == ["first", "second"]
+    assert test_func.get_parameter_names(second_hook) == {"function_call", "arguments", "agent"}
+
+
 @pytest.mark.asyncio
 async def test_function_call_async_execution():
     """Test async function call execution."""
@@ -0,0 +1,135 @@
+import asyncio
+import os
+import threading
+
+import pytest
+
+from agno.exceptions import ToolExecutorOverloadedError
+from agno.models.message import Message
+from agno.tools.decorator import tool
+from agno.tools.executor import ToolExecutor
+from agno.tools.function import Function, FunctionCall
+from agno.tools.toolkit import Toolkit
+
+
+class CountTools(Toolkit):
+    def __init__(self, executor: ToolExecutor):
+        super().__init__(name="count_tools", tools=[self.count_primes, self.get_pid], executor=executor)
+        self.calls = 0
+
+    def count_primes(self, limit: int) -> int:
+        """Count the prime numbers below a limit."""
+        self.calls += 1
+        return sum(1 for n in range(2, limit) if all(n % d for d in range(2, int(n**0.5) + 1)))
+
+    def get_pid(self) -> int:
+        """Get the process id."""
+        return os.getpid()
+
+
+process_executor = ToolExecutor(name="processes", max_workers=1, processes=True)
+
+
+@tool(executor=process_executor)
+def get_worker_pid(offset: int) -> int:
+    """Get the process id, plus an offset."""
+    return os.getpid() + offset
+
+
+def get_function_call(toolkit: Toolkit, name: str, **arguments) -> FunctionCall:
+    function = toolkit.functions[name]
+    function.process_entrypoint()
+    return FunctionCall(function=function, arguments=arguments)
+
+
+def test_toolkit_functions_run_on_the_executor():
+    executor = ToolExecutor(name="count", max_workers=2)
+    toolkit = CountTools(executor=executor)
+    function_call = get_function_call(toolkit, "count_primes", limit=20)
+
+    result = executor.run(function_call.execute)
+
+    assert result.status == "success"
+    assert function_call.result == 8
+    assert toolkit.calls == 1
+    metrics = executor.get_metrics()
+    assert metrics["completed"] == 1
+    assert metrics["running"] == 0
+    executor.shutdown()
+
+
+def test_overloaded_executor_rejects_calls():
+    executor = ToolExecutor(max_workers=1, max_pending=1)
+    release = threading.Event()
+    started = threading.Event()
+
+    def block():
+        started.set()
+        release.wait()
+
+    running = executor.submit(block)
+    started.wait()
+    pending = executor.submit(lambda: None)
+    with pytest.raises(ToolExecutorOverloadedError):
+        executor.submit(lambda: None)
+    release.set()
+    running.result()
+    pending.result()
+
+    metrics = executor.get_metrics()
+    assert metrics["rejected"] == 1
+    assert metrics["completed"] == 2
+    assert metrics["max_queue_time"] > 0
+    executor.shutdown()
+
+
+def test_model_returns_overload_as_tool_error():
+    from agno.models.openai import OpenAIChat
+
+    executor = ToolExecutor(max_workers=1, max_pending=0)
+    release = threading.Event()
+    function = Function.from_callable(lambda: "done", name="work")
+    function.executor = executor
+    executor.submit(release.wait)
+
+    results: list = []
+    list(OpenAIChat(id="gpt-4o").run_function_calls([FunctionCall(function=function)], results))
+    assert results[0].tool_call_error
+    assert "overloaded" in results[0].content
+
+    async_results: list = []
+
+    async def run():
+        async for _ in OpenAIChat(id="gpt-4o").arun_function_calls([FunctionCall(function=function)], async_results):
+            pass
+
+    asyncio.run(run())
+    assert async_results[0].tool_call_error
+    assert isinstance(async_results[0], Message)
+    release.set()
+    executor.shutdown()
+
+
+def test_toolkit_functions_run_in_worker_processes():
+    executor = ToolExecutor(max_workers=1, processes=True)
+    toolkit = CountTools(executor=executor)
+
+    function_call = get_function_call(toolkit, "count_primes", limit="20")
+    assert asyncio.run(executor.arun(function_call.execute)).status == "success"
+    assert function_call.result == 8
+    # The toolkit was updated in the worker process
+    assert toolkit.calls == 0
+
+    function_call = get_function_call(toolkit, "get_pid")
+    executor.run(function_call.execute)
+    assert function_call.result != os.getpid()
+    executor.shutdown()
+
+
+def test_decorated_functions_run_in_worker_processes():
+    get_worker_pid.process_entrypoint()
+    function_call = FunctionCall(function=get_worker_pid, arguments={"offset": "1"})
+
+    assert process_executor.run(function_call.execute).status == "success"
+    assert function_call.result != os.getpid() + 1
+    process_executor.shutdown()
@@ -0,0 +1,48 @@
+import pytest
+
+from agno.utils.import_time import LAZY_IMPORTS, check_import_budgets, get_cold_start_time, parse_importtime
+from agno.utils.lazy import LAZY_EXPORTS, verify_lazy_exports
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 | site
+import time:       200 |        200 | agno
+import time:       300 |        300 |     pydantic_core
+import time:      1000 |       1300 |   agno.models.message
+import time:       500 |       1800 | agno.agent
+"""
+
+
+def test_parse_importtime():
+    total_ms, self_times, imported = parse_importtime(IMPORTTIME_OUTPUT, "agno.agent")
+
+    assert total_ms == pytest.approx(2.0)
+    assert imported == {"agno", "pydantic_core", "agno.models.message", "agno.agent"}
+    assert self_times["agno.models.message"] == pytest.approx(1.0)
+    assert "site" not in self_times
+
+
+def test_lazy_exports_resolve():
+    import agno.memory
+
+    assert "agno.memory" in LAZY_EXPORTS
+    assert verify_lazy_exports() == {}
+    assert "AgentMemory" in dir(agno.memory)
+
+
+def test_lazy_export_unknown_attribute():
+    import agno.memory
+
+    with pytest.raises(AttributeError):
+        agno.memory.UnknownMemory  # type: ignore
+
+
+def test_lazy_imports_are_not_imported_eagerly():
+    lazy_imports = {
+        module: LAZY_IMPORTS[module] for module in ["agno.memory.v2.memory", "agno.models.base", "agno.vectordb.search"]
+    }
+    assert check_import_budgets(budgets={}, lazy_imports=lazy_imports, runs=1) == []
+
+
+def test_cold_start_time():
+    assert get_cold_start_time() > 0
@@ -0,0 +1,93 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from agno.utils.local_models import LocalModelRegistry, MicroBatcher
+
+
+def test_micro_batcher_coalesces_concurrent_requests():
+    batch_sizes = []
+
+    def batch_fn(items):
+        batch_sizes.append(len(items))
+        time.sleep(0.01)
+        return [item * 2 for item in items]
+
+    batcher = MicroBatcher(batch_fn, max_batch_size=8, max_wait_ms=50)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda i: batcher.submit([i]), range(16)))
+    batcher.close()
+
+    assert results == [[i * 2] for i in range(16)]
+    assert max(batch_sizes) > 1
+    assert max(batch_sizes) <= 8
+    assert batcher.metrics.items == 16
+    assert batcher.metrics.requests == 16
+    assert batcher.metrics.batches == len(batch_sizes)
+
+
+def test_micro_batcher_runs_oversized_request_alone():
+    batcher = MicroBatcher(lambda items: items, max_batch_size=2, max_wait_ms=0)
+    assert batcher.submit([1, 2, 3]) == [1, 2, 3]
+    assert batcher.metrics.largest_batch == 3
+    batcher.close()
+
+
+def test_micro_batcher_propagates_errors():
+    def batch_fn(items):
+        raise RuntimeError("model failed")
+
+    batcher = MicroBatcher(batch_fn, max_wait_ms=0)
+    with pytest.raises(RuntimeError):
+        batcher.submit(["text"])
+    assert batcher.metrics.errors == 1
+    batcher.close()
+
+
+def test_registry_loads_each_model_once():
+    registry = LocalModelRegistry()
+    loads = []
+
+    def loader():
+        loads.append(1)
+        time.sleep(0.02)
+        return object()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        models = list(executor.map(lambda _: registry.get_model("model", loader), range(4)))
+    assert len(loads) == 1
+    assert all(model is models[0] for model in models)
+
+    batcher = registry.get_batcher(("model", "normalized"), lambda items: items)
+    assert registry.get_batcher(("model", "normalized"), lambda items: []) is batcher
+    assert batcher.submit(["a", "b"]) == ["a", "b"]
+    metrics = registry.get_metrics()["('model', 'normalized')"]
+    assert metrics["queue_depth"] == 0
+    assert metrics["items"] == 2
+
+    registry.unload("model")
+    assert registry.get_metrics() == {}
+    registry.get_model("model", loader)
+    assert len(loads) == 2
+
+
+def test_registry_stops_private_batchers_with_their_owner():
+    import gc
+
+    class Owner:
+        pass
+
+    registry = LocalModelRegistry()
+    owner, other_owner = Owner(), Owner()
+    batcher = registry.get_batcher(("model", "normalized"), lambda items: items, owner=owner)
+    assert registry.get_batcher(("model", "normalized"), lambda items: [], owner=owner) is batcher
+    assert registry.get_batcher(("model", "normalized"), lambda items: items, owner=other_owner) is not batcher
+    assert batcher.submit(["a"]) == ["a"]
+
+    del owner
+    gc.collect()
+    batcher._worker.join(timeout=1)
+
+    assert not batcher._worker.is_alive()
+    assert len(registry.get_metrics()) == 1
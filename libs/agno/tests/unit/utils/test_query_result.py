@@ -0,0 +1,62 @@
+import csv
+
+from agno.utils.query_result import estimate_tokens, iter_batches, shape_query_result
+
+
+def _rows(n):
+    for i in range(n):
+        yield (i, f"name_{i}")
+
+
+def test_shape_query_result_within_budget():
+    result = shape_query_result(columns=["id", "name"], rows=_rows(3), max_rows=10)
+    assert not result.truncated
+    assert result.total_rows == 3
+    assert result.to_csv() == "id,name\n0,name_0\n1,name_1\n2,name_2"
+
+
+def test_shape_query_result_max_rows_stops_consuming():
+    consumed = []
+
+    def rows():
+        for row in _rows(1000):
+            consumed.append(row)
+            yield row
+
+    result = shape_query_result(columns=["id", "name"], rows=rows(), max_rows=5)
+    assert result.truncated
+    assert len(result.rows) == 5
+    assert result.total_rows is None
+    # Only one row past the budget is pulled from the cursor
+    assert len(consumed) == 6
+    assert "showing 5 rows" in result.to_csv()
+
+
+def test_shape_query_result_max_tokens():
+    result = shape_query_result(columns=["id", "name"], rows=_rows(1000), max_tokens=50)
+    assert result.truncated
+    assert sum(estimate_tokens(f"{i},name_{i}") + 1 for i, _ in result.rows) <= 50
+
+
+def test_shape_query_result_spill_file(tmp_path):
+    result = shape_query_result(columns=["id", "name"], rows=_rows(100), max_rows=2, spill_dir=str(tmp_path))
+    assert result.truncated
+    assert result.total_rows == 100
+    assert result.spill_file is not None
+    with open(result.spill_file, newline="") as f:
+        spilled = list(csv.reader(f))
+    assert spilled[0] == ["id", "name"]
+    assert len(spilled) == 101
+    assert result.spill_file in result.to_csv()
+
+
+def test_shape_query_result_no_spill_file_when_not_truncated(tmp_path):
+    result = shape_query_result(columns=["id", "name"], rows=_rows(2), max_rows=2, spill_dir=str(tmp_path))
+    assert not result.truncated
+    assert result.spill_file is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_iter_batches():
+    batches = [[1, 2], [3], []]
+    assert list(iter_batches(lambda size: batches.pop(0), batch_size=2)) == [1, 2, 3]
@@ -0,0 +1,76 @@
+from agno.agent import Agent
+from agno.memory.agent import AgentMemory, AgentRun
+from agno.models.message import Message
+from agno.models.openai import OpenAIChat
+from agno.run.response import RunResponse
+from agno.utils.tokens import count_message_tokens, get_context_window, get_input_token_budget
+
+
+def test_count_message_tokens_is_cached():
+    message = Message(role="user", content="hello world " * 50)
+    count = count_message_tokens(message)
+    assert count > 50
+    assert message._token_count is not None
+    assert count_message_tokens(message) == count
+
+    # The cache is invalidated when the content changes
+    message.content = "hello"
+    assert count_message_tokens(message) < count
+
+
+def test_context_window():
+    assert get_context_window(OpenAIChat(id="gpt-4o-mini")) == 128_000
+    assert get_context_window(OpenAIChat(id="gpt-4o", context_window=1000)) == 1000
+    assert get_input_token_budget(OpenAIChat(id="gpt-4o", context_window=1000, max_tokens=200)) == 800
+
+
+def _agent_with_history(num_runs: int, **kwargs) -> Agent:
+    memory = AgentMemory()
+    for i in range(num_runs):
+        messages = [
+            Message(role="user", content=f"question {i} " + "padding " * 100),
+            Message(role="assistant", content=f"answer {i} " + "padding " * 100),
+        ]
+        memory.runs.append(AgentRun(response=RunResponse(messages=messages)))
+    agent = Agent(
+        model=OpenAIChat(id="gpt-4o"),
+        memory=memory,
+        add_history_to_messages=True,
+        num_history_runs=num_runs,
+        context_budget=True,
+        **kwargs,
+    )
+    agent.run_response = RunResponse()
+    return agent
+
+
+def test_context_budget_keeps_recent_history():
+    agent = _agent_with_history(5, max_context_tokens=700)
+    run_messages = agent.get_run_messages(message="new question", session_id="session")
+    contents = [m.get_content_string() for m in run_messages.messages]
+
+    assert contents[-1] == "new question"
+    assert any(content.startswith("answer 4") for content in contents)
+    assert not any(content.startswith("question 0") for content in contents)
+    assert sum(count_message_tokens(m) for m in run_messages.messages) <= 700
+
+
+def test_context_budget_trims_references():
+    def retriever(agent, query, num_documents=None, **kwargs):
+        return [{"content": f"reference {i} " + "text " * 100} for i in range(5)]
+
+    agent = _agent_with_history(1, max_context_tokens=800, add_references=True, retriever=retriever)
+    run_messages = agent.get_run_messages(message="new question", session_id="session")
+    user_content = run_messages.user_message.get_content_string()
+
+    # The recent history is kept and only the references that fit are added
+    assert any(m.get_content_string().startswith("answer 0") for m in run_messages.messages)
+    assert "reference 0" in user_content
+    assert "reference 4" not in user_content
+
+
+def test_without_context_budget_all_history_is_added():
+    agent = _agent_with_history(5)
+    agent.context_budget = False
+    run_messages = agent.get_run_messages(message="new question", session_id="session")
+    assert len([m for m in run_messages.messages if m.from_history]) == 10
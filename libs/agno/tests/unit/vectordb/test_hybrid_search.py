@@ -0,0 +1,202 @@
+import asyncio
+import threading
+from typing import List
+from unittest.mock import MagicMock
+
+import pytest
+
+from agno.document import Document
+from agno.utils.string import safe_content_hash
+from agno.vectordb.base import VectorDb
+from agno.vectordb.benchmark import benchmark_search
+from agno.vectordb.index import SearchParams
+from agno.vectordb.local import LocalVectorDb
+from agno.vectordb.search import BM25Index, HybridSearch
+
+
+class KeywordEmbedder:
+    """Deterministic embedder that only knows a few words, so vector search misses the others."""
+
+    keywords = ["thai", "soup", "noodles", "curry", "pizza", "pasta"]
+    dimensions = len(keywords)
+
+    def get_embedding(self, text: str) -> List[float]:
+        words = text.lower().split()
+        return [float(sum(word.startswith(k) for word in words)) + 0.01 for k in self.keywords]
+
+    def get_embedding_and_usage(self, text: str):
+        return self.get_embedding(text), None
+
+
+@pytest.fixture
+def documents() -> List[Document]:
+    return [
+        Document(content="thai soup with coconut and galangal", name="tom_kha", meta_data={"cuisine": "thai"}),
+        Document(content="thai noodles stir fried with tamarind", name="pad_thai", meta_data={"cuisine": "thai"}),
+        Document(content="green curry with basil", name="green_curry", meta_data={"cuisine": "thai"}),
+        Document(content="pizza margherita with basil", name="pizza", meta_data={"cuisine": "italian"}),
+        Document(content="pasta carbonara with guanciale", name="pasta", meta_data={"cuisine": "italian"}),
+    ]
+
+
+def test_bm25_index_ranks_filters_and_persists(documents, tmp_path):
+    index = BM25Index(path=tmp_path / "bm25.jsonl")
+    index.add(documents)
+
+    results = index.search("basil curry", limit=5)
+    assert [document.name for document, _ in results] == ["green_curry", "pizza"]
+    assert results[0][1] > results[1][1]
+    assert [document.name for document, _ in index.search("basil", filters={"cuisine": "italian"})] == ["pizza"]
+
+    # Adding a document again replaces it
+    index.add([documents[2]], filters={"spicy": True})
+    assert len(index) == 5
+    index.delete([safe_content_hash(documents[3].content)])
+
+    reopened = BM25Index(path=tmp_path / "bm25.jsonl")
+    assert len(reopened) == 4
+    assert [document.meta_data for document, _ in reopened.search("basil")] == [{"cuisine": "thai", "spicy": True}]
+
+    reopened.clear()
+    assert len(BM25Index(path=tmp_path / "bm25.jsonl")) == 0
+
+
+@pytest.fixture
+def hybrid(documents, tmp_path):
+    vector_db = LocalVectorDb(collection="recipes", path=tmp_path, embedder=KeywordEmbedder())
+    hybrid = HybridSearch(vector_db=vector_db, keyword_index=BM25Index())
+    hybrid.create()
+    hybrid.insert(documents)
+    return hybrid
+
+
+@pytest.mark.parametrize("fusion", ["rrf", "score"])
+def test_hybrid_search_finds_vector_and_keyword_matches(hybrid, fusion):
+    hybrid.fusion = fusion
+    # "tamarind" is unknown to the embedder, only the keyword search finds pad thai
+    results = hybrid.search("thai soup tamarind", limit=2)
+    assert {document.name for document in results} == {"tom_kha", "pad_thai"}
+    assert hybrid.vector_search("tamarind", limit=1)[0].name != "pad_thai"
+    assert [document.name for document in hybrid.keyword_search("tamarind")] == ["pad_thai"]
+
+    results = asyncio.run(hybrid.async_search("basil", limit=5, filters={"cuisine": "italian"}))
+    assert [document.name for document in results][0] == "pizza"
+    assert all(document.meta_data["cuisine"] == "italian" for document in results)
+
+    # Other attributes come from the vector db
+    assert hybrid.collection == "recipes"
+    assert hybrid.name_exists("pizza")
+    hybrid.drop()
+    assert len(hybrid.keyword_index) == 0
+
+
+def test_vector_search_keeps_the_search_params_of_the_caller(hybrid):
+    seen = []
+    search = hybrid.vector_db.search
+
+    def spy(query, limit=5, filters=None):
+        seen.append(hybrid.vector_db.get_search_params().ef_search)
+        return search(query=query, limit=limit, filters=filters)
+
+    hybrid.vector_db.search = spy
+    with hybrid.using_search_params(SearchParams(ef_search=999)):
+        hybrid.search("thai soup")
+        asyncio.run(hybrid.async_search("thai soup"))
+    assert seen == [999, 999]
+    hybrid.close()
+
+
+def test_in_memory_keyword_index_is_rebuilt_by_loading_again(documents, tmp_path):
+    vector_db = LocalVectorDb(collection="recipes", path=tmp_path, embedder=KeywordEmbedder())
+    HybridSearch(vector_db=vector_db, keyword_index=BM25Index()).insert(documents)
+
+    # A new process: the vector db has the documents, the keyword index is empty
+    reopened = HybridSearch(
+        vector_db=LocalVectorDb(collection="recipes", path=tmp_path, embedder=KeywordEmbedder()),
+        keyword_index=BM25Index(),
+    )
+    assert [document.name for document in reopened.keyword_search("tamarind")] == []
+    missing = [document for document in documents if not reopened.doc_exists(document)]
+    assert len(missing) == 5
+    reopened.insert(missing)
+
+    assert reopened.vector_db.get_count() == 5
+    assert [document.name for document in reopened.keyword_search("tamarind")] == ["pad_thai"]
+    assert all(reopened.doc_exists(document) for document in documents)
+
+
+def get_vector_db(keyword_search) -> MagicMock:
+    vector_db = MagicMock(spec=VectorDb)
+    vector_db.search.side_effect = lambda query, limit, filters=None: [Document(content="vector", meta_data={})]
+    vector_db.async_search.side_effect = NotImplementedError
+    vector_db.keyword_search = keyword_search
+    return vector_db
+
+
+def test_hybrid_search_runs_native_keyword_search_concurrently():
+    both_started = threading.Barrier(2, timeout=5)
+
+    def vector_search(query: str, limit: int, filters=None) -> List[Document]:
+        # Fails if the keyword search does not run at the same time
+        both_started.wait()
+        return [Document(content="vector", meta_data={})]
+
+    def keyword_search(query: str, limit: int = 5) -> List[Document]:
+        both_started.wait()
+        return [Document(content="keyword", meta_data={"lang": "en"}), Document(content="other", meta_data={})]
+
+    vector_db = get_vector_db(keyword_search)
+    vector_db.search.side_effect = vector_search
+    hybrid = HybridSearch(vector_db=vector_db, vector_weight=2.0)
+
+    results = hybrid.search("q", limit=5, filters={"lang": "en"})
+    # The keyword search without filters has its results filtered on their metadata
+    assert [document.content for document in results] == ["vector", "keyword"]
+    assert vector_db.search.call_args.kwargs["limit"] == 10
+
+
+def test_hybrid_search_returns_the_results_of_the_search_that_succeeded():
+    def keyword_search(query: str, limit: int = 5, filters=None) -> List[Document]:
+        raise RuntimeError("no full-text index")
+
+    hybrid = HybridSearch(vector_db=get_vector_db(keyword_search))
+    assert [document.content for document in hybrid.search("q")] == ["vector"]
+    assert [document.content for document in asyncio.run(hybrid.async_search("q"))] == ["vector"]
+
+
+def test_hybrid_search_requires_a_keyword_search(tmp_path):
+    with pytest.raises(ValueError):
+        HybridSearch(vector_db=LocalVectorDb(collection="recipes", path=tmp_path, embedder=KeywordEmbedder()))
+
+
+def test_benchmark_search_compares_vector_and_hybrid_search(hybrid):
+    queries = ["tamarind noodles", "coconut soup"]
+    relevant = [["pad_thai"], ["tom_kha"]]
+    results = benchmark_search({"vector": hybrid.vector_db, "hybrid": hybrid}, queries, relevant, k=1)
+
+    assert [result.name for result in results] == ["vector", "hybrid"]
+    assert results[1].recall_at_k == 1.0
+    assert results[1].recall_at_k >= results[0].recall_at_k
+    assert results[1].to_dict()["num_queries"] == 2
+
+    with pytest.raises(ValueError):
+        benchmark_search({"hybrid": hybrid}, queries, relevant[:1])
+
+
+def test_deep_copies_share_the_keyword_index(documents, tmp_path):
+    from copy import deepcopy
+
+    hybrid = HybridSearch(
+        vector_db=LocalVectorDb(collection="recipes", path=tmp_path, embedder=KeywordEmbedder()),
+        keyword_index=BM25Index(),
+    )
+    hybrid.insert(documents)
+    hybrid.search("thai soup")
+
+    copied = deepcopy(hybrid)
+    assert copied.keyword_index is hybrid.keyword_index
+    assert copied._executor is None
+    assert [document.name for document in copied.keyword_search("tamarind")] == ["pad_thai"]
+    assert copied.search("thai soup")[0].name == "tom_kha"
+    hybrid.close()
+    copied.close()
@@ -0,0 +1,135 @@
+from typing import Any, Dict, List, Optional
+
+from agno.document import Document
+from agno.vectordb.base import VectorDb
+from agno.vectordb.benchmark import benchmark_recall, recall_at_k
+from agno.vectordb.index import IndexSpec, SearchParams
+
+
+class InMemoryVectorDb(VectorDb):
+    """Vector db over a fixed list of documents. Approximate search only sees the first `ef_search` documents."""
+
+    def __init__(self, documents: List[Document], index_spec: Optional[IndexSpec] = None):
+        self.documents = documents
+        self.index_spec = index_spec
+        self.index_builds = 0
+
+    def create(self) -> None:
+        pass
+
+    async def async_create(self) -> None:
+        pass
+
+    def doc_exists(self, document: Document) -> bool:
+        return document in self.documents
+
+    async def async_doc_exists(self, document: Document) -> bool:
+        return document in self.documents
+
+    def name_exists(self, name: str) -> bool:
+        return any(doc.name == name for doc in self.documents)
+
+    def async_name_exists(self, name: str) -> bool:
+        return self.name_exists(name)
+
+    def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        self.documents.extend(documents)
+        self.record_writes(len(documents))
+
+    async def async_insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        self.insert(documents, filters)
+
+    def upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        self.insert(documents, filters)
+
+    async def async_upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        self.insert(documents, filters)
+
+    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        search_params = self.get_search_params()
+        candidates = self.documents if search_params.exact else self.documents[: search_params.ef_search or 1]
+        return sorted(candidates, key=lambda doc: abs(len(doc.content) - len(query)))[:limit]
+
+    async def async_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        return self.search(query, limit, filters)
+
+    def exact_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        with self.using_search_params(SearchParams(exact=True)):
+            return self.search(query, limit, filters)
+
+    def create_index(self, index_spec: Optional[IndexSpec] = None, force_recreate: bool = False) -> None:
+        self.index_builds += 1
+
+    def drop(self) -> None:
+        self.documents = []
+
+    async def async_drop(self) -> None:
+        self.drop()
+
+    def exists(self) -> bool:
+        return True
+
+    async def async_exists(self) -> bool:
+        return True
+
+    def delete(self) -> bool:
+        self.drop()
+        return True
+
+
+def _documents(n: int) -> List[Document]:
+    return [Document(id=str(i), content="x" * (i + 1)) for i in range(n)]
+
+
+def test_search_params_default_and_override():
+    vector_db = InMemoryVectorDb(_documents(3), index_spec=IndexSpec(search_params=SearchParams(ef_search=40)))
+    assert vector_db.get_search_params().ef_search == 40
+
+    with vector_db.using_search_params(SearchParams(ef_search=100)):
+        assert vector_db.get_search_params().ef_search == 100
+    assert vector_db.get_search_params().ef_search == 40
+
+    assert InMemoryVectorDb(_documents(1)).get_search_params() == SearchParams()
+
+
+def test_search_params_override_only_applies_to_its_vector_db():
+    vector_db = InMemoryVectorDb(_documents(3), index_spec=IndexSpec(search_params=SearchParams(ef_search=40)))
+    other_db = InMemoryVectorDb(_documents(3), index_spec=IndexSpec(search_params=SearchParams(probes=5)))
+
+    with vector_db.using_search_params(SearchParams(ef_search=100)):
+        with other_db.using_search_params(SearchParams(probes=10)):
+            assert vector_db.get_search_params().ef_search == 100
+            assert other_db.get_search_params() == SearchParams(probes=10)
+        assert other_db.get_search_params() == SearchParams(probes=5)
+
+
+def test_rebuild_on_threshold():
+    vector_db = InMemoryVectorDb(_documents(1), index_spec=IndexSpec(rebuild_threshold=5))
+    vector_db.insert(_documents(3))
+    assert vector_db.index_builds == 0
+    vector_db.insert(_documents(3))
+    assert vector_db.index_builds == 1
+    assert vector_db.rows_since_index_build == 0
+
+
+def test_recall_at_k():
+    docs = _documents(4)
+    assert recall_at_k(docs[:2], docs[:2], k=2) == 1.0
+    assert recall_at_k([docs[0], docs[3]], docs[:2], k=2) == 0.5
+    assert recall_at_k([], [], k=2) == 1.0
+
+
+def test_benchmark_recall_sweeps_search_params():
+    vector_db = InMemoryVectorDb(_documents(10))
+    results = benchmark_recall(
+        vector_db,
+        queries=["x" * 10],
+        k=2,
+        search_params=[SearchParams(ef_search=1), SearchParams(ef_search=10)],
+    )
+    assert [result.search_params.ef_search for result in results] == [1, 10]
+    assert results[0].recall_at_k == 0.0
+    assert results[1].recall_at_k == 1.0
+    assert results[1].to_dict()["num_queries"] == 1
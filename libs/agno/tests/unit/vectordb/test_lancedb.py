@@ -139,6 +139,15 @@ def test_get_count(lance_db, sample_documents):
     assert lance_db.get_count() == 3
 
 
+def test_exact_search_filters_before_the_limit(lance_db, sample_documents):
+    """Test that filtered exact searches still return up to limit matching documents"""
+    lance_db.insert(sample_documents)
+    results = lance_db.exact_search("coconut dishes", limit=1, filters={"type": "curry"})
+    assert [doc.name for doc in results] == ["green_curry"]
+    results = lance_db.exact_search("coconut dishes", limit=2, filters={"cuisine": "Thai"})
+    assert len(results) == 2
+
+
 def test_error_handling(lance_db):
     """Test error handling scenarios"""
     results = lance_db.search("")
@@ -0,0 +1,205 @@
+import multiprocessing
+from typing import List
+
+import pytest
+
+from agno.document import Document
+from agno.vectordb.index import IndexSpec, IndexType, SearchParams
+from agno.vectordb.local import LocalVectorDb
+from agno.vectordb.quantization import Quantization
+
+
+class KeywordEmbedder:
+    """Deterministic embedder: one dimension per keyword."""
+
+    keywords = ["thai", "soup", "noodles", "curry", "pizza", "pasta", "italian", "spicy"]
+    dimensions = len(keywords)
+
+    def get_embedding(self, text: str) -> List[float]:
+        words = text.lower().split()
+        return [float(sum(word.startswith(k) for word in words)) + 0.01 for k in self.keywords]
+
+    def get_embedding_and_usage(self, text: str):
+        return self.get_embedding(text), None
+
+
+@pytest.fixture
+def documents() -> List[Document]:
+    return [
+        Document(content="thai soup with coconut", name="tom_kha", meta_data={"cuisine": "thai"}),
+        Document(content="thai noodles stir fried", name="pad_thai", meta_data={"cuisine": "thai"}),
+        Document(content="spicy thai curry", name="green_curry", meta_data={"cuisine": "thai"}),
+        Document(content="italian pizza margherita", name="pizza", meta_data={"cuisine": "italian"}),
+        Document(content="italian pasta carbonara", name="pasta", meta_data={"cuisine": "italian"}),
+    ]
+
+
+@pytest.fixture(
+    params=[
+        (Quantization.none, None),
+        (Quantization.half, None),
+        (Quantization.int8, None),
+        (Quantization.binary, 5),
+    ]
+)
+def local_db(request, tmp_path):
+    quantization, rescore_multiplier = request.param
+    db = LocalVectorDb(
+        collection="recipes",
+        path=tmp_path,
+        embedder=KeywordEmbedder(),
+        quantization=quantization,
+        rescore_multiplier=rescore_multiplier,
+    )
+    db.create()
+    yield db
+    db.drop()
+
+
+def test_insert_and_search(local_db, documents):
+    local_db.insert(documents)
+    assert local_db.get_count() == 5
+    assert local_db.exists()
+    assert local_db.name_exists("pizza")
+    assert local_db.doc_exists(documents[0])
+
+    results = local_db.search("thai curry", limit=2)
+    assert [doc.name for doc in results][0] == "green_curry"
+    assert len(results[0].embedding) == KeywordEmbedder.dimensions
+
+
+def test_search_with_filters(local_db, documents):
+    local_db.insert(documents)
+    results = local_db.search("thai soup", limit=5, filters={"cuisine": "italian"})
+    assert {doc.name for doc in results} == {"pizza", "pasta"}
+
+    results = local_db.search("thai soup", limit=5, filters={"cuisine": ["italian", "thai"]})
+    assert len(results) == 5
+
+
+def test_upsert_replaces_documents(local_db, documents):
+    local_db.upsert(documents)
+    local_db.upsert([Document(content=documents[0].content, name="tom_kha_v2", meta_data={"cuisine": "thai"})])
+    assert local_db.get_count() == 5
+    assert local_db.name_exists("tom_kha_v2")
+    assert not local_db.name_exists("tom_kha")
+
+
+def test_insert_skips_existing_ids(local_db, documents):
+    local_db.insert(documents)
+    local_db.insert(documents)
+    assert local_db.get_count() == 5
+
+
+class BrokenEmbedder(KeywordEmbedder):
+    def get_embedding(self, text: str) -> List[float]:
+        embedding = super().get_embedding(text)
+        return embedding[:2] if "broken" in text else embedding
+
+
+def test_invalid_embedding_and_interrupted_write_keep_vectors_aligned(local_db, documents):
+    local_db.embedder = BrokenEmbedder()
+    local_db.insert([Document(content="broken soup", name="broken"), *documents[:2]])
+    assert local_db.get_count() == 2
+    assert not local_db.name_exists("broken")
+
+    # Vectors written by a write interrupted before its records are dropped by the next write
+    with local_db._vectors_file.open("ab") as f:
+        f.write(b"\x01" * local_db._vectors_file.stat().st_size)
+    local_db.insert(documents[2:])
+    assert local_db.get_count() == 5
+    assert local_db.search("italian pizza", limit=1)[0].name == "pizza"
+
+
+def test_persistence_and_reopen(tmp_path, documents):
+    db = LocalVectorDb(collection="recipes", path=tmp_path, embedder=KeywordEmbedder())
+    db.create()
+    db.insert(documents)
+
+    reopened = LocalVectorDb(collection="recipes", path=tmp_path, embedder=KeywordEmbedder())
+    assert reopened.get_count() == 5
+    assert reopened.search("italian pizza", limit=1)[0].name == "pizza"
+
+    # Reader instances see rows appended by the writer on their next search
+    db.insert([Document(content="thai spicy soup", name="tom_yum")])
+    assert reopened.get_count() == 6
+
+
+def _count_in_subprocess(path, queue):
+    db = LocalVectorDb(collection="recipes", path=path, embedder=KeywordEmbedder())
+    queue.put(db.get_count())
+
+
+def test_reader_in_other_process(tmp_path, documents):
+    db = LocalVectorDb(collection="recipes", path=tmp_path, embedder=KeywordEmbedder())
+    db.insert(documents)
+    queue: multiprocessing.Queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_count_in_subprocess, args=(tmp_path, queue))
+    process.start()
+    process.join(timeout=30)
+    assert queue.get(timeout=5) == 5
+
+
+def test_ivf_index(tmp_path, documents):
+    db = LocalVectorDb(
+        collection="recipes",
+        path=tmp_path,
+        embedder=KeywordEmbedder(),
+        index_spec=IndexSpec(index_type=IndexType.ivfflat, lists=2, search_params=SearchParams(probes=2)),
+    )
+    db.insert(documents)
+    db.create_index()
+    assert (tmp_path / "recipes" / "ivf_index.npz").exists()
+
+    # Probing every list returns the same results as exact search
+    assert [d.id for d in db.search("thai soup", limit=3)] == [d.id for d in db.exact_search("thai soup", limit=3)]
+
+    # Rows added after the index was built are still found
+    db.insert([Document(content="italian pizza pizza", name="double_pizza")])
+    with db.using_search_params(SearchParams(probes=1)):
+        assert "double_pizza" in [d.name for d in db.search("pizza pizza", limit=2)]
+
+
+class SignedKeywordEmbedder(KeywordEmbedder):
+    """Keyword embedder with negative values for missing keywords, so each keyword maps to a bit."""
+
+    def get_embedding(self, text: str) -> List[float]:
+        return [v - 0.5 for v in super().get_embedding(text)]
+
+
+def test_binary_rescoring(tmp_path, documents):
+    db = LocalVectorDb(
+        collection="recipes",
+        path=tmp_path,
+        embedder=SignedKeywordEmbedder(),
+        quantization=Quantization.binary,
+        rescore_multiplier=3,
+    )
+    db.insert(documents)
+    assert tmp_path.joinpath("recipes", "vectors.binary").stat().st_size == 5
+    assert tmp_path.joinpath("recipes", "vectors_full.float32").exists()
+
+    # Full precision embeddings are returned and used for the exact search
+    results = db.search("italian pasta", limit=1)
+    assert results[0].name == "pasta"
+    assert db.exact_search("spicy curry", limit=1)[0].name == "green_curry"
+
+
+def test_hnsw_not_supported(tmp_path):
+    with pytest.raises(ValueError):
+        LocalVectorDb(collection="c", path=tmp_path, embedder=KeywordEmbedder(), index_spec=IndexSpec())
+
+
+def test_delete_clears_collection(local_db, documents):
+    local_db.insert(documents)
+    assert local_db.delete()
+    assert local_db.get_count() == 0
+    assert local_db.search("thai") == []
+
+
+async def test_async_methods(local_db, documents):
+    await local_db.async_insert(documents)
+    assert await local_db.async_exists()
+    assert await local_db.async_name_exists("pasta")
+    results = await local_db.async_search("italian pasta", limit=1)
+    assert results[0].name == "pasta"
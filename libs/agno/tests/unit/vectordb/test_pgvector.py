@@ -385,3 +385,48 @@ async def test_async_exists(mock_pgvector):
         # Check result and that exists was called via to_thread
         assert result is True
         mock_to_thread.assert_called_once_with(mock_pgvector.exists)
+
+
+def test_quantized_index_expression(mock_pgvector):
+    """Test the vector index expression for each quantization."""
+    from agno.vectordb.quantization import Quantization
+
+    dimensions = mock_pgvector.dimensions
+    assert mock_pgvector._get_index_expression() == "embedding vector_cosine_ops"
+
+    mock_pgvector.quantization = Quantization.half
+    assert mock_pgvector._get_index_expression() == f"(embedding::halfvec({dimensions})) halfvec_cosine_ops"
+
+    mock_pgvector.quantization = Quantization.binary
+    assert mock_pgvector._get_index_expression() == f"(binary_quantize(embedding)::bit({dimensions})) bit_hamming_ops"
+
+    with pytest.raises(ValueError), patch("agno.vectordb.pgvector.pgvector.scoped_session"):
+        PgVector(table_name=TEST_TABLE, db_engine=MagicMock(), quantization=Quantization.int8)
+
+
+def test_vector_index_is_rebuilt_when_quantization_changes(mock_pgvector):
+    """Test that an existing vector index built for another quantization is dropped and rebuilt."""
+    from agno.vectordb.quantization import Quantization
+
+    session = mock_pgvector.Session.return_value.__enter__.return_value
+    session.execute.return_value.scalar.return_value = (
+        f'CREATE INDEX "{TEST_TABLE}_hnsw_index" ON {TEST_SCHEMA}.{TEST_TABLE} '
+        "USING hnsw (embedding vector_cosine_ops) WITH (m='16', ef_construction='64')"
+    )
+
+    with (
+        patch.object(mock_pgvector, "_index_exists", return_value=True),
+        patch.object(mock_pgvector, "_drop_index") as mock_drop_index,
+        patch.object(mock_pgvector, "_create_hnsw_index") as mock_create_hnsw_index,
+    ):
+        # The index matches the configured quantization, it is kept
+        mock_pgvector._create_vector_index()
+        mock_drop_index.assert_not_called()
+        mock_create_hnsw_index.assert_not_called()
+
+        mock_pgvector.quantization = Quantization.half
+        mock_pgvector._create_vector_index()
+
+    mock_drop_index.assert_called_once_with(f"{TEST_TABLE}_hnsw_index")
+    mock_create_hnsw_index.assert_called_once()
+    assert "halfvec_cosine_ops" in mock_create_hnsw_index.call_args.args[2]
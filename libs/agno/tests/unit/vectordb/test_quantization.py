@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from agno.embedder.matryoshka import MatryoshkaEmbedder
+from agno.vectordb.quantization import (
+    Quantization,
+    dequantize_int8,
+    evaluate_quantization,
+    hamming_similarity,
+    quantize_binary,
+    quantize_int8,
+)
+
+
+class FixedEmbedder:
+    dimensions = 4
+
+    def get_embedding(self, text: str):
+        return [3.0, 4.0, 12.0, 0.0]
+
+    def get_embedding_and_usage(self, text: str):
+        return self.get_embedding(text), {"tokens": 1}
+
+
+@pytest.fixture
+def vectors():
+    rng = np.random.default_rng(42)
+    vectors = rng.normal(size=(500, 64)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def test_int8_round_trip(vectors):
+    codes, scales = quantize_int8(vectors)
+    assert codes.dtype == np.int8
+    assert np.abs(dequantize_int8(codes, scales) - vectors).max() < 0.01
+
+
+def test_binary_hamming():
+    packed = quantize_binary(np.array([[1.0, -1.0, 1.0], [-1.0, -1.0, 1.0]]))
+    query = quantize_binary(np.array([[1.0, -1.0, 1.0]]))[0]
+    assert packed.shape == (2, 1)
+    assert hamming_similarity(packed, query).tolist() == [0.0, -1.0]
+
+
+def test_evaluate_quantization(vectors):
+    queries = vectors[:20]
+    full = evaluate_quantization(vectors, queries, k=10, quantization=Quantization.none)
+    assert full["recall_at_k"] == 1.0
+    assert full["bytes_per_vector"] == 64 * 4
+
+    int8 = evaluate_quantization(vectors, queries, k=10, quantization=Quantization.int8)
+    assert int8["recall_at_k"] > 0.9
+
+    binary = evaluate_quantization(vectors, queries, k=10, quantization=Quantization.binary)
+    rescored = evaluate_quantization(vectors, queries, k=10, quantization=Quantization.binary, rescore_multiplier=10)
+    assert binary["compression_ratio"] == 32
+    assert rescored["recall_at_k"] >= binary["recall_at_k"]
+
+    truncated = evaluate_quantization(vectors, queries, k=10, quantization=Quantization.none, dimensions=32)
+    assert truncated["dimensions"] == 32
+    assert truncated["bytes_per_vector"] == 32 * 4
+
+
+def test_matryoshka_embedder():
+    embedder = MatryoshkaEmbedder(embedder=FixedEmbedder(), dimensions=2)
+    assert embedder.get_embedding("text") == pytest.approx([0.6, 0.8])
+    embedding, usage = embedder.get_embedding_and_usage("text")
+    assert len(embedding) == 2
+    assert usage == {"tokens": 1}
+
+    with pytest.raises(ValueError):
+        MatryoshkaEmbedder(embedder=FixedEmbedder(), dimensions=8)